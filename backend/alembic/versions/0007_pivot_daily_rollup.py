@@ -0,0 +1,44 @@
+"""Materialized pivot day rows (PIVOT_DAILY_ROLLUP).
+
+Revision ID: 0007_pivot_daily_rollup
+Revises: 0006_hold_status_history
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0007_pivot_daily_rollup"
+down_revision: Union[str, None] = "0006_hold_status_history"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "PIVOT_DAILY_ROLLUP",
+        sa.Column("rollup_id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("dataset", sa.String(length=30), nullable=False),
+        sa.Column("client_id", sa.String(length=50), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("group_by", sa.String(length=30), nullable=False),
+        sa.Column("group_key", sa.String(length=100), nullable=False),
+        sa.Column("components", sa.JSON(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["client_id"], ["CLIENT.client_id"]),
+        sa.PrimaryKeyConstraint("rollup_id"),
+    )
+    # Serves run_pivot's coverage count and day-row read (both filter
+    # dataset + group_by + day range, then client).
+    op.create_index("ix_pivot_rollup_lookup", "PIVOT_DAILY_ROLLUP", ["dataset", "group_by", "day", "client_id"])
+    # Serves the refresh delete of one (dataset, client, day range).
+    op.create_index("ix_pivot_rollup_client_day", "PIVOT_DAILY_ROLLUP", ["dataset", "client_id", "day"])
+
+
+def downgrade() -> None:
+    # drop_table alone, as in 0006: on MariaDB the client_id FK needs a
+    # covering index, so dropping the indexes first would fail (errno 1553).
+    op.drop_table("PIVOT_DAILY_ROLLUP")
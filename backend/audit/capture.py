@@ -35,6 +35,22 @@ transactionality falls out of using one connection, not out of getting a
 rollback hook right. This is also the pattern SQLAlchemy's own docs use for
 change-data-capture / versioning recipes.
 
+Batching (one executemany per flush): the handlers above no longer execute
+their INSERT immediately. Each one builds its fully-resolved parameter dict
+at event time (PK, diff, actor and request shape are all captured then, so
+nothing is resolved late) and appends it to a buffer for the flush's
+connection. A session-level `after_flush` listener drains that buffer with
+a single `connection.execute(insert, [rows...])` -- still on the flush's own
+connection, still inside the flush, so a failure there fails the flush and
+the atomicity argument above is unchanged. A bulk change of N audited rows
+now costs N + 1 statements instead of 2N.
+
+This is not the deferred-state design rejected above: the buffer holds
+nothing that needs resolving later, it lives in a module-private
+WeakKeyDictionary keyed by Session (never user-owned `session.info`), and
+`before_flush` discards whatever a previous flush left behind. A flush that
+raises before `after_flush` can therefore never leak rows into the next one.
+
 One consequence worth naming: mapper events are global to the process (they
 attach to the `Base` class with `propagate=True`, not to a Session).
 `register_audit_listener()` is idempotent, but nothing about SQLAlchemy
@@ -46,10 +62,11 @@ later test in the same process silently starts capturing audit rows too.
 import enum
 from datetime import date, datetime, timezone
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+from weakref import WeakKeyDictionary
 
 from sqlalchemy import event, inspect
-from sqlalchemy.orm import configure_mappers
+from sqlalchemy.orm import Session, configure_mappers
 
 from backend.audit.context import get_actor, get_actor_username, get_request_shape, is_suppressed
 from backend.audit.registry import REDACTED_FIELDS, is_audited
@@ -59,6 +76,9 @@ from backend.orm.audit_entry import AuditEntry, AuditOperation
 _REDACTED = "[redacted]"
 _listener_registered = False
 
+# Session -> {connection: [AUDIT_ENTRY param dicts]} for the flush in progress.
+_pending: "WeakKeyDictionary[Session, Dict[Any, List[Dict[str, Any]]]]" = WeakKeyDictionary()
+
 
 def _jsonable(value: Any) -> Any:
     """Coerce a column value into something the JSON column accepts.
@@ -188,54 +208,77 @@ def _delete_changes(obj: Any) -> Dict[str, Any]:
 
 
 def _write_entry(connection: Any, obj: Any, operation: AuditOperation, changes: Dict[str, Any]) -> None:
-    """Insert one AUDIT_ENTRY row via Core, on the flush's own connection.
+    """Queue one AUDIT_ENTRY row for the flush's own connection.
 
     Deliberately not `session.add()` / ORM: a Core insert on the connection
     the mapper event handed us lands in the exact same transaction as the
-    row it describes, with no dependency on a later flush and nothing to
-    reconcile if the surrounding transaction rolls back. It also cannot
-    recurse into these same listeners -- mapper events only fire for ORM
-    session flushes, and this bypasses the ORM entirely.
+    row it describes, with nothing to reconcile if the surrounding
+    transaction rolls back. It also cannot recurse into these same
+    listeners -- mapper events only fire for ORM session flushes, and this
+    bypasses the ORM entirely. The row is written by `_drain_pending` at the
+    end of this flush; outside a session flush (no owning session) it is
+    written immediately.
     """
+    row = _entry_params(obj, operation, changes)
+    session = inspect(obj).session
+    if session is None:
+        connection.execute(AuditEntry.__table__.insert(), row)
+        return
+    _pending.setdefault(session, {}).setdefault(connection, []).append(row)
+
+
+def _entry_params(obj: Any, operation: AuditOperation, changes: Dict[str, Any]) -> Dict[str, Any]:
+    """Fully-resolved AUDIT_ENTRY parameters, captured at mapper-event time."""
     actor = get_actor()
     username = get_actor_username()
     method, path = get_request_shape()
-    connection.execute(
-        AuditEntry.__table__.insert(),
-        {
-            # Naive UTC, deliberately. AUDIT_ENTRY.occurred_at is a plain
-            # `DateTime` column, and neither SQLite nor pymysql/MariaDB can
-            # store a UTC offset in one -- both silently discard the tzinfo,
-            # so a tz-aware bind produced a naive-UTC row anyway, just via an
-            # implicit truncation nobody had stated. Truncating here makes the
-            # stored contract explicit and identical on both dialects: every
-            # occurred_at value is naive UTC. Range filters (Phase A2) must
-            # therefore compare against naive UTC datetimes, never against
-            # `datetime.now()` local time and never against an aware value.
-            "occurred_at": datetime.now(tz=timezone.utc).replace(tzinfo=None),
-            "actor_user_id": actor,
-            # "system" means genuinely no actor. A known id with no username
-            # is left NULL rather than mislabelled "system" -- only reachable
-            # from a direct set_actor(user_id) call with no username (CLI /
-            # tests); the request path always carries both.
-            "actor_username": username if username else ("system" if actor is None else None),
-            "table_name": obj.__tablename__,
-            "record_pk": _require_pk(obj),
-            "operation": operation,
-            "changes": changes,
-            "client_id": _client_id(obj),
-            # Truncated to the column widths: MariaDB in STRICT mode ERRORS on
-            # an over-long value rather than truncating, which would turn a
-            # long path into a failed *business* write. The value is
-            # scope["path"] only — the query string is NOT included — so
-            # overflow means a genuinely long path (deep prefixes, a long
-            # path parameter), not query parameters. Losing the tail of a path
-            # is acceptable; failing the user's request in order to record the
-            # audit of it is not.
-            "request_method": method[:8] if method else None,
-            "request_path": path[:255] if path else None,
-        },
-    )
+    return {
+        # Naive UTC, deliberately. AUDIT_ENTRY.occurred_at is a plain
+        # `DateTime` column, and neither SQLite nor pymysql/MariaDB can
+        # store a UTC offset in one -- both silently discard the tzinfo,
+        # so a tz-aware bind produced a naive-UTC row anyway, just via an
+        # implicit truncation nobody had stated. Truncating here makes the
+        # stored contract explicit and identical on both dialects: every
+        # occurred_at value is naive UTC. Range filters (Phase A2) must
+        # therefore compare against naive UTC datetimes, never against
+        # `datetime.now()` local time and never against an aware value.
+        "occurred_at": datetime.now(tz=timezone.utc).replace(tzinfo=None),
+        "actor_user_id": actor,
+        # "system" means genuinely no actor. A known id with no username
+        # is left NULL rather than mislabelled "system" -- only reachable
+        # from a direct set_actor(user_id) call with no username (CLI /
+        # tests); the request path always carries both.
+        "actor_username": username if username else ("system" if actor is None else None),
+        "table_name": obj.__tablename__,
+        "record_pk": _require_pk(obj),
+        "operation": operation,
+        "changes": changes,
+        "client_id": _client_id(obj),
+        # Truncated to the column widths: MariaDB in STRICT mode ERRORS on
+        # an over-long value rather than truncating, which would turn a
+        # long path into a failed *business* write. The value is
+        # scope["path"] only — the query string is NOT included — so
+        # overflow means a genuinely long path (deep prefixes, a long
+        # path parameter), not query parameters. Losing the tail of a path
+        # is acceptable; failing the user's request in order to record the
+        # audit of it is not.
+        "request_method": method[:8] if method else None,
+        "request_path": path[:255] if path else None,
+    }
+
+
+def _reset_pending(session: Any, flush_context: Any, instances: Any) -> None:
+    """Drop anything a previous, failed flush of this session left queued."""
+    _pending.pop(session, None)
+
+
+def _drain_pending(session: Any, flush_context: Any) -> None:
+    """Write this flush's queued audit rows, one executemany per connection."""
+    batches = _pending.pop(session, None)
+    if not batches:
+        return
+    for connection, rows in batches.items():
+        connection.execute(AuditEntry.__table__.insert(), rows)
 
 
 def _capture_insert(mapper: Any, connection: Any, target: Any) -> None:
@@ -313,6 +356,8 @@ def register_audit_listener() -> None:
     event.listen(Base, "after_insert", _capture_insert, propagate=True)
     event.listen(Base, "before_update", _capture_update, propagate=True)
     event.listen(Base, "before_delete", _capture_delete, propagate=True)
+    event.listen(Session, "before_flush", _reset_pending)
+    event.listen(Session, "after_flush", _drain_pending)
     _listener_registered = True
 
 
@@ -331,4 +376,7 @@ def unregister_audit_listener() -> None:
     event.remove(Base, "after_insert", _capture_insert)
     event.remove(Base, "before_update", _capture_update)
     event.remove(Base, "before_delete", _capture_delete)
+    event.remove(Session, "before_flush", _reset_pending)
+    event.remove(Session, "after_flush", _drain_pending)
+    _pending.clear()
     _listener_registered = False
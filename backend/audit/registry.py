@@ -87,6 +87,9 @@ EXCLUDED_TABLES: Dict[str, str] = {
     "CALCULATION_ASSUMPTION": (
         "self-audits via its dedicated ASSUMPTION_CHANGE log written on every modification; would duplicate"
     ),
+    "PIVOT_DAILY_ROLLUP": (
+        "derived pivot day rows rewritten by backend/pivot/rollup.py on every source commit and nightly reconcile"
+    ),
     "ALERT": "system-generated threshold-breach alert, not authored by a person",
     "ALERT_HISTORY": "system-computed prediction-vs-actual accuracy tracking, no human decision involved",
     "TOKEN_BLACKLIST": (
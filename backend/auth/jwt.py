@@ -19,6 +19,13 @@ from backend.audit.context import set_actor
 from backend.auth.password import hash_password as _hash_password
 from backend.auth.password import needs_rehash as _needs_rehash
 from backend.auth.password import verify_password as _verify_password
+from backend.auth.principal_cache import (
+    attach_principal,
+    cache_principal,
+    drop_principal,
+    get_principal,
+    revocation_index,
+)
 from backend.config import settings
 from backend.database import get_db
 from backend.orm.token_blacklist import TokenBlacklist
@@ -77,6 +84,10 @@ def blacklist_token(db: Session, token: str, user_id: Optional[str] = None) -> N
     if db.query(TokenBlacklist.jti).filter(TokenBlacklist.jti == key).first() is None:
         db.add(TokenBlacklist(jti=key, user_id=user_id, expires_at=expires_at.replace(tzinfo=None)))
     db.commit()
+    # This process stops honouring the token at once; other workers within
+    # AUTH_REVOCATION_REFRESH_SECONDS (their cache misses query the table).
+    revocation_index.add(key)
+    drop_principal(key)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -177,10 +188,22 @@ def get_current_user(request: Request, token: str = Depends(oauth2_scheme), db:
     payload = decode_access_token(token)
 
     # Reject revoked (logged-out) tokens. The check is DB-backed so it
-    # survives restarts and is shared across workers (Run 7 T1.4).
+    # survives restarts and is shared across workers (Run 7 T1.4). A token
+    # with a cached principal was checked against the table when it was
+    # cached; from then on the refreshed in-process revocation index answers,
+    # and also drops the principal once its user's access fields change.
     jti = payload.get("jti")
     revocation_key = jti if isinstance(jti, str) and jti else hashlib.sha256(token.encode()).hexdigest()
-    if is_token_blacklisted(db, revocation_key):
+    principal = get_principal(revocation_key)
+    if principal is not None:
+        revoked = revocation_index.is_revoked(db, revocation_key)
+        if not revoked and not revocation_index.is_current(db, principal):
+            drop_principal(revocation_key)
+            principal = None
+    if principal is None:
+        revoked = is_token_blacklisted(db, revocation_key)
+    if revoked:
+        drop_principal(revocation_key)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has been revoked",
@@ -200,14 +223,23 @@ def get_current_user(request: Request, token: str = Depends(oauth2_scheme), db:
         )
     username: str = raw_username
 
-    user = db.query(User).filter(User.username == username).first()
+    if principal is not None and principal.username == username:
+        user = attach_principal(db, principal)
+        if principal.junction_resolved:
+            user._junction_clients = principal.junction_clients
+    else:
+        loaded = db.query(User).filter(User.username == username).first()
 
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        if loaded is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        user = loaded
+
+        if user.is_active:
+            _cache_principal(db, revocation_key, user)
 
     if not user.is_active:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
@@ -229,6 +261,19 @@ def get_current_user(request: Request, token: str = Depends(oauth2_scheme), db:
     return user
 
 
+def _cache_principal(db: Session, revocation_key: str, user: User) -> None:
+    """Cache the user with its client assignments, looked up once here for scoped roles."""
+    # Deferred import: backend.middleware imports this module (see resolve_client_scope)
+    from backend.middleware.client_auth import _get_clients_from_junction_table, sees_all_clients
+
+    if sees_all_clients(user):
+        cache_principal(revocation_key, user, None, resolved=False)
+        return
+    junction_clients = _get_clients_from_junction_table(db, user.user_id)
+    user._junction_clients = tuple(junction_clients) if junction_clients else None
+    cache_principal(revocation_key, user, junction_clients, resolved=True)
+
+
 # Role tiers (Run 7), per the documented permission matrix in
 # docs/user-guide/10-roles-permissions.md. Canonical definitions live in
 # backend/orm/user.py and are imported here (and by the CRUD layer and
@@ -0,0 +1,171 @@
+"""
+Authenticated principal cache
+
+get_current_user answers the same questions for every request carrying the
+same token: is it revoked (TOKEN_BLACKLIST), who is it (USER by username),
+and, for scoped roles, which clients is it assigned (USER_CLIENT_ASSIGNMENT).
+A Principal snapshot of those answers is kept in the KPICache for
+AUTH_PRINCIPAL_CACHE_TTL seconds, keyed by the token's revocation key.
+
+- A cache hit skips the blacklist query and asks RevocationIndex instead: an
+  in-process copy of TOKEN_BLACKLIST, reloaded every
+  AUTH_REVOCATION_REFRESH_SECONDS and updated at once by blacklist_token in
+  this process. TOKEN_BLACKLIST stays authoritative; misses still query it.
+- The same reload takes every account's access fields (is_active, role,
+  client_id_assigned, active client assignments). A cached principal that no
+  longer matches them is discarded, so deactivating or re-scoping a user on
+  another worker applies within AUTH_REVOCATION_REFRESH_SECONDS, not the TTL.
+- Entries are tagged "user": a commit touching USER or USER_CLIENT_ASSIGNMENT
+  evicts them through the session hooks in this process at once, and logout
+  drops the token's entry.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Set
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from backend.cache import get_cache
+from backend.cache.kpi_cache import CacheTag
+from backend.config import settings
+from backend.orm.token_blacklist import TokenBlacklist
+from backend.orm.user import User
+from backend.orm.user_client_assignment import UserClientAssignment
+
+PRINCIPAL_PREFIX = "principal"
+
+# Evicted by commits to USER and USER_CLIENT_ASSIGNMENT (see session_hooks._TABLE_ENTITIES)
+_PRINCIPAL_TAGS = (CacheTag("user"),)
+
+# USER columns that decide what a token may do; compared by RevocationIndex
+_ACCESS_COLUMNS = ("is_active", "role", "client_id_assigned")
+
+
+@dataclass(frozen=True)
+class Principal:
+    """What get_current_user resolved for one token."""
+
+    username: str
+    user_values: Dict[str, Any]  # USER column values
+    # Active USER_CLIENT_ASSIGNMENT client ids; None when there are none or
+    # the role sees every client (not looked up)
+    junction_clients: Optional[tuple[str, ...]]
+    junction_resolved: bool
+
+
+def principal_key(revocation_key: str) -> str:
+    """KPICache key of the principal cached for a token."""
+    return f"{PRINCIPAL_PREFIX}:{revocation_key}"
+
+
+def get_principal(revocation_key: str) -> Optional[Principal]:
+    """Cached principal for a token, if any."""
+    principal = get_cache().get(principal_key(revocation_key))
+    return principal if isinstance(principal, Principal) else None
+
+
+def cache_principal(revocation_key: str, user: User, junction_clients: Optional[list[str]], resolved: bool) -> None:
+    """Snapshot a freshly loaded user (and its client assignments) for this token."""
+    values = {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+    principal = Principal(
+        username=user.username,
+        user_values=values,
+        junction_clients=tuple(junction_clients) if junction_clients else None,
+        junction_resolved=resolved,
+    )
+    get_cache().set(
+        principal_key(revocation_key), principal, ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL, tags=_PRINCIPAL_TAGS
+    )
+
+
+def drop_principal(revocation_key: str) -> None:
+    """Forget the principal cached for a token (logout)."""
+    get_cache().delete(principal_key(revocation_key))
+
+
+def attach_principal(db: Session, principal: Principal) -> User:
+    """A persistent User in `db` built from the snapshot, without a SELECT."""
+    user: User = inspect(User).class_manager.new_instance()
+    for key, value in principal.user_values.items():
+        set_committed_value(user, key, value)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+class RevocationIndex:
+    """In-process set of revoked token keys mirroring TOKEN_BLACKLIST, plus
+    every user's access fields for checking cached principals."""
+
+    def __init__(self, refresh_seconds: float) -> None:
+        self._refresh_seconds = refresh_seconds
+        self._keys: Set[str] = set()
+        self._added: Dict[str, float] = {}  # key -> monotonic time of a local add()
+        self._access: Dict[str, tuple] = {}  # user_id -> _ACCESS_COLUMNS values
+        self._assignments: Dict[str, frozenset] = {}  # user_id -> active assigned client ids
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def add(self, revocation_key: str) -> None:
+        """Record a revocation this process just committed."""
+        with self._lock:
+            self._keys.add(revocation_key)
+            self._added[revocation_key] = time.monotonic()
+
+    def is_revoked(self, db: Session, revocation_key: str) -> bool:
+        """Membership test, reloading from TOKEN_BLACKLIST when the copy is stale."""
+        self._refresh_if_stale(db)
+        return revocation_key in self._keys
+
+    def is_current(self, db: Session, principal: Principal) -> bool:
+        """Whether a cached principal still matches its user's access fields
+        (reloaded like the revocations). False for a deleted user."""
+        self._refresh_if_stale(db)
+        user_id = principal.user_values.get("user_id")
+        with self._lock:
+            access = self._access.get(user_id) if isinstance(user_id, str) else None
+            assigned = self._assignments.get(user_id, frozenset()) if isinstance(user_id, str) else frozenset()
+        if access is None or access != tuple(principal.user_values.get(c) for c in _ACCESS_COLUMNS):
+            return False
+        return not principal.junction_resolved or assigned == frozenset(principal.junction_clients or ())
+
+    def refresh(self, db: Session) -> None:
+        """Reload the unexpired revocations and every user's access fields."""
+        started = time.monotonic()
+        now_naive = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+        keys = {jti for (jti,) in db.query(TokenBlacklist.jti).filter(TokenBlacklist.expires_at >= now_naive)}
+        access = {
+            row[0]: tuple(row[1:]) for row in db.query(User.user_id, *(getattr(User, c) for c in _ACCESS_COLUMNS))
+        }
+        assigned: Dict[str, Set[str]] = {}
+        for user_id, client_id in db.query(UserClientAssignment.user_id, UserClientAssignment.client_id).filter(
+            UserClientAssignment.is_active.is_(True)
+        ):
+            assigned.setdefault(user_id, set()).add(client_id)
+        with self._lock:
+            # Keys added while the query ran may have committed after its snapshot
+            self._added = {key: at for key, at in self._added.items() if at >= started}
+            self._keys = keys | set(self._added)
+            self._access = access
+            self._assignments = {user_id: frozenset(clients) for user_id, clients in assigned.items()}
+            self._loaded_at = started
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys = set()
+            self._added = {}
+            self._access = {}
+            self._assignments = {}
+            self._loaded_at = None
+
+    def _refresh_if_stale(self, db: Session) -> None:
+        loaded_at = self._loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at >= self._refresh_seconds:
+            self.refresh(db)
+
+
+revocation_index = RevocationIndex(settings.AUTH_REVOCATION_REFRESH_SECONDS)
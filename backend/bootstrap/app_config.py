@@ -1,14 +1,14 @@
 """Middleware wiring and global exception handlers."""
 
 import logging
-from typing import Awaitable, Callable
+from urllib.parse import urlparse, urlunparse
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import SQLAlchemyError
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from backend.audit.capture import register_audit_listener
 from backend.config import settings
@@ -19,6 +19,7 @@ from backend.exceptions.domain_exceptions import (
 )
 from backend.middleware.audit_actor_context import AuditActorContextMiddleware
 from backend.middleware.audit_log import AuditLogMiddleware
+from backend.middleware.compression import CompressionMiddleware
 from backend.middleware.rate_limit import configure_rate_limiting
 from backend.middleware.security_headers import SecurityHeadersMiddleware
 
@@ -30,7 +31,7 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
-class APIVersionMiddleware(BaseHTTPMiddleware):
+class APIVersionMiddleware:
     """
     Rewrites /api/v1/... paths to /api/... so that versioned requests
     are handled by the existing route handlers without any route changes.
@@ -46,38 +47,54 @@ class APIVersionMiddleware(BaseHTTPMiddleware):
     the browser's Authorization header → spurious 401 → forced logout.
     Rewriting the Location to (a) re-include /v1 and (b) be relative
     (path-only) keeps the redirect same-origin and authenticated.
+
+    Plain ASGI: the rewrite happens on a copy of the scope and the
+    Location fix on the http.response.start message, so streamed bodies
+    pass through unbuffered.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-        path = request.scope["path"]
-        original_was_v1 = path.startswith("/api/v1/") or path == "/api/v1"
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
         if path.startswith("/api/v1/"):
             # Strip the /v1 segment: "/api/v1/foo" -> "/api/foo"
-            request.scope["path"] = "/api/" + path[8:]
+            scope = dict(scope, path="/api/" + path[8:])
         elif path == "/api/v1":
-            request.scope["path"] = "/api"
-        response = await call_next(request)
-
-        if original_was_v1 and response.status_code in (301, 302, 307, 308):
-            loc = response.headers.get("location")
-            if loc:
-                from urllib.parse import urlparse, urlunparse
-
-                parsed = urlparse(loc)
-                new_path = parsed.path
-                # Re-add the /v1 segment if FastAPI emitted /api/... .
-                if new_path.startswith("/api/") and not new_path.startswith("/api/v1/"):
-                    new_path = "/api/v1/" + new_path[len("/api/") :]
-                elif new_path == "/api":
-                    new_path = "/api/v1"
-                # Drop scheme+netloc so the redirect stays relative —
-                # browser keeps the original origin and the Vite proxy
-                # (or nginx in prod) handles the next hop with auth
-                # headers intact.
-                response.headers["location"] = urlunparse(
-                    ("", "", new_path, parsed.params, parsed.query, parsed.fragment)
-                )
-        return response
+            scope = dict(scope, path="/api")
+        else:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_location(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] in (301, 302, 307, 308):
+                headers = MutableHeaders(scope=message)
+                loc = headers.get("location")
+                if loc:
+                    headers["location"] = _v1_relative_location(loc)
+            await send(message)
+
+        await self.app(scope, receive, send_with_location)
+
+
+def _v1_relative_location(loc: str) -> str:
+    parsed = urlparse(loc)
+    new_path = parsed.path
+    # Re-add the /v1 segment if FastAPI emitted /api/... .
+    if new_path.startswith("/api/") and not new_path.startswith("/api/v1/"):
+        new_path = "/api/v1/" + new_path[len("/api/") :]
+    elif new_path == "/api":
+        new_path = "/api/v1"
+    # Drop scheme+netloc so the redirect stays relative —
+    # browser keeps the original origin and the Vite proxy
+    # (or nginx in prod) handles the next hop with auth
+    # headers intact.
+    return urlunparse(("", "", new_path, parsed.params, parsed.query, parsed.fragment))
 
 
 def configure_middleware(app: FastAPI) -> None:
@@ -112,6 +129,16 @@ def configure_middleware(app: FastAPI) -> None:
     # in this repo before assuming a DetachedInstanceError here is unrelated.
     register_audit_listener()
 
+    # Response compression (gzip, or brotli when installed) — added first so it
+    # is the innermost layer and compresses exactly what the routes and
+    # exception handlers produced; the header-only layers outside it don't care.
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
     # Security headers middleware (SEC-010)
     app.add_middleware(SecurityHeadersMiddleware)
 
@@ -142,10 +169,10 @@ def configure_middleware(app: FastAPI) -> None:
     # Audit actor-context seed — added LAST so it is the true OUTERMOST
     # layer (runs first on the way in, last on the way out), ahead of every
     # other middleware above. It must seed backend.audit.context's holder
-    # before ANY of them calls call_next() -- SecurityHeaders, RateLimit,
-    # AuditLog and APIVersion are all BaseHTTPMiddleware, and each one's
-    # call_next forks the asyncio context (as does FastAPI's own dependency
-    # resolution, further in). A fork that happens before the seed would
+    # before anything downstream forks the asyncio context -- FastAPI's own
+    # dependency resolution does (threadpool dependencies), and so would any
+    # BaseHTTPMiddleware added later (the ones above are all plain ASGI now,
+    # partly for this reason). A fork that happens before the seed would
     # carry no reference to the holder at all. See
     # backend/middleware/audit_actor_context.py and
     # backend/audit/context.py (_ActorHolder) for the full mechanism.
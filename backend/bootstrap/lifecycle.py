@@ -8,8 +8,10 @@ from fastapi import FastAPI
 
 from backend.database import engine
 from backend.db.migrate import SchemaRebuildError
-from backend.events import register_all_handlers, get_event_bus
-from backend.orm.event_store import create_event_persistence_handler
+from backend.events import register_all_handlers, get_event_bus, setup_session_hooks
+from backend.events.outbox import start_event_outbox, stop_event_outbox
+from backend.pivot.rollup import stop_rollup_refresher
+from backend.services.alert_refresh import stop_alert_refresher
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +38,15 @@ try:
 except ImportError:
     pass
 
+# Nightly pivot rollup reconcile. Same import-shield pattern.
+pivot_rollup_scheduler: Optional[Any] = None
+try:
+    from backend.tasks.pivot_rollup_reconcile import scheduler as _imported_rollup_scheduler
+
+    pivot_rollup_scheduler = _imported_rollup_scheduler
+except ImportError:
+    pass
+
 
 # Server-wide advisory locks used to serialize once-only startup work across the
 # 4 gunicorn workers on MariaDB/MySQL (SQLite is single-process — no lock).
@@ -234,25 +245,47 @@ def run_startup_migrations() -> None:
 
 
 def init_event_infrastructure() -> None:
-    """Register domain-event handlers + wire persistence."""
+    """Register domain-event handlers, wire persistence (the batching EVENT_STORE
+    outbox) + commit/rollback session hooks (events, cache invalidation, pivot
+    rollup maintenance, background alert refresh)."""
+    from backend.config import settings
     from backend.database import SessionLocal
+    from backend.pivot.rollup import setup_rollup_hooks, start_rollup_refresher
+    from backend.services.alert_refresh import setup_alert_refresh_hooks, start_alert_refresher
 
     register_all_handlers()
     event_bus = get_event_bus()
-    event_bus.set_persistence_handler(create_event_persistence_handler(SessionLocal))
+    event_bus.set_persistence_handler(start_event_outbox(SessionLocal).enqueue)
+    # Rollup before session hooks: after_commit listeners run in registration
+    # order, so a change is marked as refreshing (read live until the
+    # background refresher applies it) before the cache entries built from the
+    # rollup are evicted.
+    if settings.PIVOT_ROLLUP_ENABLED:
+        start_rollup_refresher()
+        setup_rollup_hooks(SessionLocal)
+    setup_session_hooks(SessionLocal)
+    if settings.ALERT_COMMIT_REFRESH_ENABLED:
+        start_alert_refresher(SessionLocal)
+        setup_alert_refresh_hooks(SessionLocal)
     logger.info("Domain events infrastructure initialized")
 
 
 def start_schedulers() -> None:
-    """Start the report + dual-view schedulers (each None-guarded AND isolated:
-    one scheduler's start failure must not skip the other — matches the original's
-    two separate try/excepts)."""
+    """Start the report, dual-view and pivot-rollup schedulers (each None-guarded
+    AND isolated: one scheduler's start failure must not skip the others — matches
+    the original's separate try/excepts)."""
     run_best_effort("report scheduler start", lambda: report_scheduler.start() if report_scheduler else None)
     run_best_effort("dual-view scheduler start", lambda: dual_view_scheduler.start() if dual_view_scheduler else None)
+    run_best_effort(
+        "pivot rollup scheduler start", lambda: pivot_rollup_scheduler.start() if pivot_rollup_scheduler else None
+    )
 
 
 def stop_schedulers() -> None:
-    """Stop the dual-view then report schedulers (each None-guarded AND isolated)."""
+    """Stop the pivot-rollup, dual-view then report schedulers (each None-guarded AND isolated)."""
+    run_best_effort(
+        "pivot rollup scheduler stop", lambda: pivot_rollup_scheduler.stop() if pivot_rollup_scheduler else None
+    )
     run_best_effort("dual-view scheduler stop", lambda: dual_view_scheduler.stop() if dual_view_scheduler else None)
     run_best_effort("report scheduler stop", lambda: report_scheduler.stop() if report_scheduler else None)
 
@@ -303,4 +336,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     # SHUTDOWN — all best-effort
     stop_schedulers()
+    # Queued EVENT_STORE rows are written before the pool goes away
+    run_best_effort("event outbox flush", stop_event_outbox)
+    run_best_effort("pivot rollup refresh flush", stop_rollup_refresher)
+    run_best_effort("alert refresh flush", stop_alert_refresher)
     run_best_effort("engine dispose", dispose_engine)
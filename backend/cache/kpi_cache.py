@@ -7,13 +7,51 @@ Simple dict-based cache with TTL (no Redis for now).
 Used for caching dashboard summaries, trend calculations, and client config lookups.
 """
 
-from typing import Optional, Any, Dict, Callable
-from datetime import datetime, timedelta, timezone
-from dataclasses import dataclass
+from typing import Optional, Any, Dict, Callable, Iterable, NamedTuple, Tuple
+from collections import OrderedDict, defaultdict
+from datetime import date, datetime, timedelta, timezone
+from dataclasses import dataclass, field
+import random
+import sys
 import threading
 import hashlib
 import json
 
+from backend.config import settings
+
+# Containers nested deeper than this are counted by their shallow size only.
+_SIZE_MAX_DEPTH = 4
+
+# Distinguishes "not cached" from a cached None inside get_or_set.
+_MISSING = object()
+
+
+class CacheTag(NamedTuple):
+    """
+    What a cached value was derived from, for event-driven invalidation.
+
+    ``client_id`` None means the value spans every client; ``start``/``end``
+    None leave that side of the date range open. A change to ``entity`` for
+    client C on day D evicts every entry with a tag that covers (C, D).
+    """
+
+    entity: str
+    client_id: Optional[str] = None
+    start: Optional[date] = None
+    end: Optional[date] = None
+
+    def covers(self, client_id: Optional[str], day: Optional[date]) -> bool:
+        """True when a change for (client_id, day) may affect the tagged value.
+
+        A None client_id or day on the change side means "unknown" and
+        matches everything on that axis.
+        """
+        if client_id is not None and self.client_id is not None and client_id != self.client_id:
+            return False
+        if day is None:
+            return True
+        return (self.start is None or self.start <= day) and (self.end is None or day <= self.end)
+
 
 @dataclass
 class CacheEntry:
@@ -22,6 +60,48 @@ class CacheEntry:
     value: Any
     expiry: datetime
     created_at: datetime
+    size: int = 0
+    # Past expiry but before this, get_or_set may still serve the value
+    # while one caller recomputes it. Defaults to expiry (no stale window).
+    stale_until: Optional[datetime] = None
+    tags: Tuple[CacheTag, ...] = ()
+
+
+@dataclass
+class _Flight:
+    """One in-progress get_or_set computation that other callers wait on."""
+
+    done: threading.Event = field(default_factory=threading.Event)
+    owner: int = field(default_factory=threading.get_ident)
+    value: Any = None
+    error: Optional[BaseException] = None
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """
+    Rough deep size of a cached value in bytes.
+
+    Recurses into dicts, lists, tuples and sets (and objects exposing a
+    ``__dict__``, which covers dataclasses and Pydantic models) down to
+    ``_SIZE_MAX_DEPTH`` levels. Shared references are counted each time they
+    appear, so this errs on the high side -- good enough for a budget, not an
+    exact measurement.
+    """
+    size = sys.getsizeof(value)
+    if _depth >= _SIZE_MAX_DEPTH:
+        return size
+    if isinstance(value, dict):
+        return size + sum(estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(item, _depth + 1) for item in value)
+    if hasattr(value, "__dict__") and not isinstance(value, type):
+        return size + estimate_size(vars(value), _depth + 1)
+    return size
+
+
+def key_prefix(key: str) -> str:
+    """Statistics bucket for a key: everything before the first ":"."""
+    return key.split(":", 1)[0]
 
 
 class KPICache:
@@ -30,9 +110,17 @@ class KPICache:
 
     Features:
     - TTL-based expiration
+    - Bounded size with O(1) least-recently-used eviction
+    - Optional byte budget (per-entry size estimated on set)
+    - Single-flight get_or_set: one caller computes a missing key, concurrent
+      callers wait for its result instead of recomputing
+    - Optional stale-while-revalidate window and TTL jitter
+    - None/falsy values are cached like any other value
+    - Tag-based invalidation: entries tagged with CacheTag(entity, client,
+      date range) are evicted by invalidate_tags() when that data changes
+      (in this process only; other workers rely on the TTL)
     - Thread-safe operations
-    - Automatic cleanup on access
-    - Cache statistics
+    - Cache statistics, overall and per key prefix
 
     Usage:
         cache = KPICache(ttl_seconds=300)
@@ -40,19 +128,62 @@ class KPICache:
         data = cache.get("dashboard:client123")
     """
 
-    def __init__(self, ttl_seconds: int = 300, max_entries: int = 1000):
+    def __init__(
+        self,
+        ttl_seconds: int = 300,
+        max_entries: int = 1000,
+        max_bytes: Optional[int] = None,
+        stale_seconds: int = 0,
+        ttl_jitter: float = 0.0,
+        flight_wait_seconds: float = 30.0,
+    ):
         """
         Initialize the cache.
 
         Args:
             ttl_seconds: Default time-to-live in seconds (default: 5 minutes)
-            max_entries: Maximum number of entries before cleanup (default: 1000)
+            max_entries: Maximum number of entries; the least recently used
+                entry is evicted beyond this (default: 1000)
+            max_bytes: Optional budget for the estimated size of all cached
+                values; least recently used entries are evicted beyond it.
+                None disables size accounting.
+            stale_seconds: How long past expiry get_or_set may keep serving
+                the old value while a single caller refreshes it (default: 0)
+            ttl_jitter: Fraction by which each entry's TTL is randomly
+                shortened or lengthened (0.1 = +/-10%), so keys written
+                together do not all expire on the same request (default: 0)
+            flight_wait_seconds: How long a get_or_set caller waits for another
+                caller's computation of the same key before computing it
+                itself (default: 30)
         """
-        self._cache: Dict[str, CacheEntry] = {}
+        # Ordered oldest -> newest use; get() and set() move a key to the end.
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self._ttl = timedelta(seconds=ttl_seconds)
         self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._stale = timedelta(seconds=stale_seconds)
+        self._ttl_jitter = ttl_jitter
+        self._flight_wait = flight_wait_seconds
         self._lock = threading.RLock()
-        self._stats = {"hits": 0, "misses": 0, "sets": 0, "evictions": 0}
+        self._inflight: Dict[str, _Flight] = {}
+        # entity -> keys carrying a tag for it; entity -> invalidation count
+        # (lets an in-flight get_or_set notice it computed from stale data).
+        self._tag_index: Dict[str, set] = defaultdict(set)
+        self._tag_generation: Dict[str, int] = defaultdict(int)
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "stale_hits": 0,
+            "coalesced": 0,
+            "flight_timeouts": 0,
+        }
+        self._prefix_stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"entries": 0, "hits": 0, "misses": 0, "sets": 0, "evictions": 0}
+        )
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -62,41 +193,94 @@ class KPICache:
             key: Cache key
 
         Returns:
-            Cached value if found and not expired, None otherwise
+            Cached value if found and not expired, None otherwise (use
+            get_or_set to tell a cached None apart from a miss)
         """
         with self._lock:
-            if key in self._cache:
-                entry = self._cache[key]
-                if datetime.now(tz=timezone.utc) < entry.expiry:
-                    self._stats["hits"] += 1
-                    return entry.value
-                else:
-                    # Expired - remove it
-                    del self._cache[key]
-                    self._stats["evictions"] += 1
-
-            self._stats["misses"] += 1
-            return None
-
-    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+            value, _ = self._lookup(key, allow_stale=False)
+            return None if value is _MISSING else value
+
+    def _lookup(self, key: str, allow_stale: bool) -> Tuple[Any, bool]:
+        """
+        Return (value, is_stale), or (_MISSING, False) on a miss.
+
+        An entry past its expiry but inside its stale window is kept (so a
+        later get_or_set can still serve it) and only returned when
+        allow_stale is set; past the window it is removed. Caller holds the
+        lock.
+        """
+        prefix_stats = self._prefix_stats[key_prefix(key)]
+        entry = self._cache.get(key)
+        if entry is not None:
+            now = datetime.now(tz=timezone.utc)
+            if now < entry.expiry:
+                self._cache.move_to_end(key)
+                self._stats["hits"] += 1
+                prefix_stats["hits"] += 1
+                return entry.value, False
+            if entry.stale_until is not None and now < entry.stale_until:
+                if allow_stale:
+                    self._cache.move_to_end(key)
+                    self._stats["stale_hits"] += 1
+                    prefix_stats["hits"] += 1
+                    return entry.value, True
+            else:
+                # Expired - remove it
+                self._remove(key)
+                self._stats["evictions"] += 1
+                self._stats["expirations"] += 1
+                prefix_stats["evictions"] += 1
+
+        self._stats["misses"] += 1
+        prefix_stats["misses"] += 1
+        return _MISSING, False
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[int] = None,
+        stale_seconds: Optional[int] = None,
+        tags: Iterable[CacheTag] = (),
+    ) -> None:
         """
         Set a value in the cache.
 
+        Evicts least recently used entries until the entry count and the
+        optional byte budget both fit. A value whose estimated size alone
+        exceeds the byte budget is not cached.
+
         Args:
             key: Cache key
-            value: Value to cache
+            value: Value to cache (None included)
             ttl_seconds: Optional custom TTL (uses default if not specified)
+            stale_seconds: Optional custom stale-while-revalidate window
+            tags: What the value was derived from (see invalidate_tags)
         """
+        tags = tuple(tags)
+        size = estimate_size(value) if self._max_bytes is not None else 0
         with self._lock:
-            # Cleanup if we're at capacity
-            if len(self._cache) >= self._max_entries:
-                self._cleanup_expired()
+            self._remove(key)
+            if self._max_bytes is not None and size > self._max_bytes:
+                return
 
             ttl = timedelta(seconds=ttl_seconds) if ttl_seconds else self._ttl
+            if self._ttl_jitter:
+                ttl *= random.uniform(1 - self._ttl_jitter, 1 + self._ttl_jitter)  # nosec B311 - not security
+            stale = timedelta(seconds=stale_seconds) if stale_seconds is not None else self._stale
             now = datetime.now(tz=timezone.utc)
 
-            self._cache[key] = CacheEntry(value=value, expiry=now + ttl, created_at=now)
+            self._cache[key] = CacheEntry(
+                value=value, expiry=now + ttl, created_at=now, size=size, stale_until=now + ttl + stale, tags=tags
+            )
+            for tag in tags:
+                self._tag_index[tag.entity].add(key)
+            self._bytes += size
+            prefix_stats = self._prefix_stats[key_prefix(key)]
+            prefix_stats["entries"] += 1
+            prefix_stats["sets"] += 1
             self._stats["sets"] += 1
+            self._evict_to_fit()
 
     def delete(self, key: str) -> bool:
         """
@@ -109,10 +293,7 @@ class KPICache:
             True if key was deleted, False if not found
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                return True
-            return False
+            return self._remove(key) is not None
 
     def invalidate_pattern(self, pattern: str) -> int:
         """
@@ -127,20 +308,74 @@ class KPICache:
         with self._lock:
             keys_to_delete = [key for key in self._cache.keys() if key.startswith(pattern)]
             for key in keys_to_delete:
-                del self._cache[key]
+                self._remove(key)
                 self._stats["evictions"] += 1
+                self._prefix_stats[key_prefix(key)]["evictions"] += 1
             return len(keys_to_delete)
 
-    def get_or_set(self, key: str, factory: Callable[[], Any], ttl_seconds: Optional[int] = None) -> Any:
+    def invalidate_tags(self, entity: str, client_id: Optional[str] = None, day: Optional[date] = None) -> int:
+        """
+        Evict every entry tagged as derived from ``entity`` data that a change
+        for (client_id, day) may have affected.
+
+        Args:
+            entity: Changed entity (e.g. "production", "quality")
+            client_id: Client whose data changed (None = unknown/all)
+            day: Date the changed row belongs to (None = unknown/all dates)
+
+        Returns:
+            Number of keys invalidated
+        """
+        with self._lock:
+            self._tag_generation[entity] += 1
+            keys = [
+                key
+                for key in self._tag_index.get(entity, ())
+                if any(tag.entity == entity and tag.covers(client_id, day) for tag in self._cache[key].tags)
+            ]
+            for key in keys:
+                self._remove(key)
+                self._stats["evictions"] += 1
+                self._prefix_stats[key_prefix(key)]["evictions"] += 1
+            return len(keys)
+
+    def get_or_set(
+        self,
+        key: str,
+        factory: Callable[[], Any],
+        ttl_seconds: Optional[int] = None,
+        stale_seconds: Optional[int] = None,
+        tags: Iterable[CacheTag] = (),
+        wait_seconds: Optional[float] = None,
+    ) -> Any:
         """
         Get a value from cache, or compute and cache it if not found.
 
         This is the preferred method for caching expensive operations.
 
+        Single-flight: when the key is missing, exactly one caller runs
+        ``factory``; concurrent callers for the same key block until it
+        finishes and receive its result (or re-raise its exception, which
+        is not cached). When the entry is merely stale (inside its
+        stale-while-revalidate window) the first caller recomputes it while
+        everyone else is served the stale value without waiting. Results of
+        None or other falsy values are cached too. If one of ``tags`` is
+        invalidated while the factory runs, the result is returned but not
+        cached, since it may predate the change.
+
+        A waiting caller gives up after ``wait_seconds`` and runs ``factory``
+        itself (uncached), so a hung computation cannot stall every request
+        for the key. A factory that asks for its own key from inside itself
+        computes it directly instead of waiting on itself.
+
         Args:
             key: Cache key
             factory: Function to call if value not in cache
             ttl_seconds: Optional custom TTL
+            stale_seconds: Optional custom stale-while-revalidate window
+            tags: What the value is derived from (see invalidate_tags)
+            wait_seconds: How long to wait for another caller computing the
+                same key (default: the cache's flight_wait_seconds)
 
         Returns:
             Cached or newly computed value
@@ -156,14 +391,47 @@ class KPICache:
                 ttl_seconds=300
             )
         """
-        value = self.get(key)
-        if value is not None:
-            return value
-
-        # Compute the value
-        value = factory()
-        self.set(key, value, ttl_seconds)
-        return value
+        tags = tuple(tags)
+        with self._lock:
+            value, stale = self._lookup(key, allow_stale=True)
+            if value is not _MISSING and not stale:
+                return value
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._inflight[key] = _Flight()
+            elif value is not _MISSING:
+                # Someone is already refreshing this stale entry.
+                return value
+            elif flight.owner != threading.get_ident():
+                self._stats["coalesced"] += 1
+            generations = [self._tag_generation[tag.entity] for tag in tags]
+
+        if not leader:
+            if flight.owner == threading.get_ident():
+                # Re-entered from this key's own factory: waiting would deadlock
+                return factory()
+            if not flight.done.wait(self._flight_wait if wait_seconds is None else wait_seconds):
+                with self._lock:
+                    self._stats["flight_timeouts"] += 1
+                return factory()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = factory()
+            with self._lock:
+                if generations == [self._tag_generation[tag.entity] for tag in tags]:
+                    self.set(key, flight.value, ttl_seconds, stale_seconds, tags)
+            return flight.value
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
 
     def clear(self) -> int:
         """
@@ -175,6 +443,10 @@ class KPICache:
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
+            self._tag_index.clear()
+            self._bytes = 0
+            for prefix_stats in self._prefix_stats.values():
+                prefix_stats["entries"] = 0
             return count
 
     def get_stats(self) -> Dict[str, Any]:
@@ -182,7 +454,8 @@ class KPICache:
         Get cache statistics.
 
         Returns:
-            Dictionary with hit rate, entry count, etc.
+            Dictionary with hit rate, entry count, size and LRU limits, plus a
+            ``prefixes`` breakdown keyed by the part of each key before ":"
         """
         with self._lock:
             total_requests = self._stats["hits"] + self._stats["misses"]
@@ -195,23 +468,57 @@ class KPICache:
                 "hit_rate": round(hit_rate, 2),
                 "sets": self._stats["sets"],
                 "evictions": self._stats["evictions"],
+                "expirations": self._stats["expirations"],
+                "stale_hits": self._stats["stale_hits"],
+                "coalesced": self._stats["coalesced"],
+                "flight_timeouts": self._stats["flight_timeouts"],
+                "max_entries": self._max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "prefixes": {prefix: dict(stats) for prefix, stats in sorted(self._prefix_stats.items())},
             }
 
+    def _remove(self, key: str) -> Optional[CacheEntry]:
+        """Drop a key and its size/prefix accounting. Caller holds the lock."""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+            self._prefix_stats[key_prefix(key)]["entries"] -= 1
+            for tag in entry.tags:
+                self._tag_index[tag.entity].discard(key)
+        return entry
+
+    def _evict_to_fit(self) -> None:
+        """Pop least recently used entries until both limits hold. Caller holds the lock."""
+        while self._cache and (
+            len(self._cache) > self._max_entries or (self._max_bytes is not None and self._bytes > self._max_bytes)
+        ):
+            key = next(iter(self._cache))
+            self._remove(key)
+            self._stats["evictions"] += 1
+            self._prefix_stats[key_prefix(key)]["evictions"] += 1
+
     def _cleanup_expired(self) -> int:
         """
         Remove all expired entries.
 
+        Not needed for bounding the cache (LRU eviction does that); kept for
+        callers that want to reclaim expired entries eagerly.
+
         Returns:
             Number of entries removed
         """
-        now = datetime.now(tz=timezone.utc)
-        expired_keys = [key for key, entry in self._cache.items() if now >= entry.expiry]
+        with self._lock:
+            now = datetime.now(tz=timezone.utc)
+            expired_keys = [key for key, entry in self._cache.items() if now >= entry.expiry]
 
-        for key in expired_keys:
-            del self._cache[key]
-            self._stats["evictions"] += 1
+            for key in expired_keys:
+                self._remove(key)
+                self._stats["evictions"] += 1
+                self._stats["expirations"] += 1
+                self._prefix_stats[key_prefix(key)]["evictions"] += 1
 
-        return len(expired_keys)
+            return len(expired_keys)
 
 
 # =============================================================================
@@ -294,7 +601,14 @@ def get_cache(ttl_seconds: int = 300) -> KPICache:
     if _global_cache is None:
         with _cache_lock:
             if _global_cache is None:
-                _global_cache = KPICache(ttl_seconds=ttl_seconds)
+                _global_cache = KPICache(
+                    ttl_seconds=ttl_seconds,
+                    max_entries=settings.CACHE_MAX_ENTRIES,
+                    max_bytes=settings.CACHE_MAX_BYTES or None,
+                    stale_seconds=settings.CACHE_STALE_SECONDS,
+                    ttl_jitter=settings.CACHE_TTL_JITTER,
+                    flight_wait_seconds=settings.CACHE_FLIGHT_WAIT_SECONDS,
+                )
 
     return _global_cache
 
@@ -9,18 +9,26 @@ TRUE-OTD% = (COMPLETE Orders Delivered On Time / Total COMPLETE Orders) * 100
 
 Date Inference Chain (per specification):
 planned_ship_date → required_date → (planned_start + cycle_time × qty)
+
+TRUE-OTD, standard OTD, the trend and the by-product view all read one
+column-only WorkOrder scan (_fetch_otd_rows) and classify TRUE and standard
+OTD in the same pass (_tally_delivered).
 """
 
+from bisect import bisect_right
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from datetime import date, datetime, timedelta
+from sqlalchemy import func, and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
-from typing import Any, Optional, Dict, List, Sequence
+from typing import Any, Optional, Dict, List, Sequence, Union
 from dataclasses import dataclass
 
 from backend.orm.delay_taxonomy import DelayClassificationEnum
 from backend.orm.production_entry import ProductionEntry
 from backend.orm.work_order import WorkOrder, WorkOrderStatus
+from backend.db.sql_functions import date_window
 
 # =============================================================================
 # OTD Date Inference Chain (Audit Requirement)
@@ -37,7 +45,12 @@ class InferredDate:
     confidence_score: float  # 1.0 for actual, 0.8 for required_date, 0.5 for calculated
 
 
-def infer_planned_delivery_date(work_order: WorkOrder) -> InferredDate:
+# A WorkOrder entity or a row of _OTD_COLUMNS: the inference chain and is_late
+# only read columns, so both accept either.
+OTDRecord = Union[WorkOrder, "Row[Any]"]
+
+
+def infer_planned_delivery_date(work_order: OTDRecord) -> InferredDate:
     """
     Infer the planned delivery date using the specification fallback chain:
     planned_ship_date → required_date → (planned_start + cycle_time × qty)
@@ -45,7 +58,7 @@ def infer_planned_delivery_date(work_order: WorkOrder) -> InferredDate:
     This implements the OTD Date Inference Chain per audit requirement.
 
     Args:
-        work_order: WorkOrder object with date and cycle time fields
+        work_order: WorkOrder (or _OTD_COLUMNS row) with date and cycle time fields
 
     Returns:
         InferredDate with the resolved date and inference metadata
@@ -91,7 +104,7 @@ def infer_planned_delivery_date(work_order: WorkOrder) -> InferredDate:
     return InferredDate(date=None, is_inferred=False, inference_source="none", confidence_score=0.0)
 
 
-def is_late(work_order: WorkOrder, as_of: date) -> bool:
+def is_late(work_order: OTDRecord, as_of: date) -> bool:
     """THE single lateness definition (spec §4) — gates classification
     eligibility (API + UI) and feeds the gross/net OTD metrics. Do not
     introduce a second definition anywhere.
@@ -108,6 +121,19 @@ def is_late(work_order: WorkOrder, as_of: date) -> bool:
     return inferred.date < datetime.combine(as_of, datetime.min.time())
 
 
+def planned_date_floor() -> ColumnElement[Any]:
+    """SQL lower bound of the inferred planned date:
+    COALESCE(planned_ship_date, required_date, planned_start_date).
+
+    Equal to the inferred date for the first two links of the chain; for the
+    calculated link the inferred date is planned_start + at least one day, so
+    it is strictly later. NULL exactly when inference yields "none". Used to
+    prune undelivered orders in SQL (`floor < as_of` is necessary for is_late)
+    while is_late keeps the final say.
+    """
+    return func.coalesce(WorkOrder.planned_ship_date, WorkOrder.required_date, WorkOrder.planned_start_date)
+
+
 def calculate_otd(
     db: Session, start_date: date, end_date: date, product_id: Optional[int] = None
 ) -> tuple[Decimal, int, int]:
@@ -282,6 +308,95 @@ def identify_late_orders(
 # P3-001: TRUE-OTD vs Standard OTD Calculation
 # =============================================================================
 
+# Every column the inference chain, is_late and the classifiers read.
+_OTD_COLUMNS = (
+    WorkOrder.status,
+    WorkOrder.style_model,
+    WorkOrder.planned_quantity,
+    WorkOrder.planned_start_date,
+    WorkOrder.planned_ship_date,
+    WorkOrder.required_date,
+    WorkOrder.actual_delivery_date,
+    WorkOrder.ideal_cycle_time,
+    WorkOrder.calculated_cycle_time,
+    WorkOrder.delay_classification,
+    WorkOrder.justified_delay_reason,
+)
+
+
+def _fetch_otd_rows(
+    db: Session, client_id: str, start_date: date, end_date: date, late_as_of: Optional[date] = None
+) -> List["Row[Any]"]:
+    """One column-only scan: orders delivered in [start_date, end_date] and,
+    when `late_as_of` is given, the undelivered orders that could be late by
+    then (planned_date_floor() before `late_as_of`)."""
+    delivered = and_(
+        WorkOrder.actual_delivery_date.isnot(None),
+        date_window(WorkOrder.actual_delivery_date, start_date, end_date),
+    )
+    scope = delivered
+    if late_as_of is not None:
+        scope = or_(
+            delivered,
+            and_(
+                WorkOrder.actual_delivery_date.is_(None),
+                planned_date_floor() < datetime.combine(late_as_of, time.min),
+            ),
+        )
+    return list(db.query(*_OTD_COLUMNS).filter(WorkOrder.client_id == client_id, scope).all())
+
+
+@dataclass
+class _OTDTally:
+    """Delivery counters for one OTD basis (TRUE or standard)."""
+
+    rows: int = 0
+    skipped: int = 0  # no inferable planned date -> not in the denominator
+    inferred: int = 0
+    on_time: int = 0
+    early: int = 0  # subset of on_time: more than 1 day before planned
+    late: int = 0
+    justified_late: int = 0  # subset of late with delay_classification == "justified"
+
+    @property
+    def total(self) -> int:
+        return self.rows - self.skipped
+
+    def add(self, row: OTDRecord, inferred: InferredDate) -> None:
+        self.rows += 1
+        actual_delivery = row.actual_delivery_date
+        if inferred.date is None or actual_delivery is None:
+            self.skipped += 1
+            return
+        if inferred.is_inferred:
+            self.inferred += 1
+        if actual_delivery <= inferred.date:
+            self.on_time += 1
+            if (inferred.date - actual_delivery).days > 1:
+                self.early += 1
+        else:
+            self.late += 1
+            if row.delay_classification == DelayClassificationEnum.JUSTIFIED.value:
+                self.justified_late += 1
+
+
+def _tally_delivered(rows: Sequence[OTDRecord]) -> tuple[_OTDTally, _OTDTally]:
+    """Classify delivered orders for TRUE-OTD (COMPLETED only) and standard
+    OTD (any status) in one pass, inferring each planned date once."""
+    true_otd, standard = _OTDTally(), _OTDTally()
+    for row in rows:
+        inferred = infer_planned_delivery_date(row)
+        standard.add(row, inferred)
+        if row.status == WorkOrderStatus.COMPLETED:
+            true_otd.add(row, inferred)
+    return true_otd, standard
+
+
+def _percentage(count: int, total: int) -> Decimal:
+    if total > 0:
+        return (Decimal(str(count)) / Decimal(str(total))) * 100
+    return Decimal("0")
+
 
 def calculate_true_otd(db: Session, client_id: str, start_date: date, end_date: date) -> Dict:
     """
@@ -307,166 +422,39 @@ def calculate_true_otd(db: Session, client_id: str, start_date: date, end_date:
     Returns:
         Dict with both TRUE-OTD and Standard OTD metrics plus inference metadata
     """
-    # Convert dates to datetime for comparison
-    start_datetime = datetime.combine(start_date, datetime.min.time())
-    end_datetime = datetime.combine(end_date, datetime.max.time())
-
-    # TRUE-OTD: Only COMPLETED orders with actual delivery date
-    # ENHANCED: Removed planned_ship_date requirement - use inference chain
-    complete_orders = (
-        db.query(WorkOrder)
-        .filter(
-            and_(
-                WorkOrder.client_id == client_id,
-                WorkOrder.status == WorkOrderStatus.COMPLETED,
-                WorkOrder.actual_delivery_date.isnot(None),
-                WorkOrder.actual_delivery_date >= start_datetime,
-                WorkOrder.actual_delivery_date <= end_datetime,
-            )
-        )
-        .all()
-    )
-
-    # Calculate TRUE-OTD metrics with inference chain
-    true_otd_on_time = 0
-    true_otd_late = 0
-    true_otd_early = 0
-    true_otd_justified_late = 0  # subset of true_otd_late with delay_classification == "justified"
-    true_otd_inferred_count = 0
-    true_otd_skipped = 0  # Orders without any inferable date
-
-    for wo in complete_orders:
-        # Use inference chain to get planned date
-        inferred = infer_planned_delivery_date(wo)
-
-        if inferred.date is None:
-            # No date could be inferred - skip this order
-            true_otd_skipped += 1
-            continue
-
-        # The query filters on actual_delivery_date.isnot(None), but the
-        # ORM column is Optional from mypy's POV. Skip defensively if null.
-        actual_delivery = wo.actual_delivery_date
-        if actual_delivery is None:
-            true_otd_skipped += 1
-            continue
-
-        if inferred.is_inferred:
-            true_otd_inferred_count += 1
-
-        if actual_delivery <= inferred.date:
-            true_otd_on_time += 1
-            # Check if early (more than 1 day before planned)
-            days_diff = (inferred.date - actual_delivery).days
-            if days_diff > 1:
-                true_otd_early += 1
-        else:
-            true_otd_late += 1
-            if wo.delay_classification == DelayClassificationEnum.JUSTIFIED.value:
-                true_otd_justified_late += 1
-
-    true_otd_total = len(complete_orders) - true_otd_skipped
-    true_otd_pct = Decimal("0")
-    if true_otd_total > 0:
-        true_otd_pct = (Decimal(str(true_otd_on_time)) / Decimal(str(true_otd_total))) * 100
-
+    # One scan covers both bases and the late counts: delivered orders in the
+    # window (TRUE-OTD is the COMPLETED subset) plus undelivered orders whose
+    # planned-date floor is already past end_date.
+    rows = _fetch_otd_rows(db, client_id, start_date, end_date, late_as_of=end_date)
+    delivered = [row for row in rows if row.actual_delivery_date is not None]
+    true_otd, standard = _tally_delivered(delivered)
+
+    true_otd_pct = _percentage(true_otd.on_time, true_otd.total)
+    standard_pct = _percentage(standard.on_time, standard.total)
     # Net-of-justified: late orders classified "justified" count toward the
     # numerator (spec §6). Denominator unchanged.
-    true_otd_net_on_time = true_otd_on_time + true_otd_justified_late
-    true_otd_net_pct = Decimal("0")
-    if true_otd_total > 0:
-        true_otd_net_pct = (Decimal(str(true_otd_net_on_time)) / Decimal(str(true_otd_total))) * 100
-
-    # Standard OTD: All orders with delivery dates (any status)
-    # ENHANCED: Removed planned_ship_date requirement - use inference chain
-    standard_orders = (
-        db.query(WorkOrder)
-        .filter(
-            and_(
-                WorkOrder.client_id == client_id,
-                WorkOrder.actual_delivery_date.isnot(None),
-                WorkOrder.actual_delivery_date >= start_datetime,
-                WorkOrder.actual_delivery_date <= end_datetime,
-            )
-        )
-        .all()
-    )
-
-    standard_on_time = 0
-    standard_justified_late = (
-        0  # subset of (standard_total - standard_on_time) with delay_classification == "justified"
-    )
-    standard_inferred_count = 0
-    standard_skipped = 0
-
-    for wo in standard_orders:
-        inferred = infer_planned_delivery_date(wo)
-
-        if inferred.date is None:
-            standard_skipped += 1
-            continue
-
-        # Same null-defence as the TRUE-OTD loop above.
-        actual_delivery = wo.actual_delivery_date
-        if actual_delivery is None:
-            standard_skipped += 1
-            continue
-
-        if inferred.is_inferred:
-            standard_inferred_count += 1
-
-        if actual_delivery <= inferred.date:
-            standard_on_time += 1
-        elif wo.delay_classification == DelayClassificationEnum.JUSTIFIED.value:
-            standard_justified_late += 1
-
-    standard_total = len(standard_orders) - standard_skipped
-    standard_pct = Decimal("0")
-    if standard_total > 0:
-        standard_pct = (Decimal(str(standard_on_time)) / Decimal(str(standard_total))) * 100
-
-    # Net-of-justified (standard mode) — same formula as true_otd above.
-    standard_net_on_time = standard_on_time + standard_justified_late
-    standard_net_pct = Decimal("0")
-    if standard_total > 0:
-        standard_net_pct = (Decimal(str(standard_net_on_time)) / Decimal(str(standard_total))) * 100
+    true_otd_net_pct = _percentage(true_otd.on_time + true_otd.justified_late, true_otd.total)
+    standard_net_pct = _percentage(standard.on_time + standard.justified_late, standard.total)
 
     # Calculate inference rate
-    total_processed = true_otd_total + standard_total
-    total_inferred = true_otd_inferred_count + standard_inferred_count
+    total_processed = true_otd.total + standard.total
+    total_inferred = true_otd.inferred + standard.inferred
     inference_rate = (total_inferred / total_processed * 100) if total_processed > 0 else 0
 
-    # Late-order counts + justification breakdown (spec §6). Built from:
-    # (a) standard_orders — the superset of delivered orders in scope
-    #     (complete_orders is always a subset: same client/date-range/
-    #     actual_delivery_date-not-null predicate plus a status filter), so
-    #     iterating it once here doesn't double-count the true-otd loop's orders.
-    # (b) undelivered past-due orders, found via a client_id + actual_delivery_date
-    #     IS NULL query only — no date-window predicate on planned dates. Lateness
-    #     is decided in Python by the ONE definition (is_late), per spec §4.
-    undelivered_orders = (
-        db.query(WorkOrder)
-        .filter(
-            and_(
-                WorkOrder.client_id == client_id,
-                WorkOrder.actual_delivery_date.is_(None),
-            )
-        )
-        .all()
-    )
-    late_orders_all = [wo for wo in standard_orders if is_late(wo, end_date)] + [
-        wo for wo in undelivered_orders if is_late(wo, end_date)
-    ]
+    # Late-order counts + justification breakdown (spec §6) over delivered and
+    # undelivered orders alike. The SQL floor only prunes; lateness is decided
+    # in Python by the ONE definition (is_late), per spec §4.
+    late_orders_all = [row for row in rows if is_late(row, end_date)]
 
     late_justified = 0
     late_unjustified = 0
     late_unclassified = 0
     justified_by_reason: Dict[str, int] = {}
-    for wo in late_orders_all:
-        classification = wo.delay_classification
+    for row in late_orders_all:
+        classification = row.delay_classification
         if classification == DelayClassificationEnum.JUSTIFIED.value:
             late_justified += 1
-            reason = wo.justified_delay_reason
+            reason = row.justified_delay_reason
             if reason is not None:
                 justified_by_reason[reason] = justified_by_reason.get(reason, 0) + 1
         elif classification == DelayClassificationEnum.UNJUSTIFIED.value:
@@ -476,28 +464,28 @@ def calculate_true_otd(db: Session, client_id: str, start_date: date, end_date:
 
     return {
         "true_otd": {
-            "on_time": true_otd_on_time,
-            "late": true_otd_late,
-            "early": true_otd_early,
-            "total": true_otd_total,
+            "on_time": true_otd.on_time,
+            "late": true_otd.late,
+            "early": true_otd.early,
+            "total": true_otd.total,
             "percentage": true_otd_pct.quantize(Decimal("0.01")),
             "net_percentage": true_otd_net_pct.quantize(Decimal("0.01")),
             "description": "COMPLETE orders only",
-            "inferred_dates_count": true_otd_inferred_count,
-            "skipped_no_date": true_otd_skipped,
+            "inferred_dates_count": true_otd.inferred,
+            "skipped_no_date": true_otd.skipped,
         },
         "standard_otd": {
-            "on_time": standard_on_time,
-            "total": standard_total,
+            "on_time": standard.on_time,
+            "total": standard.total,
             "percentage": standard_pct.quantize(Decimal("0.01")),
             "net_percentage": standard_net_pct.quantize(Decimal("0.01")),
             "description": "All orders with delivery dates",
-            "inferred_dates_count": standard_inferred_count,
-            "skipped_no_date": standard_skipped,
+            "inferred_dates_count": standard.inferred,
+            "skipped_no_date": standard.skipped,
         },
         "variance": {
             "percentage_diff": (true_otd_pct - standard_pct).quantize(Decimal("0.01")),
-            "count_diff": true_otd_total - standard_total,
+            "count_diff": true_otd.total - standard.total,
         },
         "inference": {
             "is_estimated": total_inferred > 0,
@@ -595,8 +583,6 @@ def calculate_otd_trend(
     Returns:
         Dict with trend data
     """
-    from datetime import timedelta
-
     # Determine interval
     if interval == "daily":
         delta = timedelta(days=1)
@@ -613,18 +599,23 @@ def calculate_otd_trend(
         periods.append((current, period_end))
         current = current + delta
 
-    # Calculate metrics for each period
+    # One scan for the whole range, bucketed by delivery day into periods
+    period_starts = [period_start for period_start, _ in periods]
+    buckets: List[List["Row[Any]"]] = [[] for _ in periods]
+    for row in _fetch_otd_rows(db, client_id, start_date, end_date):
+        buckets[bisect_right(period_starts, row.actual_delivery_date.date()) - 1].append(row)
+
     trend_data = []
-    for period_start, period_end in periods:
-        metrics = calculate_true_otd(db, client_id, period_start, period_end)
+    for (period_start, period_end), rows in zip(periods, buckets):
+        true_otd, standard = _tally_delivered(rows)
         trend_data.append(
             {
                 "period_start": period_start.isoformat(),
                 "period_end": period_end.isoformat(),
-                "true_otd_percentage": metrics["true_otd"]["percentage"],
-                "true_otd_count": metrics["true_otd"]["total"],
-                "standard_otd_percentage": metrics["standard_otd"]["percentage"],
-                "standard_otd_count": metrics["standard_otd"]["total"],
+                "true_otd_percentage": _percentage(true_otd.on_time, true_otd.total).quantize(Decimal("0.01")),
+                "true_otd_count": true_otd.total,
+                "standard_otd_percentage": _percentage(standard.on_time, standard.total).quantize(Decimal("0.01")),
+                "standard_otd_count": standard.total,
             }
         )
 
@@ -671,96 +662,37 @@ def calculate_otd_by_product(db: Session, client_id: str, start_date: date, end_
     Returns:
         Dict with OTD by product
     """
-    start_datetime = datetime.combine(start_date, datetime.min.time())
-    end_datetime = datetime.combine(end_date, datetime.max.time())
-
-    # Get all orders in range
-    # ENHANCED: Removed planned_ship_date requirement - use inference chain
-    orders = (
-        db.query(WorkOrder)
-        .filter(
-            and_(
-                WorkOrder.client_id == client_id,
-                WorkOrder.actual_delivery_date.isnot(None),
-                WorkOrder.actual_delivery_date >= start_datetime,
-                WorkOrder.actual_delivery_date <= end_datetime,
-            )
-        )
-        .all()
-    )
+    # Group the delivered orders by style_model, then tally each group
+    by_style: Dict[str, List["Row[Any]"]] = {}
+    for row in _fetch_otd_rows(db, client_id, start_date, end_date):
+        by_style.setdefault(row.style_model, []).append(row)
 
-    # Group by style_model with inference tracking. Annotated explicitly
-    # so the inner counter increments don't get inferred as `object + int`.
-    product_metrics: Dict[str, Dict[str, Any]] = {}
+    results: List[Dict[str, Any]] = []
+    total_processed = 0
     total_inferred = 0
     total_skipped = 0
-
-    for wo in orders:
-        # Use inference chain to get planned date
-        inferred = infer_planned_delivery_date(wo)
-
-        if inferred.date is None:
-            total_skipped += 1
-            continue
-
-        actual_delivery = wo.actual_delivery_date
-        if actual_delivery is None:
-            total_skipped += 1
-            continue
-
-        if inferred.is_inferred:
-            total_inferred += 1
-
-        style = wo.style_model
-        if style not in product_metrics:
-            product_metrics[style] = {
-                "style_model": style,
-                "true_otd_on_time": 0,
-                "true_otd_total": 0,
-                "standard_on_time": 0,
-                "standard_total": 0,
-                "inferred_count": 0,
-            }
-
-        if inferred.is_inferred:
-            product_metrics[style]["inferred_count"] += 1
-
-        # Standard OTD using inferred date
-        product_metrics[style]["standard_total"] += 1
-        if actual_delivery <= inferred.date:
-            product_metrics[style]["standard_on_time"] += 1
-
-        # TRUE-OTD (only COMPLETED)
-        if wo.status == WorkOrderStatus.COMPLETED:
-            product_metrics[style]["true_otd_total"] += 1
-            if actual_delivery <= inferred.date:
-                product_metrics[style]["true_otd_on_time"] += 1
-
-    # Calculate percentages
-    results: List[Dict[str, Any]] = []
-    for style, metrics in product_metrics.items():
-        true_pct = Decimal("0")
-        if metrics["true_otd_total"] > 0:
-            true_pct = (Decimal(str(metrics["true_otd_on_time"])) / Decimal(str(metrics["true_otd_total"]))) * 100
-
-        standard_pct = Decimal("0")
-        if metrics["standard_total"] > 0:
-            standard_pct = (Decimal(str(metrics["standard_on_time"])) / Decimal(str(metrics["standard_total"]))) * 100
+    for style, rows in by_style.items():
+        true_otd, standard = _tally_delivered(rows)
+        total_processed += standard.total
+        total_inferred += standard.inferred
+        total_skipped += standard.skipped
+        if standard.total == 0:
+            continue  # only orders without an inferable date: no product row
 
         results.append(
             {
                 "style_model": style,
                 "true_otd": {
-                    "on_time": metrics["true_otd_on_time"],
-                    "total": metrics["true_otd_total"],
-                    "percentage": true_pct.quantize(Decimal("0.01")),
+                    "on_time": true_otd.on_time,
+                    "total": true_otd.total,
+                    "percentage": _percentage(true_otd.on_time, true_otd.total).quantize(Decimal("0.01")),
                 },
                 "standard_otd": {
-                    "on_time": metrics["standard_on_time"],
-                    "total": metrics["standard_total"],
-                    "percentage": standard_pct.quantize(Decimal("0.01")),
+                    "on_time": standard.on_time,
+                    "total": standard.total,
+                    "percentage": _percentage(standard.on_time, standard.total).quantize(Decimal("0.01")),
                 },
-                "inferred_dates_count": metrics["inferred_count"],
+                "inferred_dates_count": standard.inferred,
             }
         )
 
@@ -768,7 +700,6 @@ def calculate_otd_by_product(db: Session, client_id: str, start_date: date, end_
     results.sort(key=lambda x: x["true_otd"]["percentage"])
 
     # Calculate inference rate
-    total_processed = len(orders) - total_skipped
     inference_rate = (total_inferred / total_processed * 100) if total_processed > 0 else 0
 
     return {
@@ -3,12 +3,16 @@ Prediction and Forecasting Module
 Implements exponential smoothing, ARIMA forecasting, and trend extrapolation
 """
 
-from typing import List, Tuple, Dict
+from typing import Dict, Hashable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, TypeVar, Union
 from decimal import Decimal
 from datetime import date
 import statistics
 from dataclasses import dataclass
 
+# Forecast inputs: Decimal from the ORM, float from the API layer. Fitting
+# runs in float; ForecastResult is converted back to Decimal.
+Number = Union[Decimal, float, int]
+
 
 @dataclass
 class ForecastResult:
@@ -22,15 +26,128 @@ class ForecastResult:
     accuracy_score: Decimal  # Model accuracy (0-100)
 
 
+# Candidate alpha/beta values for the one-step-ahead SSE grid search.
+SMOOTHING_GRID: Tuple[float, ...] = tuple(i / 10 for i in range(1, 11))
+
+# Minimum history each method needs; shorter series cannot be forecast.
+MIN_FORECAST_POINTS = 2
+
+# forecast() method names (the API's `method` query values) -> implementation.
+FORECAST_METHODS = ("auto", "simple", "double", "linear")
+
+K = TypeVar("K", bound=Hashable)
+
+
+class _LinearFit(NamedTuple):
+    slope: float
+    intercept: float
+    r_squared: float
+    residuals: List[float]
+
+
+def _floats(values: Sequence[Number]) -> List[float]:
+    return [float(v) for v in values]
+
+
+def _result(
+    predictions: Sequence[float],
+    lower_bounds: Sequence[float],
+    upper_bounds: Sequence[float],
+    confidence_scores: Sequence[float],
+    method: str,
+    accuracy_score: float,
+) -> ForecastResult:
+    """The one place forecasts leave float arithmetic for Decimal."""
+    return ForecastResult(
+        predictions=[Decimal(str(round(p, 4))) for p in predictions],
+        lower_bounds=[Decimal(str(round(lb, 4))) for lb in lower_bounds],
+        upper_bounds=[Decimal(str(round(ub, 4))) for ub in upper_bounds],
+        confidence_scores=[Decimal(str(round(c, 2))) for c in confidence_scores],
+        method=method,
+        accuracy_score=Decimal(str(round(accuracy_score, 2))),
+    )
+
+
+def _fit_accuracy(ys: Sequence[float], fitted: Sequence[float]) -> Tuple[float, float]:
+    """(mean absolute error, 100 - MAPE floored at 0) of an in-sample fit."""
+    n = len(ys)
+    mae = sum(abs(y - f) for y, f in zip(ys, fitted)) / n
+    mape = sum(abs((y - f) / y) for y, f in zip(ys, fitted) if y != 0) / n * 100
+    return mae, max(0.0, 100 - mape)
+
+
+def _ses_sse(ys: Sequence[float], alpha: float) -> float:
+    """One-step-ahead squared error of simple exponential smoothing."""
+    level = ys[0]
+    sse = 0.0
+    for y in ys[1:]:
+        error = y - level
+        sse += error * error
+        level += alpha * error
+    return sse
+
+
+def _holt_sse(ys: Sequence[float], alpha: float, beta: float) -> float:
+    """One-step-ahead squared error of Holt's linear method."""
+    level, trend = ys[0], ys[1] - ys[0]
+    sse = 0.0
+    for y in ys[1:]:
+        error = y - (level + trend)
+        sse += error * error
+        prev_level = level
+        level = alpha * y + (1 - alpha) * (level + trend)
+        trend = beta * (level - prev_level) + (1 - beta) * trend
+    return sse
+
+
+def fit_smoothing_alpha(values: Sequence[Number]) -> float:
+    """Alpha from SMOOTHING_GRID minimising one-step-ahead SSE (smallest on ties)."""
+    ys = _floats(values)
+    return min(SMOOTHING_GRID, key=lambda alpha: _ses_sse(ys, alpha))
+
+
+def fit_holt_parameters(values: Sequence[Number]) -> Tuple[float, float]:
+    """(alpha, beta) from SMOOTHING_GRID minimising Holt's one-step-ahead SSE."""
+    ys = _floats(values)
+    return min(
+        ((alpha, beta) for alpha in SMOOTHING_GRID for beta in SMOOTHING_GRID),
+        key=lambda params: _holt_sse(ys, *params),
+    )
+
+
+def _linear_fit(ys: Sequence[float]) -> _LinearFit:
+    """Least-squares line through (0, y0) .. (n-1, y_n-1)."""
+    n = len(ys)
+    x_mean = (n - 1) / 2
+    y_mean = sum(ys) / n
+    sxx = sum((x - x_mean) ** 2 for x in range(n))
+    slope = sum((x - x_mean) * (y - y_mean) for x, y in enumerate(ys)) / sxx
+    intercept = y_mean - slope * x_mean
+    residuals = [y - (slope * x + intercept) for x, y in enumerate(ys)]
+    ss_tot = sum((y - y_mean) ** 2 for y in ys)
+    # A flat series is fitted exactly by a flat line.
+    r_squared = 1 - sum(r * r for r in residuals) / ss_tot if ss_tot > 0 else 1.0
+    return _LinearFit(slope, intercept, r_squared, residuals)
+
+
+def _parameter(value: Optional[Number], name: str) -> Optional[float]:
+    if value is None:
+        return None
+    if not (0 < value <= 1):
+        raise ValueError(f"{name} must be between 0 and 1")
+    return float(value)
+
+
 def simple_exponential_smoothing(
-    values: List[Decimal], alpha: Decimal = Decimal("0.3"), forecast_periods: int = 7
+    values: Sequence[Number], alpha: Optional[Number] = None, forecast_periods: int = 7
 ) -> ForecastResult:
     """
     Simple exponential smoothing for time series forecasting
 
     Args:
         values: Historical KPI values
-        alpha: Smoothing parameter (0 < alpha <= 1), default 0.3
+        alpha: Smoothing parameter (0 < alpha <= 1); None fits it to the
+            series (see fit_smoothing_alpha)
         forecast_periods: Number of periods to forecast
 
     Returns:
@@ -41,65 +158,45 @@ def simple_exponential_smoothing(
         >>> result = simple_exponential_smoothing(values, Decimal("0.3"), 7)
         >>> print(result.predictions)  # Next 7 forecasted values
     """
-    if not (Decimal("0") < alpha <= Decimal("1")):
-        raise ValueError("Alpha must be between 0 and 1")
+    a = _parameter(alpha, "Alpha")
 
-    if len(values) < 2:
+    if len(values) < MIN_FORECAST_POINTS:
         raise ValueError("Need at least 2 historical values for forecasting")
 
-    # Initialize with first value
-    smoothed = [values[0]]
-
-    # Calculate smoothed values for historical data
-    for i in range(1, len(values)):
-        new_smoothed = alpha * values[i] + (Decimal("1") - alpha) * smoothed[-1]
-        smoothed.append(new_smoothed)
-
-    # Forecast future values (constant forecast = last smoothed value)
-    last_smoothed = smoothed[-1]
-    predictions = [last_smoothed] * forecast_periods
-
-    # Calculate prediction intervals based on historical error.
-    # Decimal start for sum() so the result stays Decimal (the default
-    # int(0) seed would yield int|Decimal and break mae * Decimal("2")).
-    errors = [abs(values[i] - smoothed[i]) for i in range(len(values))]
-    mae: Decimal = sum(errors, Decimal("0")) / len(errors)  # Mean Absolute Error
-
-    # 95% confidence interval (approximately 2 * MAE)
-    confidence_margin = mae * Decimal("2")
-
-    lower_bounds = [p - confidence_margin for p in predictions]
-    upper_bounds = [p + confidence_margin for p in predictions]
-
-    # Confidence decreases with forecast horizon
-    base_confidence = Decimal("85.0")
-    confidence_decay = Decimal("2.0")  # Lose 2% per period
-    confidence_scores = [
-        max(Decimal("50.0"), base_confidence - (confidence_decay * i)) for i in range(forecast_periods)
-    ]
-
-    # Calculate accuracy score (based on historical fit). Same Decimal
-    # seed reasoning — mape needs to stay Decimal through the divide
-    # and the final accuracy_score subtraction.
-    mape: Decimal = sum(
-        (abs((values[i] - smoothed[i]) / values[i]) for i in range(len(values)) if values[i] != 0),
-        Decimal("0"),
-    )
-    mape = (mape / len(values)) * 100
-    accuracy_score = max(Decimal("0"), Decimal("100") - mape)
+    ys = _floats(values)
+    if a is None:
+        a = fit_smoothing_alpha(ys)
 
-    return ForecastResult(
-        predictions=[Decimal(str(round(p, 4))) for p in predictions],
-        lower_bounds=[Decimal(str(round(lb, 4))) for lb in lower_bounds],
-        upper_bounds=[Decimal(str(round(ub, 4))) for ub in upper_bounds],
-        confidence_scores=[Decimal(str(round(c, 2))) for c in confidence_scores],
-        method="simple_exponential_smoothing",
-        accuracy_score=Decimal(str(round(accuracy_score, 2))),
+    # Smoothed values for historical data, starting from the first value
+    smoothed = [ys[0]]
+    for y in ys[1:]:
+        smoothed.append(a * y + (1 - a) * smoothed[-1])
+
+    # Constant forecast = last smoothed value
+    predictions = [smoothed[-1]] * forecast_periods
+
+    # 95% confidence interval (approximately 2 * MAE of the historical fit)
+    mae, accuracy_score = _fit_accuracy(ys, smoothed)
+    margin = mae * 2
+
+    # Confidence decreases with forecast horizon: lose 2% per period
+    confidence_scores = [max(50.0, 85.0 - 2.0 * i) for i in range(forecast_periods)]
+
+    return _result(
+        predictions,
+        [p - margin for p in predictions],
+        [p + margin for p in predictions],
+        confidence_scores,
+        "simple_exponential_smoothing",
+        accuracy_score,
     )
 
 
 def double_exponential_smoothing(
-    values: List[Decimal], alpha: Decimal = Decimal("0.3"), beta: Decimal = Decimal("0.1"), forecast_periods: int = 7
+    values: Sequence[Number],
+    alpha: Optional[Number] = None,
+    beta: Optional[Number] = None,
+    forecast_periods: int = 7,
 ) -> ForecastResult:
     """
     Double exponential smoothing (Holt's method) for trending data
@@ -110,73 +207,55 @@ def double_exponential_smoothing(
         beta: Trend smoothing parameter (0 < beta <= 1)
         forecast_periods: Number of periods to forecast
 
+    Alpha and beta left None are fitted together by one-step-ahead SSE (see
+    fit_holt_parameters); one given explicitly is kept and the other fitted.
+
     Returns:
         ForecastResult with predictions accounting for trend
     """
+    a = _parameter(alpha, "Alpha")
+    b = _parameter(beta, "Beta")
+
     if len(values) < 3:
         # Fall back to simple exponential smoothing
         return simple_exponential_smoothing(values, alpha, forecast_periods)
 
-    # Initialize level and trend
-    level = values[0]
-    trend = values[1] - values[0]
-
+    ys = _floats(values)
+    if a is None or b is None:
+        grid = [
+            (ga, gb)
+            for ga in ((a,) if a is not None else SMOOTHING_GRID)
+            for gb in ((b,) if b is not None else SMOOTHING_GRID)
+        ]
+        a, b = min(grid, key=lambda params: _holt_sse(ys, *params))
+
+    # Smoothed levels and trends, from the first value and first difference
+    level, trend = ys[0], ys[1] - ys[0]
     smoothed = [level]
-    trends = [trend]
-
-    # Calculate smoothed values and trends
-    for i in range(1, len(values)):
+    for y in ys[1:]:
         prev_level = level
-        level = alpha * values[i] + (Decimal("1") - alpha) * (level + trend)
-        trend = beta * (level - prev_level) + (Decimal("1") - beta) * trend
-
+        level = a * y + (1 - a) * (level + trend)
+        trend = b * (level - prev_level) + (1 - b) * trend
         smoothed.append(level)
-        trends.append(trend)
-
-    # Forecast with trend
-    predictions = []
-    last_level = smoothed[-1]
-    last_trend = trends[-1]
-
-    for h in range(1, forecast_periods + 1):
-        forecast = last_level + last_trend * h
-        predictions.append(forecast)
 
-    # Calculate prediction intervals (Decimal seeds — see SES variant).
-    errors = [abs(values[i] - smoothed[i]) for i in range(len(values))]
-    mae: Decimal = sum(errors, Decimal("0")) / len(errors)
+    predictions = [level + trend * h for h in range(1, forecast_periods + 1)]
 
-    confidence_margin = mae * Decimal("2.5")  # Slightly wider for trending data
+    mae, accuracy_score = _fit_accuracy(ys, smoothed)
+    margin = mae * 2.5  # Slightly wider for trending data
 
-    lower_bounds = [p - confidence_margin for p in predictions]
-    upper_bounds = [p + confidence_margin for p in predictions]
-
-    # Confidence scores
-    base_confidence = Decimal("82.0")
-    confidence_decay = Decimal("2.5")
-    confidence_scores = [
-        max(Decimal("45.0"), base_confidence - (confidence_decay * i)) for i in range(forecast_periods)
-    ]
-
-    # Accuracy
-    mape: Decimal = sum(
-        (abs((values[i] - smoothed[i]) / values[i]) for i in range(len(values)) if values[i] != 0),
-        Decimal("0"),
-    )
-    mape = (mape / len(values)) * 100
-    accuracy_score = max(Decimal("0"), Decimal("100") - mape)
+    confidence_scores = [max(45.0, 82.0 - 2.5 * i) for i in range(forecast_periods)]
 
-    return ForecastResult(
-        predictions=[Decimal(str(round(p, 4))) for p in predictions],
-        lower_bounds=[Decimal(str(round(lb, 4))) for lb in lower_bounds],
-        upper_bounds=[Decimal(str(round(ub, 4))) for ub in upper_bounds],
-        confidence_scores=[Decimal(str(round(c, 2))) for c in confidence_scores],
-        method="double_exponential_smoothing",
-        accuracy_score=Decimal(str(round(accuracy_score, 2))),
+    return _result(
+        predictions,
+        [p - margin for p in predictions],
+        [p + margin for p in predictions],
+        confidence_scores,
+        "double_exponential_smoothing",
+        accuracy_score,
     )
 
 
-def linear_trend_extrapolation(values: List[Decimal], forecast_periods: int = 7) -> ForecastResult:
+def linear_trend_extrapolation(values: Sequence[Number], forecast_periods: int = 7) -> ForecastResult:
     """
     Linear trend extrapolation using least squares regression
 
@@ -187,70 +266,34 @@ def linear_trend_extrapolation(values: List[Decimal], forecast_periods: int = 7)
     Returns:
         ForecastResult with linear predictions
     """
-    if len(values) < 2:
+    if len(values) < MIN_FORECAST_POINTS:
         raise ValueError("Need at least 2 values for trend extrapolation")
+    ys = _floats(values)
+    return _linear_forecast(ys, _linear_fit(ys), forecast_periods)
 
-    n = len(values)
-    x_values = list(range(n))
-    y_values = [float(v) for v in values]
-
-    # Calculate linear regression
-    x_mean = sum(x_values) / n
-    y_mean = sum(y_values) / n
-
-    numerator = sum((x_values[i] - x_mean) * (y_values[i] - y_mean) for i in range(n))
-    denominator = sum((x - x_mean) ** 2 for x in x_values)
-
-    if denominator == 0:
-        slope = 0.0
-        intercept = y_mean
-    else:
-        slope = numerator / denominator
-        intercept = y_mean - slope * x_mean
-
-    # Forecast future values
-    predictions = []
-    for h in range(n, n + forecast_periods):
-        forecast = slope * h + intercept
-        predictions.append(Decimal(str(forecast)))
 
-    # Calculate residuals for confidence intervals
-    residuals = [y_values[i] - (slope * x_values[i] + intercept) for i in range(n)]
-    residual_std = statistics.stdev(residuals) if len(residuals) > 1 else 0
+def _linear_forecast(ys: Sequence[float], fit: _LinearFit, forecast_periods: int) -> ForecastResult:
+    n = len(ys)
+    predictions = [fit.slope * h + fit.intercept for h in range(n, n + forecast_periods)]
 
     # Confidence intervals widen with forecast horizon
-    lower_bounds = []
-    upper_bounds = []
-
-    for h in range(forecast_periods):
-        # Widen interval as we go further into future
-        margin = Decimal(str(residual_std * 2 * (1 + h * 0.1)))
-        lower_bounds.append(predictions[h] - margin)
-        upper_bounds.append(predictions[h] + margin)
-
-    # Confidence scores
-    r_squared = 1 - (sum(r**2 for r in residuals) / sum((y - y_mean) ** 2 for y in y_values))
-    base_confidence = Decimal(str(max(50, r_squared * 100)))
-    confidence_decay = Decimal("3.0")
-
-    confidence_scores = [
-        max(Decimal("40.0"), base_confidence - (confidence_decay * i)) for i in range(forecast_periods)
-    ]
-
-    # Accuracy
-    accuracy_score = Decimal(str(round(r_squared * 100, 2)))
-
-    return ForecastResult(
-        predictions=[Decimal(str(round(p, 4))) for p in predictions],
-        lower_bounds=[Decimal(str(round(lb, 4))) for lb in lower_bounds],
-        upper_bounds=[Decimal(str(round(ub, 4))) for ub in upper_bounds],
-        confidence_scores=[Decimal(str(round(c, 2))) for c in confidence_scores],
-        method="linear_trend_extrapolation",
-        accuracy_score=Decimal(str(round(accuracy_score, 2))),
+    residual_std = statistics.stdev(fit.residuals) if n > 1 else 0.0
+    margins = [residual_std * 2 * (1 + h * 0.1) for h in range(forecast_periods)]
+
+    base_confidence = max(50.0, fit.r_squared * 100)
+    confidence_scores = [max(40.0, base_confidence - 3.0 * i) for i in range(forecast_periods)]
+
+    return _result(
+        predictions,
+        [p - m for p, m in zip(predictions, margins)],
+        [p + m for p, m in zip(predictions, margins)],
+        confidence_scores,
+        "linear_trend_extrapolation",
+        fit.r_squared * 100,
     )
 
 
-def auto_forecast(values: List[Decimal], forecast_periods: int = 7) -> ForecastResult:
+def auto_forecast(values: Sequence[Number], forecast_periods: int = 7) -> ForecastResult:
     """
     Automatically select best forecasting method based on data characteristics
 
@@ -270,36 +313,56 @@ def auto_forecast(values: List[Decimal], forecast_periods: int = 7) -> ForecastR
         return simple_exponential_smoothing(values, forecast_periods=forecast_periods)
 
     # Analyze trend strength
-    n = len(values)
-    x = list(range(n))
-    y = [float(v) for v in values]
-
-    x_mean = sum(x) / n
-    y_mean = sum(y) / n
-
-    numerator = sum((x[i] - x_mean) * (y[i] - y_mean) for i in range(n))
-    denominator = sum((xi - x_mean) ** 2 for xi in x)
-
-    if denominator != 0:
-        slope = numerator / denominator
-        residuals = [y[i] - (slope * x[i] + (y_mean - slope * x_mean)) for i in range(n)]
-        r_squared = 1 - (sum(r**2 for r in residuals) / sum((yi - y_mean) ** 2 for yi in y))
-    else:
-        slope = 0
-        r_squared = 0
+    ys = _floats(values)
+    fit = _linear_fit(ys)
 
     # Decision logic
-    if r_squared > 0.7 and abs(slope) > 0.1:
+    if fit.r_squared > 0.7 and abs(fit.slope) > 0.1:
         # Strong linear trend
-        if slope > 0.05 or slope < -0.05:
+        if fit.slope > 0.05 or fit.slope < -0.05:
             # Significant trend - use double exponential smoothing
-            return double_exponential_smoothing(values, forecast_periods=forecast_periods)
+            return double_exponential_smoothing(ys, forecast_periods=forecast_periods)
         else:
             # Moderate trend - use linear extrapolation
-            return linear_trend_extrapolation(values, forecast_periods=forecast_periods)
+            return _linear_forecast(ys, fit, forecast_periods)
     else:
         # Weak trend or high variability - use simple smoothing
+        return simple_exponential_smoothing(ys, forecast_periods=forecast_periods)
+
+
+def forecast(values: Sequence[Number], forecast_periods: int = 7, method: Optional[str] = None) -> ForecastResult:
+    """
+    Forecast one series with a FORECAST_METHODS method (None or unknown = auto).
+    """
+    if method == "simple":
         return simple_exponential_smoothing(values, forecast_periods=forecast_periods)
+    if method == "double":
+        return double_exponential_smoothing(values, forecast_periods=forecast_periods)
+    if method == "linear":
+        return linear_trend_extrapolation(values, forecast_periods=forecast_periods)
+    return auto_forecast(values, forecast_periods)
+
+
+def forecast_many(
+    series: Mapping[K, Sequence[Number]], forecast_periods: int = 7, method: Optional[str] = None
+) -> Dict[K, ForecastResult]:
+    """
+    Forecast many series at once, e.g. every KPI for every client on a dashboard.
+
+    Args:
+        series: Key (KPI, client, ...) -> historical values
+        forecast_periods: Number of periods to forecast
+        method: FORECAST_METHODS name (None = auto)
+
+    Returns:
+        Key -> ForecastResult; keys whose series has fewer than
+        MIN_FORECAST_POINTS values are left out
+    """
+    return {
+        key: forecast(values, forecast_periods, method)
+        for key, values in series.items()
+        if len(values) >= MIN_FORECAST_POINTS
+    }
 
 
 # =============================================================================
@@ -325,8 +388,7 @@ def predict_metric_value(values: List[float], dates: List[date], days_ahead: int
         return (sum(values) / len(values) if values else 0.0, "average")
 
     # Use auto_forecast
-    decimal_values = [Decimal(str(v)) for v in values]
-    result = auto_forecast(decimal_values, forecast_periods=max(1, days_ahead))
+    result = auto_forecast(values, forecast_periods=max(1, days_ahead))
 
     predicted = float(result.predictions[min(days_ahead - 1, len(result.predictions) - 1)])
     return (predicted, result.method)
@@ -65,6 +65,10 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "insecure-dev-only-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    AUTH_PRINCIPAL_CACHE_TTL: int = 30  # seconds a token's resolved user + client list is reused
+    AUTH_REVOCATION_REFRESH_SECONDS: float = (
+        5.0  # max lag before another worker's logout/deactivation/re-scope reaches cached tokens
+    )
 
     # CORS
     CORS_ORIGINS: str = "http://localhost:3000"
@@ -115,10 +119,43 @@ class Settings(BaseSettings):
     REPORT_EMAIL_TIME: str = "06:00"  # Daily report time (HH:MM format)
 
     # Cache Configuration
+    # KPICache is per process and commit-time invalidation (events/session_hooks.py)
+    # only evicts the committing worker's copy; the other gunicorn workers serve
+    # their entries until these TTLs run out. Keep them short.
     CACHE_TTL_CLIENT_CONFIG: int = 900  # 15 minutes
     CACHE_TTL_REFERENCE_DATA: int = 1800  # 30 minutes
     CACHE_TTL_AGGREGATIONS: int = 300  # 5 minutes
     CACHE_MAX_ENTRIES: int = 1000
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # estimated value size budget; 0 disables
+    CACHE_STALE_SECONDS: int = 60  # serve-stale window while one caller refreshes
+    CACHE_TTL_JITTER: float = 0.1  # +/- fraction applied to each entry's TTL
+    CACHE_FLIGHT_WAIT_SECONDS: float = 30.0  # max wait on another request computing the same key
+
+    MY_SHIFT_CACHE_TTL: int = 30  # seconds; /api/my-shift snapshot (commits evict it sooner)
+
+    # QR images (backend/services/qr_service.py)
+    QR_IMAGE_CACHE_MAX_BYTES: int = 16 * 1024 * 1024  # rendered PNGs kept in memory, keyed by (payload, size)
+    QR_LABEL_WORKERS: int = 4  # threads rendering a bulk label sheet
+
+    # EVENT_STORE outbox (backend/events/outbox.py)
+    EVENT_OUTBOX_MAX_QUEUE: int = 10000  # events buffered before commits write inline
+    EVENT_OUTBOX_BATCH_SIZE: int = 200  # rows per multi-row INSERT
+    EVENT_OUTBOX_FLUSH_INTERVAL: float = 0.5  # seconds a partial batch waits before it is written
+    EVENT_OUTBOX_ENQUEUE_TIMEOUT: float = 0.05  # seconds a commit waits on a full queue
+
+    # Pivot rollup store (backend/pivot/rollup.py)
+    PIVOT_ROLLUP_ENABLED: bool = True  # read pivots from PIVOT_DAILY_ROLLUP when it covers the window
+    PIVOT_ROLLUP_RECONCILE_DAYS: int = 400  # trailing days the nightly reconcile rebuilds
+    PIVOT_ROLLUP_CRON_HOUR: int = 3  # UTC, after the 02:00 dual-view run
+    PIVOT_ROLLUP_REFRESH_MAX_QUEUE: int = 1000  # committed changes queued before commits refresh inline
+
+    # Alert refresh on commit (backend/services/alert_refresh.py)
+    ALERT_COMMIT_REFRESH_ENABLED: bool = True  # re-check OTD/hold alerts for committed work-order and hold writes
+
+    # Response compression (backend/middleware/compression.py)
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # bytes; smaller bodies are sent uncompressed
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4  # used only when the optional brotli package is installed
 
     # Feature Flags
     CAPACITY_CACHING_ENABLED: bool = True
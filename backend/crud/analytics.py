@@ -3,15 +3,32 @@ Analytics CRUD operations
 Database queries for retrieving analytics data with multi-tenant filtering
 """
 
-from typing import List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from decimal import Decimal
 from datetime import date, datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import func, select, and_
+from backend.cache import CacheTag, get_cache
+from backend.cache.kpi_cache import build_hash_key
+from backend.config import settings
 from backend.middleware.client_auth import get_user_client_filter
 from backend.orm.user import User
 
 
+def _time_series_columns() -> Dict[str, Any]:
+    """KPI type -> the per-entry ProductionEntry expression averaged per day."""
+    from backend.orm.production_entry import ProductionEntry
+
+    return {
+        "efficiency": ProductionEntry.efficiency_percentage,
+        "performance": ProductionEntry.performance_percentage,
+        # Quality rate = (units_produced - defect_count) / units_produced
+        "quality": (
+            (ProductionEntry.units_produced - ProductionEntry.defect_count) / ProductionEntry.units_produced * 100
+        ),
+    }
+
+
 def get_kpi_time_series_data(
     db: Session, client_id: str, kpi_type: str, start_date: date, end_date: date, current_user: User
 ) -> List[Tuple[date, Decimal]]:
@@ -39,15 +56,7 @@ def get_kpi_time_series_data(
     # Verify client access
     verify_client_access(current_user, client_id)
 
-    # Map KPI type to column
-    kpi_column_map = {
-        "efficiency": ProductionEntry.efficiency_percentage,
-        "performance": ProductionEntry.performance_percentage,
-        # Quality rate = (units_produced - defect_count) / units_produced
-        "quality": (
-            (ProductionEntry.units_produced - ProductionEntry.defect_count) / ProductionEntry.units_produced * 100
-        ),
-    }
+    kpi_column_map = _time_series_columns()
 
     if kpi_type not in kpi_column_map:
         raise ValueError(f"Unknown KPI type: {kpi_type}")
@@ -75,6 +84,75 @@ def get_kpi_time_series_data(
     return [(row.production_date, Decimal(str(row.avg_value))) for row in results]
 
 
+def get_kpi_time_series_bundle(
+    db: Session, client_id: str, kpi_types: Iterable[str], start_date: date, end_date: date, current_user: User
+) -> Dict[str, List[Tuple[date, Decimal]]]:
+    """
+    Retrieve time series for several KPIs at once (e.g. the predictions dashboard)
+
+    Every KPI with a per-entry column comes from ONE grouped query (one AVG
+    per KPI, per production_date), cached per (client, window) and evicted
+    when the client's production entries or work orders change. Each series
+    matches get_kpi_time_series_data for that KPI.
+
+    Args:
+        db: Database session
+        client_id: Client ID to filter
+        kpi_types: KPI types wanted
+        start_date: Start date for data retrieval
+        end_date: End date for data retrieval
+        current_user: Current authenticated user (for access control)
+
+    Returns:
+        Dict of kpi_type -> (date, value) tuples ordered by date; KPI types
+        with no per-entry column map to an empty list
+
+    Raises:
+        ClientAccessError: If user doesn't have access to this client
+    """
+    from backend.middleware.client_auth import verify_client_access
+    from backend.orm.production_entry import ProductionEntry
+    from backend.orm.work_order import WorkOrder
+
+    # Verify client access (per call -- the cache is shared across users)
+    verify_client_access(current_user, client_id)
+
+    kpi_column_map = _time_series_columns()
+
+    def fetch_series() -> Dict[str, List[Tuple[date, Decimal]]]:
+        query = (
+            select(
+                ProductionEntry.production_date,
+                *(func.avg(column).label(kpi) for kpi, column in kpi_column_map.items()),
+            )
+            .join(WorkOrder, ProductionEntry.work_order_id == WorkOrder.work_order_id)
+            .where(
+                and_(
+                    WorkOrder.client_id == client_id,
+                    ProductionEntry.production_date >= datetime.combine(start_date, datetime.min.time()),
+                    ProductionEntry.production_date <= datetime.combine(end_date, datetime.max.time()),
+                )
+            )
+            .group_by(ProductionEntry.production_date)
+            .order_by(ProductionEntry.production_date)
+        )
+        series: Dict[str, List[Tuple[date, Decimal]]] = {kpi: [] for kpi in kpi_column_map}
+        for row in db.execute(query).all():
+            for kpi in kpi_column_map:
+                # AVG is NULL where the single-KPI query's IS NOT NULL filter drops the day
+                value = row._mapping[kpi]
+                if value is not None:
+                    series[kpi].append((row.production_date, Decimal(str(value))))
+        return series
+
+    cache_key = build_hash_key("kpi_time_series", client_id=client_id, start=start_date, end=end_date)
+    tags = [CacheTag("production", client_id, start_date, end_date), CacheTag("work_order", client_id)]
+    all_series: Dict[str, List[Tuple[date, Decimal]]] = get_cache().get_or_set(
+        cache_key, fetch_series, settings.CACHE_TTL_AGGREGATIONS, tags=tags
+    )
+    return {kpi: list(all_series.get(kpi, ())) for kpi in kpi_types}
+
+
 def get_shift_heatmap_data(
     db: Session, client_id: str, kpi_type: str, start_date: date, end_date: date, current_user: User
 ) -> List[Tuple[date, str, str, Optional[Decimal]]]:
@@ -90,11 +90,9 @@ def _build_attendance_responses_batch(db: Session, entries: List[AttendanceEntry
     return [_compose_attendance_response(entry, class_by_employee_id.get(entry.employee_id)) for entry in entries]
 
 
-def create_attendance_record(
-    db: Session, attendance: AttendanceRecordCreate, current_user: User
-) -> AttendanceRecordResponse:
+def build_attendance_entry(attendance: AttendanceRecordCreate, current_user: User) -> AttendanceEntry:
     """
-    Create new attendance record
+    Build an unsaved attendance record with its hour allocations (no commit)
     SECURITY: Verifies user has access to the specified client
     """
     # SECURITY: Verify user has access to this client
@@ -133,6 +131,17 @@ def create_attendance_record(
         db_attendance.hour_allocations = [
             AttendanceHourAllocation(category=item.category.value, hours=item.hours) for item in allocations
         ]
+    return db_attendance
+
+
+def create_attendance_record(
+    db: Session, attendance: AttendanceRecordCreate, current_user: User
+) -> AttendanceRecordResponse:
+    """
+    Create new attendance record
+    SECURITY: Verifies user has access to the specified client
+    """
+    db_attendance = build_attendance_entry(attendance, current_user)
 
     db.add(db_attendance)
     db.commit()
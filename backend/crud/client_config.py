@@ -14,7 +14,7 @@ from backend.orm.client_config import ClientConfig
 from backend.orm.client import Client
 from backend.orm.user import User
 from backend.middleware.client_auth import verify_client_access
-from backend.cache import get_cache
+from backend.cache import CacheTag, get_cache
 from backend.cache.kpi_cache import build_cache_key
 
 # Global default values (used when no config exists)
@@ -167,7 +167,9 @@ def get_client_config_or_defaults(db: Session, client_id: str) -> dict:
     # cache.get_or_set returns Any; the loader (`fetch_config`) returns
     # a dict by construction, so cast to satisfy the declared dict
     # return type without weakening the type system.
-    return cast(dict, cache.get_or_set(cache_key, fetch_config, ttl_seconds=900))
+    return cast(
+        dict, cache.get_or_set(cache_key, fetch_config, ttl_seconds=900, tags=[CacheTag("client_config", client_id)])
+    )
 
 
 def update_client_config(
@@ -5,6 +5,7 @@ PHASE 2
 
 from sqlalchemy.orm import Session
 from typing import Optional, List
+from uuid import uuid4
 from datetime import date, datetime
 from fastapi import HTTPException
 
@@ -15,12 +16,20 @@ from backend.orm.user import User
 from backend.utils.soft_delete import soft_delete
 
 
-def create_downtime_event(db: Session, downtime: DowntimeEventCreate, current_user: User) -> DowntimeEventResponse:
-    """Create new downtime event"""
+def build_downtime_event(downtime: DowntimeEventCreate, current_user: User) -> DowntimeEntry:
+    """Build an unsaved downtime event (access-checked); callers own add/commit."""
     # Verify user has access to this client
     verify_client_access(current_user, downtime.client_id)
 
-    db_downtime = DowntimeEntry(**downtime.model_dump(), entered_by=current_user.user_id)
+    # Pre-existing gap: this passed entered_by (not a DOWNTIME_ENTRY column)
+    # and never set the String PK, so every insert failed before reaching the
+    # DB. Same uuid4().hex pattern as create_attendance_record.
+    return DowntimeEntry(downtime_entry_id=uuid4().hex, **downtime.model_dump(), reported_by=current_user.user_id)
+
+
+def create_downtime_event(db: Session, downtime: DowntimeEventCreate, current_user: User) -> DowntimeEventResponse:
+    """Create new downtime event"""
+    db_downtime = build_downtime_event(downtime, current_user)
 
     db.add(db_downtime)
     db.commit()
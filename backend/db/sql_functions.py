@@ -4,13 +4,19 @@
 provides an ORM-level, dialect-compiled replacement so route handlers can build
 date-difference expressions without hardcoding a dialect-specific function.
 
+`date_window` is the day-range filter: a half-open range on the raw column, so
+the (client_id, shift_date) composite indexes stay usable where a
+`func.date(col)` comparison would scan the table.
+
 SQLAlchemy reports MariaDB (pymysql) as dialect "mysql", so the "mysql" compiler
 covers MariaDB; the default compiler mirrors it for any other backend.
 """
 
-from typing import Any
+from datetime import date, datetime, time, timedelta
+from typing import Any, Optional
 
-from sqlalchemy import Float
+from sqlalchemy import Date, Float, and_
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql.functions import FunctionElement
 
@@ -46,3 +52,17 @@ def _date_diff_days_mysql(element: Any, compiler: Any, **kw: Any) -> str:
 def _date_diff_days_default(element: Any, compiler: Any, **kw: Any) -> str:
     end, start = list(element.clauses)
     return f"TIMESTAMPDIFF(SECOND, {compiler.process(start, **kw)}, {compiler.process(end, **kw)}) / 86400.0"
+
+
+def date_window(column: Any, start_date: date, end_date: Optional[date] = None) -> ColumnElement[bool]:
+    """`column` falls on a day in [start_date, end_date] (end defaults to start).
+
+    Compiles to `column >= start 00:00 AND column < (end + 1 day) 00:00`:
+    sargable on both dialects, unlike a `func.date(column)` comparison, and
+    independent of the column's fractional-seconds precision, unlike an
+    inclusive `<= end 23:59:59.999999` bound. Date columns are bound as dates.
+    """
+    stop = (end_date if end_date is not None else start_date) + timedelta(days=1)
+    if isinstance(getattr(column, "type", None), Date):
+        return and_(column >= start_date, column < stop)
+    return and_(column >= datetime.combine(start_date, time.min), column < datetime.combine(stop, time.min))
@@ -17,9 +17,9 @@ from backend.middleware.client_auth import verify_client_access
 from backend.schemas.production import CSVUploadResponse
 
 # Import CRUD functions
-from backend.crud.downtime import create_downtime_event
+from backend.crud.downtime import build_downtime_event, create_downtime_event
 from backend.crud.hold import create_wip_hold
-from backend.crud.attendance import create_attendance_record
+from backend.crud.attendance import build_attendance_entry, create_attendance_record
 from backend.calculations.labor_hours import validate_ot_split
 from backend.crud.coverage import create_shift_coverage
 from backend.crud.quality import create_quality_inspection
@@ -122,6 +122,7 @@ async def upload_downtime_csv(
         row_mapper=_map_downtime_row,
         create_fn=create_downtime_event,
         id_getter=lambda c: c.downtime_entry_id,
+        build_fn=build_downtime_event,
     )
 
 
@@ -301,6 +302,7 @@ async def upload_attendance_csv(
         row_mapper=_map_attendance_row,
         create_fn=create_attendance_record,
         id_getter=lambda c: c.attendance_entry_id,
+        build_fn=build_attendance_entry,
     )
 
 
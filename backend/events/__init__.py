@@ -19,8 +19,8 @@ Usage:
         triggered_by=user.user_id,
         client_id=work_order.client_id
     )
-    event_bus.collect(event)
-    # Event will be flushed after db.commit()
+    event_bus.collect(event, session=db)
+    # Event will be flushed after db.commit() (discarded on rollback)
 """
 
 # Base classes
@@ -7,9 +7,16 @@ Provides event publishing and handling with:
 - Priority-based handler execution
 - Async handler support
 - Error isolation
+
+Collected events are never process-global: they live on the SQLAlchemy
+session they were collected for (Session.info) or, without a session, in the
+collecting request's context (a ContextVar). One request's commit or
+rollback therefore only flushes or discards its own events, whatever the
+number of worker threads.
 """
 
-from typing import List, Dict, Callable, Optional
+from contextvars import ContextVar
+from typing import Any, List, Dict, Callable, Optional, Tuple
 from dataclasses import dataclass
 from collections import defaultdict
 import asyncio
@@ -20,6 +27,14 @@ from backend.events.base import DomainEvent, EventHandler
 
 logger = logging.getLogger(__name__)
 
+# Session.info key holding the events collected for that session.
+SESSION_EVENTS_KEY = "collected_events"
+
+# Events collected without a session. An immutable tuple, re-set on every
+# collect, so a context copied into a worker thread never shares a mutable
+# list with its parent.
+_context_events: ContextVar[Tuple[DomainEvent, ...]] = ContextVar("collected_events", default=())
+
 
 @dataclass
 class HandlerRegistration:
@@ -37,7 +52,8 @@ class EventBus:
 
     Features:
     - Collect/flush pattern for transactional consistency
-    - Events collected during transaction, flushed after commit
+    - Events collected during transaction (per session / per request
+      context), flushed after commit
     - Priority-based handler execution
     - Async handlers run after HTTP response
     - Error isolation prevents cascade failures
@@ -64,8 +80,10 @@ class EventBus:
         if self._initialized:
             return
 
+        # Lists are replaced, never mutated, under _subscription_lock, so
+        # dispatch on any thread iterates a consistent snapshot.
         self._handlers: Dict[str, List[HandlerRegistration]] = defaultdict(list)
-        self._collected_events: List[DomainEvent] = []
+        self._subscription_lock = threading.Lock()
         self._persistence_handler: Optional[Callable] = None
         self._initialized = True
 
@@ -80,9 +98,11 @@ class EventBus:
             is_async: If True, handler runs after HTTP response
         """
         registration = HandlerRegistration(handler=handler, event_type=event_type, priority=priority, is_async=is_async)
-        self._handlers[event_type].append(registration)
-        # Sort by priority
-        self._handlers[event_type].sort(key=lambda r: r.priority)
+        with self._subscription_lock:
+            # Sort by priority
+            self._handlers[event_type] = sorted(
+                [*self._handlers.get(event_type, []), registration], key=lambda r: r.priority
+            )
         logger.debug(f"Subscribed handler to {event_type} with priority {priority}")
 
     def unsubscribe(self, event_type: str, handler: EventHandler) -> bool:
@@ -96,11 +116,12 @@ class EventBus:
         Returns:
             True if handler was found and removed
         """
-        handlers = self._handlers.get(event_type, [])
-        for i, reg in enumerate(handlers):
-            if reg.handler is handler:
-                handlers.pop(i)
-                return True
+        with self._subscription_lock:
+            handlers = self._handlers.get(event_type, [])
+            for i, reg in enumerate(handlers):
+                if reg.handler is handler:
+                    self._handlers[event_type] = handlers[:i] + handlers[i + 1 :]
+                    return True
         return False
 
     def publish(self, event: DomainEvent) -> None:
@@ -114,7 +135,7 @@ class EventBus:
         """
         self._dispatch_to_handlers(event, sync_only=True)
 
-    def collect(self, event: DomainEvent) -> None:
+    def collect(self, event: DomainEvent, session: Optional[Any] = None) -> None:
         """
         Collect an event for later flushing (after transaction commit).
 
@@ -123,19 +144,35 @@ class EventBus:
 
         Args:
             event: The domain event to collect
+            session: SQLAlchemy session whose commit publishes the event.
+                Without one, the event is held in the current request's
+                context and goes out with the next commit made from it.
         """
-        self._collected_events.append(event)
+        if session is not None:
+            session.info.setdefault(SESSION_EVENTS_KEY, []).append(event)
+        else:
+            _context_events.set(_context_events.get() + (event,))
         logger.debug(f"Collected event: {event.event_type} ({event.event_id})")
 
-    def flush_collected(self) -> int:
+    def _take_collected(self, session: Optional[Any]) -> List[DomainEvent]:
+        """Remove and return the session's events plus the current context's."""
+        events: List[DomainEvent] = session.info.pop(SESSION_EVENTS_KEY, []) if session is not None else []
+        events.extend(_context_events.get())
+        _context_events.set(())
+        return events
+
+    def flush_collected(self, session: Optional[Any] = None) -> int:
         """
-        Flush all collected events (call after transaction commit).
+        Flush collected events (call after transaction commit).
+
+        Args:
+            session: Committed session; its events are flushed along with
+                the current context's session-less events.
 
         Returns:
             Number of events flushed
         """
-        events = self._collected_events.copy()
-        self._collected_events.clear()
+        events = self._take_collected(session)
 
         count = 0
         for event in events:
@@ -154,26 +191,33 @@ class EventBus:
         logger.debug(f"Flushed {count} events")
         return count
 
-    def discard_collected(self) -> int:
+    def discard_collected(self, session: Optional[Any] = None) -> int:
         """
-        Discard all collected events (call on transaction rollback).
+        Discard collected events (call on transaction rollback).
+
+        Args:
+            session: Rolled-back session; its events are discarded along
+                with the current context's session-less events.
 
         Returns:
             Number of events discarded
         """
-        count = len(self._collected_events)
-        self._collected_events.clear()
+        count = len(self._take_collected(session))
         logger.debug(f"Discarded {count} collected events")
         return count
 
-    def get_collected_events(self) -> List[DomainEvent]:
+    def get_collected_events(self, session: Optional[Any] = None) -> List[DomainEvent]:
         """
         Get currently collected events (for testing/debugging).
 
+        Args:
+            session: Include the events collected for this session
+
         Returns:
             List of collected events
         """
-        return self._collected_events.copy()
+        pending = list(session.info.get(SESSION_EVENTS_KEY, [])) if session is not None else []
+        return pending + list(_context_events.get())
 
     def set_persistence_handler(self, handler: Callable[[DomainEvent], None]) -> None:
         """
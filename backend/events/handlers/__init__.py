@@ -6,6 +6,7 @@ Contains event handlers for different domains:
 - workflow_handlers: Workflow state change handlers
 - notification_handlers: Notification and alert handlers
 - analytics_handlers: Analytics and metrics handlers
+- cache_handlers: KPICache invalidation on data changes
 """
 
 from typing import List
@@ -35,6 +36,7 @@ def register_all_handlers() -> None:
         ProductionMetricsHandler,
         QualityMetricsHandler,
     )
+    from backend.events.handlers.cache_handlers import CacheInvalidationHandler
 
     # Workflow handlers
     bus.subscribe("work_order.status_changed", WorkflowAuditHandler(), priority=10)
@@ -51,6 +53,9 @@ def register_all_handlers() -> None:
     bus.subscribe("quality.inspection_recorded", QualityMetricsHandler(), priority=50)
     bus.subscribe("quality.defect_reported", QualityMetricsHandler(), priority=50)
 
+    # Cache invalidation (every event; evicts only entries tagged for its entity)
+    bus.subscribe("*", CacheInvalidationHandler(), priority=5)
+
 
 __all__ = [
     "register_all_handlers",
@@ -0,0 +1,52 @@
+"""
+Cache Invalidation Event Handlers
+Phase 3: Domain Events Infrastructure
+
+Evicts KPICache entries derived from data a domain event says has changed.
+Cached values carry CacheTag(entity, client_id, date range) tags; this
+handler turns each event into an (entity, client_id, day) change and calls
+KPICache.invalidate_tags, so only the affected entries go. Writes that do
+not raise a domain event are covered by the ORM change hooks in
+events/session_hooks.py, which feed the same invalidate_tags call. Like
+them, it only evicts this process's cache.
+"""
+
+import logging
+from datetime import date, datetime
+from typing import Any, Optional
+
+from backend.cache import get_cache
+from backend.events.base import DomainEvent, EventHandler
+
+logger = logging.getLogger(__name__)
+
+# Event attributes naming the business day a change belongs to, in order.
+_EVENT_DATE_ATTRS = ("production_date", "shift_date")
+
+
+def as_day(value: Any) -> Optional[date]:
+    """Normalise a date/datetime column or event value to a date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return None
+
+
+def event_entity(event: DomainEvent) -> str:
+    """Cache entity an event describes: the event_type prefix ("production.entry_created" -> "production")."""
+    return event.event_type.split(".", 1)[0]
+
+
+class CacheInvalidationHandler(EventHandler):
+    """Evict cached aggregates affected by a domain event."""
+
+    def __init__(self) -> None:
+        super().__init__(is_async=False, priority=5)
+
+    async def handle(self, event: DomainEvent) -> None:
+        day = next((as_day(getattr(event, attr, None)) for attr in _EVENT_DATE_ATTRS if hasattr(event, attr)), None)
+        entity = event_entity(event)
+        evicted = get_cache().invalidate_tags(entity, event.client_id, day)
+        if evicted:
+            logger.debug(f"CACHE: evicted {evicted} entries for {entity} (client={event.client_id}, day={day})")
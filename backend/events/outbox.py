@@ -0,0 +1,263 @@
+"""
+EVENT_STORE Outbox
+Phase 3: Domain Events Infrastructure
+
+Buffers committed domain events and writes them to EVENT_STORE from one
+background thread in multi-row INSERTs, so a business commit no longer pays
+a session checkout + INSERT + COMMIT per event on the request thread.
+
+- Bounded queue with backpressure: when it is full the committing thread
+  waits up to EVENT_OUTBOX_ENQUEUE_TIMEOUT, then writes its event inline.
+  Nothing is dropped.
+- A batch goes out once EVENT_OUTBOX_BATCH_SIZE rows are buffered or its
+  oldest row has waited EVENT_OUTBOX_FLUSH_INTERVAL.
+- stop() writes whatever is still queued before returning (lifespan shutdown),
+  including events whose enqueue() was already under way when it was called.
+- get_stats() reports queue depth and flush latency.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.events.base import DomainEvent
+from backend.orm.event_store import EventStore
+
+logger = logging.getLogger(__name__)
+
+_Row = Dict[str, Any]
+
+
+class EventOutbox:
+    """Bounded, batching EVENT_STORE writer; use enqueue() as the event bus persistence handler."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        max_queue: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 0.5,
+        enqueue_timeout: float = 0.05,
+    ) -> None:
+        self._session_factory = session_factory
+        self._queue: "queue.Queue[_Row]" = queue.Queue(maxsize=max_queue)
+        self._max_queue = max_queue
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._enqueue_timeout = enqueue_timeout
+        self._stopping = threading.Event()
+        # Guards _stopping against puts: stop() sets it and then waits for the
+        # puts already past the check, so none can land after the final drain
+        self._gate = threading.Condition()
+        self._puts_in_flight = 0
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Any] = {
+            "enqueued": 0,
+            "inline_writes": 0,
+            "batches": 0,
+            "written": 0,
+            "failed": 0,
+            "peak_depth": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+        }
+
+    def start(self) -> None:
+        """Start the background writer (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="event-outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> int:
+        """
+        Stop the writer and write everything still queued.
+
+        Returns:
+            Number of events drained after the writer stopped
+        """
+        with self._gate:
+            self._stopping.set()
+            # Bounded by enqueue_timeout: a put that cannot land goes inline
+            self._gate.wait_for(lambda: self._puts_in_flight == 0)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        return self.flush()
+
+    def enqueue(self, event: DomainEvent) -> None:
+        """Queue an event for the next batch; write it inline if the queue stays full."""
+        row = EventStore.values_from_domain_event(event)
+        with self._gate:
+            stopping = self._stopping.is_set()
+            if not stopping:
+                self._puts_in_flight += 1
+        if stopping:
+            # Shut down: nothing will drain the queue any more
+            self._write_inline(row)
+            return
+        try:
+            self._queue.put(row, timeout=self._enqueue_timeout)
+        except queue.Full:
+            logger.warning("Event outbox full (%d queued); writing %s inline", self._max_queue, event.event_id)
+            self._write_inline(row)
+            return
+        finally:
+            with self._gate:
+                self._puts_in_flight -= 1
+                self._gate.notify_all()
+        depth = self._queue.qsize()
+        with self._lock:
+            self._stats["enqueued"] += 1
+            self._stats["peak_depth"] = max(self._stats["peak_depth"], depth)
+
+    def flush(self) -> int:
+        """
+        Write everything queued now, on the calling thread.
+
+        Returns:
+            Number of events taken off the queue
+        """
+        rows: List[_Row] = []
+        while True:
+            try:
+                rows.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        for start in range(0, len(rows), self._batch_size):
+            self._write(rows[start : start + self._batch_size])
+        return len(rows)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get outbox statistics.
+
+        Returns:
+            Dictionary with queue depth and limits, event counters and
+            flush latency in milliseconds
+        """
+        with self._lock:
+            batches = self._stats["batches"]
+            return {
+                "running": self._thread is not None and self._thread.is_alive(),
+                "queue_depth": self._queue.qsize(),
+                "max_queue": self._max_queue,
+                "peak_depth": self._stats["peak_depth"],
+                "enqueued": self._stats["enqueued"],
+                "inline_writes": self._stats["inline_writes"],
+                "batches": batches,
+                "written": self._stats["written"],
+                "failed": self._stats["failed"],
+                "last_flush_ms": round(self._stats["last_flush_ms"], 2),
+                "avg_flush_ms": round(self._stats["total_flush_ms"] / batches, 2) if batches else 0.0,
+                "max_flush_ms": round(self._stats["max_flush_ms"], 2),
+            }
+
+    def _write_inline(self, row: _Row) -> None:
+        with self._lock:
+            self._stats["inline_writes"] += 1
+        self._write([row])
+
+    def _run(self) -> None:
+        """Writer loop: one batch per size/time threshold until stop()."""
+        while not self._stopping.is_set():
+            try:
+                batch = self._next_batch()
+                if batch:
+                    self._write(batch)
+            except Exception as e:  # keep the writer alive; the rows are counted as failed in _write
+                logger.error(f"Event outbox writer error: {e}")
+
+    def _next_batch(self) -> List[_Row]:
+        """Block for the first row, then gather until the batch is full or the interval has passed."""
+        try:
+            batch = [self._queue.get(timeout=self._flush_interval)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self._flush_interval
+        while len(batch) < self._batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, rows: List[_Row]) -> None:
+        """One multi-row INSERT + COMMIT; on failure retry row by row so one bad event can't sink the batch."""
+        started = time.perf_counter()
+        written = 0
+        session = self._session_factory()
+        try:
+            try:
+                session.execute(insert(EventStore), rows)
+                session.commit()
+                written = len(rows)
+            except SQLAlchemyError as e:
+                session.rollback()
+                logger.warning(f"EVENT_STORE batch of {len(rows)} failed ({e}); retrying row by row")
+                for row in rows:
+                    try:
+                        session.execute(insert(EventStore), [row])
+                        session.commit()
+                        written += 1
+                    except SQLAlchemyError as row_error:
+                        session.rollback()
+                        logger.error(f"Error persisting event {row['event_id']}: {row_error}")
+        finally:
+            session.close()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                self._stats["batches"] += 1
+                self._stats["written"] += written
+                self._stats["failed"] += len(rows) - written
+                self._stats["last_flush_ms"] = elapsed_ms
+                self._stats["max_flush_ms"] = max(self._stats["max_flush_ms"], elapsed_ms)
+                self._stats["total_flush_ms"] += elapsed_ms
+
+
+# Process-wide outbox, started by the application lifespan
+_outbox: Optional[EventOutbox] = None
+
+
+def start_event_outbox(session_factory: Callable[[], Any]) -> EventOutbox:
+    """Create (from settings) and start the process outbox, replacing any previous one."""
+    from backend.config import settings
+
+    global _outbox
+    if _outbox is not None:
+        _outbox.stop()
+    _outbox = EventOutbox(
+        session_factory,
+        max_queue=settings.EVENT_OUTBOX_MAX_QUEUE,
+        batch_size=settings.EVENT_OUTBOX_BATCH_SIZE,
+        flush_interval=settings.EVENT_OUTBOX_FLUSH_INTERVAL,
+        enqueue_timeout=settings.EVENT_OUTBOX_ENQUEUE_TIMEOUT,
+    )
+    _outbox.start()
+    return _outbox
+
+
+def get_event_outbox() -> Optional[EventOutbox]:
+    """Get the process outbox (None before startup or after shutdown)."""
+    return _outbox
+
+
+def stop_event_outbox() -> None:
+    """Stop the process outbox, writing every queued event first."""
+    global _outbox
+    if _outbox is None:
+        return
+    drained = _outbox.stop()
+    _outbox = None
+    logger.info(f"Event outbox stopped ({drained} queued events written on shutdown)")
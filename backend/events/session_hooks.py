@@ -4,16 +4,127 @@ Phase 3: Domain Events Infrastructure
 
 Provides automatic event flushing after successful commits
 and event discarding on rollbacks.
+
+Also tracks which cached entities each transaction touched (production,
+quality, work orders, ...) so KPICache entries derived from them are
+evicted the moment the change commits -- including writes that never
+raise a domain event (CSV imports, plain CRUD updates). The eviction is
+local to the committing process: other workers keep their copies until
+the entry's TTL expires, so it does not make long TTLs safe.
 """
 
-from sqlalchemy import event
+from datetime import date
+from typing import Any, Dict, Optional, Set, Tuple
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import event, inspect
 import logging
 
+from backend.cache import get_cache
 from backend.events.bus import get_event_bus
-from typing import Any
+from backend.events.handlers.cache_handlers import as_day
 
 logger = logging.getLogger(__name__)
 
+# Table -> KPICache tag entity. Tables not listed never invalidate anything.
+_TABLE_ENTITIES: Dict[str, str] = {
+    "PRODUCTION_ENTRY": "production",
+    "QUALITY_ENTRY": "quality",
+    "DOWNTIME_ENTRY": "downtime",
+    "ATTENDANCE_ENTRY": "attendance",
+    "HOLD_ENTRY": "hold",
+    "WORK_ORDER": "work_order",
+    "CLIENT_CONFIG": "client_config",
+    "PRODUCT": "product",
+    "SHIFT": "shift",
+    "PRODUCTION_LINE": "production_line",
+    "EMPLOYEE": "employee",
+    # No client or date of its own: an allocation edit evicts every
+    # attendance-derived entry.
+    "ATTENDANCE_HOUR_ALLOCATION": "attendance",
+    # Cached authenticated principals (backend/auth/principal_cache.py)
+    "USER": "user",
+    "USER_CLIENT_ASSIGNMENT": "user",
+}
+
+# Date columns a changed row is bucketed by; every one present is recorded,
+# old and new values alike, so moving a row between days evicts both.
+_DATE_ATTRS = ("production_date", "shift_date", "hold_date")
+
+_Change = Tuple[str, Optional[str], Optional[date]]
+
+# Session -> changes flushed in its current transaction, applied on commit.
+_pending_changes: "WeakKeyDictionary[Any, Set[_Change]]" = WeakKeyDictionary()
+
+
+def _row_changes(obj: Any) -> Set[_Change]:
+    """(entity, client_id, day) triples a new/dirty/deleted row affects."""
+    entity = _TABLE_ENTITIES.get(getattr(obj, "__tablename__", ""))
+    if entity is None:
+        return set()
+    client_id = getattr(obj, "client_id", None)
+    state = inspect(obj)
+    days: Set[Optional[date]] = set()
+    for attr in _DATE_ATTRS:
+        if attr not in state.mapper.column_attrs:
+            continue
+        history = state.attrs[attr].history
+        for value in (*history.added, *history.unchanged, *history.deleted):
+            days.add(as_day(value))
+    if not days:
+        days.add(None)
+    return {(entity, client_id, day) for day in days}
+
+
+def _record_changes(session: Any, flush_context: Any) -> None:
+    """after_flush: remember what this flush wrote (new/dirty/deleted still reflect it here)."""
+    changes: Set[_Change] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        changes |= _row_changes(obj)
+    if changes:
+        _pending_changes.setdefault(session, set()).update(changes)
+
+
+def _invalidate_committed(session: Any) -> None:
+    """after_commit: evict cache entries derived from what this transaction changed."""
+    changes = _pending_changes.pop(session, None)
+    if not changes:
+        return
+    cache = get_cache()
+    evicted = sum(cache.invalidate_tags(entity, client_id, day) for entity, client_id, day in changes)
+    if evicted > 0:
+        logger.debug(f"Evicted {evicted} cache entries after commit")
+
+
+def _discard_changes(session: Any) -> None:
+    """after_rollback: nothing was written, nothing to evict."""
+    _pending_changes.pop(session, None)
+
+
+def _flush_events(session: Any) -> None:
+    """Flush this session's (and this context's) collected events after successful commit."""
+    bus = get_event_bus()
+    count = bus.flush_collected(session)
+    if count > 0:
+        logger.debug(f"Flushed {count} events after commit")
+
+
+def _discard_events(session: Any) -> None:
+    """Discard this session's (and this context's) collected events on rollback."""
+    bus = get_event_bus()
+    count = bus.discard_collected(session)
+    if count > 0:
+        logger.debug(f"Discarded {count} events after rollback")
+
+
+_HOOKS = (
+    ("after_flush", _record_changes),
+    ("after_commit", _invalidate_committed),
+    ("after_commit", _flush_events),
+    ("after_rollback", _discard_changes),
+    ("after_rollback", _discard_events),
+)
+
 
 def setup_session_hooks(session_factory: Any) -> None:
     """
@@ -24,22 +135,12 @@ def setup_session_hooks(session_factory: Any) -> None:
     - Flushed after successful commit
     - Discarded on rollback
 
+    and commit-time KPICache invalidation for the tables in _TABLE_ENTITIES.
+    Idempotent per session_factory.
+
     Args:
         session_factory: SQLAlchemy session factory or Session class
     """
-
-    @event.listens_for(session_factory, "after_commit")
-    def after_commit(session: Any) -> None:
-        """Flush collected events after successful commit."""
-        bus = get_event_bus()
-        count = bus.flush_collected()
-        if count > 0:
-            logger.debug(f"Flushed {count} events after commit")
-
-    @event.listens_for(session_factory, "after_rollback")
-    def after_rollback(session: Any) -> None:
-        """Discard collected events on rollback."""
-        bus = get_event_bus()
-        count = bus.discard_collected()
-        if count > 0:
-            logger.debug(f"Discarded {count} events after rollback")
+    for identifier, fn in _HOOKS:
+        if not event.contains(session_factory, identifier, fn):
+            event.listen(session_factory, identifier, fn)
@@ -1,6 +1,6 @@
 """
 Backend middleware for multi-tenant authorization, client isolation, rate limiting,
-and audit logging.
+audit logging and response compression.
 """
 
 from .client_auth import verify_client_access, get_user_client_filter, ClientAccessError
@@ -15,6 +15,7 @@ from .rate_limit import (
     report_rate_limit,
 )
 from .audit_log import AuditLogMiddleware
+from .compression import CompressionMiddleware
 from .write_access import require_capacity_write, require_operations_write
 
 __all__ = [
@@ -33,6 +34,8 @@ __all__ = [
     "report_rate_limit",
     # Audit logging
     "AuditLogMiddleware",
+    # Response compression
+    "CompressionMiddleware",
     # Write access control
     "require_capacity_write",
     "require_operations_write",
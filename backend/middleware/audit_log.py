@@ -11,10 +11,9 @@ Log format:
 
 import logging
 import time
+from typing import Any, Dict
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("audit")
 
@@ -22,38 +21,48 @@ logger = logging.getLogger("audit")
 _AUDITED_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
 
 
-class AuditLogMiddleware(BaseHTTPMiddleware):
+class AuditLogMiddleware:
     """
-    Starlette middleware that emits structured audit log lines for every
+    ASGI middleware that emits structured audit log lines for every
     state-changing request that hits an ``/api/`` path.
 
     Non-mutating methods (GET, HEAD, OPTIONS) and non-API paths (health
     checks, static assets, docs) are silently passed through.
     """
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Fast-path: skip methods and paths we don't care about
-        if request.method not in _AUDITED_METHODS:
-            return await call_next(request)
+        if scope["type"] != "http" or scope["method"] not in _AUDITED_METHODS or not scope["path"].startswith("/api/"):
+            await self.app(scope, receive, send)
+            return
+
+        # request.state is backed by scope["state"]; create it here so the
+        # dict the auth dependency writes user_id into is the one read below
+        state: Dict[str, Any] = scope.setdefault("state", {})
+        status_code = 500
 
-        if not request.url.path.startswith("/api/"):
-            return await call_next(request)
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         start = time.monotonic()
-        response = await call_next(request)
+        await self.app(scope, receive, send_with_status)
         elapsed_ms = round((time.monotonic() - start) * 1000)
 
         # Extract user_id from request state (set by auth dependencies) or
         # fall back to "anonymous".
-        user_id = getattr(request.state, "user_id", None) or "anonymous"
+        user_id = state.get("user_id") or "anonymous"
 
         logger.info(
             "[AUDIT] %s %s | user=%s | status=%s | time=%dms",
-            request.method,
-            request.url.path,
+            scope["method"],
+            scope["path"],
             user_id,
-            response.status_code,
+            status_code,
             elapsed_ms,
         )
-
-        return response
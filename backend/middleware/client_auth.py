@@ -15,6 +15,9 @@ from backend.orm.user import User, UserRole
 
 logger = logging.getLogger(__name__)
 
+# getattr default telling "assignments never looked up" from "looked up, none"
+_UNRESOLVED: Any = object()
+
 
 class ClientAccessError(HTTPException):
     """Custom exception for client access violations"""
@@ -71,6 +74,11 @@ def _get_clients_from_legacy_field(user: User) -> Optional[List[str]]:
     return user_clients if user_clients else None
 
 
+def sees_all_clients(user: User) -> bool:
+    """ADMIN and POWERUSER are not confined to assigned clients."""
+    return user.role in [UserRole.ADMIN, UserRole.POWERUSER]
+
+
 def get_user_client_filter(user: User, db: Optional[Session] = None) -> Optional[List[str]]:
     """
     Get list of client IDs the user can access
@@ -81,9 +89,9 @@ def get_user_client_filter(user: User, db: Optional[Session] = None) -> Optional
     JWT Freshness Note:
         This function reads client assignments from the DB user record
         (user.client_id_assigned) or the junction table — never from JWT
-        claims. The user object passed here is loaded fresh from the DB
-        by get_current_user on every request, so the client list is always
-        current regardless of what the JWT token contains.
+        claims. get_current_user serves the user and its junction rows from
+        a short-TTL principal cache that any USER / USER_CLIENT_ASSIGNMENT
+        commit evicts, so the client list tracks the database, not the token.
 
     Args:
         user: Authenticated user object (loaded from DB by get_current_user)
@@ -97,13 +105,18 @@ def get_user_client_filter(user: User, db: Optional[Session] = None) -> Optional
         ClientAccessError: If user has no client assignment
     """
     # ADMIN and POWERUSER have access to all clients
-    if user.role in [UserRole.ADMIN, UserRole.POWERUSER]:
+    if sees_all_clients(user):
         return None  # None = no filtering, access all
 
-    # Try junction table first (if db session available)
+    # Try junction table first (if db session available). get_current_user
+    # attaches the assignments it cached with the principal.
     user_clients = None
     if db is not None:
-        user_clients = _get_clients_from_junction_table(db, user.user_id)
+        cached: Optional[tuple[str, ...]] = getattr(user, "_junction_clients", _UNRESOLVED)
+        if cached is _UNRESOLVED:
+            user_clients = _get_clients_from_junction_table(db, user.user_id)
+        elif cached is not None:
+            user_clients = list(cached)
 
     # Fall back to legacy comma-separated field
     if user_clients is None:
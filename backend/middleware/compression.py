@@ -0,0 +1,210 @@
+"""
+Response Compression Middleware
+
+Compresses response bodies with the best encoding the client accepts:
+brotli when the optional ``brotli`` package is installed, otherwise gzip.
+KPI, pivot and export payloads are large, repetitive JSON/CSV and shrink
+5-20x on the wire.
+
+- Bodies smaller than ``minimum_size`` are sent as-is; compressing them costs
+  more than it saves.
+- Only text-like content types are compressed (JSON, text/*, CSV, XML, JS,
+  SVG). Images and XLSX/ZIP exports are already compressed.
+- A response that already carries a Content-Encoding is passed through
+  untouched, as are Server-Sent Events (they must not be buffered).
+- Streaming responses stay streaming: each chunk goes through one
+  incremental compressor, and Content-Length is dropped.
+
+Plain ASGI, like every other middleware in this package.
+"""
+
+import zlib
+from typing import Optional, Union
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Brotli is optional: without it every client that accepts gzip gets gzip
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+_COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/problem+json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+_EXCLUDED_TYPES = ("text/event-stream",)
+
+
+class _GzipEncoder:
+    def __init__(self, level: int) -> None:
+        # wbits=31: zlib deflate with a gzip header and trailer
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliEncoder:
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return bytes(self._compressor.process(data))
+
+    def finish(self) -> bytes:
+        return bytes(self._compressor.finish())
+
+
+_Encoder = Union[_GzipEncoder, _BrotliEncoder]
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the response encoding for an Accept-Encoding header.
+
+    Returns:
+        "br", "gzip", or None for identity. Codings listed with q=0 are
+        refused; otherwise brotli (when installed) wins over gzip.
+    """
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip()
+        if not coding:
+            continue
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding)
+    if BROTLI_AVAILABLE and ("br" in accepted or "*" in accepted):
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def is_compressible(content_type: str) -> bool:
+    """True for text-like media types that are worth compressing."""
+    content_type = content_type.lower()
+    if content_type.startswith(_EXCLUDED_TYPES):
+        return False
+    return content_type.startswith(_COMPRESSIBLE_TYPES) or "+json" in content_type
+
+
+class CompressionMiddleware:
+    """
+    Negotiated gzip/brotli compression for responses of at least
+    ``minimum_size`` bytes.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def _encoder(self, encoding: str) -> _Encoder:
+        if encoding == "br":
+            return _BrotliEncoder(self.brotli_quality)
+        return _GzipEncoder(self.gzip_level)
+
+
+class _CompressionResponder:
+    """Per-request send() wrapper; holds back the start message until the first body chunk."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self._middleware = middleware
+        self._encoding = encoding
+        self._send = send
+        self._start: Optional[Message] = None
+        self._encoder: Optional[_Encoder] = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self._passthrough = "content-encoding" in headers or not is_compressible(headers.get("content-type", ""))
+            if self._passthrough:
+                await self._send(message)
+            else:
+                self._start = message
+            return
+
+        if message_type != "http.response.body" or self._passthrough:
+            if self._start is not None:  # e.g. http.response.pathsend
+                await self._send(self._start)
+                self._start = None
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._start is not None:
+            # First body chunk decides: small complete bodies go out unchanged
+            start, self._start = self._start, None
+            headers = MutableHeaders(raw=start["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if not more_body and len(body) < self._middleware.minimum_size:
+                await self._send(start)
+                await self._send(message)
+                return
+            self._encoder = self._middleware._encoder(self._encoding)
+            headers["Content-Encoding"] = self._encoding
+            if "content-length" in headers:
+                del headers["Content-Length"]
+            compressed = _compress(self._encoder, body, more_body)
+            if not more_body:
+                headers["Content-Length"] = str(len(compressed))
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+            return
+
+        if self._encoder is None:
+            # Uncompressed response that turned out to be streamed
+            await self._send(message)
+            return
+        compressed = _compress(self._encoder, body, more_body)
+        await self._send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
+
+def _compress(encoder: _Encoder, body: bytes, more_body: bool) -> bytes:
+    data = encoder.compress(body)
+    if not more_body:
+        data += encoder.finish()
+    return data
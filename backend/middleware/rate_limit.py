@@ -14,8 +14,9 @@ Environment Variables:
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from typing import Any, Optional
 import time
 import os
@@ -71,9 +72,9 @@ class RateLimitConfig:
     REPORT_LIMIT = "10/minute"
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
-    Custom middleware to add rate limit headers to all responses
+    Custom ASGI middleware to add rate limit headers to all responses
 
     Headers added:
     - X-RateLimit-Limit: Maximum requests allowed
@@ -81,33 +82,35 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     - X-RateLimit-Reset: Timestamp when limit resets
     """
 
-    def __init__(self, app: Any, limiter_instance: Optional[Limiter] = None):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, limiter_instance: Optional[Limiter] = None):
+        self.app = app
         self.limiter = limiter_instance or limiter
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and add rate limit headers to response"""
-
-        # Get client identifier
-        get_remote_address(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Calculate current window
         current_time = int(time.time())
         window_start = current_time - (current_time % 60)  # 1-minute windows
         window_reset = window_start + 60
 
-        # Call the actual endpoint
-        response = await call_next(request)
-
-        # Add rate limit headers to response
-        response.headers["X-RateLimit-Limit"] = "200"
-        response.headers["X-RateLimit-Reset"] = str(window_reset)
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add rate limit headers to response
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = "200"
+                headers["X-RateLimit-Reset"] = str(window_reset)
 
-        # Note: Actual remaining count is managed by slowapi internally
-        # These are informational headers
-        response.headers["X-RateLimit-Policy"] = "200 requests per minute"
+                # Note: Actual remaining count is managed by slowapi internally
+                # These are informational headers
+                headers["X-RateLimit-Policy"] = "200 requests per minute"
+            await send(message)
 
-        return response
+        # Call the actual endpoint
+        await self.app(scope, receive, send_with_headers)
 
 
 def get_rate_limit_key(request: Request) -> str:
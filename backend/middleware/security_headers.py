@@ -5,12 +5,20 @@ Adds standard security headers to all HTTP responses to mitigate
 common web vulnerabilities (XSS, clickjacking, MIME sniffing, etc.).
 """
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+_SECURITY_HEADERS = (
+    ("X-Content-Type-Options", "nosniff"),
+    ("X-Frame-Options", "DENY"),
+    ("X-XSS-Protection", "1; mode=block"),
+    ("Referrer-Policy", "strict-origin-when-cross-origin"),
+    ("Permissions-Policy", "camera=(), microphone=(), geolocation=()"),
+)
+_HSTS = "max-age=31536000; includeSubDomains"
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+
+class SecurityHeadersMiddleware:
     """
     Middleware that injects security-related HTTP headers into every response.
 
@@ -21,20 +29,30 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         Strict-Transport-Security: max-age=31536000; includeSubDomains (non-localhost only)
         Referrer-Policy: strict-origin-when-cross-origin
         Permissions-Policy: camera=(), microphone=(), geolocation=()
+
+    Plain ASGI: the headers are set on the http.response.start message, so
+    streamed bodies pass through unbuffered.
     """
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        response = await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Only add HSTS when not running on localhost (avoids breaking local dev)
-        host = request.headers.get("host", "")
-        if not host.startswith("localhost") and not host.startswith("127.0.0.1"):
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-
-        return response
+        host = Headers(scope=scope).get("host", "")
+        add_hsts = not host.startswith("localhost") and not host.startswith("127.0.0.1")
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in _SECURITY_HEADERS:
+                    headers[name] = value
+                if add_hsts:
+                    headers["Strict-Transport-Security"] = _HSTS
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
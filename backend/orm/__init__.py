@@ -126,6 +126,9 @@ from .simulation_scenario import SimulationScenario
 # Project A — Audit trail
 from .audit_entry import AuditEntry, AuditOperation
 
+# Pivot rollup store
+from .pivot_daily_rollup import PivotDailyRollup
+
 
 def register_all_models() -> None:
     """Register EVERY ORM model on Base.metadata (idempotent).
@@ -236,4 +239,6 @@ __all__ = [
     # Project A — Audit trail
     "AuditEntry",
     "AuditOperation",
+    # Pivot rollup store
+    "PivotDailyRollup",
 ]
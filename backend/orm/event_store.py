@@ -7,7 +7,7 @@ Enables event replay, audit trails, and event sourcing.
 """
 
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from sqlalchemy import DateTime, ForeignKey, Index, Integer, JSON, String, func
 from sqlalchemy.orm import Mapped, mapped_column
@@ -61,22 +61,38 @@ class EventStore(Base):
         Returns:
             EventStore instance ready for persistence
         """
-        return cls(
-            event_id=event.event_id,
-            event_type=event.event_type,
-            aggregate_type=event.aggregate_type,
-            aggregate_id=event.aggregate_id,
-            client_id=event.client_id,
-            triggered_by=event.triggered_by,
-            occurred_at=event.occurred_at,
-            payload=event.to_dict(),
-        )
+        return cls(**cls.values_from_domain_event(event))
+
+    @staticmethod
+    def values_from_domain_event(event: Any) -> Dict[str, Any]:
+        """
+        Column values for a DomainEvent, for multi-row INSERTs.
+
+        Args:
+            event: DomainEvent instance
+
+        Returns:
+            Dict keyed by EventStore column name
+        """
+        return {
+            "event_id": event.event_id,
+            "event_type": event.event_type,
+            "aggregate_type": event.aggregate_type,
+            "aggregate_id": event.aggregate_id,
+            "client_id": event.client_id,
+            "triggered_by": event.triggered_by,
+            "occurred_at": event.occurred_at,
+            "payload": event.to_dict(),
+        }
 
 
 def create_event_persistence_handler(db_session_factory: Any) -> Any:
     """
     Create a persistence handler for the event bus.
 
+    Writes each event in its own session and commit; the application uses
+    the batching EventOutbox (backend/events/outbox.py) instead.
+
     Args:
         db_session_factory: Callable that returns a database session
 
@@ -0,0 +1,49 @@
+"""
+PIVOT_DAILY_ROLLUP table — materialized pivot day rows.
+
+One row per (dataset, client, day, group_by, group_key) holding the summed
+components run_pivot would otherwise aggregate from raw rows on every call.
+Written only by backend/pivot/rollup.py (commit hooks + nightly reconcile).
+"""
+
+from datetime import date, datetime
+from typing import Any, Dict
+
+from sqlalchemy import JSON, Date, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.database import Base
+
+
+class PivotDailyRollup(Base):
+    """PIVOT_DAILY_ROLLUP table - per-client day rows for one dataset/group_by."""
+
+    __tablename__ = "PIVOT_DAILY_ROLLUP"
+    __table_args__ = (
+        # run_pivot's coverage count and day-row read.
+        Index("ix_pivot_rollup_lookup", "dataset", "group_by", "day", "client_id"),
+        # The refresh delete of one (dataset, client, day range). Nothing is
+        # unique on purpose: hook-path group keys are grouped in Python, so two
+        # keys a case-insensitive collation considers equal are separate rows.
+        Index("ix_pivot_rollup_client_day", "dataset", "client_id", "day"),
+        {"extend_existing": True},
+    )
+
+    rollup_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    dataset: Mapped[str] = mapped_column(String(30), nullable=False)
+    # A real FK so the seeder's --reset sweep (which derives tenant tables from
+    # FKs into CLIENT) clears a client's rollup rows with the rest of its data.
+    client_id: Mapped[str] = mapped_column(String(50), ForeignKey("CLIENT.client_id"), nullable=False)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+
+    # "" for the ungrouped row, in both columns. Every refreshed (dataset,
+    # client, day) gets an ungrouped row, with empty components when the day
+    # has no data -- its presence is what marks the day as materialized.
+    group_by: Mapped[str] = mapped_column(String(30), nullable=False)
+    group_key: Mapped[str] = mapped_column(String(100), nullable=False)
+
+    #: {component: float}, only the components the live path produced.
+    components: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
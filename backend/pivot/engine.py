@@ -1,8 +1,13 @@
 """Generic pivot execution: one SQL aggregate per (day, group), Python bucket
-rollup, ratio-of-sums composition, float coercion (Cycle 4 spec §3)."""
+rollup, ratio-of-sums composition, float coercion (Cycle 4 spec §3).
+
+Day rows come from PIVOT_DAILY_ROLLUP when it covers the whole window (see
+backend/pivot/rollup.py), else from the live path below. Either way they are
+cached per (dataset, group_by, window, client set), so re-bucketing the same
+window -- or several pivots over it via run_pivots -- never refetches."""
 
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from datetime import date
 from decimal import Decimal
 from typing import Any, Optional, Sequence
@@ -10,8 +15,13 @@ from typing import Any, Optional, Sequence
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from backend.cache import CacheTag, get_cache
+from backend.cache.kpi_cache import build_hash_key
+from backend.config import settings
+from backend.db.sql_functions import date_window
 from backend.pivot.buckets import VALID_BUCKETS, bucket_start
 from backend.pivot.registry import DATASETS, Component, Count, Dataset, Ratio, Share, Sum
+from backend.pivot.rollup import read_rollup
 
 
 def _as_date(value: Any) -> date:
@@ -29,6 +39,30 @@ def _as_float(value: Any) -> float:
     return float(value)
 
 
+# KPICache tag entities (backend/events/session_hooks._TABLE_ENTITIES) each
+# dataset's day rows derive from: (dated source rows, dimension rows whose
+# edits can change any day -- group names, cycle times, labor classes).
+_DAY_ROW_SOURCES: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "production": (("production",), ("product", "production_line")),
+    "downtime": (("downtime",), ("production_line",)),
+    "quality": (("quality",), ("work_order",)),
+    "holds": (("hold",), ()),
+    "labor": (("attendance", "production"), ("employee", "product")),
+    "delivery": (("work_order",), ()),
+}
+
+_DayRow = tuple[date, Optional[str], dict[str, Any]]
+
+
+def _dataset(dataset_name: str, bucket: str, group_by: Optional[str]) -> Dataset:
+    ds = DATASETS[dataset_name]  # KeyError -> route 422
+    if bucket not in VALID_BUCKETS:
+        raise ValueError(f"bucket must be one of {VALID_BUCKETS}")
+    if group_by is not None and group_by not in ds.group_bys:
+        raise ValueError(f"group_by must be one of {sorted(ds.group_bys)}")
+    return ds
+
+
 def run_pivot(
     db: Session,
     dataset_name: str,
@@ -38,18 +72,75 @@ def run_pivot(
     end_date: date,
     client_ids: Optional[Sequence[str]],
 ) -> dict[str, Any]:
-    ds = DATASETS[dataset_name]  # KeyError -> route 422
-    if bucket not in VALID_BUCKETS:
-        raise ValueError(f"bucket must be one of {VALID_BUCKETS}")
-    if group_by is not None and group_by not in ds.group_bys:
-        raise ValueError(f"group_by must be one of {sorted(ds.group_bys)}")
+    ds = _dataset(dataset_name, bucket, group_by)
+    return _bucketed(ds, bucket, group_by, cached_day_rows(db, ds, group_by, start_date, end_date, client_ids))
 
-    components = {n: m for n, m in ds.measures.items() if isinstance(m, (Sum, Count, Component))}
 
-    if ds.fetch is not None:
-        day_rows = ds.fetch(db, group_by, start_date, end_date, client_ids)
-    else:
-        day_rows = _sql_day_rows(db, ds, group_by, start_date, end_date, client_ids, components)
+def run_pivots(
+    db: Session,
+    specs: Sequence[tuple[str, str, Optional[str]]],
+    start_date: date,
+    end_date: date,
+    client_ids: Optional[Sequence[str]],
+) -> list[dict[str, Any]]:
+    """run_pivot for several (dataset, bucket, group_by) specs over one window
+    and scope. Day rows are fetched once per (dataset, group_by) and
+    re-bucketed for each spec. Every spec is validated before any is run."""
+    resolved = [(_dataset(name, bucket, group_by), bucket, group_by) for name, bucket, group_by in specs]
+    fetched: dict[tuple[str, Optional[str]], list[_DayRow]] = {}
+    results = []
+    for ds, bucket, group_by in resolved:
+        key = (ds.name, group_by)
+        if key not in fetched:
+            fetched[key] = cached_day_rows(db, ds, group_by, start_date, end_date, client_ids)
+        results.append(_bucketed(ds, bucket, group_by, fetched[key]))
+    return results
+
+
+def cached_day_rows(
+    db: Session,
+    ds: Dataset,
+    group_by: Optional[str],
+    start_date: date,
+    end_date: date,
+    client_ids: Optional[Sequence[str]],
+) -> list[_DayRow]:
+    """Day rows for one (dataset, group_by, window, client set), through
+    KPICache: from the rollup store when it covers the window, else live.
+
+    Bucket is not part of the key -- any bucket is a rollup of the same day
+    rows. The entry is tagged with the dataset's sources so a commit touching
+    them evicts it. The key carries the window's "as of" day because hold
+    ages are measured against it."""
+
+    def compute() -> list[_DayRow]:
+        rows: Optional[Iterable[_DayRow]] = None
+        if settings.PIVOT_ROLLUP_ENABLED:
+            rows = read_rollup(db, ds, group_by, start_date, end_date, client_ids)
+        if rows is None:
+            rows = day_rows(db, ds, group_by, start_date, end_date, client_ids)
+        return list(rows)
+
+    clients = sorted(client_ids) if client_ids is not None else None
+    key = build_hash_key(
+        "pivot_days",
+        dataset=ds.name,
+        group_by=group_by,
+        start=start_date,
+        end=end_date,
+        clients=clients,
+        as_of=min(date.today(), end_date),
+    )
+    dated, dimensions = _DAY_ROW_SOURCES[ds.name]
+    tag_clients: Sequence[Optional[str]] = clients if clients is not None else [None]
+    tags = [CacheTag(entity, c, start_date, end_date) for entity in dated for c in tag_clients]
+    tags += [CacheTag(entity, c) for entity in dimensions for c in tag_clients]
+    rows: list[_DayRow] = get_cache().get_or_set(key, compute, settings.CACHE_TTL_AGGREGATIONS, tags=tags)
+    return rows
+
+
+def _bucketed(ds: Dataset, bucket: str, group_by: Optional[str], rows_in: Iterable[_DayRow]) -> dict[str, Any]:
+    components = _components(ds)
 
     # rollup: (bucket_start, group_key) -> {component: float}
     acc: dict[tuple, dict[str, float]] = defaultdict(lambda: {n: 0.0 for n in components})
@@ -59,7 +150,7 @@ def run_pivot(
     # Component that was NEVER produced (e.g. labor's earned_hours when
     # group_by == "labor_class") is omitted rather than shown as 0/None.
     produced: set[str] = set()
-    for day, grp, comps in day_rows:
+    for day, grp, comps in rows_in:
         key = (bucket_start(day, bucket), grp)
         for n in components:
             if n in comps:
@@ -80,7 +171,7 @@ def run_pivot(
     totals.update(_derived(ds, window_totals, window_totals, produced))
 
     return {
-        "dataset": dataset_name,
+        "dataset": ds.name,
         "bucket": bucket,
         "group_by": group_by,
         "rows": rows,
@@ -88,6 +179,25 @@ def run_pivot(
     }
 
 
+def _components(ds: Dataset) -> dict[str, Any]:
+    return {n: m for n, m in ds.measures.items() if isinstance(m, (Sum, Count, Component))}
+
+
+def day_rows(
+    db: Session,
+    ds: Dataset,
+    group_by: Optional[str],
+    start_date: date,
+    end_date: date,
+    client_ids: Optional[Sequence[str]],
+) -> Iterator[tuple[date, Optional[str], dict[str, Any]]]:
+    """Live (day, group, components) rows: the dataset's fetch hook, or one
+    SQL GROUP BY over its raw rows. Also what the rollup store is built from."""
+    if ds.fetch is not None:
+        return iter(ds.fetch(db, group_by, start_date, end_date, client_ids))
+    return _sql_day_rows(db, ds, group_by, start_date, end_date, client_ids, _components(ds))
+
+
 def _derived(
     ds: Dataset, comps: dict[str, float], window_totals: dict[str, float], produced: set[str]
 ) -> dict[str, Any]:
@@ -133,7 +243,7 @@ def _sql_day_rows(
     q = db.query(*cols)
     for target, onclause in ds.joins + (gb.joins if gb else ()):
         q = q.outerjoin(target, onclause)
-    q = q.filter(func.date(ds.date_column) >= start_date, func.date(ds.date_column) <= end_date)
+    q = q.filter(date_window(ds.date_column, start_date, end_date))
     for f in ds.base_filters:
         q = q.filter(f)
     if client_ids is not None:
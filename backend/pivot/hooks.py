@@ -15,12 +15,12 @@ nullness check -- see fetch_holds' own docstring, review round CRITICAL 1)
 is only expressible in Python."""
 
 from collections import defaultdict
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal
-from typing import Iterator, Optional, Sequence
+from typing import Any, Iterator, Optional, Sequence
 
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session, raiseload
 
 from backend.calculations.labor_hours import (
     available_for_efficiency_hours,
@@ -28,10 +28,13 @@ from backend.calculations.labor_hours import (
     effective_labor_class,
 )
 from backend.calculations.otd import infer_planned_delivery_date
+from backend.db.sql_functions import date_window
 from backend.orm.attendance_entry import AttendanceEntry
+from backend.orm.attendance_hour_allocation import AttendanceHourAllocation
 from backend.orm.delay_taxonomy import DelayClassificationEnum
 from backend.orm.employee import Employee
 from backend.orm.hold_entry import HoldEntry, HoldStatus
+from backend.orm.product import Product
 from backend.orm.production_entry import ProductionEntry
 from backend.orm.work_order import WorkOrder
 
@@ -43,6 +46,14 @@ _OPEN_HOLD_STATUSES = frozenset(
 )
 
 
+def _in_window(q: Query, model: Any, start_date: date, end_date: date, client_ids: Optional[Sequence[str]]) -> Query:
+    """Restrict an attendance/production query to the window and client scope."""
+    q = q.filter(date_window(model.shift_date, start_date, end_date))
+    if client_ids is not None:
+        q = q.filter(model.client_id.in_(client_ids))
+    return q
+
+
 def fetch_labor(
     db: Session,
     group_by: Optional[str],
@@ -56,32 +67,52 @@ def fetch_labor(
     from production entries (entry ict else product default; neither ->
     excluded) so efficiency_available_basis composes as a ratio of sums --
     earned is only attributed when group_by is None or 'client' (production
-    rows carry no labor class, so it is never produced for 'labor_class')."""
-    q = db.query(AttendanceEntry).filter(
-        func.date(AttendanceEntry.shift_date) >= start_date,
-        func.date(AttendanceEntry.shift_date) <= end_date,
-    )
-    if client_ids is not None:
-        q = q.filter(AttendanceEntry.client_id.in_(client_ids))
-    entries = q.all()
+    rows carry no labor class, so it is never produced for 'labor_class').
 
-    class_by_employee: dict[int, Optional[str]] = {}
+    Column-only and set-based: attendance rows (employee class joined when
+    grouping by it), their allocations per category, and production rows
+    with the product's cycle time joined -- three statements however large
+    the window, with no ORM entities to lazy-load from."""
+    cols = [
+        AttendanceEntry.attendance_entry_id,
+        AttendanceEntry.shift_date,
+        AttendanceEntry.client_id,
+        AttendanceEntry.scheduled_hours,
+        AttendanceEntry.actual_hours,
+        AttendanceEntry.normal_hours,
+        AttendanceEntry.double_hours,
+        AttendanceEntry.triple_hours,
+    ]
     if group_by == "labor_class":
-        employee_ids = {e.employee_id for e in entries}
-        if employee_ids:
-            class_rows = (
-                db.query(Employee.employee_id, Employee.labor_class)
-                .filter(Employee.employee_id.in_(employee_ids))
-                .all()
-            )
-            class_by_employee = {row.employee_id: row.labor_class for row in class_rows}
+        cols += [AttendanceEntry.labor_class_override, Employee.labor_class]
+    q = _in_window(db.query(*cols), AttendanceEntry, start_date, end_date, client_ids)
+    if group_by == "labor_class":
+        q = q.outerjoin(Employee, Employee.employee_id == AttendanceEntry.employee_id)
+    entries = q.all()
+
+    # Allocation hours per (entry, category) in one query, fed to the same
+    # billed_hours / available_for_efficiency_hours the KPI path uses.
+    allocs_by_entry: dict[str, list[tuple[str, Decimal]]] = defaultdict(list)
+    alloc_q = _in_window(
+        db.query(
+            AttendanceHourAllocation.attendance_entry_id,
+            AttendanceHourAllocation.category,
+            func.sum(AttendanceHourAllocation.hours),
+        ).join(AttendanceEntry, AttendanceEntry.attendance_entry_id == AttendanceHourAllocation.attendance_entry_id),
+        AttendanceEntry,
+        start_date,
+        end_date,
+        client_ids,
+    ).group_by(AttendanceHourAllocation.attendance_entry_id, AttendanceHourAllocation.category)
+    for entry_id, category, hours in alloc_q.all():
+        allocs_by_entry[entry_id].append((category, hours))
 
     acc: dict[tuple[date, Optional[str]], dict[str, float]] = defaultdict(lambda: defaultdict(float))
     for e in entries:
         day = e.shift_date.date()
         grp: Optional[str]
         if group_by == "labor_class":
-            cls = effective_labor_class(e.labor_class_override, class_by_employee.get(e.employee_id))
+            cls = effective_labor_class(e.labor_class_override, e.labor_class)
             grp = cls if cls in ("direct", "indirect") else "unclassified"
         elif group_by == "client":
             grp = e.client_id
@@ -97,19 +128,26 @@ def fetch_labor(
             c["triple"] += float(e.triple_hours or 0)
         else:
             c["unsplit_actual"] += actual
-        allocs = [(a.category, a.hours) for a in e.hour_allocations]
+        allocs = allocs_by_entry.get(e.attendance_entry_id, [])
         c["billed"] += float(billed_hours(allocs))
         c["available_for_efficiency"] += float(
             available_for_efficiency_hours(Decimal(str(e.actual_hours or 0)), allocs)
         )
 
     if group_by in (None, "client"):
-        pq = db.query(ProductionEntry).filter(
-            func.date(ProductionEntry.shift_date) >= start_date,
-            func.date(ProductionEntry.shift_date) <= end_date,
+        pq = _in_window(
+            db.query(
+                ProductionEntry.shift_date,
+                ProductionEntry.client_id,
+                ProductionEntry.units_produced,
+                ProductionEntry.ideal_cycle_time,
+                Product.ideal_cycle_time.label("product_ideal_cycle_time"),
+            ).outerjoin(Product, Product.product_id == ProductionEntry.product_id),
+            ProductionEntry,
+            start_date,
+            end_date,
+            client_ids,
         )
-        if client_ids is not None:
-            pq = pq.filter(ProductionEntry.client_id.in_(client_ids))
         production_entries = pq.all()
         if not production_entries:
             # No production rows at all in scope this call -- earned_hours/
@@ -123,8 +161,8 @@ def fetch_labor(
                 c["excluded_entries"] += 0.0
         for pe in production_entries:
             ict = pe.ideal_cycle_time
-            if ict is None and pe.product is not None:
-                ict = pe.product.ideal_cycle_time
+            if ict is None:
+                ict = pe.product_ideal_cycle_time
             pe_day = pe.shift_date.date()
             pe_grp = pe.client_id if group_by == "client" else None
             pc = acc[(pe_day, pe_grp)]
@@ -149,6 +187,7 @@ def fetch_holds(
     start_date: date,
     end_date: date,
     client_ids: Optional[Sequence[str]],
+    age_open_holds: bool = True,
 ) -> Iterator[tuple[date, Optional[str], dict[str, float]]]:
     """Per-(day, group) hold components (validation finding F3; review round
     CRITICAL 1). The SQL-path `hold_days` measure summed
@@ -182,11 +221,24 @@ def fetch_holds(
     coalesce-to-"uncategorized" semantics reapplied here in Python since the
     fetch path bypasses the SQL func.coalesce() -- `is None` only (NOT
     `or`), so an empty string doesn't fold into the sentinel, matching SQL
-    COALESCE's NULL-only substitution exactly."""
-    q = db.query(HoldEntry).filter(
+    COALESCE's NULL-only substitution exactly.
+
+    Every bucket also carries an `open_holds` count (not a registered
+    measure, so run_pivot ignores it). With age_open_holds=False open holds
+    add nothing to hold_days: backend/pivot/rollup.py stores that
+    window-independent part and re-ages the open holds against the reading
+    window's own "as of" day."""
+    q = db.query(
+        HoldEntry.hold_date,
+        HoldEntry.client_id,
+        HoldEntry.hold_reason_category,
+        HoldEntry.hold_reason,
+        HoldEntry.hold_status,
+        HoldEntry.total_hold_duration_hours,
+        HoldEntry.resume_date,
+    ).filter(
         HoldEntry.hold_date.isnot(None),
-        func.date(HoldEntry.hold_date) >= start_date,
-        func.date(HoldEntry.hold_date) <= end_date,
+        date_window(HoldEntry.hold_date, start_date, end_date),
     )
     if client_ids is not None:
         q = q.filter(HoldEntry.client_id.in_(client_ids))
@@ -212,7 +264,8 @@ def fetch_holds(
         c = acc[(day, grp)]
         c["holds"] += 1
         if h.hold_status in _OPEN_HOLD_STATUSES:
-            c["hold_days"] += (as_of - day).days
+            c["open_holds"] += 1
+            c["hold_days"] += (as_of - day).days if age_open_holds else 0.0
         elif h.total_hold_duration_hours:
             c["hold_days"] += float(h.total_hold_duration_hours) / 24.0
         elif h.resume_date is not None:
@@ -232,16 +285,21 @@ def fetch_delivery(
     client_ids: Optional[Sequence[str]],
 ) -> Iterator[tuple[date, Optional[str], dict[str, float]]]:
     """Per-(day, group) delivery components mirroring calculate_true_otd's
-    STANDARD-OTD counting rules (backend/calculations/otd.py:380-433, spec §4
+    STANDARD-OTD counting rules (backend/calculations/otd.py::_OTDTally, spec §4
     amendment 2026-08-07): delivered-orders basis -- any status counts, not
     just COMPLETED -- with actual_delivery_date in window; planned date via
     the inference chain; orders with no inferable date are skipped (not in
     the denominator, same as calculate_true_otd's skipped_no_date bucket);
     justified-late per delay_classification."""
-    q = db.query(WorkOrder).filter(
-        WorkOrder.actual_delivery_date.isnot(None),
-        WorkOrder.actual_delivery_date >= datetime.combine(start_date, datetime.min.time()),
-        WorkOrder.actual_delivery_date <= datetime.combine(end_date, datetime.max.time()),
+    # Whole entities, since infer_planned_delivery_date takes a WorkOrder; it
+    # reads columns only, and raiseload keeps it that way.
+    q = (
+        db.query(WorkOrder)
+        .options(raiseload("*"))
+        .filter(
+            WorkOrder.actual_delivery_date.isnot(None),
+            date_window(WorkOrder.actual_delivery_date, start_date, end_date),
+        )
     )
     if client_ids is not None:
         q = q.filter(WorkOrder.client_id.in_(client_ids))
@@ -0,0 +1,626 @@
+"""Materialized pivot day rows (PIVOT_DAILY_ROLLUP) for run_pivot.
+
+The store holds exactly what the live path yields -- (day, group, summed
+components) -- split by client so a client scope stays a plain filter. Only
+summed components are stored, so bucket rollup and ratio-of-sums composition
+in engine.py run unchanged on top of it. Rows are computed BY the live path
+(engine.day_rows over one client and day range), never by a second copy of
+the math, so the goldens hold for the store by construction.
+
+Maintenance:
+- refresh_rollup() recomputes one (dataset, client, day range) in place.
+- setup_rollup_hooks() records whatever a committed transaction touched and
+  hands it to the process RollupRefresher (start_rollup_refresher), which
+  recomputes it on its own thread and session. The commit pays for a queue
+  put, not a re-aggregation, and a rollup failure can never fail the business
+  write. Until a change is applied, read_rollup() answers None for that
+  (dataset, client), so pivots read live rather than stale rows. Without a
+  running refresher (scripts, tests) the change is applied inline after the
+  commit. Every ORM write -- including every one that raises a domain event
+  -- passes through these hooks.
+- reconcile_rollups() rebuilds the trailing PIVOT_ROLLUP_RECONCILE_DAYS for
+  every client; it is what the nightly job runs. It also heals what the hooks
+  cannot see: Core bulk writes (the demo seeder) and dimension edits
+  (product/line renames, labor-class changes), which drop the affected
+  rollup instead of recomputing every day inline.
+
+read_rollup() answers only when every (client, day) in the window has been
+materialized; otherwise run_pivot falls back to the live path.
+"""
+
+import logging
+import queue
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Iterable, Iterator, Optional, Sequence
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import delete, event, func, insert, inspect, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from backend.config import settings
+from backend.orm.attendance_entry import AttendanceEntry
+from backend.orm.client import Client
+from backend.orm.pivot_daily_rollup import PivotDailyRollup
+from backend.pivot.registry import DATASETS, Dataset
+
+logger = logging.getLogger(__name__)
+
+#: group_by / group_key of the ungrouped row.
+_UNGROUPED = ""
+
+# Datasets whose fetch hook ages still-open rows against the query window's
+# own "as of" day (min(today, end_date)), which can't be frozen into a stored
+# row. They are stored un-aged and re-aged on read:
+# dataset -> (aged component, count of open rows it is aged over).
+_AGED_ON_READ: dict[str, tuple[str, str]] = {"holds": ("hold_days", "open_holds")}
+
+# Source tables feeding a dataset beyond its own model: fetch_labor folds
+# production earned hours into the labor rows.
+_EXTRA_SOURCES: dict[str, tuple[tuple[str, str], ...]] = {
+    "PRODUCTION_ENTRY": (("labor", "shift_date"),),
+}
+
+# Attributes of rows outside a dataset that change its group keys or
+# components on every day at once (a product rename regroups a year of
+# production). Too broad to recompute inline: the rollup is dropped -- the
+# row's client when it has one, else every client -- and run_pivot falls
+# back to the live path until the next reconcile.
+_DIMENSIONS: dict[str, tuple[frozenset[str], tuple[str, ...]]] = {
+    "PRODUCT": (frozenset({"product_name", "ideal_cycle_time"}), ("production", "labor")),
+    "PRODUCTION_LINE": (frozenset({"line_name"}), ("production", "downtime")),
+    "WORK_ORDER": (frozenset({"style_model"}), ("quality",)),
+    "EMPLOYEE": (frozenset({"labor_class"}), ("labor",)),
+}
+
+# Refresh day runs split on gaps wider than this, so a row moved from January
+# to December refreshes two short ranges rather than the whole year.
+_MAX_RUN_GAP_DAYS = 7
+
+
+def _sources() -> dict[str, tuple[tuple[str, str], ...]]:
+    """Source table -> (dataset, date attribute) pairs a changed row re-buckets."""
+    out: dict[str, list[tuple[str, str]]] = defaultdict(list)
+    for name, ds in DATASETS.items():
+        out[ds.model.__tablename__].append((name, ds.date_column.key))
+    for table, extra in _EXTRA_SOURCES.items():
+        out[table].extend(extra)
+    return {table: tuple(pairs) for table, pairs in out.items()}
+
+
+_SOURCES = _sources()
+
+
+def _as_day(value: Any) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return None
+
+
+def _as_float(value: Any) -> float:
+    if value is None:
+        return 0.0
+    if isinstance(value, Decimal):
+        return float(value)
+    return float(value)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _live_rows(
+    db: Session, ds: Dataset, group_by: Optional[str], start_date: date, end_date: date, client_id: str
+) -> Iterable[tuple[date, Optional[str], dict[str, Any]]]:
+    from backend.pivot.engine import day_rows  # engine imports read_rollup from here
+
+    if ds.name in _AGED_ON_READ and ds.fetch is not None:
+        rows: Iterable[tuple[date, Optional[str], dict[str, Any]]] = ds.fetch(
+            db, group_by, start_date, end_date, [client_id], age_open_holds=False
+        )
+        return rows
+    return day_rows(db, ds, group_by, start_date, end_date, [client_id])
+
+
+def refresh_rollup(db: Session, dataset_name: str, client_id: str, start_date: date, end_date: date) -> int:
+    """Recompute one client's rollup rows for [start_date, end_date] in place.
+
+    Deletes before reading so that, on MariaDB, a concurrent refresh of the
+    same range waits on this one's locks and then reads what it committed,
+    instead of both inserting a copy. Does not commit. Returns rows written.
+    """
+    ds = DATASETS[dataset_name]
+    db.execute(
+        delete(PivotDailyRollup).where(
+            PivotDailyRollup.dataset == dataset_name,
+            PivotDailyRollup.client_id == client_id,
+            PivotDailyRollup.day >= start_date,
+            PivotDailyRollup.day <= end_date,
+        )
+    )
+
+    now = _utcnow()
+    records: list[dict[str, Any]] = []
+    materialized: set[date] = set()
+    for group_by in (None, *ds.group_bys):
+        for day, grp, comps in _live_rows(db, ds, group_by, start_date, end_date, client_id):
+            if group_by is None:
+                materialized.add(day)
+            records.append(
+                {
+                    "dataset": dataset_name,
+                    "client_id": client_id,
+                    "day": day,
+                    "group_by": group_by or _UNGROUPED,
+                    "group_key": _UNGROUPED if group_by is None or grp is None else str(grp),
+                    "components": {n: _as_float(v) for n, v in comps.items()},
+                    "refreshed_at": now,
+                }
+            )
+    day = start_date
+    while day <= end_date:
+        if day not in materialized:
+            records.append(
+                {
+                    "dataset": dataset_name,
+                    "client_id": client_id,
+                    "day": day,
+                    "group_by": _UNGROUPED,
+                    "group_key": _UNGROUPED,
+                    "components": {},
+                    "refreshed_at": now,
+                }
+            )
+        day += timedelta(days=1)
+
+    db.execute(insert(PivotDailyRollup), records)
+    return len(records)
+
+
+def drop_rollup(db: Session, dataset_name: str, client_id: Optional[str] = None) -> int:
+    """Delete a dataset's rollup rows (one client's, or all). Does not commit."""
+    stmt = delete(PivotDailyRollup).where(PivotDailyRollup.dataset == dataset_name)
+    if client_id is not None:
+        stmt = stmt.where(PivotDailyRollup.client_id == client_id)
+    result = db.execute(stmt)
+    return int(getattr(result, "rowcount", 0) or 0)
+
+
+def read_rollup(
+    db: Session,
+    ds: Dataset,
+    group_by: Optional[str],
+    start_date: date,
+    end_date: date,
+    client_ids: Optional[Sequence[str]],
+) -> Optional[list[tuple[date, Optional[str], dict[str, float]]]]:
+    """Stored day rows for the window, or None unless every (client, day) in
+    scope is materialized. client_ids=None means every CLIENT row."""
+    refresher = _refresher
+    if refresher is not None and refresher.is_refreshing(ds.name, client_ids):
+        return None
+    if client_ids is None:
+        clients = db.query(func.count(Client.client_id)).scalar() or 0
+        if clients == 0:
+            return None
+    else:
+        scope = sorted(set(client_ids))
+        if not scope:
+            return []
+        clients = len(scope)
+
+    coverage = db.query(func.count(PivotDailyRollup.rollup_id)).filter(
+        PivotDailyRollup.dataset == ds.name,
+        PivotDailyRollup.group_by == _UNGROUPED,
+        PivotDailyRollup.day >= start_date,
+        PivotDailyRollup.day <= end_date,
+    )
+    if client_ids is not None:
+        coverage = coverage.filter(PivotDailyRollup.client_id.in_(scope))
+    if (coverage.scalar() or 0) < ((end_date - start_date).days + 1) * clients:
+        return None
+
+    q = db.query(PivotDailyRollup.day, PivotDailyRollup.group_key, PivotDailyRollup.components).filter(
+        PivotDailyRollup.dataset == ds.name,
+        PivotDailyRollup.group_by == (group_by or _UNGROUPED),
+        PivotDailyRollup.day >= start_date,
+        PivotDailyRollup.day <= end_date,
+    )
+    if client_ids is not None:
+        q = q.filter(PivotDailyRollup.client_id.in_(scope))
+
+    aged = _AGED_ON_READ.get(ds.name)
+    as_of = min(date.today(), end_date)
+    rows: list[tuple[date, Optional[str], dict[str, float]]] = []
+    for day, key, stored in q.all():
+        if not stored:
+            continue  # coverage marker for a day with no data
+        comps = dict(stored)
+        if aged is not None:
+            component, open_count = aged
+            comps[component] = comps.get(component, 0.0) + comps.get(open_count, 0.0) * (as_of - day).days
+        rows.append((day, key if group_by is not None else None, comps))
+    return rows
+
+
+def reconcile_rollups(
+    db: Session,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    datasets: Optional[Iterable[str]] = None,
+) -> int:
+    """Rebuild every client's rollup rows for a window, one commit per
+    (dataset, client). Defaults to the trailing PIVOT_ROLLUP_RECONCILE_DAYS
+    through the end of the current year, so windows that end on a future
+    period boundary (this month, this quarter) are covered too."""
+    today = date.today()
+    end = end_date or date(today.year, 12, 31)
+    start = start_date or today - timedelta(days=settings.PIVOT_ROLLUP_RECONCILE_DAYS - 1)
+    clients = [client_id for (client_id,) in db.query(Client.client_id).order_by(Client.client_id)]
+    written = 0
+    for name in datasets or DATASETS:
+        for client_id in clients:
+            written += refresh_rollup(db, name, client_id, start, end)
+            db.commit()
+    return written
+
+
+# --- Commit hooks -------------------------------------------------------------
+
+
+@dataclass
+class _Changes:
+    days: dict[tuple[str, str], set[date]] = field(default_factory=lambda: defaultdict(set))
+    dropped: set[tuple[str, Optional[str]]] = field(default_factory=set)
+
+    def keys(self) -> set[tuple[str, Optional[str]]]:
+        """(dataset, client) pairs touched; client None means every client."""
+        return {*self.days, *self.dropped}
+
+    def merge(self, other: "_Changes") -> None:
+        for key, days in other.days.items():
+            self.days[key].update(days)
+        self.dropped.update(other.dropped)
+
+
+# Session -> what its current transaction touched, applied on commit.
+_pending: "WeakKeyDictionary[Session, _Changes]" = WeakKeyDictionary()
+
+
+def _attr_values(obj: Any, state: Any, attr: str) -> Optional[list[Any]]:
+    """Old and new values of attr, loading it if it expired (an expired
+    attribute has no history). None when it can't be known: a deleted row."""
+    if attr in state.unloaded:
+        if state.deleted or state.was_deleted:
+            return None
+        return [getattr(obj, attr)]
+    history = state.attrs[attr].history
+    return [*history.added, *history.unchanged, *history.deleted]
+
+
+def _record_row(session: Session, obj: Any, changes: _Changes) -> None:
+    table = getattr(obj, "__tablename__", "")
+    state = inspect(obj)
+
+    dimension = _DIMENSIONS.get(table)
+    if dimension is not None and obj in session.dirty:
+        attrs, dataset_names = dimension
+        if any(state.attrs[a].history.has_changes() for a in attrs):
+            client_id = getattr(obj, "client_id", None)
+            for name in dataset_names:
+                changes.dropped.add((name, client_id))
+
+    if table == "ATTENDANCE_HOUR_ALLOCATION":
+        # Replace-on-write child rows: refresh the parent's labor day.
+        parent = session.get(AttendanceEntry, obj.attendance_entry_id)
+        if parent is not None and parent.shift_date is not None:
+            changes.days[("labor", parent.client_id)].add(parent.shift_date.date())
+        return
+
+    for name, attr in _SOURCES.get(table, ()):
+        clients = _attr_values(obj, state, "client_id")
+        days = _attr_values(obj, state, attr)
+        if clients is None or days is None:
+            for client_id in clients or [None]:
+                changes.dropped.add((name, client_id))
+            continue
+        for client_id in clients:
+            if client_id is not None:
+                changes.days[(name, client_id)].update(d for d in map(_as_day, days) if d is not None)
+
+
+def _record_prior_days(session: Session, flush_context: Any, instances: Any) -> None:
+    """before_flush: an attribute set while expired carries no old value in
+    its history, so a row moved off a day would never refresh that day. Read
+    the old client/day from the row itself before the flush overwrites it."""
+    changes = _pending.get(session) or _Changes()
+    for obj in session.dirty:
+        sources = _SOURCES.get(getattr(obj, "__tablename__", ""))
+        if not sources:
+            continue
+        state = inspect(obj)
+        attrs = ["client_id", *dict.fromkeys(attr for _, attr in sources)]
+        blind = False
+        for attr in attrs:
+            history = state.attrs[attr].history
+            blind = blind or bool(history.added and not history.deleted and not history.unchanged)
+        if not blind or state.identity is None:
+            continue
+        mapper = state.mapper
+        cols = [mapper.column_attrs[attr].columns[0] for attr in attrs]
+        pk = [col == value for col, value in zip(mapper.primary_key, state.identity)]
+        row = session.execute(select(*cols).where(*pk)).first()
+        if row is None:
+            continue
+        prior = dict(zip(attrs, row))
+        for name, attr in sources:
+            day = _as_day(prior[attr])
+            if prior["client_id"] is not None and day is not None:
+                changes.days[(name, prior["client_id"])].add(day)
+    if changes.days or changes.dropped:
+        _pending[session] = changes
+
+
+def _record_changes(session: Session, flush_context: Any) -> None:
+    """after_flush: remember which (dataset, client, day)s this flush touched."""
+    changes = _pending.get(session) or _Changes()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if obj in session.dirty and not session.is_modified(obj):
+            continue
+        _record_row(session, obj, changes)
+    if changes.days or changes.dropped:
+        _pending[session] = changes
+
+
+def _day_runs(days: Iterable[date]) -> Iterator[tuple[date, date]]:
+    ordered = sorted(days)
+    run_start = run_end = ordered[0]
+    for day in ordered[1:]:
+        if (day - run_end).days > _MAX_RUN_GAP_DAYS:
+            yield run_start, run_end
+            run_start = day
+        run_end = day
+    yield run_start, run_end
+
+
+def apply_changes(db: Session, changes: _Changes) -> None:
+    """Drop, then refresh, everything a committed transaction touched."""
+    for name, client_id in changes.dropped:
+        drop_rollup(db, name, client_id)
+    for (name, client_id), days in changes.days.items():
+        if not days or (name, client_id) in changes.dropped or (name, None) in changes.dropped:
+            continue
+        for start, end in _day_runs(days):
+            refresh_rollup(db, name, client_id, start, end)
+
+
+def _refresh_committed(session: Session) -> None:
+    """after_commit: queue what just committed for the refresher, or apply it
+    here when no refresher is running (or its queue stays full)."""
+    changes = _pending.pop(session, None)
+    if changes is None:
+        return
+    refresher = _refresher
+    if refresher is None or not refresher.submit(session.get_bind(), changes):
+        _apply_committed(session.get_bind(), changes)
+
+
+def _apply_committed(bind: Any, changes: _Changes) -> None:
+    """Bring the rollup in line with committed changes, on a session of its own."""
+    db = Session(bind=bind)
+    try:
+        apply_changes(db, changes)
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        logger.warning("Pivot rollup refresh failed; dropping the affected rows", exc_info=True)
+        # Stale rows would keep answering; dropped ones fall back to live.
+        try:
+            for name, client_id in changes.keys():
+                drop_rollup(db, name, client_id)
+            db.commit()
+        except SQLAlchemyError:
+            db.rollback()
+            logger.exception("Pivot rollup drop failed; reconcile will repair it")
+    finally:
+        db.close()
+
+
+def _discard_changes(session: Session) -> None:
+    """after_rollback: nothing was written."""
+    _pending.pop(session, None)
+
+
+_HOOKS = (
+    ("before_flush", _record_prior_days),
+    ("after_flush", _record_changes),
+    ("after_commit", _refresh_committed),
+    ("after_rollback", _discard_changes),
+)
+
+
+def setup_rollup_hooks(session_factory: Any) -> None:
+    """Keep PIVOT_DAILY_ROLLUP current for sessions from session_factory.
+    Idempotent per session_factory."""
+    for identifier, fn in _HOOKS:
+        if not event.contains(session_factory, identifier, fn):
+            event.listen(session_factory, identifier, fn)
+
+
+# --- Background refresh -------------------------------------------------------
+
+
+class RollupRefresher:
+    """Applies committed rollup changes from one background thread.
+
+    submit() marks the changed (dataset, client) pairs as refreshing and
+    queues them; the worker merges whatever is queued, applies it with
+    apply_changes() and clears the marks. read_rollup() treats a marked pair
+    as not materialized, so nothing reads rows older than a commit. stop()
+    applies everything still queued, including submits already under way.
+    """
+
+    def __init__(self, max_queue: int = 1000, enqueue_timeout: float = 0.05, poll_interval: float = 0.5) -> None:
+        self._queue: "queue.Queue[tuple[Any, _Changes]]" = queue.Queue(maxsize=max_queue)
+        self._max_queue = max_queue
+        self._enqueue_timeout = enqueue_timeout
+        self._poll_interval = poll_interval
+        self._stopping = threading.Event()
+        # Same gate as EventOutbox: stop() waits out the puts already past the
+        # _stopping check, so none can land after the final drain
+        self._gate = threading.Condition()
+        self._puts_in_flight = 0
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._refreshing: Counter[tuple[str, Optional[str]]] = Counter()
+        self._stats = {"submitted": 0, "inline": 0, "applied": 0}
+
+    def start(self) -> None:
+        """Start the worker (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="pivot-rollup-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> int:
+        """Stop the worker and apply everything still queued. Returns changes applied."""
+        with self._gate:
+            self._stopping.set()
+            self._gate.wait_for(lambda: self._puts_in_flight == 0)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        return self.flush()
+
+    def submit(self, bind: Any, changes: _Changes) -> bool:
+        """Queue committed changes. False when stopped or the queue stays full:
+        the caller applies them itself."""
+        with self._gate:
+            if self._stopping.is_set():
+                return False
+            self._puts_in_flight += 1
+        try:
+            self._mark(changes)
+            try:
+                self._queue.put((bind, changes), timeout=self._enqueue_timeout)
+            except queue.Full:
+                self._unmark(changes)
+                logger.warning("Pivot rollup refresh queue full (%d); refreshing inline", self._max_queue)
+                with self._lock:
+                    self._stats["inline"] += 1
+                return False
+        finally:
+            with self._gate:
+                self._puts_in_flight -= 1
+                self._gate.notify_all()
+        with self._lock:
+            self._stats["submitted"] += 1
+        return True
+
+    def flush(self) -> int:
+        """Apply everything queued now, on the calling thread. Returns changes applied."""
+        items = self._drain()
+        if items:
+            self._apply(items)
+        return len(items)
+
+    def is_refreshing(self, dataset_name: str, client_ids: Optional[Sequence[str]]) -> bool:
+        """Whether a queued change covers this dataset for any client in scope
+        (client_ids=None: any client)."""
+        with self._lock:
+            if not self._refreshing:
+                return False
+            if (dataset_name, None) in self._refreshing:
+                return True
+            if client_ids is None:
+                return any(name == dataset_name for name, _ in self._refreshing)
+            return any((dataset_name, client_id) in self._refreshing for client_id in client_ids)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Queue depth and counters."""
+        with self._lock:
+            return {
+                "running": self._thread is not None and self._thread.is_alive(),
+                "queue_depth": self._queue.qsize(),
+                "max_queue": self._max_queue,
+                "refreshing": len(self._refreshing),
+                **self._stats,
+            }
+
+    def _mark(self, changes: _Changes) -> None:
+        with self._lock:
+            self._refreshing.update(changes.keys())
+
+    def _unmark(self, changes: _Changes) -> None:
+        with self._lock:
+            self._refreshing.subtract(changes.keys())
+            self._refreshing += Counter()  # drop the pairs that reached zero
+
+    def _drain(self) -> list[tuple[Any, _Changes]]:
+        items = []
+        while True:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                return items
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                first = self._queue.get(timeout=self._poll_interval)
+            except queue.Empty:
+                continue
+            try:
+                self._apply([first, *self._drain()])
+            except Exception:  # keep the worker alive; reconcile repairs what was missed
+                logger.exception("Pivot rollup refresher error")
+
+    def _apply(self, items: list[tuple[Any, _Changes]]) -> None:
+        """Merge queued changes per database and apply each once."""
+        merged: dict[Any, _Changes] = {}
+        for bind, changes in items:
+            merged.setdefault(bind, _Changes()).merge(changes)
+        try:
+            for bind, changes in merged.items():
+                _apply_committed(bind, changes)
+        finally:
+            for _, changes in items:
+                self._unmark(changes)
+            with self._lock:
+                self._stats["applied"] += len(items)
+
+
+# Process-wide refresher, started by the application lifespan
+_refresher: Optional[RollupRefresher] = None
+
+
+def start_rollup_refresher() -> RollupRefresher:
+    """Create (from settings) and start the process refresher, replacing any previous one."""
+    global _refresher
+    if _refresher is not None:
+        _refresher.stop()
+    _refresher = RollupRefresher(max_queue=settings.PIVOT_ROLLUP_REFRESH_MAX_QUEUE)
+    _refresher.start()
+    return _refresher
+
+
+def get_rollup_refresher() -> Optional[RollupRefresher]:
+    """Get the process refresher (None before startup or after shutdown)."""
+    return _refresher
+
+
+def stop_rollup_refresher() -> None:
+    """Stop the process refresher, applying every queued change first."""
+    global _refresher
+    if _refresher is None:
+        return
+    applied = _refresher.stop()
+    _refresher = None
+    logger.info(f"Pivot rollup refresher stopped ({applied} queued changes applied on shutdown)")
@@ -9,22 +9,17 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from typing import Any, List, Optional
-from datetime import datetime, timezone
 from decimal import Decimal
 
 from backend.database import get_db
 from backend.orm.alert import Alert
 from backend.orm.kpi_threshold import KPIThreshold
 from backend.schemas.alert import AlertResponse
-from backend.calculations.alerts import (
-    generate_alert_id,
-    generate_otd_risk_alert,
-    generate_capacity_alert,
-    generate_hold_alert,
-)
+from backend.calculations.alerts import generate_alert_id, generate_capacity_alert
 from backend.auth.jwt import get_current_active_supervisor
 from backend.orm.user import User
 from backend.middleware.client_auth import verify_client_access
+from backend.services.alert_service import generate_hold_alerts, generate_otd_alerts
 from backend.utils.logging_utils import get_module_logger
 
 logger = get_module_logger(__name__)
@@ -189,89 +184,7 @@ def _check_efficiency_alerts(db: Session, client_id: Optional[str], thresholds:
 
 def _check_otd_alerts(db: Session, client_id: Optional[str]) -> List[Alert]:
     """Check OTD risk on pending work orders"""
-    from backend.orm.work_order import WorkOrder, WorkOrderStatus
-
-    alerts = []
-
-    query = db.query(WorkOrder).filter(
-        WorkOrder.status == WorkOrderStatus.ACTIVE,
-        WorkOrder.planned_ship_date.isnot(None),
-    )
-
-    if client_id:
-        query = query.filter(WorkOrder.client_id == client_id)
-
-    work_orders = query.all()
-
-    for wo in work_orders:
-        if not wo.planned_ship_date:
-            continue
-
-        due_date = wo.planned_ship_date
-        if isinstance(due_date, str):
-            due_date = datetime.fromisoformat(due_date)
-
-        if not due_date.tzinfo:
-            due_date = due_date.replace(tzinfo=timezone.utc)
-        days_remaining = (due_date - datetime.now(tz=timezone.utc)).days
-
-        if days_remaining < 0 or days_remaining > 30:
-            continue
-
-        total_qty = wo.planned_quantity or 1
-        completed_qty = wo.actual_quantity or 0
-        current_completion = Decimal(str((completed_qty / total_qty) * 100))
-
-        if wo.created_at:
-            created_at = wo.created_at if wo.created_at.tzinfo else wo.created_at.replace(tzinfo=timezone.utc)
-            total_days = (due_date - created_at).days
-            elapsed_days = (datetime.now(tz=timezone.utc) - created_at).days
-            planned_completion = Decimal(str(min(100, (elapsed_days / max(1, total_days)) * 100)))
-        else:
-            planned_completion = Decimal("50")
-
-        result = generate_otd_risk_alert(
-            work_order_id=wo.work_order_id,
-            client_name=wo.client_id or "Unknown",
-            due_date=due_date,
-            current_completion_percent=current_completion,
-            planned_completion_percent=planned_completion,
-            days_remaining=days_remaining,
-        )
-
-        if result and result.should_alert:
-            existing = (
-                db.query(Alert)
-                .filter(
-                    Alert.work_order_id == wo.work_order_id,
-                    Alert.category == "otd",
-                    Alert.status == "active",
-                )
-                .first()
-            )
-
-            if not existing:
-                alert = Alert(
-                    alert_id=generate_alert_id(),
-                    category="otd",
-                    severity=result.severity,
-                    status="active",
-                    title=result.title,
-                    message=result.message,
-                    recommendation=result.recommendation,
-                    client_id=wo.client_id,
-                    kpi_key="otd",
-                    work_order_id=wo.work_order_id,
-                    current_value=float(current_completion),
-                    threshold_value=float(planned_completion),
-                    confidence=float(result.confidence) if result.confidence else None,
-                    alert_metadata=result.metadata,
-                )
-                db.add(alert)
-                alerts.append(alert)
-
-    db.commit()
-    return alerts
+    return generate_otd_alerts(db, client_id)
 
 
 def _check_quality_alerts(db: Session, client_id: Optional[str], thresholds: dict) -> List[Alert]:
@@ -283,73 +196,4 @@ def _check_quality_alerts(db: Session, client_id: Optional[str], thresholds: dic
 
 def _check_hold_alerts(db: Session, client_id: Optional[str]) -> List[Alert]:
     """Check for pending hold approvals"""
-    from backend.orm.hold_entry import HoldEntry, HoldStatus
-
-    query = db.query(HoldEntry).filter(
-        HoldEntry.hold_status.in_([HoldStatus.PENDING_HOLD_APPROVAL, HoldStatus.PENDING_RESUME_APPROVAL])
-    )
-
-    if client_id:
-        query = query.filter(HoldEntry.client_id == client_id)
-
-    pending_holds = query.all()
-
-    if not pending_holds:
-        return []
-
-    oldest_hold = min(pending_holds, key=lambda h: h.created_at)
-    oldest_hours = (
-        int(
-            (
-                datetime.now(tz=timezone.utc)
-                - (
-                    oldest_hold.created_at
-                    if oldest_hold.created_at.tzinfo
-                    else oldest_hold.created_at.replace(tzinfo=timezone.utc)
-                )
-            ).total_seconds()
-            / 3600
-        )
-        if oldest_hold.created_at
-        else None
-    )
-
-    total_units = len(pending_holds)
-
-    result = generate_hold_alert(
-        pending_holds_count=len(pending_holds),
-        oldest_hold_hours=oldest_hours,
-        total_units_on_hold=total_units,
-    )
-
-    if not result or not result.should_alert:
-        return []
-
-    existing = db.query(Alert).filter(Alert.category == "hold", Alert.status == "active").first()
-
-    if existing:
-        existing.severity = result.severity
-        existing.title = result.title
-        existing.message = result.message
-        existing.alert_metadata = result.metadata
-        db.commit()
-        return [existing]
-
-    alert = Alert(
-        alert_id=generate_alert_id(),
-        category="hold",
-        severity=result.severity,
-        status="active",
-        title=result.title,
-        message=result.message,
-        recommendation=result.recommendation,
-        client_id=client_id,
-        kpi_key="hold_approval",
-        alert_metadata=result.metadata,
-    )
-
-    db.add(alert)
-    db.commit()
-    db.refresh(alert)
-
-    return [alert]
+    return generate_hold_alerts(db, client_id)
@@ -35,7 +35,9 @@ async def get_cache_stats(current_user: User = Depends(get_current_user)) -> Dic
     - misses: Number of cache misses
     - hit_rate: Cache hit percentage
     - sets: Number of cache writes
-    - evictions: Number of expired/evicted entries
+    - evictions: Number of expired/evicted entries (expirations: the expired subset)
+    - max_entries / bytes / max_bytes: LRU bounds and estimated size in use
+    - prefixes: the same counters broken down by key prefix (text before ":")
 
     Requires authentication.
     """
@@ -5,12 +5,16 @@ Provides CSV download endpoints for all major entities in the system.
 Each endpoint streams CSV data with proper Content-Disposition headers
 for browser download. Column names match the CSV upload format for
 round-trip compatibility.
+
+All endpoints share ``_build_csv_response``, which drives the keyset-paged
+``stream_csv_export`` engine and gzips the stream when the client sends
+``Accept-Encoding: gzip``.
 """
 
 from datetime import date, datetime, timezone
 from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
@@ -18,7 +22,7 @@ from backend.database import get_db
 from backend.auth.jwt import get_current_user
 from backend.orm.user import User
 from backend.middleware.client_auth import build_client_filter_clause
-from backend.services.csv_export_service import stream_csv_export
+from backend.services.csv_export_service import gzip_stream, stream_csv_export
 from backend.utils.logging_utils import get_module_logger
 
 # ORM models (in schemas/ per project convention)
@@ -37,6 +41,21 @@ logger = get_module_logger(__name__)
 router = APIRouter(prefix="/api/export", tags=["Data Export"])
 
 
+def _accepts_gzip(request: Optional[Request]) -> bool:
+    """True when the client advertises gzip in Accept-Encoding (and not with q=0)."""
+    if request is None:
+        return False
+    for token in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = token.strip().partition(";")
+        if coding.strip().lower() == "gzip":
+            return params.replace(" ", "").lower() not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+# Sentinel: distinguishes "no override" from an explicit None (= no tenant filter).
+_NO_CLIENT_FILTER_OVERRIDE: Any = object()
+
+
 def _build_csv_response(
     db: Session,
     current_user: User,
@@ -48,6 +67,8 @@ def _build_csv_response(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     line_id: Optional[int] = None,
+    request: Optional[Request] = None,
+    client_filter: Any = _NO_CLIENT_FILTER_OVERRIDE,
 ) -> StreamingResponse:
     """
     Build a StreamingResponse for CSV export of any entity.
@@ -63,16 +84,20 @@ def _build_csv_response(
         start_date: Optional start date for range filter.
         end_date: Optional end date for range filter.
         line_id: Optional line_id filter.
+        request: Incoming request, used to negotiate gzip encoding.
+        client_filter: Explicit tenant filter clause (or None for no
+            filtering) for entities without a ``client_id`` column.
 
     Returns:
         StreamingResponse with CSV content.
     """
-    # Build client isolation filter
-    if client_id:
-        # If explicit client_id is provided, filter to just that client
-        client_filter = model_class.client_id == client_id
-    else:
-        client_filter = build_client_filter_clause(current_user, model_class.client_id)
+    # Build client isolation filter (unless the caller supplied its own)
+    if client_filter is _NO_CLIENT_FILTER_OVERRIDE:
+        if client_id:
+            # If explicit client_id is provided, filter to just that client
+            client_filter = model_class.client_id == client_id
+        else:
+            client_filter = build_client_filter_clause(current_user, model_class.client_id)
 
     timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d")
     filename = f"{entity_name}_{timestamp}.csv"
@@ -104,11 +129,12 @@ def _build_csv_response(
         line_id=line_id,
     )
 
-    return StreamingResponse(
-        generator,
-        media_type="text/csv",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"', "Vary": "Accept-Encoding"}
+    if _accepts_gzip(request):
+        headers["Content-Encoding"] = "gzip"
+        return StreamingResponse(gzip_stream(generator), media_type="text/csv", headers=headers)
+
+    return StreamingResponse(generator, media_type="text/csv", headers=headers)
 
 
 # =============================================================================
@@ -147,6 +173,7 @@ PRODUCTION_ENTRY_COLUMNS = [
 
 @router.get("/production-entries")
 async def export_production_entries(
+    request: Request,
     client_id: Optional[str] = Query(None, description="Filter by client ID"),
     start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
@@ -162,6 +189,7 @@ async def export_production_entries(
     return _build_csv_response(
         db=db,
         current_user=current_user,
+        request=request,
         model_class=ProductionEntry,
         columns=PRODUCTION_ENTRY_COLUMNS,
         entity_name="production_entries",
@@ -201,6 +229,7 @@ WORK_ORDER_COLUMNS = [
 
 @router.get("/work-orders")
 async def export_work_orders(
+    request: Request,
     client_id: Optional[str] = Query(None, description="Filter by client ID"),
     start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
@@ -215,6 +244,7 @@ async def export_work_orders(
     return _build_csv_response(
         db=db,
         current_user=current_user,
+        request=request,
         model_class=WorkOrder,
         columns=WORK_ORDER_COLUMNS,
         entity_name="work_orders",
@@ -254,6 +284,7 @@ QUALITY_ENTRY_COLUMNS = [
 
 @router.get("/quality-inspections")
 async def export_quality_inspections(
+    request: Request,
     client_id: Optional[str] = Query(None, description="Filter by client ID"),
     start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
@@ -268,6 +299,7 @@ async def export_quality_inspections(
     return _build_csv_response(
         db=db,
         current_user=current_user,
+        request=request,
         model_class=QualityEntry,
         columns=QUALITY_ENTRY_COLUMNS,
         entity_name="quality_inspections",
@@ -300,6 +332,7 @@ DOWNTIME_ENTRY_COLUMNS = [
 
 @router.get("/downtime-events")
 async def export_downtime_events(
+    request: Request,
     client_id: Optional[str] = Query(None, description="Filter by client ID"),
     start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
@@ -315,6 +348,7 @@ async def export_downtime_events(
     return _build_csv_response(
         db=db,
         current_user=current_user,
+        request=request,
         model_class=DowntimeEntry,
         columns=DOWNTIME_ENTRY_COLUMNS,
         entity_name="downtime_events",
@@ -353,6 +387,7 @@ ATTENDANCE_ENTRY_COLUMNS = [
 
 @router.get("/attendance")
 async def export_attendance(
+    request: Request,
     client_id: Optional[str] = Query(None, description="Filter by client ID"),
     start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
@@ -368,6 +403,7 @@ async def export_attendance(
     return _build_csv_response(
         db=db,
         current_user=current_user,
+        request=request,
         model_class=AttendanceEntry,
         columns=ATTENDANCE_ENTRY_COLUMNS,
         entity_name="attendance",
@@ -400,6 +436,7 @@ EMPLOYEE_COLUMNS = [
 
 @router.get("/employees")
 async def export_employees(
+    request: Request,
     client_id: Optional[str] = Query(None, description="Filter by client ID (matches client_id_assigned)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -430,30 +467,15 @@ async def export_employees(
 
             client_filter = or_(*[Employee.client_id_assigned.like(f"%{c}%") for c in user_clients])
 
-    timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d")
-    filename = f"employees_{timestamp}.csv"
-
-    logger.info(
-        "CSV export requested: entity=employees, client_id=%s, user=%s",
-        client_id,
-        current_user.username,
-    )
-
-    # Eager probe so a DB error fires BEFORE StreamingResponse flushes
-    # headers (otherwise Starlette can't convert mid-stream errors to 503).
-    db.query(Employee).limit(1).first()
-
-    generator = stream_csv_export(
+    return _build_csv_response(
         db=db,
+        current_user=current_user,
+        request=request,
         model_class=Employee,
-        client_filter=client_filter,
         columns=EMPLOYEE_COLUMNS,
-    )
-
-    return StreamingResponse(
-        generator,
-        media_type="text/csv",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        entity_name="employees",
+        client_id=client_id,
+        client_filter=client_filter,
     )
 
 
@@ -475,6 +497,7 @@ PRODUCT_COLUMNS = [
 
 @router.get("/products")
 async def export_products(
+    request: Request,
     client_id: Optional[str] = Query(None, description="Filter by client ID"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -483,6 +506,7 @@ async def export_products(
     return _build_csv_response(
         db=db,
         current_user=current_user,
+        request=request,
         model_class=Product,
         columns=PRODUCT_COLUMNS,
         entity_name="products",
@@ -507,6 +531,7 @@ SHIFT_COLUMNS = [
 
 @router.get("/shifts")
 async def export_shifts(
+    request: Request,
     client_id: Optional[str] = Query(None, description="Filter by client ID"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -515,6 +540,7 @@ async def export_shifts(
     return _build_csv_response(
         db=db,
         current_user=current_user,
+        request=request,
         model_class=Shift,
         columns=SHIFT_COLUMNS,
         entity_name="shifts",
@@ -546,6 +572,7 @@ HOLD_ENTRY_COLUMNS = [
 
 @router.get("/holds")
 async def export_holds(
+    request: Request,
     client_id: Optional[str] = Query(None, description="Filter by client ID"),
     start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
@@ -560,6 +587,7 @@ async def export_holds(
     return _build_csv_response(
         db=db,
         current_user=current_user,
+        request=request,
         model_class=HoldEntry,
         columns=HOLD_ENTRY_COLUMNS,
         entity_name="holds",
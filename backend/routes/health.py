@@ -26,6 +26,7 @@ except ImportError:
 
 from backend.database import get_db, get_pool_status
 from backend.config import validate_production_config
+from backend.events.outbox import get_event_outbox
 from backend.auth.jwt import get_current_user
 from backend.orm.user import User
 from backend.utils.logging_utils import get_module_logger
@@ -140,6 +141,17 @@ async def detailed_health_check(
         checks["database"] = {"status": "unhealthy", "error": "Database connection failed"}
         overall_status = "unhealthy"
 
+    # EVENT_STORE outbox: queue depth and flush latency
+    outbox = get_event_outbox()
+    if outbox is not None:
+        outbox_stats = outbox.get_stats()
+        outbox_status = "healthy"
+        if outbox_stats["queue_depth"] >= outbox_stats["max_queue"] * 0.9 or not outbox_stats["running"]:
+            outbox_status = "warning"
+            if overall_status == "healthy":
+                overall_status = "degraded"
+        checks["event_outbox"] = {"status": outbox_status, **outbox_stats}
+
     # Memory usage check (DEP-001)
     if PSUTIL_AVAILABLE:
         try:
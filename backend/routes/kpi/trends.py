@@ -9,10 +9,11 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import func, case
 from typing import Any, Optional
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 
 from backend.utils.logging_utils import get_module_logger
 from backend.database import get_db
+from backend.db.sql_functions import date_window
 from backend.auth.jwt import get_current_user, ClientScope, resolve_client_scope
 from backend.orm.user import User
 
@@ -49,8 +50,7 @@ def get_performance_trend(
         func.date(ProductionEntry.shift_date).label("date"),
         func.avg(ProductionEntry.performance_percentage).label("value"),
     ).filter(
-        ProductionEntry.shift_date >= datetime.combine(start_date, datetime.min.time()),
-        ProductionEntry.shift_date <= datetime.combine(end_date, datetime.max.time()),
+        date_window(ProductionEntry.shift_date, start_date, end_date),
     )
 
     query = query.filter(scope.filter(ProductionEntry.client_id))
@@ -98,8 +98,7 @@ def get_performance_by_shift(
         )
         .outerjoin(Shift, ProductionEntry.shift_id == Shift.shift_id)
         .filter(
-            ProductionEntry.shift_date >= datetime.combine(start_date, datetime.min.time()),
-            ProductionEntry.shift_date <= datetime.combine(end_date, datetime.max.time()),
+            date_window(ProductionEntry.shift_date, start_date, end_date),
         )
     )
 
@@ -160,8 +159,7 @@ def get_performance_by_product(
         )
         .join(Product, ProductionEntry.product_id == Product.product_id)
         .filter(
-            ProductionEntry.shift_date >= datetime.combine(start_date, datetime.min.time()),
-            ProductionEntry.shift_date <= datetime.combine(end_date, datetime.max.time()),
+            date_window(ProductionEntry.shift_date, start_date, end_date),
         )
     )
 
@@ -208,8 +206,7 @@ def get_quality_trend(
         func.sum(QualityEntry.units_passed).label("passed"),
         func.sum(QualityEntry.units_inspected).label("inspected"),
     ).filter(
-        QualityEntry.shift_date >= datetime.combine(start_date, datetime.min.time()),
-        QualityEntry.shift_date <= datetime.combine(end_date, datetime.max.time()),
+        date_window(QualityEntry.shift_date, start_date, end_date),
     )
 
     query = query.filter(scope.filter(QualityEntry.client_id))
@@ -248,8 +245,7 @@ def get_availability_trend(
         func.date(ProductionEntry.shift_date).label("date"),
         func.count(ProductionEntry.production_entry_id).label("entries"),
     ).filter(
-        ProductionEntry.shift_date >= datetime.combine(start_date, datetime.min.time()),
-        ProductionEntry.shift_date <= datetime.combine(end_date, datetime.max.time()),
+        date_window(ProductionEntry.shift_date, start_date, end_date),
     )
     prod_query = prod_query.filter(scope.filter(ProductionEntry.client_id))
     prod_results = {
@@ -261,8 +257,7 @@ def get_availability_trend(
         func.date(DowntimeEntry.shift_date).label("date"),
         func.sum(DowntimeEntry.downtime_duration_minutes).label("downtime_mins"),
     ).filter(
-        DowntimeEntry.shift_date >= datetime.combine(start_date, datetime.min.time()),
-        DowntimeEntry.shift_date <= datetime.combine(end_date, datetime.max.time()),
+        date_window(DowntimeEntry.shift_date, start_date, end_date),
     )
     dt_query = dt_query.filter(scope.filter(DowntimeEntry.client_id))
     dt_results = {
@@ -306,8 +301,7 @@ def get_oee_trend(
         func.avg(ProductionEntry.performance_percentage).label("performance"),
         func.count(ProductionEntry.production_entry_id).label("entries"),
     ).filter(
-        ProductionEntry.shift_date >= datetime.combine(start_date, datetime.min.time()),
-        ProductionEntry.shift_date <= datetime.combine(end_date, datetime.max.time()),
+        date_window(ProductionEntry.shift_date, start_date, end_date),
     )
     perf_query = perf_query.filter(scope.filter(ProductionEntry.client_id))
     perf_results = {
@@ -321,8 +315,7 @@ def get_oee_trend(
         func.sum(QualityEntry.units_passed).label("passed"),
         func.sum(QualityEntry.units_inspected).label("inspected"),
     ).filter(
-        QualityEntry.shift_date >= datetime.combine(start_date, datetime.min.time()),
-        QualityEntry.shift_date <= datetime.combine(end_date, datetime.max.time()),
+        date_window(QualityEntry.shift_date, start_date, end_date),
     )
     qual_query = qual_query.filter(scope.filter(QualityEntry.client_id))
     qual_results = {
@@ -340,8 +333,7 @@ def get_oee_trend(
         func.date(DowntimeEntry.shift_date).label("date"),
         func.sum(DowntimeEntry.downtime_duration_minutes).label("downtime_mins"),
     ).filter(
-        DowntimeEntry.shift_date >= datetime.combine(start_date, datetime.min.time()),
-        DowntimeEntry.shift_date <= datetime.combine(end_date, datetime.max.time()),
+        date_window(DowntimeEntry.shift_date, start_date, end_date),
     )
     dt_query = dt_query.filter(scope.filter(DowntimeEntry.client_id))
     dt_results = {
@@ -387,8 +379,7 @@ def get_otd_trend(
         func.sum(case((WorkOrder.actual_delivery_date <= WorkOrder.required_date, 1), else_=0)).label("on_time"),
     ).filter(
         WorkOrder.required_date.isnot(None),
-        WorkOrder.required_date >= datetime.combine(start_date, datetime.min.time()),
-        WorkOrder.required_date <= datetime.combine(end_date, datetime.max.time()),
+        date_window(WorkOrder.required_date, start_date, end_date),
     )
 
     query = query.filter(scope.filter(WorkOrder.client_id))
@@ -424,8 +415,7 @@ def get_absenteeism_trend(
         func.sum(AttendanceEntry.scheduled_hours).label("scheduled"),
         func.sum(func.coalesce(AttendanceEntry.absence_hours, 0)).label("absent"),
     ).filter(
-        AttendanceEntry.shift_date >= datetime.combine(start_date, datetime.min.time()),
-        AttendanceEntry.shift_date <= datetime.combine(end_date, datetime.max.time()),
+        date_window(AttendanceEntry.shift_date, start_date, end_date),
     )
 
     query = query.filter(scope.filter(AttendanceEntry.client_id))
@@ -475,8 +465,7 @@ def get_throughput_time_trend(
         func.sum(ProductionEntry.run_time_hours).label("run_hours"),
         func.sum(ProductionEntry.units_produced).label("units"),
     ).filter(
-        ProductionEntry.shift_date >= datetime.combine(start_date, datetime.min.time()),
-        ProductionEntry.shift_date <= datetime.combine(end_date, datetime.max.time()),
+        date_window(ProductionEntry.shift_date, start_date, end_date),
     )
     query = query.filter(scope.filter(ProductionEntry.client_id))
 
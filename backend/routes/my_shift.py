@@ -6,13 +6,19 @@ Provides personalized shift summary data for line operators
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func
+from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from pydantic import BaseModel, ConfigDict
 
+from backend.cache import CacheTag, get_cache
+from backend.cache.kpi_cache import build_hash_key
+from backend.config import settings
 from backend.database import get_db
+from backend.db.sql_functions import date_window
 from backend.orm.production_entry import ProductionEntry
 from backend.orm.downtime_entry import DowntimeEntry
+from backend.orm.product import Product
 from backend.orm.quality_entry import QualityEntry
 from backend.orm.work_order import WorkOrder
 from backend.auth.jwt import get_current_user, ClientScope, resolve_client_scope
@@ -86,6 +92,202 @@ class MyShiftSummary(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# =============================================================================
+# Shift Snapshot
+# =============================================================================
+
+# Newest rows kept per activity type: enough for /activity's largest `limit`.
+RECENT_ROWS = 50
+
+
+@dataclass
+class ShiftSnapshot:
+    """
+    Everything the my-shift endpoints read for one (client scope, shift date,
+    shift): aggregate totals, work orders in progress and the newest rows of
+    each activity type. Built by grouped/LIMITed queries, cached briefly.
+    """
+
+    production_entries: int
+    units_produced: int
+    avg_efficiency: Optional[float]  # mean of the entries' cached efficiency_percentage
+    downtime_incidents: int
+    downtime_minutes: int
+    quality_checks: int
+    defect_count: int
+    work_orders: List[Dict[str, Any]]  # work_order_id, product_name, produced, planned
+    recent_production: List[Dict[str, Any]]
+    recent_downtime: List[Dict[str, Any]]
+    recent_quality: List[Dict[str, Any]]
+
+
+def _work_orders_in_shift(db: Session, production_filters: Sequence[Any]) -> List[Dict[str, Any]]:
+    """Work orders logged in the shift, first-logged first, with their OVERALL
+    (all dates) produced total and planned quantity."""
+    rows = (
+        db.query(ProductionEntry.work_order_id, func.min(Product.product_name))
+        .outerjoin(Product, Product.product_id == ProductionEntry.product_id)
+        .filter(*production_filters, ProductionEntry.work_order_id.isnot(None))
+        .group_by(ProductionEntry.work_order_id)
+        .order_by(func.min(ProductionEntry.created_at), ProductionEntry.work_order_id)
+        .all()
+    )
+    if not rows:
+        return []
+    wo_ids = [row[0] for row in rows]
+    cumulative: Dict[str, int] = {
+        str(row[0]): int(row[1] or 0)
+        for row in db.query(
+            ProductionEntry.work_order_id,
+            func.coalesce(func.sum(ProductionEntry.units_produced), 0),
+        )
+        .filter(ProductionEntry.work_order_id.in_(wo_ids))
+        .group_by(ProductionEntry.work_order_id)
+        .all()
+    }
+    planned = {
+        row[0]: int(row[1] or 0)
+        for row in db.query(WorkOrder.work_order_id, WorkOrder.planned_quantity).filter(
+            WorkOrder.work_order_id.in_(wo_ids)
+        )
+    }
+    return [
+        {
+            "work_order_id": wo_id,
+            "product_name": product_name or "Unknown",
+            "produced": cumulative.get(wo_id, 0),
+            "planned": planned.get(wo_id, 0),
+        }
+        for wo_id, product_name in rows
+    ]
+
+
+def _build_snapshot(db: Session, scope: ClientScope, target_date: date, shift_id: Optional[int]) -> ShiftSnapshot:
+    # Production is scoped by shift_date and (optionally) shift_id; downtime
+    # and quality carry no shift FK, so they are date-scoped only.
+    production_filters = [date_window(ProductionEntry.shift_date, target_date), scope.filter(ProductionEntry.client_id)]
+    if shift_id is not None:
+        production_filters.append(ProductionEntry.shift_id == shift_id)
+    downtime_filters = [date_window(DowntimeEntry.shift_date, target_date), scope.filter(DowntimeEntry.client_id)]
+    quality_filters = [date_window(QualityEntry.shift_date, target_date), scope.filter(QualityEntry.client_id)]
+
+    production = (
+        db.query(
+            func.count(ProductionEntry.production_entry_id),
+            func.sum(ProductionEntry.units_produced),
+            func.avg(ProductionEntry.efficiency_percentage),
+        )
+        .filter(*production_filters)
+        .one()
+    )
+    downtime = (
+        db.query(func.count(DowntimeEntry.downtime_entry_id), func.sum(DowntimeEntry.downtime_duration_minutes))
+        .filter(*downtime_filters)
+        .one()
+    )
+    quality = (
+        db.query(func.count(QualityEntry.quality_entry_id), func.sum(QualityEntry.units_defective))
+        .filter(*quality_filters)
+        .one()
+    )
+
+    recent_production = [
+        {
+            "id": row[0],
+            "units": row[1],
+            "work_order_id": row[2],
+            "timestamp": row[3] or row[4],
+        }
+        for row in db.query(
+            ProductionEntry.production_entry_id,
+            ProductionEntry.units_produced,
+            ProductionEntry.work_order_id,
+            ProductionEntry.created_at,
+            ProductionEntry.shift_date,
+        )
+        .filter(*production_filters)
+        .order_by(ProductionEntry.created_at.desc())
+        .limit(RECENT_ROWS)
+    ]
+    recent_downtime = [
+        {
+            "id": row[0],
+            "reason": row[1],
+            "minutes": row[2],
+            "work_order_id": row[3],
+            "timestamp": row[4] or row[5],
+        }
+        for row in db.query(
+            DowntimeEntry.downtime_entry_id,
+            DowntimeEntry.downtime_reason,
+            DowntimeEntry.downtime_duration_minutes,
+            DowntimeEntry.work_order_id,
+            DowntimeEntry.created_at,
+            DowntimeEntry.shift_date,
+        )
+        .filter(*downtime_filters)
+        .order_by(DowntimeEntry.created_at.desc())
+        .limit(RECENT_ROWS)
+    ]
+    recent_quality = [
+        {
+            "id": row[0],
+            "inspected": row[1],
+            "defective": row[2],
+            "work_order_id": row[3],
+            "timestamp": row[4] or row[5],
+        }
+        for row in db.query(
+            QualityEntry.quality_entry_id,
+            QualityEntry.units_inspected,
+            QualityEntry.units_defective,
+            QualityEntry.work_order_id,
+            QualityEntry.created_at,
+            QualityEntry.shift_date,
+        )
+        .filter(*quality_filters)
+        .order_by(QualityEntry.created_at.desc())
+        .limit(RECENT_ROWS)
+    ]
+
+    return ShiftSnapshot(
+        production_entries=int(production[0] or 0),
+        units_produced=int(production[1] or 0),
+        avg_efficiency=float(production[2]) if production[2] is not None else None,
+        downtime_incidents=int(downtime[0] or 0),
+        downtime_minutes=int(downtime[1] or 0),
+        quality_checks=int(quality[0] or 0),
+        defect_count=int(quality[1] or 0),
+        work_orders=_work_orders_in_shift(db, production_filters),
+        recent_production=recent_production,
+        recent_downtime=recent_downtime,
+        recent_quality=recent_quality,
+    )
+
+
+def get_shift_snapshot(
+    db: Session, scope: ClientScope, target_date: date, shift_id: Optional[int] = None
+) -> ShiftSnapshot:
+    """
+    ShiftSnapshot through KPICache, shared by /summary, /stats and /activity.
+
+    Cached per (client scope, shift date, shift) for MY_SHIFT_CACHE_TTL
+    seconds -- tablets refresh often -- and evicted on commit of the rows it
+    reads. Production is tagged for every date because work order progress
+    is cumulative.
+    """
+    clients = sorted(scope.client_ids) if scope.client_ids is not None else None
+    key = build_hash_key("my_shift", clients=clients, shift_date=target_date, shift_id=shift_id)
+    tag_clients: Sequence[Optional[str]] = clients if clients is not None else [None]
+    tags = [CacheTag("production", c) for c in tag_clients]
+    tags += [CacheTag(entity, c, target_date, target_date) for entity in ("downtime", "quality") for c in tag_clients]
+    tags += [CacheTag(entity, c) for entity in ("work_order", "product") for c in tag_clients]
+    snapshot: ShiftSnapshot = get_cache().get_or_set(
+        key, lambda: _build_snapshot(db, scope, target_date, shift_id), settings.MY_SHIFT_CACHE_TTL, tags=tags
+    )
+    return snapshot
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -118,137 +320,85 @@ def get_my_shift_summary(
       not the operator. Wire up via EMPLOYEE_LINE_ASSIGNMENT when needed.
     """
     target_date = shift_date or date.today()
-
-    # Production entries — scoped by shift_date and (optionally) shift_id.
-    production_query = db.query(ProductionEntry).filter(func.date(ProductionEntry.shift_date) == target_date)
-    # Multi-tenant isolation: client-scope authorization
-    production_query = production_query.filter(scope.filter(ProductionEntry.client_id))
-    if shift_id is not None:
-        production_query = production_query.filter(ProductionEntry.shift_id == shift_id)
-
-    productions = production_query.all()
+    snapshot = get_shift_snapshot(db, scope, target_date, shift_id)
 
     # Calculate production stats. Target falls back to actual when not
     # tracked; ideal_cycle_time × run_time would give a more accurate
     # target but the current schema doesn't carry a hard target field.
-    total_units = sum(p.units_produced or 0 for p in productions)
+    total_units = snapshot.units_produced
     total_target = total_units or 1  # avoid div-by-zero in efficiency
-    cached_efficiency = [float(p.efficiency_percentage) for p in productions if p.efficiency_percentage is not None]
-    if cached_efficiency:
-        efficiency = sum(cached_efficiency) / len(cached_efficiency)
+    if snapshot.avg_efficiency is not None:
+        efficiency = snapshot.avg_efficiency
     else:
         efficiency = (total_units / total_target * 100) if total_target > 0 else 0
 
-    # Downtime entries — scoped by shift_date.
-    downtime_query = db.query(DowntimeEntry).filter(func.date(DowntimeEntry.shift_date) == target_date)
-    downtime_query = downtime_query.filter(scope.filter(DowntimeEntry.client_id))
-
-    downtimes = downtime_query.all()
-    downtime_incidents = len(downtimes)
-    downtime_minutes = sum(d.downtime_duration_minutes or 0 for d in downtimes)
-
-    # Quality entries — scoped by shift_date.
-    quality_query = db.query(QualityEntry).filter(func.date(QualityEntry.shift_date) == target_date)
-    quality_query = quality_query.filter(scope.filter(QualityEntry.client_id))
-
-    qualities = quality_query.all()
-    quality_checks = len(qualities)
-    defect_count = sum(q.units_defective or 0 for q in qualities)
-
     stats = ShiftStats(
         units_produced=total_units,
         efficiency=round(efficiency, 1),
-        downtime_incidents=downtime_incidents,
-        downtime_minutes=downtime_minutes,
-        quality_checks=quality_checks,
-        defect_count=defect_count,
+        downtime_incidents=snapshot.downtime_incidents,
+        downtime_minutes=snapshot.downtime_minutes,
+        quality_checks=snapshot.quality_checks,
+        defect_count=snapshot.defect_count,
     )
 
     # Work orders active in today's shift, shown with their OVERALL completion
     # (cumulative produced vs the order's planned quantity). A today-only tally
     # (produced/produced) always read 0% or 100%; cumulative-vs-planned gives a
     # real progress bar (e.g. an in-progress order at ~50%).
-    work_order_stats: Dict[str, Dict[str, Any]] = {}
-    for p in productions:
-        wo_id = p.work_order_id
-        if not wo_id:
-            continue
-        if wo_id not in work_order_stats:
-            product_name = "Unknown"
-            if getattr(p, "product", None) is not None:
-                product_name = getattr(p.product, "product_name", None) or "Unknown"
-            work_order_stats[wo_id] = {"product_name": product_name}
-
     assigned_work_orders: List[WorkOrderProgress] = []
-    if work_order_stats:
-        wo_ids = list(work_order_stats.keys())
-        cumulative: Dict[str, int] = {
-            str(row[0]): int(row[1] or 0)
-            for row in db.query(
-                ProductionEntry.work_order_id,
-                func.coalesce(func.sum(ProductionEntry.units_produced), 0),
-            )
-            .filter(ProductionEntry.work_order_id.in_(wo_ids))
-            .group_by(ProductionEntry.work_order_id)
-            .all()
-        }
-        planned = {
-            w.work_order_id: int(w.planned_quantity or 0)
-            for w in db.query(WorkOrder).filter(WorkOrder.work_order_id.in_(wo_ids)).all()
-        }
-        for i, (wo_id, wo_data) in enumerate(work_order_stats.items(), 1):
-            produced = int(cumulative.get(wo_id, 0) or 0)
-            # Prefer the order's planned quantity as the target; fall back to
-            # produced so progress never divides by zero.
-            target_qty = planned.get(wo_id) or produced or 1
-            progress = (produced / target_qty * 100) if target_qty > 0 else 0
-            assigned_work_orders.append(
-                WorkOrderProgress(
-                    id=i,
-                    work_order_id=wo_id,
-                    product_name=wo_data["product_name"],
-                    target_qty=target_qty,
-                    produced=produced,
-                    progress_percent=round(min(progress, 100), 1),
-                )
+    for i, wo in enumerate(snapshot.work_orders, 1):
+        produced = wo["produced"]
+        # Prefer the order's planned quantity as the target; fall back to
+        # produced so progress never divides by zero.
+        target_qty = wo["planned"] or produced or 1
+        progress = (produced / target_qty * 100) if target_qty > 0 else 0
+        assigned_work_orders.append(
+            WorkOrderProgress(
+                id=i,
+                work_order_id=wo["work_order_id"],
+                product_name=wo["product_name"],
+                target_qty=target_qty,
+                produced=produced,
+                progress_percent=round(min(progress, 100), 1),
             )
+        )
 
     # Recent activity (top 5, mixed types).
     activities: List[ActivityEntry] = []
 
-    for p in productions[:5]:
+    for p in snapshot.recent_production[:5]:
         activities.append(
             ActivityEntry(
-                id=f"prod-{p.production_entry_id}",
+                id=f"prod-{p['id']}",
                 type="production",
                 activity_type="production_logged",
-                params={"units": p.units_produced or 0, "work_order_id": p.work_order_id or "—"},
-                description=f"Logged {p.units_produced} units for {p.work_order_id or '—'}",
-                timestamp=p.created_at or p.shift_date,
+                params={"units": p["units"] or 0, "work_order_id": p["work_order_id"] or "—"},
+                description=f"Logged {p['units']} units for {p['work_order_id'] or '—'}",
+                timestamp=p["timestamp"],
             )
         )
 
-    for d in downtimes[:3]:
+    for d in snapshot.recent_downtime[:3]:
         activities.append(
             ActivityEntry(
-                id=f"down-{d.downtime_entry_id}",
+                id=f"down-{d['id']}",
                 type="downtime",
                 activity_type="downtime_logged",
-                params={"reason": d.downtime_reason, "minutes": d.downtime_duration_minutes or 0},
-                description=f"{d.downtime_reason}: {d.downtime_duration_minutes} min downtime",
-                timestamp=d.created_at or d.shift_date,
+                params={"reason": d["reason"], "minutes": d["minutes"] or 0},
+                description=f"{d['reason']}: {d['minutes']} min downtime",
+                timestamp=d["timestamp"],
             )
         )
 
-    for q in qualities[:2]:
+    for q in snapshot.recent_quality[:2]:
         activities.append(
             ActivityEntry(
-                id=f"qual-{q.quality_entry_id}",
+                id=f"qual-{q['id']}",
                 type="quality",
                 activity_type="quality_checked",
-                params={"inspected": q.units_inspected or 0, "defects": q.units_defective or 0},
-                description=f"Quality check: {q.units_inspected} inspected, {q.units_defective} defects",
-                timestamp=q.created_at or q.shift_date,
+                params={"inspected": q["inspected"] or 0, "defects": q["defective"] or 0},
+                description=f"Quality check: {q['inspected']} inspected, {q['defective']} defects",
+                timestamp=q["timestamp"],
             )
         )
 
@@ -256,26 +406,28 @@ def get_my_shift_summary(
     activities = activities[:5]
 
     # Data completeness — light heuristic for the widget.
+    production_entries = snapshot.production_entries
+    quality_checks = snapshot.quality_checks
     expected_production = 8
     expected_quality = 2
-    prod_pct = min(round(len(productions) / expected_production * 100), 100)
+    prod_pct = min(round(production_entries / expected_production * 100), 100)
     qual_pct = min(round(quality_checks / expected_quality * 100), 100)
     overall_pct = round((prod_pct + 100 + qual_pct) / 3)
 
     data_completeness: Dict[str, Dict[str, Any]] = {
         "production": {
-            "entered": len(productions),
+            "entered": production_entries,
             "expected": expected_production,
             "percentage": prod_pct,
             "status": (
                 "complete"
-                if len(productions) >= expected_production
-                else "warning" if len(productions) >= expected_production * 0.5 else "incomplete"
+                if production_entries >= expected_production
+                else "warning" if production_entries >= expected_production * 0.5 else "incomplete"
             ),
         },
         "downtime": {
-            "entered": downtime_incidents,
-            "expected": downtime_incidents,
+            "entered": snapshot.downtime_incidents,
+            "expected": snapshot.downtime_incidents,
             "percentage": 100,
             "status": "complete",
         },
@@ -318,34 +470,9 @@ def get_my_shift_stats(
     Lightweight endpoint for dashboard widgets.
     """
     target_date = shift_date or date.today()
+    snapshot = get_shift_snapshot(db, scope, target_date, shift_id)
 
-    production_query = db.query(
-        func.sum(ProductionEntry.units_produced).label("total_units"),
-        func.count(ProductionEntry.production_entry_id).label("entry_count"),
-    ).filter(func.date(ProductionEntry.shift_date) == target_date)
-    production_query = production_query.filter(scope.filter(ProductionEntry.client_id))
-    if shift_id is not None:
-        production_query = production_query.filter(ProductionEntry.shift_id == shift_id)
-
-    prod_result = production_query.first()
-
-    downtime_query = db.query(
-        func.count(DowntimeEntry.downtime_entry_id).label("incidents"),
-        func.sum(DowntimeEntry.downtime_duration_minutes).label("total_minutes"),
-    ).filter(func.date(DowntimeEntry.shift_date) == target_date)
-    downtime_query = downtime_query.filter(scope.filter(DowntimeEntry.client_id))
-
-    down_result = downtime_query.first()
-
-    quality_query = db.query(
-        func.count(QualityEntry.quality_entry_id).label("checks"),
-        func.sum(QualityEntry.units_defective).label("defects"),
-    ).filter(func.date(QualityEntry.shift_date) == target_date)
-    quality_query = quality_query.filter(scope.filter(QualityEntry.client_id))
-
-    qual_result = quality_query.first()
-
-    total_units = (prod_result.total_units or 0) if prod_result else 0
+    total_units = snapshot.units_produced
     total_target = total_units or 1
     efficiency = (total_units / total_target * 100) if total_target > 0 else 0
 
@@ -354,10 +481,10 @@ def get_my_shift_stats(
         "shift_id": shift_id,
         "units_produced": total_units,
         "efficiency": round(efficiency, 1),
-        "downtime_incidents": (down_result.incidents or 0) if down_result else 0,
-        "downtime_minutes": int(down_result.total_minutes or 0) if down_result else 0,
-        "quality_checks": (qual_result.checks or 0) if qual_result else 0,
-        "defect_count": int(qual_result.defects or 0) if qual_result else 0,
+        "downtime_incidents": snapshot.downtime_incidents,
+        "downtime_minutes": snapshot.downtime_minutes,
+        "quality_checks": snapshot.quality_checks,
+        "defect_count": snapshot.defect_count,
     }
 
 
@@ -365,7 +492,7 @@ def get_my_shift_stats(
 def get_my_recent_activity(
     shift_date: Optional[date] = Query(None),
     shift_id: Optional[int] = Query(None),
-    limit: int = Query(10, ge=1, le=50),
+    limit: int = Query(10, ge=1, le=RECENT_ROWS),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
     scope: ClientScope = Depends(resolve_client_scope),
@@ -375,55 +502,42 @@ def get_my_recent_activity(
     Returns production, downtime, and quality entries combined.
     """
     target_date = shift_date or date.today()
+    snapshot = get_shift_snapshot(db, scope, target_date, shift_id)
     activities: List[Dict[str, Any]] = []
 
-    production_query = db.query(ProductionEntry).filter(func.date(ProductionEntry.shift_date) == target_date)
-    production_query = production_query.filter(scope.filter(ProductionEntry.client_id))
-    if shift_id is not None:
-        production_query = production_query.filter(ProductionEntry.shift_id == shift_id)
-
-    for p in production_query.order_by(ProductionEntry.created_at.desc()).limit(limit):
-        ts = (p.created_at or p.shift_date).isoformat()
+    for p in snapshot.recent_production[:limit]:
         activities.append(
             {
-                "id": f"prod-{p.production_entry_id}",
+                "id": f"prod-{p['id']}",
                 "type": "production",
-                "description": f"Logged {p.units_produced} units for {p.work_order_id or '—'}",
-                "timestamp": ts,
-                "work_order_id": p.work_order_id,
-                "value": p.units_produced,
+                "description": f"Logged {p['units']} units for {p['work_order_id'] or '—'}",
+                "timestamp": p["timestamp"].isoformat(),
+                "work_order_id": p["work_order_id"],
+                "value": p["units"],
             }
         )
 
-    downtime_query = db.query(DowntimeEntry).filter(func.date(DowntimeEntry.shift_date) == target_date)
-    downtime_query = downtime_query.filter(scope.filter(DowntimeEntry.client_id))
-
-    for d in downtime_query.order_by(DowntimeEntry.created_at.desc()).limit(limit):
-        ts = (d.created_at or d.shift_date).isoformat()
+    for d in snapshot.recent_downtime[:limit]:
         activities.append(
             {
-                "id": f"down-{d.downtime_entry_id}",
+                "id": f"down-{d['id']}",
                 "type": "downtime",
-                "description": f"{d.downtime_reason}: {d.downtime_duration_minutes} min downtime",
-                "timestamp": ts,
-                "work_order_id": d.work_order_id,
-                "value": d.downtime_duration_minutes,
+                "description": f"{d['reason']}: {d['minutes']} min downtime",
+                "timestamp": d["timestamp"].isoformat(),
+                "work_order_id": d["work_order_id"],
+                "value": d["minutes"],
             }
         )
 
-    quality_query = db.query(QualityEntry).filter(func.date(QualityEntry.shift_date) == target_date)
-    quality_query = quality_query.filter(scope.filter(QualityEntry.client_id))
-
-    for q in quality_query.order_by(QualityEntry.created_at.desc()).limit(limit):
-        ts = (q.created_at or q.shift_date).isoformat()
+    for q in snapshot.recent_quality[:limit]:
         activities.append(
             {
-                "id": f"qual-{q.quality_entry_id}",
+                "id": f"qual-{q['id']}",
                 "type": "quality",
-                "description": f"Quality check: {q.units_inspected} inspected, {q.units_defective} defects",
-                "timestamp": ts,
-                "work_order_id": q.work_order_id,
-                "value": q.units_inspected,
+                "description": f"Quality check: {q['inspected']} inspected, {q['defective']} defects",
+                "timestamp": q["timestamp"].isoformat(),
+                "work_order_id": q["work_order_id"],
+                "value": q["inspected"],
             }
         )
 
@@ -14,9 +14,11 @@ from backend.auth.jwt import ClientScope, get_current_user, resolve_client_scope
 from backend.database import get_db
 from backend.orm.user import User
 from backend.pivot.buckets import VALID_BUCKETS
-from backend.pivot.engine import run_pivot
+from backend.pivot.engine import run_pivot, run_pivots
 from backend.pivot.registry import DATASETS
+from backend.schemas.pivot import PivotBatchRequest
 from backend.utils.date_range import validate_date_range
+from backend.utils.json_response import FastJSONResponse
 
 router = APIRouter(prefix="/api/pivot", tags=["Pivot Summaries"])
 
@@ -43,6 +45,16 @@ def _escape_csv_cell(value: Any) -> Any:
     return value
 
 
+def _validate_spec(dataset: str, bucket: str, group_by: Optional[str]) -> None:
+    if dataset not in DATASETS:
+        raise HTTPException(422, detail=f"dataset must be one of {sorted(DATASETS)}")
+    if bucket not in VALID_BUCKETS:
+        raise HTTPException(422, detail=f"bucket must be one of {list(VALID_BUCKETS)}")
+    allowed = sorted(DATASETS[dataset].group_bys)
+    if group_by is not None and group_by not in allowed:
+        raise HTTPException(422, detail=f"group_by must be one of {allowed}")
+
+
 def _run(
     db: Session,
     dataset: str,
@@ -52,18 +64,30 @@ def _run(
     end_date: date,
     scope: ClientScope,
 ) -> dict[str, Any]:
-    if dataset not in DATASETS:
-        raise HTTPException(422, detail=f"dataset must be one of {sorted(DATASETS)}")
-    if bucket not in VALID_BUCKETS:
-        raise HTTPException(422, detail=f"bucket must be one of {list(VALID_BUCKETS)}")
-    allowed = sorted(DATASETS[dataset].group_bys)
-    if group_by is not None and group_by not in allowed:
-        raise HTTPException(422, detail=f"group_by must be one of {allowed}")
+    _validate_spec(dataset, bucket, group_by)
     validate_date_range(start_date, end_date)
     return run_pivot(db, dataset, bucket, group_by, start_date, end_date, scope.client_ids)
 
 
-@router.get("/{dataset}")
+@router.post("/batch", response_class=FastJSONResponse)
+def post_pivot_batch(
+    request: PivotBatchRequest,
+    client_id: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    scope: ClientScope = Depends(resolve_client_scope),
+) -> FastJSONResponse:
+    """Several pivots over one window and client scope -- a dashboard's tiles in
+    one round trip. Pivots sharing a (dataset, group_by) share one day-row
+    fetch; each is re-bucketed in memory. Any invalid spec fails the batch."""
+    for spec in request.pivots:
+        _validate_spec(spec.dataset, spec.bucket, spec.group_by)
+    validate_date_range(request.start_date, request.end_date)
+    specs = [(spec.dataset, spec.bucket, spec.group_by) for spec in request.pivots]
+    return FastJSONResponse({"pivots": run_pivots(db, specs, request.start_date, request.end_date, scope.client_ids)})
+
+
+@router.get("/{dataset}", response_class=FastJSONResponse)
 def get_pivot(
     dataset: str,
     bucket: str,
@@ -74,8 +98,8 @@ def get_pivot(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
     scope: ClientScope = Depends(resolve_client_scope),
-) -> Any:
-    return _run(db, dataset, bucket, group_by, start_date, end_date, scope)
+) -> FastJSONResponse:
+    return FastJSONResponse(_run(db, dataset, bucket, group_by, start_date, end_date, scope))
 
 
 @router.get("/{dataset}/csv")
@@ -13,9 +13,8 @@ All endpoints enforce client access control and multi-tenant isolation
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from typing import Any, Optional, List
+from typing import Any, Dict, Optional, List
 from datetime import date, timedelta, datetime, timezone
-from decimal import Decimal
 
 from backend.database import get_db
 from backend.auth.jwt import get_current_user
@@ -37,17 +36,13 @@ from backend.schemas.analytics import (
     KPIHealthAssessment,
     KPIBenchmark,
 )
-from backend.calculations.predictions import (
-    auto_forecast,
-    simple_exponential_smoothing,
-    double_exponential_smoothing,
-    linear_trend_extrapolation,
-)
+from backend.calculations.predictions import ForecastResult, forecast, forecast_many
 from backend.generators.sample_data_phase5 import (
     get_kpi_benchmarks,
     calculate_kpi_health_score,
     KPITypePhase5,
 )
+from backend.utils.json_response import FastJSONResponse
 from backend.utils.logging_utils import get_module_logger
 
 logger = get_module_logger(__name__)
@@ -110,8 +105,47 @@ def get_historical_kpi_data(
         return []
 
 
+def get_historical_kpi_bundle(
+    db: Session, client_id: str, kpi_types: List[str], start_date: date, end_date: date, current_user: User
+) -> Dict[str, List[dict]]:
+    """
+    get_historical_kpi_data for several KPIs from one grouped query.
+
+    Args:
+        db: Database session
+        client_id: Client ID
+        kpi_types: Types of KPI
+        start_date: Start date
+        end_date: End date
+        current_user: Current user for access control
+
+    Returns:
+        Dict of kpi_type -> historical data points (may be empty)
+    """
+    from backend.middleware.client_auth import verify_client_access
+    from backend.services.analytics_crud_service import get_time_series_bundle
+
+    # Verify client access
+    verify_client_access(current_user, client_id)
+
+    try:
+        bundle = get_time_series_bundle(db, client_id, kpi_types, start_date, end_date, current_user)
+    except Exception as e:
+        logger.exception("Failed to retrieve KPI time series: %s", e)
+        return {kpi_type: [] for kpi_type in kpi_types}
+    return {
+        kpi_type: [{"date": d, "value": float(v), "is_anomaly": False} for d, v in series]
+        for kpi_type, series in bundle.items()
+    }
+
+
 def build_comprehensive_prediction(
-    client_id: str, kpi_type: str, historical_data: List[dict], forecast_days: int, method: Optional[str] = None
+    client_id: str,
+    kpi_type: str,
+    historical_data: List[dict],
+    forecast_days: int,
+    method: Optional[str] = None,
+    forecast_result: Optional[ForecastResult] = None,
 ) -> ComprehensivePredictionResponse:
     """
     Build a comprehensive prediction response for a single KPI
@@ -122,12 +156,14 @@ def build_comprehensive_prediction(
         historical_data: Historical data points
         forecast_days: Number of days to forecast
         method: Forecasting method (auto, simple, double, linear)
+        forecast_result: Forecast already computed (e.g. by forecast_many);
+            skips running `method` again
 
     Returns:
         ComprehensivePredictionResponse with full analytics
     """
     # Extract values for forecasting
-    values = [Decimal(str(d["value"])) for d in historical_data]
+    values = [float(d["value"]) for d in historical_data]
     dates = [d["date"] for d in historical_data]
 
     # Get historical bounds
@@ -138,17 +174,9 @@ def build_comprehensive_prediction(
     # Calculate historical average
     historical_average = sum(float(v) for v in values) / len(values) if values else 0
 
-    # Run forecast
-    if method is None or method == "auto":
-        forecast_result = auto_forecast(values, forecast_days)
-    elif method == "simple":
-        forecast_result = simple_exponential_smoothing(values, forecast_periods=forecast_days)
-    elif method == "double":
-        forecast_result = double_exponential_smoothing(values, forecast_periods=forecast_days)
-    elif method == "linear":
-        forecast_result = linear_trend_extrapolation(values, forecast_periods=forecast_days)
-    else:
-        forecast_result = auto_forecast(values, forecast_days)
+    # Run forecast (unknown methods fall back to auto)
+    if forecast_result is None:
+        forecast_result = forecast(values, forecast_days, method)
 
     # Generate forecast dates
     forecast_start = historical_end + timedelta(days=1)
@@ -258,6 +286,7 @@ async def get_benchmarks(current_user: User = Depends(get_current_user)) -> Any:
 @router.get(
     "/{kpi_type}",
     response_model=ComprehensivePredictionResponse,
+    response_class=FastJSONResponse,
     summary="Get KPI Prediction with Full Analytics",
     description="""
     Generate comprehensive KPI prediction with:
@@ -304,7 +333,7 @@ async def get_kpi_prediction(
     method: Optional[str] = Query(None, pattern="^(auto|simple|double|linear)$", description="Forecasting method"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> ComprehensivePredictionResponse:
+) -> FastJSONResponse:
     """
     GET /api/predictions/{kpi_type} - Comprehensive KPI prediction with analytics
     """
@@ -343,19 +372,23 @@ async def get_kpi_prediction(
             },
         )
 
-    # Build comprehensive prediction
-    return build_comprehensive_prediction(
-        client_id=client_id,
-        kpi_type=kpi_type,
-        historical_data=historical_data,
-        forecast_days=forecast_days,
-        method=method,
+    # Build comprehensive prediction; the model is serialized straight to
+    # bytes instead of being re-validated against response_model
+    return FastJSONResponse(
+        build_comprehensive_prediction(
+            client_id=client_id,
+            kpi_type=kpi_type,
+            historical_data=historical_data,
+            forecast_days=forecast_days,
+            method=method,
+        )
     )
 
 
 @router.get(
     "/dashboard/all",
     response_model=AllKPIPredictionsResponse,
+    response_class=FastJSONResponse,
     summary="Get All KPI Predictions Dashboard",
     description="""
     Generate predictions for all 10 KPIs in a single dashboard response.
@@ -395,7 +428,7 @@ async def get_all_kpi_predictions(
     ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> AllKPIPredictionsResponse:
+) -> FastJSONResponse:
     """
     GET /api/predictions/dashboard/all - All KPI predictions dashboard
     """
@@ -420,39 +453,50 @@ async def get_all_kpi_predictions(
     stable = 0
     priority_actions = []
 
-    for kpi in KPITypePhase5:
+    # All KPI series from one grouped query
+    histories = {
+        kpi_type: data
+        for kpi_type, data in get_historical_kpi_bundle(
+            db, client_id, [kpi.value for kpi in KPITypePhase5], start_date, end_date, current_user
+        ).items()
+        if len(data) >= 30
+    }
+
+    # Fit every KPI's forecast in one batch
+    forecasts = forecast_many(
+        {kpi: [float(d["value"]) for d in data] for kpi, data in histories.items()}, forecast_days, "auto"
+    )
+
+    for kpi_type, kpi_forecast in forecasts.items():
         try:
-            historical_data = get_historical_kpi_data(db, client_id, kpi.value, start_date, end_date, current_user)
-
-            if len(historical_data) >= 30:
-                prediction = build_comprehensive_prediction(
-                    client_id=client_id,
-                    kpi_type=kpi.value,
-                    historical_data=historical_data,
-                    forecast_days=forecast_days,
-                    method="auto",
-                )
-
-                kpi_predictions[kpi.value] = prediction
-                health_scores.append(prediction.health_assessment.health_score)
-
-                # Track trends
-                if prediction.health_assessment.trend == "improving":
-                    improving += 1
-                elif prediction.health_assessment.trend == "declining":
-                    declining += 1
-                    # Add to priority actions if health is low
-                    if prediction.health_assessment.health_score < 70:
-                        priority_actions.append(
-                            f"Review {prediction.kpi_display_name}: declining trend, "
-                            f"score {prediction.health_assessment.health_score:.1f}"
-                        )
-                else:
-                    stable += 1
-
-                # Add recommendations from low-health KPIs
-                if prediction.health_assessment.health_score < 60:
-                    priority_actions.extend(prediction.health_assessment.recommendations[:2])
+            prediction = build_comprehensive_prediction(
+                client_id=client_id,
+                kpi_type=kpi_type,
+                historical_data=histories[kpi_type],
+                forecast_days=forecast_days,
+                forecast_result=kpi_forecast,
+            )
+
+            kpi_predictions[kpi_type] = prediction
+            health_scores.append(prediction.health_assessment.health_score)
+
+            # Track trends
+            if prediction.health_assessment.trend == "improving":
+                improving += 1
+            elif prediction.health_assessment.trend == "declining":
+                declining += 1
+                # Add to priority actions if health is low
+                if prediction.health_assessment.health_score < 70:
+                    priority_actions.append(
+                        f"Review {prediction.kpi_display_name}: declining trend, "
+                        f"score {prediction.health_assessment.health_score:.1f}"
+                    )
+            else:
+                stable += 1
+
+            # Add recommendations from low-health KPIs
+            if prediction.health_assessment.health_score < 60:
+                priority_actions.extend(prediction.health_assessment.recommendations[:2])
 
         except Exception:
             # Skip KPIs that fail to generate
@@ -461,25 +505,27 @@ async def get_all_kpi_predictions(
     # Calculate overall health score
     overall_health_score = sum(health_scores) / len(health_scores) if health_scores else 50.0
 
-    return AllKPIPredictionsResponse(
-        client_id=client_id,
-        forecast_days=forecast_days,
-        generated_at=datetime.now(tz=timezone.utc),
-        efficiency=kpi_predictions.get("efficiency"),
-        performance=kpi_predictions.get("performance"),
-        availability=kpi_predictions.get("availability"),
-        oee=kpi_predictions.get("oee"),
-        ppm=kpi_predictions.get("ppm"),
-        dpmo=kpi_predictions.get("dpmo"),
-        fpy=kpi_predictions.get("fpy"),
-        rty=kpi_predictions.get("rty"),
-        absenteeism=kpi_predictions.get("absenteeism"),
-        otd=kpi_predictions.get("otd"),
-        overall_health_score=round(overall_health_score, 1),
-        kpis_improving=improving,
-        kpis_declining=declining,
-        kpis_stable=stable,
-        priority_actions=priority_actions[:10],  # Limit to top 10 actions
+    return FastJSONResponse(
+        AllKPIPredictionsResponse(
+            client_id=client_id,
+            forecast_days=forecast_days,
+            generated_at=datetime.now(tz=timezone.utc),
+            efficiency=kpi_predictions.get("efficiency"),
+            performance=kpi_predictions.get("performance"),
+            availability=kpi_predictions.get("availability"),
+            oee=kpi_predictions.get("oee"),
+            ppm=kpi_predictions.get("ppm"),
+            dpmo=kpi_predictions.get("dpmo"),
+            fpy=kpi_predictions.get("fpy"),
+            rty=kpi_predictions.get("rty"),
+            absenteeism=kpi_predictions.get("absenteeism"),
+            otd=kpi_predictions.get("otd"),
+            overall_health_score=round(overall_health_score, 1),
+            kpis_improving=improving,
+            kpis_declining=declining,
+            kpis_stable=stable,
+            priority_actions=priority_actions[:10],  # Limit to top 10 actions
+        )
     )
 
 
@@ -3,10 +3,10 @@ QR Code API Routes
 Provides QR code generation and lookup endpoints for work orders, products, jobs, and employees
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import Response
 from sqlalchemy.orm import Session
-from typing import Any
+from typing import Any, Dict, List, Set
 from urllib.parse import unquote
 
 from backend.database import get_db
@@ -14,7 +14,14 @@ from backend.utils.logging_utils import get_module_logger
 from backend.auth.jwt import get_current_user
 from backend.orm.user import User
 from backend.middleware.client_auth import verify_client_access
-from backend.schemas.qr import QREntityType, QRGenerateRequest, QRLookupResponse, QRCodeResponse
+from backend.schemas.qr import (
+    QRCodeData,
+    QREntityType,
+    QRGenerateRequest,
+    QRLabelsRequest,
+    QRLookupResponse,
+    QRCodeResponse,
+)
 from backend.services.qr_service import QRService, QRServiceError
 
 # Import ORM schemas for database queries
@@ -50,6 +57,28 @@ def _entity_to_dict(entity: Any) -> dict:
     return result
 
 
+def _if_none_match(request: Request) -> Set[str]:
+    """Entity tags in the request's If-None-Match header (weak prefixes dropped)."""
+    header = request.headers.get("if-none-match", "")
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+
+def _png_response(request: Request, qr_data: QRCodeData, size: int, filename: str) -> Response:
+    """
+    QR PNG response with an ETag derived from the payload
+
+    A matching If-None-Match is answered 304 without rendering; otherwise the
+    image comes from QRService's render cache.
+    """
+    etag = QRService.image_etag(qr_data, size)
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=86400"}
+    tags = _if_none_match(request)
+    if etag in tags or "*" in tags:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    headers["Content-Disposition"] = f"inline; filename={filename}"
+    return Response(content=QRService.generate_qr_image(qr_data, size), media_type="image/png", headers=headers)
+
+
 @router.get(
     "/lookup",
     response_model=QRLookupResponse,
@@ -178,6 +207,7 @@ async def qr_lookup(
     },
 )
 async def get_work_order_qr_image(
+    request: Request,
     work_order_id: str,
     size: int = Query(200, ge=100, le=500, description="QR code image size in pixels"),
     db: Session = Depends(get_db),
@@ -197,13 +227,7 @@ async def get_work_order_qr_image(
     # Generate QR code
     try:
         qr_data = QRService.create_qr_data(QREntityType.WORK_ORDER.value, work_order_id)
-        image_bytes = QRService.generate_qr_image(qr_data, size)
-
-        return Response(
-            content=image_bytes,
-            media_type="image/png",
-            headers={"Content-Disposition": f"inline; filename=qr_work_order_{work_order_id}.png"},
-        )
+        return _png_response(request, qr_data, size, f"qr_work_order_{work_order_id}.png")
     except QRServiceError as e:
         logger.exception("Failed to generate work order QR image: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to process QR code")
@@ -225,6 +249,7 @@ async def get_work_order_qr_image(
     },
 )
 async def get_product_qr_image(
+    request: Request,
     product_id: str,
     size: int = Query(200, ge=100, le=500, description="QR code image size in pixels"),
     db: Session = Depends(get_db),
@@ -253,13 +278,7 @@ async def get_product_qr_image(
     # Generate QR code
     try:
         qr_data = QRService.create_qr_data(QREntityType.PRODUCT.value, qr_identifier)
-        image_bytes = QRService.generate_qr_image(qr_data, size)
-
-        return Response(
-            content=image_bytes,
-            media_type="image/png",
-            headers={"Content-Disposition": f"inline; filename=qr_product_{qr_identifier}.png"},
-        )
+        return _png_response(request, qr_data, size, f"qr_product_{qr_identifier}.png")
     except QRServiceError as e:
         logger.exception("Failed to generate product QR image: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to process QR code")
@@ -282,6 +301,7 @@ async def get_product_qr_image(
     },
 )
 async def get_job_qr_image(
+    request: Request,
     job_id: str,
     size: int = Query(200, ge=100, le=500, description="QR code image size in pixels"),
     db: Session = Depends(get_db),
@@ -301,13 +321,7 @@ async def get_job_qr_image(
     # Generate QR code
     try:
         qr_data = QRService.create_qr_data(QREntityType.JOB.value, job_id)
-        image_bytes = QRService.generate_qr_image(qr_data, size)
-
-        return Response(
-            content=image_bytes,
-            media_type="image/png",
-            headers={"Content-Disposition": f"inline; filename=qr_job_{job_id}.png"},
-        )
+        return _png_response(request, qr_data, size, f"qr_job_{job_id}.png")
     except QRServiceError as e:
         logger.exception("Failed to generate job QR image: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to process QR code")
@@ -329,6 +343,7 @@ async def get_job_qr_image(
     },
 )
 async def get_employee_qr_image(
+    request: Request,
     employee_id: str,
     size: int = Query(200, ge=100, le=500, description="QR code image size in pixels"),
     db: Session = Depends(get_db),
@@ -354,13 +369,7 @@ async def get_employee_qr_image(
     # Generate QR code
     try:
         qr_data = QRService.create_qr_data(QREntityType.EMPLOYEE.value, qr_identifier)
-        image_bytes = QRService.generate_qr_image(qr_data, size)
-
-        return Response(
-            content=image_bytes,
-            media_type="image/png",
-            headers={"Content-Disposition": f"inline; filename=qr_employee_{qr_identifier}.png"},
-        )
+        return _png_response(request, qr_data, size, f"qr_employee_{qr_identifier}.png")
     except QRServiceError as e:
         logger.exception("Failed to generate employee QR image: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to process QR code")
@@ -470,7 +479,10 @@ async def generate_qr_code(
     },
 )
 async def generate_qr_code_image(
-    request: QRGenerateRequest, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+    request: QRGenerateRequest,
+    http_request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
 ) -> Response:
     """
     POST /api/qr/generate/image - Generate and return QR code PNG for any entity
@@ -521,13 +533,124 @@ async def generate_qr_code_image(
     try:
         type_value = entity_type if isinstance(entity_type, str) else entity_type.value
         qr_data = QRService.create_qr_data(type_value, entity_id)
-        image_bytes = QRService.generate_qr_image(qr_data, size)
+        return _png_response(http_request, qr_data, size, f"qr_{type_value}_{entity_id}.png")
+    except QRServiceError as e:
+        logger.exception("Failed to generate QR image: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to process QR code")
+
+
+def _label_identifiers(db: Session, entity_type: str, entity_ids: List[str], current_user: User) -> List[str]:
+    """
+    QR identifiers for entity_ids, in request order
+
+    One query per sheet instead of one per label. IDs resolve and are
+    access-checked exactly as the single-image routes do (product and
+    employee labels encode their code).
+    """
+    found: Dict[str, Any] = {}
+    client_ids: Set[str] = set()
+
+    if entity_type == QREntityType.WORK_ORDER:
+        work_orders = db.query(WorkOrder.work_order_id, WorkOrder.client_id).filter(
+            WorkOrder.work_order_id.in_(entity_ids)
+        )
+        for work_order_id, client_id in work_orders:
+            found[work_order_id] = work_order_id
+            client_ids.add(client_id)
 
-        return Response(
-            content=image_bytes,
-            media_type="image/png",
-            headers={"Content-Disposition": f"inline; filename=qr_{type_value}_{entity_id}.png"},
+    elif entity_type == QREntityType.JOB:
+        for job_id, client_id in db.query(Job.job_id, Job.client_id_fk).filter(Job.job_id.in_(entity_ids)):
+            found[job_id] = job_id
+            client_ids.add(client_id)
+
+    elif entity_type == QREntityType.PRODUCT:
+        numeric = {int(i) for i in entity_ids if i.lstrip("-").isdigit()}
+        codes = [i for i in entity_ids if not i.lstrip("-").isdigit()]
+        products = db.query(Product.product_id, Product.product_code, Product.client_id).filter(
+            Product.product_id.in_(numeric) | Product.product_code.in_(codes)
+        )
+        for product_id, product_code, client_id in products:
+            if product_id in numeric:
+                found[str(product_id)] = product_code
+            if product_code in codes:
+                found[product_code] = product_code
+            client_ids.add(client_id)
+
+    elif entity_type == QREntityType.EMPLOYEE:
+        numeric = {int(i) for i in entity_ids if i.lstrip("-").isdigit()}
+        codes = [i for i in entity_ids if not i.lstrip("-").isdigit()]
+        employees = db.query(Employee.employee_id, Employee.employee_code).filter(
+            Employee.employee_id.in_(numeric) | Employee.employee_code.in_(codes)
         )
+        for employee_id, employee_code in employees:
+            if employee_id in numeric:
+                found[str(employee_id)] = employee_code
+            if employee_code in codes:
+                found[employee_code] = employee_code
+
+    else:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unsupported entity type: {entity_type}")
+
+    missing = [i for i in dict.fromkeys(entity_ids) if i not in found]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"{entity_type} not found: {', '.join(missing[:20])}"
+        )
+    # Enforce client access control for every client on the sheet
+    for client_id in client_ids:
+        verify_client_access(current_user, client_id)
+    return [str(found[i]) for i in entity_ids]
+
+
+@router.post(
+    "/labels",
+    summary="Generate a printable QR label sheet",
+    description="""
+    Render QR codes for many entities of one type in a single request.
+
+    **Formats:**
+    - pdf: letter pages of labels (QR code with its identifier underneath)
+    - zip: one PNG per label
+
+    **Security:** Same access control as the single-image endpoints; the
+    whole request fails if any entity is missing or inaccessible.
+
+    **Returns:** PDF (application/pdf) or ZIP (application/zip) attachment
+    """,
+    responses={
+        200: {"description": "Label sheet", "content": {"application/pdf": {}, "application/zip": {}}},
+        403: {"description": "Access denied to one of the entities"},
+        404: {"description": "One or more entities not found"},
+    },
+)
+def generate_qr_labels(
+    request: QRLabelsRequest, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+) -> Response:
+    """
+    POST /api/qr/labels - Bulk QR labels as a PDF sheet or ZIP of PNGs
+    """
+    entity_type = request.entity_type if isinstance(request.entity_type, str) else request.entity_type.value
+    identifiers = _label_identifiers(db, entity_type, request.entity_ids, current_user)
+    if request.format == "zip":
+        # One file per distinct label
+        identifiers = list(dict.fromkeys(identifiers))
+
+    try:
+        images = QRService.generate_label_images(entity_type, identifiers, request.size)
+        if request.format == "zip":
+            content = QRService.build_label_zip(
+                [(f"qr_{entity_type}_{identifier}.png", png) for identifier, png in zip(identifiers, images)]
+            )
+            media_type = "application/zip"
+        else:
+            content = QRService.build_label_pdf(list(zip(identifiers, images)))
+            media_type = "application/pdf"
     except QRServiceError as e:
-        logger.exception("Failed to generate QR image: %s", e)
+        logger.exception("Failed to generate QR labels: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to process QR code")
+
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=qr_labels_{entity_type}.{request.format}"},
+    )
@@ -9,6 +9,7 @@ tool without persisting scenarios to the database.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 
 from backend.auth.jwt import get_current_active_supervisor
 from backend.orm.user import User
@@ -32,7 +33,7 @@ from backend.simulation_v2.models import (
 from backend.simulation_v2.validation import validate_simulation_config
 from backend.simulation_v2.engine import run_simulation
 from backend.simulation_v2.calculations import calculate_all_blocks
-from backend.simulation_v2.monte_carlo import run_monte_carlo
+from backend.simulation_v2.monte_carlo import run_monte_carlo, validate_target_metrics
 from backend.simulation_v2.optimization import (
     MiniZincNotAvailableError,
     MiniZincSolveError,
@@ -309,6 +310,16 @@ async def run_monte_carlo_endpoint(
     4. Returns a `sample_run` (the first replication) for non-numeric
        blocks and as a concrete reference shape.
 
+    Set `max_workers > 1` to fan the replications out over a process pool.
+    Each replication owns its seeded RNG stream, so the aggregated output
+    for a given `base_seed` does not depend on the worker count. The run
+    is dispatched off the event loop either way.
+
+    Set `target_relative_half_width` for adaptive mode: replications stop
+    as soon as the `target_metrics` CIs are tight enough, with
+    `n_replications` as the budget. `converged` reports whether the target
+    was met.
+
     Use the single-replication `/run` endpoint for fast feedback during
     iteration; use this endpoint when committing to a plan and you want
     uncertainty bounds on the projected metrics.
@@ -320,14 +331,24 @@ async def run_monte_carlo_endpoint(
     logger.info(
         f"User {current_user.username} running Monte Carlo: "
         f"{request.n_replications} replications, base_seed={request.base_seed}, "
-        f"{len(config.operations)} ops, mode={config.mode.value}"
+        f"max_workers={request.max_workers}, {len(config.operations)} ops, mode={config.mode.value}"
     )
 
+    if request.target_metrics:
+        try:
+            validate_target_metrics(request.target_metrics)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
+
     try:
-        result = run_monte_carlo(
+        result = await run_in_threadpool(
+            run_monte_carlo,
             config=config,
             n_replications=request.n_replications,
             base_seed=request.base_seed,
+            max_workers=request.max_workers,
+            target_relative_half_width=request.target_relative_half_width,
+            target_metrics=request.target_metrics,
         )
 
         validation_report: ValidationReport = result["validation_report"]
@@ -348,7 +369,7 @@ async def run_monte_carlo_endpoint(
 
         logger.info(
             f"Monte Carlo completed for user {current_user.username}: "
-            f"{result['n_replications']} replications, "
+            f"{result['n_replications']} replications on {result['workers']} worker(s), "
             f"total_duration={result['total_duration_seconds']:.2f}s"
         )
 
@@ -358,6 +379,9 @@ async def run_monte_carlo_endpoint(
             base_seed=result["base_seed"],
             total_duration_seconds=result["total_duration_seconds"],
             per_run_duration_seconds=result["per_run_duration_seconds"],
+            workers=result["workers"],
+            converged=result["converged"],
+            achieved_relative_half_width=result["achieved_relative_half_width"],
             aggregated_stats=result["aggregated_stats"],
             sample_run=result["sample_run"],
             validation_report=validation_report,
@@ -0,0 +1,27 @@
+"""
+Pivot API request models (backend/routes/pivot.py)
+"""
+
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+# A dashboard's worth of tiles; each spec is a full pivot response.
+MAX_BATCH_PIVOTS = 20
+
+
+class PivotSpec(BaseModel):
+    """One pivot of a batch: same meaning as GET /api/pivot/{dataset}'s params."""
+
+    dataset: str = Field(..., description="Registered pivot dataset")
+    bucket: str = Field(..., description="Time bucket (week, month, quarter, year)")
+    group_by: Optional[str] = Field(default=None, description="Optional grouping for the dataset")
+
+
+class PivotBatchRequest(BaseModel):
+    """Several pivots over one window, as POSTed to /api/pivot/batch."""
+
+    start_date: date
+    end_date: date
+    pivots: list[PivotSpec] = Field(..., min_length=1, max_length=MAX_BATCH_PIVOTS)
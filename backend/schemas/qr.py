@@ -3,7 +3,7 @@ QR Code Pydantic models for request/response validation
 """
 
 from pydantic import BaseModel, ConfigDict, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Literal
 from enum import Enum
 
 
@@ -45,6 +45,26 @@ class QRGenerateRequest(BaseModel):
     model_config = ConfigDict(use_enum_values=True)
 
 
+MAX_LABELS = 500
+
+
+class QRLabelsRequest(BaseModel):
+    """
+    Request model for a bulk label sheet
+
+    Used by POST /api/qr/labels to print many QR labels at once
+    """
+
+    entity_type: QREntityType = Field(..., description="Type of every entity on the sheet")
+    entity_ids: List[str] = Field(
+        ..., min_length=1, max_length=MAX_LABELS, description="IDs of the entities to label, in print order"
+    )
+    size: int = Field(default=200, ge=100, le=500, description="QR code image size in pixels")
+    format: Literal["pdf", "zip"] = Field(default="pdf", description="pdf: printable sheet; zip: one PNG per label")
+
+    model_config = ConfigDict(use_enum_values=True)
+
+
 class QRLookupResponse(BaseModel):
     """
     Response model for QR code lookup
@@ -0,0 +1,160 @@
+"""
+Middleware stack micro-benchmark.
+
+Drives a trivial route through three stacks, calling the ASGI app directly
+(no HTTP client, no server) so the numbers are middleware overhead only:
+
+  bare        no middleware
+  basehttp    the former stack: APIVersion, SecurityHeaders, AuditLog and
+              RateLimit as BaseHTTPMiddleware dispatch() layers
+  asgi        the current plain-ASGI classes plus CompressionMiddleware
+
+and then reports what compression does to a ~10k-row KPI JSON payload.
+
+Usage:
+  python -m backend.scripts.bench_middleware [--requests 5000]
+"""
+
+import sys
+import os
+
+# Standalone script: extend sys.path before importing project modules.
+# Per-line E402 below is unavoidable for this pattern.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import time  # noqa: E402
+from typing import Any, Dict, List, Tuple  # noqa: E402
+
+from fastapi import FastAPI  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import Response  # noqa: E402
+from starlette.types import ASGIApp, Message  # noqa: E402
+
+from backend.bootstrap.app_config import APIVersionMiddleware  # noqa: E402
+from backend.middleware.audit_log import AuditLogMiddleware  # noqa: E402
+from backend.middleware.compression import CompressionMiddleware  # noqa: E402
+from backend.middleware.rate_limit import RateLimitMiddleware  # noqa: E402
+from backend.middleware.security_headers import SecurityHeadersMiddleware  # noqa: E402
+
+ROWS = [
+    {"client_id": f"CLIENT-{n % 12}", "shift_date": "2026-10-01", "efficiency": 84.5 + n % 7, "units": 1000 + n}
+    for n in range(10000)
+]
+
+
+class _HeaderLayer(BaseHTTPMiddleware):
+    """BaseHTTPMiddleware equivalent of one header-setting layer of the former stack."""
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        response = await call_next(request)
+        response.headers["X-Bench"] = "1"
+        return response
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping() -> Dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/api/kpi")
+    def kpi() -> List[Dict[str, Any]]:
+        return ROWS
+
+    return app
+
+
+def build_stacks() -> Dict[str, ASGIApp]:
+    bare = _app()
+
+    basehttp = _app()
+    for _ in range(4):
+        basehttp.add_middleware(_HeaderLayer)
+
+    asgi = _app()
+    asgi.add_middleware(CompressionMiddleware)
+    asgi.add_middleware(SecurityHeadersMiddleware)
+    asgi.add_middleware(RateLimitMiddleware)
+    asgi.add_middleware(AuditLogMiddleware)
+    asgi.add_middleware(APIVersionMiddleware)
+    return {"bare": bare, "basehttp": basehttp, "asgi": asgi}
+
+
+async def request(app: ASGIApp, path: str, accept_encoding: str = "") -> Tuple[int, int]:
+    """One GET straight through the ASGI app; returns (status, body bytes)."""
+    headers = [(b"host", b"bench")]
+    if accept_encoding:
+        headers.append((b"accept-encoding", accept_encoding.encode()))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    status = 0
+    size = 0
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status, size
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, size
+
+
+async def per_request_us(app: ASGIApp, n: int) -> float:
+    """Mean wall time of one GET of the async ping route, in microseconds."""
+    for _ in range(200):  # warm-up
+        await request(app, "/api/ping")
+    started = time.perf_counter()
+    for _ in range(n):
+        await request(app, "/api/ping")
+    return (time.perf_counter() - started) / n * 1e6
+
+
+async def main_async(n: int) -> None:
+    stacks = build_stacks()
+    timings = {name: await per_request_us(app, n) for name, app in stacks.items()}
+    print(f"Per-request time over {n} GETs (small JSON route):")
+    for name, us in timings.items():
+        overhead = us - timings["bare"]
+        print(f"  {name:<9} {us:8.1f} us   ({overhead:+7.1f} us middleware)")
+
+    raw = len(json.dumps(ROWS, separators=(",", ":")))
+    print(f"\n{len(ROWS)}-row KPI payload ({raw / 1024:.0f} KiB JSON):")
+    for accept in ("", "gzip", "br, gzip"):
+        started = time.perf_counter()
+        _, size = await request(stacks["asgi"], "/api/kpi", accept)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"  Accept-Encoding {accept or '(none)':<9} {size / 1024:8.0f} KiB  {elapsed_ms:7.1f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000, help="GETs per stack")
+    args = parser.parse_args()
+    asyncio.run(main_async(args.requests))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+"""
+Pivot response serialization benchmark.
+
+Serves a 10k-row pivot result (the shape run_pivot returns) three ways and
+times each request end to end through the ASGI app:
+
+  default      route returns the dict: jsonable_encoder + stdlib json
+  fast         route returns FastJSONResponse(dict) with orjson
+  fast-stdlib  FastJSONResponse with the stdlib fallback (orjson absent)
+
+Usage:
+  python -m backend.scripts.bench_pivot_json [--rows 10000] [--repeat 20]
+"""
+
+import sys
+import os
+
+# Standalone script: extend sys.path before importing project modules.
+# Per-line E402 below is unavoidable for this pattern.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import time  # noqa: E402
+from datetime import date, timedelta  # noqa: E402
+from typing import Any, Dict, List  # noqa: E402
+
+from fastapi import FastAPI  # noqa: E402
+
+from backend.scripts.bench_middleware import request  # noqa: E402
+from backend.utils import json_response  # noqa: E402
+from backend.utils.json_response import FastJSONResponse  # noqa: E402
+
+
+def pivot_result(n_rows: int) -> Dict[str, Any]:
+    """A run_pivot-shaped result: daily buckets x 25 group keys."""
+    rows: List[Dict[str, Any]] = []
+    for n in range(n_rows):
+        units = 1000.0 + n % 97
+        rows.append(
+            {
+                "bucket_start": (date(2026, 1, 1) + timedelta(days=n // 25)).isoformat(),
+                "group_key": f"STYLE-{n % 25:03d}",
+                "units_produced": units,
+                "run_time_hours": 7.5,
+                "earned_hours": units / 140.0,
+                "efficiency": round(units / 140.0 / 7.5 * 100, 2),
+                "share_of_units": round(100.0 / n_rows, 4),
+            }
+        )
+    totals = {k: sum(r[k] for r in rows) for k in ("units_produced", "run_time_hours", "earned_hours")}
+    return {"dataset": "production", "bucket": "day", "group_by": "style", "rows": rows, "totals": totals}
+
+
+def build_app(result: Dict[str, Any]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/pivot/default")
+    def default() -> Any:
+        return result
+
+    @app.get("/api/pivot/fast", response_class=FastJSONResponse)
+    def fast() -> FastJSONResponse:
+        return FastJSONResponse(result)
+
+    return app
+
+
+async def time_ms(app: FastAPI, path: str, repeat: int) -> float:
+    await request(app, path)  # warm-up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await request(app, path)
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+async def main_async(n_rows: int, repeat: int) -> None:
+    app = build_app(pivot_result(n_rows))
+    _, size = await request(app, "/api/pivot/fast")
+    print(f"{n_rows}-row pivot, {size / 1024:.0f} KiB JSON, mean of {repeat} requests:")
+
+    timings = {"default": await time_ms(app, "/api/pivot/default", repeat)}
+    if json_response.ORJSON_AVAILABLE:
+        timings["fast"] = await time_ms(app, "/api/pivot/fast", repeat)
+    json_response.ORJSON_AVAILABLE = False
+    timings["fast-stdlib"] = await time_ms(app, "/api/pivot/fast", repeat)
+
+    for name, ms in timings.items():
+        print(f"  {name:<12} {ms:8.1f} ms   ({timings['default'] / ms:4.1f}x)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000, help="pivot rows")
+    parser.add_argument("--repeat", type=int, default=20, help="requests per variant")
+    args = parser.parse_args()
+    asyncio.run(main_async(args.rows, args.repeat))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,152 @@
+"""
+Alert Refresh on Commit
+Keeps OTD-risk and pending-hold alerts current between full sweeps
+(POST /api/alerts/generate/check-all).
+
+setup_alert_refresh_hooks() records which work orders and which clients'
+holds a transaction wrote, and after the commit hands them to the process
+AlertRefresher. Its single background thread re-runs the set-based checks in
+services/alert_service.py for just those work orders and clients, so a
+commit never pays for them and an incremental refresh never creates an alert
+the sweep would not have. Requests queued while a refresh runs are merged
+into the next one. Without a running refresher (scripts, tests) nothing is
+refreshed; the sweep still covers everything.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional, Set
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from backend.services.alert_service import generate_hold_alerts, generate_otd_alerts
+
+logger = logging.getLogger(__name__)
+
+
+class AlertRefresher:
+    """Re-runs the alert checks for committed work-order and hold changes on one background thread."""
+
+    def __init__(self, session_factory: Callable[[], Any]) -> None:
+        self._session_factory = session_factory
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="alert-refresh")
+        self._lock = threading.Lock()
+        self._work_order_ids: Set[str] = set()
+        self._hold_clients: Set[str] = set()
+        self._scheduled = False
+        self._stopped = False
+
+    def submit(self, work_order_ids: Iterable[str], hold_clients: Iterable[str]) -> None:
+        """Queue a refresh; merged with whatever is already waiting."""
+        with self._lock:
+            if self._stopped:
+                return
+            self._work_order_ids.update(work_order_ids)
+            self._hold_clients.update(hold_clients)
+            if self._scheduled or not (self._work_order_ids or self._hold_clients):
+                return
+            self._scheduled = True
+        self._executor.submit(self.flush)
+
+    def flush(self) -> int:
+        """
+        Run the queued refresh now, on the calling thread.
+
+        Returns:
+            Number of alerts created or refreshed
+        """
+        with self._lock:
+            work_order_ids, self._work_order_ids = self._work_order_ids, set()
+            hold_clients, self._hold_clients = self._hold_clients, set()
+            self._scheduled = False
+        if not work_order_ids and not hold_clients:
+            return 0
+        db = self._session_factory()
+        try:
+            refreshed = len(generate_otd_alerts(db, work_order_ids=sorted(work_order_ids))) if work_order_ids else 0
+            for client_id in sorted(hold_clients):
+                refreshed += len(generate_hold_alerts(db, client_id))
+        except SQLAlchemyError:
+            db.rollback()
+            logger.exception("Alert refresh failed; the next sweep will catch up")
+            return 0
+        finally:
+            db.close()
+        if refreshed:
+            logger.debug(f"ALERTS: {refreshed} alert(s) refreshed after commit")
+        return refreshed
+
+    def stop(self) -> int:
+        """Stop the thread and run whatever is still queued. Returns alerts created or refreshed."""
+        with self._lock:
+            self._stopped = True
+        self._executor.shutdown(wait=True)
+        return self.flush()
+
+
+# Session -> (work order ids, hold client ids) its current transaction wrote
+_pending: "WeakKeyDictionary[Session, tuple[Set[str], Set[str]]]" = WeakKeyDictionary()
+
+
+def _record_changes(session: Session, flush_context: Any) -> None:
+    """after_flush: remember the work orders and hold clients this flush wrote."""
+    for obj in (*session.new, *session.dirty):
+        table = getattr(obj, "__tablename__", "")
+        if table == "WORK_ORDER" and obj.work_order_id:
+            _pending.setdefault(session, (set(), set()))[0].add(obj.work_order_id)
+        elif table == "HOLD_ENTRY" and obj.client_id:
+            _pending.setdefault(session, (set(), set()))[1].add(obj.client_id)
+
+
+def _refresh_committed(session: Session) -> None:
+    """after_commit: hand what just committed to the refresher."""
+    changes = _pending.pop(session, None)
+    refresher = _refresher
+    if changes is not None and refresher is not None:
+        refresher.submit(*changes)
+
+
+def _discard_changes(session: Session) -> None:
+    """after_rollback: nothing was written."""
+    _pending.pop(session, None)
+
+
+_HOOKS = (
+    ("after_flush", _record_changes),
+    ("after_commit", _refresh_committed),
+    ("after_rollback", _discard_changes),
+)
+
+
+def setup_alert_refresh_hooks(session_factory: Any) -> None:
+    """Refresh alerts for what sessions from session_factory commit. Idempotent per session_factory."""
+    for identifier, fn in _HOOKS:
+        if not event.contains(session_factory, identifier, fn):
+            event.listen(session_factory, identifier, fn)
+
+
+# Process-wide refresher, started by the application lifespan
+_refresher: Optional[AlertRefresher] = None
+
+
+def start_alert_refresher(session_factory: Callable[[], Any]) -> AlertRefresher:
+    """Create and start the process refresher, replacing any previous one."""
+    global _refresher
+    if _refresher is not None:
+        _refresher.stop()
+    _refresher = AlertRefresher(session_factory)
+    return _refresher
+
+
+def stop_alert_refresher() -> None:
+    """Stop the process refresher, running any queued refresh first."""
+    global _refresher
+    if _refresher is None:
+        return
+    refreshed = _refresher.stop()
+    _refresher = None
+    logger.info(f"Alert refresher stopped ({refreshed} alert(s) refreshed on shutdown)")
@@ -0,0 +1,217 @@
+"""
+Alert Service
+Set-based alert generation for the OTD-risk and pending-hold checks.
+
+Each check reads its candidates in one column-only query, drops the ones that
+already have an active alert inside that same query (NOT EXISTS against
+ALERT's work_order_id / category / status indexes), and inserts what is left
+in one flush. The routes in routes/alerts/generate.py run them as a full
+sweep; services/alert_refresh.py runs them for just the work orders and
+clients a commit touched.
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Iterable, List, Optional
+
+from sqlalchemy import exists, func
+from sqlalchemy.orm import Session
+
+from backend.calculations.alerts import generate_alert_id, generate_hold_alert, generate_otd_risk_alert
+from backend.orm.alert import Alert
+from backend.orm.hold_entry import HoldEntry, HoldStatus
+from backend.orm.work_order import WorkOrder, WorkOrderStatus
+
+# Work orders due further out than this are not at OTD risk yet
+OTD_ALERT_HORIZON_DAYS = 30
+
+
+def generate_otd_alerts(
+    db: Session,
+    client_id: Optional[str] = None,
+    work_order_ids: Optional[Iterable[str]] = None,
+) -> List[Alert]:
+    """
+    Create OTD-risk alerts for active work orders due within the horizon.
+
+    Args:
+        db: Database session; committed when new alerts are added
+        client_id: Limit the check to one client
+        work_order_ids: Limit the check to these work orders (incremental
+            refresh from domain events); None checks every active order
+
+    Returns:
+        The newly created alerts
+    """
+    now = datetime.now(tz=timezone.utc)
+    # planned_ship_date is a naive UTC column
+    window_start = now.replace(tzinfo=None)
+    window_end = window_start + timedelta(days=OTD_ALERT_HORIZON_DAYS + 1)
+
+    has_active_alert = exists().where(
+        Alert.work_order_id == WorkOrder.work_order_id,
+        Alert.category == "otd",
+        Alert.status == "active",
+    )
+    query = db.query(
+        WorkOrder.work_order_id,
+        WorkOrder.client_id,
+        WorkOrder.planned_ship_date,
+        WorkOrder.planned_quantity,
+        WorkOrder.actual_quantity,
+        WorkOrder.created_at,
+    ).filter(
+        WorkOrder.status == WorkOrderStatus.ACTIVE,
+        WorkOrder.planned_ship_date >= window_start,
+        WorkOrder.planned_ship_date < window_end,
+        ~has_active_alert,
+    )
+    if client_id:
+        query = query.filter(WorkOrder.client_id == client_id)
+    if work_order_ids is not None:
+        work_order_ids = list(work_order_ids)
+        if not work_order_ids:
+            return []
+        query = query.filter(WorkOrder.work_order_id.in_(work_order_ids))
+
+    alerts = []
+    for wo in query:
+        due_date = wo.planned_ship_date
+        if isinstance(due_date, str):
+            due_date = datetime.fromisoformat(due_date)
+        if not due_date.tzinfo:
+            due_date = due_date.replace(tzinfo=timezone.utc)
+
+        # The SQL window is a prefilter; this is the authoritative bound
+        days_remaining = (due_date - now).days
+        if days_remaining < 0 or days_remaining > OTD_ALERT_HORIZON_DAYS:
+            continue
+
+        total_qty = wo.planned_quantity or 1
+        completed_qty = wo.actual_quantity or 0
+        current_completion = Decimal(str((completed_qty / total_qty) * 100))
+
+        if wo.created_at:
+            created_at = wo.created_at if wo.created_at.tzinfo else wo.created_at.replace(tzinfo=timezone.utc)
+            total_days = (due_date - created_at).days
+            elapsed_days = (now - created_at).days
+            planned_completion = Decimal(str(min(100, (elapsed_days / max(1, total_days)) * 100)))
+        else:
+            planned_completion = Decimal("50")
+
+        result = generate_otd_risk_alert(
+            work_order_id=wo.work_order_id,
+            client_name=wo.client_id or "Unknown",
+            due_date=due_date,
+            current_completion_percent=current_completion,
+            planned_completion_percent=planned_completion,
+            days_remaining=days_remaining,
+        )
+        if not result or not result.should_alert:
+            continue
+
+        alerts.append(
+            Alert(
+                alert_id=generate_alert_id(),
+                category="otd",
+                severity=result.severity,
+                status="active",
+                title=result.title,
+                message=result.message,
+                recommendation=result.recommendation,
+                client_id=wo.client_id,
+                kpi_key="otd",
+                work_order_id=wo.work_order_id,
+                current_value=float(current_completion),
+                threshold_value=float(planned_completion),
+                confidence=float(result.confidence) if result.confidence else None,
+                alert_metadata=result.metadata,
+                created_at=now,
+            )
+        )
+
+    return _insert_alerts(db, alerts)
+
+
+def generate_hold_alerts(db: Session, client_id: Optional[str] = None) -> List[Alert]:
+    """
+    Create or refresh the pending-hold-approval alert.
+
+    Pending holds are counted in one aggregate query. The client's active
+    hold alert, if any, is updated in place instead of duplicated.
+
+    Args:
+        db: Database session; committed when an alert is added or updated
+        client_id: Count only this client's holds (None: all clients)
+
+    Returns:
+        The created or refreshed alert, or an empty list
+    """
+    query = db.query(func.count(), func.min(HoldEntry.created_at)).filter(
+        HoldEntry.hold_status.in_([HoldStatus.PENDING_HOLD_APPROVAL, HoldStatus.PENDING_RESUME_APPROVAL])
+    )
+    if client_id:
+        query = query.filter(HoldEntry.client_id == client_id)
+    pending_count, oldest_created_at = query.one()
+
+    if not pending_count:
+        return []
+
+    now = datetime.now(tz=timezone.utc)
+    oldest_hours = None
+    if oldest_created_at:
+        if not oldest_created_at.tzinfo:
+            oldest_created_at = oldest_created_at.replace(tzinfo=timezone.utc)
+        oldest_hours = int((now - oldest_created_at).total_seconds() / 3600)
+
+    result = generate_hold_alert(
+        pending_holds_count=pending_count,
+        oldest_hold_hours=oldest_hours,
+        total_units_on_hold=pending_count,
+    )
+    if not result or not result.should_alert:
+        return []
+
+    existing = (
+        db.query(Alert)
+        .filter(
+            Alert.category == "hold",
+            Alert.status == "active",
+            Alert.client_id == client_id if client_id else Alert.client_id.is_(None),
+        )
+        .first()
+    )
+
+    if existing:
+        existing.severity = result.severity
+        existing.title = result.title
+        existing.message = result.message
+        existing.alert_metadata = result.metadata
+        db.commit()
+        return [existing]
+
+    alert = Alert(
+        alert_id=generate_alert_id(),
+        category="hold",
+        severity=result.severity,
+        status="active",
+        title=result.title,
+        message=result.message,
+        recommendation=result.recommendation,
+        client_id=client_id,
+        kpi_key="hold_approval",
+        alert_metadata=result.metadata,
+        created_at=now,
+    )
+    return _insert_alerts(db, [alert])
+
+
+def _insert_alerts(db: Session, alerts: List[Alert]) -> List[Alert]:
+    """Insert alerts in one flush, then reload them with one SELECT (not one refresh per alert)."""
+    if not alerts:
+        return []
+    db.add_all(alerts)
+    db.commit()
+    # The commit expired them; loading by key repopulates the same instances
+    db.query(Alert).filter(Alert.alert_id.in_([a.alert_id for a in alerts])).all()
+    return alerts
@@ -7,13 +7,14 @@ Note: The AnalyticsService class in backend.services.analytics_service provides
 higher-level trend analysis. This module handles CRUD query passthrough.
 """
 
-from typing import Any
+from typing import Any, Iterable
 from datetime import date
 from sqlalchemy.orm import Session
 
 from backend.orm.user import User
 from backend.crud.analytics import (
     get_kpi_time_series_data,
+    get_kpi_time_series_bundle,
     get_shift_heatmap_data,
     get_client_comparison_data,
     get_defect_pareto_data,
@@ -35,6 +36,18 @@ def get_time_series(
     return get_kpi_time_series_data(db, client_id, kpi_type, start_date, end_date, current_user)
 
 
+def get_time_series_bundle(
+    db: Session,
+    client_id: str,
+    kpi_types: Iterable[str],
+    start_date: date,
+    end_date: date,
+    current_user: User,
+) -> Any:
+    """Get time series for several KPIs from one grouped query."""
+    return get_kpi_time_series_bundle(db, client_id, kpi_types, start_date, end_date, current_user)
+
+
 def get_heatmap(
     db: Session,
     client_id: str,
@@ -230,7 +230,7 @@ class AnalyticsService:
         Aggregates multiple metrics for dashboard display.
         Uses caching to improve performance for repeated requests.
         """
-        from backend.cache import get_cache, build_cache_key
+        from backend.cache import CacheTag, get_cache, build_cache_key
 
         if as_of_date is None:
             as_of_date = date.today()
@@ -279,8 +279,14 @@ class AnalyticsService:
             "alerts": self._get_active_alerts(client_id),
         }
 
-        # Cache for 5 minutes (dashboard data changes slowly)
-        cache.set(cache_key, result, ttl_seconds=300)
+        # Cache for 5 minutes (dashboard data changes slowly); tagged so a
+        # commit touching any of its sources evicts it immediately.
+        tags = [
+            CacheTag("production", client_id, month_start, as_of_date),
+            CacheTag("quality", client_id, month_start, as_of_date),
+            CacheTag("work_order", client_id),
+        ]
+        cache.set(cache_key, result, ttl_seconds=300, tags=tags)
 
         return result
 
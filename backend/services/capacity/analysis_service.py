@@ -187,7 +187,7 @@ class CapacityAnalysisService:
                     available_hours=result.capacity_hours,
                     required_hours=result.demand_hours,
                 )
-                event_bus.collect(event)
+                event_bus.collect(event, session=self.db)
 
             # Store analysis result
             self._store_analysis_result(client_id, analysis_date, line, result)
@@ -149,7 +149,7 @@ class BOMService:
                 components_count=len(components),
                 explosion_depth=1,
             )
-            event_bus.collect(event)
+            event_bus.collect(event, session=self.db)
 
         return result
 
@@ -599,7 +599,7 @@ class KPIIntegrationService:
                     threshold_percent=Decimal("10.0"),
                     alert_level="critical" if abs(variance_percent) > 15 else "warning",
                 )
-                event_bus.collect(event)
+                event_bus.collect(event, session=self.db)
 
             # Determine status
             if abs(variance_percent) <= 5:
@@ -659,7 +659,7 @@ class KPIIntegrationService:
                 threshold_percent=self.variance_threshold,
                 alert_level=alert.alert_level,
             )
-            event_bus.collect(event)
+            event_bus.collect(event, session=self.db)
 
         return alerts
 
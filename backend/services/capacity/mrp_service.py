@@ -166,7 +166,7 @@ class MRPService:
                         available_quantity=available_qty,
                         affected_orders_count=len(affected),
                     )
-                    event_bus.collect(event)
+                    event_bus.collect(event, session=self.db)
             elif available_qty < required_qty * Decimal("1.1"):
                 # Less than 10% buffer - mark as partial
                 status = ComponentStatus.PARTIAL
@@ -341,7 +341,7 @@ class ScenarioService:
             base_schedule_id=base_schedule_id,
             scenario_type=type_str,
         )
-        event_bus.collect(event)
+        event_bus.collect(event, session=self.db)
 
         self.db.commit()
         return scenario
@@ -569,7 +569,7 @@ class ScenarioService:
                 ),
             },
         )
-        event_bus.collect(event)
+        event_bus.collect(event, session=self.db)
 
         return comparisons
 
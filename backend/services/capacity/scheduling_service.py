@@ -237,7 +237,7 @@ class SchedulingService:
                 scheduled_date=item.get("scheduled_date"),
                 scheduled_quantity=item.get("scheduled_quantity", 0),
             )
-            event_bus.collect(event)
+            event_bus.collect(event, session=self.db)
 
         self.db.commit()
         return schedule
@@ -289,7 +289,7 @@ class SchedulingService:
             period_start=schedule.period_start,
             period_end=schedule.period_end,
         )
-        event_bus.collect(event)
+        event_bus.collect(event, session=self.db)
 
         self.db.commit()
         return schedule
@@ -3,14 +3,22 @@ CSV Export Service
 
 Generic CSV export service that streams CSV rows from SQLAlchemy query results.
 Supports CSV injection protection, date range filtering, and multi-tenant isolation.
+
+Rows are paged with a keyset cursor on the primary key (``WHERE pk > :last
+ORDER BY pk LIMIT n``) rather than OFFSET, so every batch is an index seek
+and total cost stays linear in the export size. Only the exported columns
+are selected, as plain tuples, and each batch is written into a single
+multi-row buffer. ``gzip_stream`` optionally compresses the chunk stream.
 """
 
 import csv
 import io
+import zlib
 from datetime import date, datetime, time
 from decimal import Decimal
-from typing import Any, Generator, List, Optional, Tuple
+from typing import Any, Generator, Iterable, List, Optional, Tuple
 
+from sqlalchemy import and_, null, or_
 from sqlalchemy.orm import Session
 
 from backend.utils.logging_utils import get_module_logger
@@ -20,6 +28,9 @@ logger = get_module_logger(__name__)
 # Characters that could trigger formula injection in spreadsheets
 _CSV_INJECTION_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
 
+# Rows fetched per keyset page; each page is emitted as one CSV chunk.
+EXPORT_BATCH_SIZE = 2000
+
 
 def sanitize_csv_value(value: str) -> str:
     """
@@ -72,6 +83,20 @@ def _format_value(value: Any) -> str:
     return sanitize_csv_value(str(value))
 
 
+def _keyset_after(pk_columns: List[Any], last_key: Tuple[Any, ...]) -> Any:
+    """
+    Build the "strictly after ``last_key``" predicate for a (possibly composite) key.
+
+    Expanded lexicographically -- (a > x) OR (a = x AND b > y) ... -- rather than
+    as a row-value comparison so it stays portable and index-friendly.
+    """
+    clauses = []
+    for i, column in enumerate(pk_columns):
+        equal_prefix = [pk_columns[j] == last_key[j] for j in range(i)]
+        clauses.append(and_(*equal_prefix, column > last_key[i]))
+    return or_(*clauses) if len(clauses) > 1 else clauses[0]
+
+
 def stream_csv_export(
     db: Session,
     model_class: Any,
@@ -81,12 +106,13 @@ def stream_csv_export(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     line_id: Optional[int] = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
 ) -> Generator[str, None, None]:
     """
     Generic CSV export generator for any entity.
 
-    Yields CSV rows as strings, starting with the header row. Streams data
-    in chunks to keep memory usage low for large datasets.
+    Yields the header row, then one multi-row CSV chunk per keyset page.
+    Memory stays bounded by ``batch_size`` regardless of the export size.
 
     Args:
         db: SQLAlchemy database session.
@@ -99,59 +125,61 @@ def stream_csv_export(
         start_date: Optional start date for range filtering (inclusive).
         end_date: Optional end date for range filtering (inclusive, end of day).
         line_id: Optional production line ID filter.
+        batch_size: Rows per keyset page / emitted chunk.
 
     Yields:
-        CSV-formatted strings (header row first, then data rows).
+        CSV-formatted strings (header row first, then one chunk per batch).
     """
-    # Build query
-    query = db.query(model_class)
+    pk_columns = list(model_class.__table__.primary_key.columns)
+    mapped_columns = model_class.__mapper__.column_attrs
+
+    # Select the primary key (cursor) followed by the exported columns only.
+    # Attributes that are not mapped columns export as empty cells, matching
+    # the old getattr(row, name, None) behaviour.
+    export_exprs = [getattr(model_class, attr) if attr in mapped_columns else null() for attr, _ in columns]
+    key_width = len(pk_columns)
+
+    filters = []
 
     # Apply multi-tenant filter
     if client_filter is not None:
-        query = query.filter(client_filter)
+        filters.append(client_filter)
 
     # Apply date range filter
     if date_field is not None:
         if start_date is not None:
-            query = query.filter(date_field >= datetime.combine(start_date, datetime.min.time()))
+            filters.append(date_field >= datetime.combine(start_date, datetime.min.time()))
         if end_date is not None:
-            query = query.filter(date_field <= datetime.combine(end_date, datetime.max.time()))
+            filters.append(date_field <= datetime.combine(end_date, datetime.max.time()))
 
     # Apply line_id filter if the model has line_id and a value was provided
     if line_id is not None and hasattr(model_class, "line_id"):
-        query = query.filter(model_class.line_id == line_id)
-
-    # Order by primary key for deterministic output
-    pk_columns = [col for col in model_class.__table__.primary_key.columns]
-    if pk_columns:
-        query = query.order_by(*pk_columns)
+        filters.append(model_class.line_id == line_id)
 
     # Yield header row
     output = io.StringIO()
     writer = csv.writer(output)
-    header = [col_header for _, col_header in columns]
-    writer.writerow(header)
+    writer.writerow([col_header for _, col_header in columns])
     yield output.getvalue()
 
-    # Stream data rows in batches
-    batch_size = 500
-    offset = 0
     total_rows = 0
+    last_key: Optional[Tuple[Any, ...]] = None
 
     while True:
-        batch = query.offset(offset).limit(batch_size).all()
+        query = db.query(*pk_columns, *export_exprs).filter(*filters)
+        if last_key is not None:
+            query = query.filter(_keyset_after(pk_columns, last_key))
+        batch = query.order_by(*pk_columns).limit(batch_size).all()
         if not batch:
             break
 
-        for row in batch:
-            output = io.StringIO()
-            writer = csv.writer(output)
-            values = [_format_value(getattr(row, attr_name, None)) for attr_name, _ in columns]
-            writer.writerow(values)
-            yield output.getvalue()
-            total_rows += 1
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerows([_format_value(value) for value in row[key_width:]] for row in batch)
+        yield output.getvalue()
 
-        offset += batch_size
+        total_rows += len(batch)
+        last_key = tuple(batch[-1][:key_width])
 
         if len(batch) < batch_size:
             break
@@ -161,3 +189,25 @@ def stream_csv_export(
         model_class.__tablename__,
         total_rows,
     )
+
+
+def gzip_stream(chunks: Iterable[str], encoding: str = "utf-8") -> Generator[bytes, None, None]:
+    """
+    Gzip-compress a stream of text chunks incrementally.
+
+    Each input chunk is fed through one compressor; output is yielded as
+    soon as zlib releases it, so compression never buffers the full export.
+
+    Args:
+        chunks: Iterable of text chunks (e.g. from ``stream_csv_export``).
+        encoding: Text encoding applied before compression.
+
+    Yields:
+        Gzip-framed byte chunks.
+    """
+    compressor = zlib.compressobj(wbits=31)  # 16 + MAX_WBITS -> gzip container
+    for chunk in chunks:
+        compressed = compressor.compress(chunk.encode(encoding))
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -1,4 +1,10 @@
-"""Shared CSV/XLSX upload processing — one correct per-row loop for all upload endpoints."""
+"""Shared CSV/XLSX upload processing — one correct per-row loop for all upload endpoints.
+
+Endpoints that supply a ``build_fn`` get the bulk path: every row is mapped
+and built first, then valid rows are inserted in chunks of
+``BULK_CHUNK_SIZE`` with one flush + commit per chunk instead of one commit
+per row. The per-row error report and the audit trail are unchanged.
+"""
 
 import csv
 import io
@@ -20,6 +26,12 @@ _CSV_INJECTION_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
 _MAX_CSV_SIZE = 10 * 1024 * 1024  # 10MB
 _ALLOWED_EXTENSIONS = (".csv", ".xlsx")
 
+# Rows per insert transaction on the bulk path.
+BULK_CHUNK_SIZE = 500
+
+# Per-row failures reported (not raised) by both the per-row and bulk paths.
+_ROW_PARSE_ERRORS = (ValueError, TypeError, KeyError, InvalidOperation)
+
 
 def sanitize_csv_value(value: str) -> str:
     """Strip CSV injection prefixes (=, +, -, @, \\t, \\r) from string values."""
@@ -60,9 +72,15 @@ def process_csv_upload(
     row_mapper: Callable[[dict, User], Any],
     create_fn: Callable[[Session, Any, User], Any],
     id_getter: Callable[[Any], Any],
+    build_fn: Optional[Callable[[Any, User], Any]] = None,
+    chunk_size: int = BULK_CHUNK_SIZE,
 ) -> CSVUploadResponse:
     """Run each row through row_mapper → create_fn, collecting the same counts/errors as the legacy endpoints.
 
+    When ``build_fn`` is given (entry, user → unsaved ORM object), rows take
+    the bulk path instead (see ``_process_bulk``); ``create_fn`` is then
+    unused. ``id_getter`` must work on the ORM object in that case.
+
     NOT suppressed from audit capture (owner ruling 2026-08-12): this is
     reached from 11 authenticated, user-facing endpoints
     (backend/endpoints/csv_upload.py). A supervisor uploading 500 hold
@@ -72,6 +90,9 @@ def process_csv_upload(
     backend/scripts/init_demo_database.py) suppress, because they generate
     fixture data rather than a human decision.
     """
+    if build_fn is not None:
+        return _process_bulk(rows, db, current_user, row_mapper, build_fn, id_getter, chunk_size)
+
     total_rows = 0
     successful = 0
     failed = 0
@@ -93,7 +114,7 @@ def process_csv_upload(
             logger.exception("Database error processing CSV row %d", row_num)
             failed += 1
             errors.append({"row": row_num, "error": "Database error processing row", "data": row})
-        except (ValueError, TypeError, KeyError, InvalidOperation) as e:
+        except _ROW_PARSE_ERRORS as e:
             logger.warning("Data parsing error in CSV row %d: %s", row_num, e)
             failed += 1
             errors.append({"row": row_num, "error": "Data parsing error in CSV row", "data": row})
@@ -101,3 +122,68 @@ def process_csv_upload(
     return CSVUploadResponse(
         total_rows=total_rows, successful=successful, failed=failed, errors=errors[:100], created_entries=created_ids
     )
+
+
+def _process_bulk(
+    rows: list[dict],
+    db: Session,
+    current_user: User,
+    row_mapper: Callable[[dict, User], Any],
+    build_fn: Callable[[Any, User], Any],
+    id_getter: Callable[[Any], Any],
+    chunk_size: int,
+) -> CSVUploadResponse:
+    """Validate every row up front, then insert the valid ones chunk by chunk.
+
+    Each chunk is ``add_all`` + one commit, so SQLAlchemy's unit of work
+    batches the INSERTs and the mapper-level audit listeners still fire per
+    row inside the chunk's transaction. If a chunk's commit fails, it is
+    rolled back and replayed one row per transaction so the failing rows are
+    reported individually with the same "Database error processing row"
+    entry the per-row path produces; the rest of the chunk still lands.
+    """
+    errors: list[dict] = []
+    valid: list[tuple[int, dict, Any]] = []
+
+    # Phase 1: map + build every row; nothing touches the session yet.
+    for row_num, row in enumerate(rows, start=2):
+        try:
+            valid.append((row_num, row, build_fn(row_mapper(row, current_user), current_user)))
+        except ValidationError as e:
+            logger.warning("CSV row %d validation failed: %s", row_num, e)
+            errors.append({"row": row_num, "error": "Validation error in CSV row data", "data": row})
+        except _ROW_PARSE_ERRORS as e:
+            logger.warning("Data parsing error in CSV row %d: %s", row_num, e)
+            errors.append({"row": row_num, "error": "Data parsing error in CSV row", "data": row})
+
+    # Phase 2: one transaction per chunk of valid rows.
+    created_ids: list = []
+    for start in range(0, len(valid), max(chunk_size, 1)):
+        chunk = valid[start : start + chunk_size]
+        try:
+            db.add_all([obj for _, _, obj in chunk])
+            db.commit()
+            created_ids.extend(id_getter(obj) for _, _, obj in chunk)
+            continue
+        except SQLAlchemyError:
+            db.rollback()
+            logger.warning("Bulk insert of CSV rows %d-%d failed; retrying row by row", chunk[0][0], chunk[-1][0])
+
+        for row_num, row, obj in chunk:
+            try:
+                db.add(obj)
+                db.commit()
+                created_ids.append(id_getter(obj))
+            except SQLAlchemyError:
+                db.rollback()
+                logger.exception("Database error processing CSV row %d", row_num)
+                errors.append({"row": row_num, "error": "Database error processing row", "data": row})
+
+    errors.sort(key=lambda e: e["row"])
+    return CSVUploadResponse(
+        total_rows=len(rows),
+        successful=len(created_ids),
+        failed=len(errors),
+        errors=errors[:100],
+        created_entries=created_ids,
+    )
@@ -23,7 +23,7 @@ from backend.orm.production_entry import ProductionEntry
 from backend.orm.product import Product
 from backend.orm.shift import Shift
 from backend.crud.client_config import get_client_config_or_defaults
-from backend.cache import get_cache
+from backend.cache import CacheTag, get_cache
 from backend.cache.kpi_cache import build_cache_key
 
 logger = logging.getLogger(__name__)
@@ -142,7 +142,7 @@ class ProductionKPIService:
                 }
             return None
 
-        cached_data = self._cache.get_or_set(cache_key, fetch_product, ttl_seconds=1800)
+        cached_data = self._cache.get_or_set(cache_key, fetch_product, ttl_seconds=1800, tags=[CacheTag("product")])
 
         if cached_data is None:
             return None
@@ -179,7 +179,7 @@ class ProductionKPIService:
                 }
             return None
 
-        cached_data = self._cache.get_or_set(cache_key, fetch_shift, ttl_seconds=1800)
+        cached_data = self._cache.get_or_set(cache_key, fetch_shift, ttl_seconds=1800, tags=[CacheTag("shift")])
 
         if cached_data is None:
             return None
@@ -490,7 +490,8 @@ class ProductionKPIService:
                 "entry_count": result.entry_count or 0,
             }
 
-        return cast(Dict[str, Any], self._cache.get_or_set(cache_key, compute_summary, ttl_seconds=300))
+        tags = [CacheTag("production", client_id, target_date, target_date)]
+        return cast(Dict[str, Any], self._cache.get_or_set(cache_key, compute_summary, ttl_seconds=300, tags=tags))
 
     # ========================================================================
     # Private calculation methods
@@ -3,17 +3,37 @@ QR Code Service for KPI Platform
 Handles QR code generation, decoding, and auto-fill field mapping
 """
 
+import hashlib
 import json
 import logging
+import zipfile
 import qrcode
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from typing import Dict, Any
+from typing import Dict, Any, List, Sequence, Tuple
 from pydantic import ValidationError
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen import canvas
 
+from backend.cache import KPICache
+from backend.config import settings
 from backend.schemas.qr import QRCodeData, QREntityType
 
 logger = logging.getLogger(__name__)
 
+# Rendered PNGs, content-addressed by image_etag(). A payload always renders
+# to the same image, so entries never go stale; the TTL only ages out cold
+# ones and the byte budget bounds memory.
+_image_cache = KPICache(ttl_seconds=24 * 3600, max_entries=10_000, max_bytes=settings.QR_IMAGE_CACHE_MAX_BYTES or None)
+
+# Label sheet layout: a grid of square QR labels, caption underneath.
+LABEL_COLUMNS = 3
+LABEL_ROWS = 4
+LABEL_MARGIN = 0.5 * inch
+LABEL_CAPTION_HEIGHT = 0.3 * inch
+
 
 class QRServiceError(Exception):
     """Custom exception for QR service errors"""
@@ -34,11 +54,25 @@ class QRService:
     # Version for QR code schema compatibility
     QR_VERSION = "1.0"
 
+    @staticmethod
+    def image_etag(data: QRCodeData, size: int = 200) -> str:
+        """
+        Strong ETag for the PNG of `data` at `size`
+
+        Derived from the encoded payload, not the image bytes, so a request
+        can be answered 304 before anything is rendered.
+        """
+        digest = hashlib.sha256(f"{size}:{data.model_dump_json()}".encode()).hexdigest()
+        return f'"{digest[:32]}"'
+
     @staticmethod
     def generate_qr_image(data: QRCodeData, size: int = 200) -> bytes:
         """
         Generate QR code PNG image bytes
 
+        Renders once per (payload, size); repeats are served from an
+        in-memory, byte-bounded cache.
+
         Args:
             data: QRCodeData containing type, id, and version
             size: Image size in pixels (default 200)
@@ -49,6 +83,13 @@ class QRService:
         Raises:
             QRServiceError: If QR code generation fails
         """
+        image: bytes = _image_cache.get_or_set(
+            QRService.image_etag(data, size), lambda: QRService._render_qr_image(data, size)
+        )
+        return image
+
+    @staticmethod
+    def _render_qr_image(data: QRCodeData, size: int) -> bytes:
         try:
             # Serialize data to JSON string
             qr_string = data.model_dump_json()
@@ -83,6 +124,62 @@ class QRService:
             logger.exception("QR code image generation I/O error")
             raise QRServiceError("Failed to generate QR code image")
 
+    @staticmethod
+    def generate_label_images(entity_type: str, entity_ids: Sequence[str], size: int = 200) -> List[bytes]:
+        """
+        Render the QR PNGs for many entities of one type, in order
+
+        Uncached images are rendered on a pool of QR_LABEL_WORKERS threads.
+
+        Raises:
+            QRServiceError: If the entity type is invalid or rendering fails
+        """
+        payloads = [QRService.create_qr_data(entity_type, entity_id) for entity_id in entity_ids]
+        with ThreadPoolExecutor(max_workers=max(1, settings.QR_LABEL_WORKERS)) as pool:
+            return list(pool.map(lambda data: QRService.generate_qr_image(data, size), payloads))
+
+    @staticmethod
+    def build_label_pdf(labels: Sequence[Tuple[str, bytes]]) -> bytes:
+        """
+        Lay out (caption, PNG) labels on letter pages, LABEL_COLUMNS x LABEL_ROWS per page
+
+        Returns:
+            PDF document as bytes
+        """
+        page_width, page_height = letter
+        cell_width = (page_width - 2 * LABEL_MARGIN) / LABEL_COLUMNS
+        cell_height = (page_height - 2 * LABEL_MARGIN) / LABEL_ROWS
+        side = min(cell_width, cell_height - LABEL_CAPTION_HEIGHT) * 0.9
+        per_page = LABEL_COLUMNS * LABEL_ROWS
+
+        buffer = BytesIO()
+        pdf = canvas.Canvas(buffer, pagesize=letter)
+        for index, (caption, png) in enumerate(labels):
+            if index and index % per_page == 0:
+                pdf.showPage()
+            row, column = divmod(index % per_page, LABEL_COLUMNS)
+            left = LABEL_MARGIN + column * cell_width
+            top = page_height - LABEL_MARGIN - row * cell_height
+            x = left + (cell_width - side) / 2
+            pdf.drawImage(ImageReader(BytesIO(png)), x, top - side, width=side, height=side)
+            pdf.setFont("Helvetica", 9)
+            pdf.drawCentredString(left + cell_width / 2, top - side - LABEL_CAPTION_HEIGHT / 2, caption)
+        pdf.save()
+        return buffer.getvalue()
+
+    @staticmethod
+    def build_label_zip(files: Sequence[Tuple[str, bytes]]) -> bytes:
+        """
+        Bundle (filename, PNG) pairs into a ZIP archive
+
+        PNGs are already compressed, so entries are stored, not deflated.
+        """
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as archive:
+            for filename, png in files:
+                archive.writestr(filename, png)
+        return buffer.getvalue()
+
     @staticmethod
     def create_qr_data(entity_type: str, entity_id: str) -> QRCodeData:
         """
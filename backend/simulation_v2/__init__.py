@@ -58,9 +58,16 @@ from .models import (
 )
 
 from .validation import validate_simulation_config
-from .engine import run_simulation, ProductionLineSimulator
+from .engine import run_simulation, ProductionLineSimulator, RandomStreams
 from .calculations import calculate_all_blocks
-from .monte_carlo import run_monte_carlo, aggregate_runs, compute_stat
+from .monte_carlo import (
+    run_monte_carlo,
+    aggregate_runs,
+    compute_stat,
+    RunningStat,
+    StreamingAggregator,
+    validate_target_metrics,
+)
 from .optimization.operator_allocation import (
     optimize_operator_allocation,
     apply_allocation_to_config,
@@ -140,11 +147,15 @@ __all__ = [
     # Engine
     "run_simulation",
     "ProductionLineSimulator",
+    "RandomStreams",
     "calculate_all_blocks",
     # Monte Carlo
     "run_monte_carlo",
     "aggregate_runs",
     "compute_stat",
+    "RunningStat",
+    "StreamingAggregator",
+    "validate_target_metrics",
     # Optimization (Pattern 1+)
     "optimize_operator_allocation",
     "apply_allocation_to_config",
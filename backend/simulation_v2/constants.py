@@ -21,6 +21,8 @@ MAX_TOTAL_OPERATIONS = 100
 MAX_HORIZON_DAYS = 7
 MAX_BUNDLE_SIZE = 100
 MAX_OPERATORS_PER_STATION = 20
+MAX_MONTE_CARLO_WORKERS = 8  # Upper bound on process-pool size for replications
+MIN_ADAPTIVE_REPLICATIONS = 3  # Replications before an adaptive Monte Carlo run may stop early
 
 # =============================================================================
 # OPERATION DEFAULTS
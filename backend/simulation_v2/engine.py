@@ -5,7 +5,9 @@ Implements the core simulation logic using SimPy's process-based approach.
 Each bundle flows through operations as a generator function, yielding
 events for resource requests, timeouts, and state changes.
 
-This module is stateless with no database dependencies.
+This module is stateless with no database dependencies. Every stochastic
+draw goes through per-run RandomStreams, never the module-global ``random``
+state, so simulations running concurrently in threads stay reproducible.
 """
 
 import simpy
@@ -69,6 +71,48 @@ class SimulationMetrics:
     breakdown_time_lost: float = 0.0
 
 
+@dataclass
+class RandomStreams:
+    """
+    Independent random generators, one per stochastic source.
+
+    Keeping variability, breakdown and rework draws on separate streams
+    means a change to one source (e.g. a higher rework_pct) does not shift
+    the sequence seen by the others, so two scenarios run with the same
+    seed share common random numbers for a fair comparison.
+    """
+
+    variability: random.Random
+    breakdown: random.Random
+    rework: random.Random
+
+    @classmethod
+    def from_seed(cls, seed: int | None = None) -> "RandomStreams":
+        """
+        Build streams from a seed.
+
+        Each stream is seeded with ``"<seed>:<source>"`` (string seeds are
+        hashed with SHA-512, so the streams are stable across processes and
+        Python runs). With no seed every stream draws OS entropy.
+        """
+        if seed is None:
+            return cls(variability=random.Random(), breakdown=random.Random(), rework=random.Random())
+        return cls(
+            variability=random.Random(f"{seed}:variability"),
+            breakdown=random.Random(f"{seed}:breakdown"),
+            rework=random.Random(f"{seed}:rework"),
+        )
+
+    @classmethod
+    def from_generator(cls, rng: random.Random) -> "RandomStreams":
+        """Spawn child streams from a parent generator."""
+        return cls(
+            variability=random.Random(rng.getrandbits(64)),
+            breakdown=random.Random(rng.getrandbits(64)),
+            rework=random.Random(rng.getrandbits(64)),
+        )
+
+
 class ProductionLineSimulator:
     """
     SimPy-based discrete-event simulation for labor-intensive production lines.
@@ -78,19 +122,25 @@ class ProductionLineSimulator:
     operator capacity.
     """
 
-    def __init__(self, config: SimulationConfig, seed: int | None = None):
+    def __init__(
+        self,
+        config: SimulationConfig,
+        seed: int | None = None,
+        rng: random.Random | None = None,
+    ):
         """
         Initialize the simulator with configuration.
 
         Args:
             config: Complete simulation configuration
             seed: Optional random seed for reproducibility
+            rng: Optional parent generator to spawn the per-source streams
+                from (``seed`` is ignored when given)
         """
         self.config = config
 
-        # Set random seed if provided
-        if seed is not None:
-            random.seed(seed)
+        # Per-run generators; the module-global random state is never touched
+        self.streams = RandomStreams.from_generator(rng) if rng is not None else RandomStreams.from_seed(seed)
 
         self.env = simpy.Environment()
         self.metrics = SimulationMetrics()
@@ -136,7 +186,7 @@ class ProductionLineSimulator:
 
         return resources
 
-    def _calculate_process_time(self, op: OperationInput) -> float:
+    def _calculate_process_time(self, op: OperationInput, rng: random.Random | None = None) -> float:
         """
         Calculate actual processing time for a single piece.
 
@@ -144,6 +194,8 @@ class ProductionLineSimulator:
 
         Args:
             op: Operation with SAM and adjustment factors
+            rng: Stream to draw variability from (defaults to the
+                variability stream; rework cycles pass the rework stream)
 
         Returns:
             Processing time in minutes (minimum MIN_PROCESS_TIME_MINUTES)
@@ -153,7 +205,7 @@ class ProductionLineSimulator:
         # Variability factor
         if op.variability == VariabilityType.TRIANGULAR:
             # Symmetric triangular distribution centered at 0
-            variability_factor = random.triangular(
+            variability_factor = (rng or self.streams.variability).triangular(
                 TRIANGULAR_VARIABILITY_MIN, TRIANGULAR_VARIABILITY_MAX, TRIANGULAR_VARIABILITY_MODE
             )
         else:
@@ -195,7 +247,7 @@ class ProductionLineSimulator:
             Breakdown delay in minutes (0 if no breakdown)
         """
         breakdown_pct = self.breakdowns_by_tool.get(machine_tool, 0.0)
-        if breakdown_pct > 0 and random.random() * 100 < breakdown_pct:
+        if breakdown_pct > 0 and self.streams.breakdown.random() * 100 < breakdown_pct:
             # Simplified breakdown: fixed 30-minute delay
             # Could be made configurable in future versions
             delay = 30.0
@@ -204,6 +256,33 @@ class ProductionLineSimulator:
             return delay
         return 0.0
 
+    def _sample_bundle_work(self, op: OperationInput, bundle_size: int) -> Tuple[float, int, int]:
+        """
+        Draw every piece and rework time for one bundle-operation up front.
+
+        Uses the same per-piece sampling procedure as the piece-by-piece
+        loop (variability draw, rework check, rework draw), so busy-time and
+        rework metrics have the same distribution; only the number of SimPy
+        events differs. Exact sample paths diverge when bundles interleave
+        at a shared station, since draws are no longer spread over time.
+
+        Args:
+            op: Operation being performed
+            bundle_size: Number of pieces in the bundle
+
+        Returns:
+            Tuple of (total work minutes incl. rework, pieces processed, rework count)
+        """
+        total_time = 0.0
+        rework_count = 0
+        check_rework = op.rework_pct > 0
+        for _ in range(bundle_size):
+            total_time += self._calculate_process_time(op)
+            if check_rework and self.streams.rework.random() * 100 < op.rework_pct:
+                rework_count += 1
+                total_time += self._calculate_process_time(op, self.streams.rework)
+        return total_time, bundle_size, rework_count
+
     def _bundle_process(
         self, bundle_id: int, product: str, bundle_size: int, operations: List[OperationInput]
     ) -> Generator[Any, Any, None]:
@@ -214,6 +293,8 @@ class ProductionLineSimulator:
         1. Enters the system (WIP increases)
         2. Flows through operations in sequence
         3. At each operation: waits for resource, processes each piece
+           (one timeout per piece, or a single timeout for the whole bundle
+           when ``config.batch_piece_sampling`` is set)
         4. Exits the system (WIP decreases, throughput recorded)
 
         Args:
@@ -248,23 +329,33 @@ class ProductionLineSimulator:
                 if breakdown_delay > 0:
                     yield self.env.timeout(breakdown_delay)
 
-                # Process each piece in the bundle
-                for piece_idx in range(bundle_size):
-                    process_time = self._calculate_process_time(op)
-                    yield self.env.timeout(process_time)
-
-                    # Accumulate busy time and piece count
-                    self.metrics.station_busy_time[op.machine_tool] += process_time
-                    self.metrics.station_pieces_processed[op.machine_tool] += 1
-
-                    # Check for rework requirement
-                    if op.rework_pct > 0 and random.random() * 100 < op.rework_pct:
-                        self.metrics.rework_count += 1
-                        self.metrics.rework_by_station[op.machine_tool] += 1
-                        # Rework adds another processing cycle at this station
-                        rework_time = self._calculate_process_time(op)
-                        yield self.env.timeout(rework_time)
-                        self.metrics.station_busy_time[op.machine_tool] += rework_time
+                if self.config.batch_piece_sampling:
+                    # One clock advance for the whole bundle-operation
+                    work_time, piece_count, rework_count = self._sample_bundle_work(op, bundle_size)
+                    yield self.env.timeout(work_time)
+                    self.metrics.station_busy_time[op.machine_tool] += work_time
+                    self.metrics.station_pieces_processed[op.machine_tool] += piece_count
+                    if rework_count:
+                        self.metrics.rework_count += rework_count
+                        self.metrics.rework_by_station[op.machine_tool] += rework_count
+                else:
+                    # Process each piece in the bundle
+                    for piece_idx in range(bundle_size):
+                        process_time = self._calculate_process_time(op)
+                        yield self.env.timeout(process_time)
+
+                        # Accumulate busy time and piece count
+                        self.metrics.station_busy_time[op.machine_tool] += process_time
+                        self.metrics.station_pieces_processed[op.machine_tool] += 1
+
+                        # Check for rework requirement
+                        if op.rework_pct > 0 and self.streams.rework.random() * 100 < op.rework_pct:
+                            self.metrics.rework_count += 1
+                            self.metrics.rework_by_station[op.machine_tool] += 1
+                            # Rework adds another processing cycle at this station
+                            rework_time = self._calculate_process_time(op, self.streams.rework)
+                            yield self.env.timeout(rework_time)
+                            self.metrics.station_busy_time[op.machine_tool] += rework_time
 
             # Exit transition delay
             yield self.env.timeout(transition_time)
@@ -381,7 +472,11 @@ class ProductionLineSimulator:
         return self.metrics
 
 
-def run_simulation(config: SimulationConfig, seed: int | None = None) -> Tuple[SimulationMetrics, float]:
+def run_simulation(
+    config: SimulationConfig,
+    seed: int | None = None,
+    rng: random.Random | None = None,
+) -> Tuple[SimulationMetrics, float]:
     """
     Execute simulation and return metrics with duration.
 
@@ -390,13 +485,14 @@ def run_simulation(config: SimulationConfig, seed: int | None = None) -> Tuple[S
     Args:
         config: Complete simulation configuration
         seed: Optional random seed for reproducibility
+        rng: Optional parent generator for the per-source streams
 
     Returns:
         Tuple of (SimulationMetrics, duration_seconds)
     """
     start_time = datetime.now(tz=timezone.utc)
 
-    simulator = ProductionLineSimulator(config, seed=seed)
+    simulator = ProductionLineSimulator(config, seed=seed, rng=rng)
     metrics = simulator.run()
 
     end_time = datetime.now(tz=timezone.utc)
@@ -24,6 +24,7 @@ from .constants import (
     MAX_BUNDLE_SIZE,
     MAX_HORIZON_DAYS,
     ENGINE_VERSION,
+    MAX_MONTE_CARLO_WORKERS,
 )
 
 # =============================================================================
@@ -285,6 +286,15 @@ class SimulationConfig(BaseModel):
     horizon_days: int = Field(
         default=DEFAULT_HORIZON_DAYS, ge=1, le=MAX_HORIZON_DAYS, description="Simulation horizon in days"
     )
+    batch_piece_sampling: bool = Field(
+        default=False,
+        description=(
+            "Engine mode: sample all piece and rework times of a bundle-operation "
+            "at once and advance the clock by their sum (one SimPy event instead of "
+            "one per piece). Metrics match the per-piece mode in distribution; a "
+            "bundle still in process at the horizon is credited only once it finishes."
+        ),
+    )
 
     @model_validator(mode="after")
     def validate_mix_mode_total_demand(self) -> Any:
@@ -524,6 +534,34 @@ class MonteCarloRequest(BaseModel):
             "`base_seed + i`. If omitted, replications use independent RNG."
         ),
     )
+    max_workers: int = Field(
+        default=1,
+        ge=1,
+        le=MAX_MONTE_CARLO_WORKERS,
+        description=(
+            "Parallelism for the replications. 1 runs them sequentially; "
+            "larger values fan out over a process pool (capped at the CPU "
+            "count). Results are identical for a given base_seed either way."
+        ),
+    )
+    target_relative_half_width: Optional[float] = Field(
+        default=None,
+        gt=0,
+        le=1,
+        description=(
+            "Adaptive mode: stop as soon as every target metric's 95% CI "
+            "half-width is within this fraction of its mean (e.g. 0.02 = ±2%). "
+            "n_replications then acts as the maximum budget."
+        ),
+    )
+    target_metrics: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "Adaptive mode: '<block>.<field>' paths the target applies to, e.g. "
+            "'daily_summary.daily_throughput_pcs' or 'station_performance.util_pct' "
+            "(worst row governs). Defaults to daily throughput."
+        ),
+    )
 
 
 class MonteCarloStat(BaseModel):
@@ -808,6 +846,13 @@ class MonteCarloResponse(BaseModel):
     base_seed: Optional[int] = None
     total_duration_seconds: float = 0.0
     per_run_duration_seconds: List[float] = Field(default_factory=list)
+    workers: int = 1
+    converged: Optional[bool] = Field(
+        default=None, description="Adaptive mode only: whether the precision target was met within the budget."
+    )
+    achieved_relative_half_width: Dict[str, float] = Field(
+        default_factory=dict, description="Adaptive mode only: final relative CI half-width per target metric."
+    )
     aggregated_stats: Dict[str, Any] = Field(default_factory=dict)
     sample_run: Optional[SimulationResults] = None
     validation_report: ValidationReport
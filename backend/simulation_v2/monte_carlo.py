@@ -14,20 +14,45 @@ have at least one concrete replication for inspection.
 
 This addresses the simulator's largest credibility gap (single-rep,
 no uncertainty bounds) without requiring engine refactoring.
+
+Replications are independent, so they can fan out over a process pool
+(`max_workers > 1`). Each replication draws from its own engine
+RandomStreams seeded with `base_seed + i` (never the module-global RNG), which keeps
+results bit-for-bit identical for a given `base_seed` whatever the worker
+count or completion order.
+
+Replications are folded into streaming (Welford) statistics as they
+complete rather than held in memory, which also enables an adaptive mode:
+given a target relative CI half-width on chosen metrics, the runner stops
+as soon as every metric reaches it, treating `n_replications` as a budget.
 """
 
 from __future__ import annotations
 
 import math
+import os
 import statistics
+from collections import deque
+from contextlib import closing
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, Generator, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
 
 from .calculations import calculate_all_blocks
+from .constants import MAX_MONTE_CARLO_WORKERS, MIN_ADAPTIVE_REPLICATIONS
 from .engine import run_simulation
 from .models import (
+    BundleMetricsRow,
+    DailySummary,
+    FreeCapacityAnalysis,
+    PerProductSummaryRow,
     SimulationConfig,
     SimulationResults,
+    StationPerformanceRow,
+    ValidationReport,
+    WeeklyDemandCapacityRow,
 )
 from .validation import validate_simulation_config
 
@@ -180,42 +205,310 @@ def aggregate_runs(runs: List[SimulationResults]) -> Dict[str, Any]:
     return aggregated
 
 
+# =============================================================================
+# Streaming aggregation
+# =============================================================================
+
+# Z-score for the 95% half-width, shared with `compute_stat`.
+_Z_95 = 1.96
+
+_SINGLETON_BLOCKS: Tuple[str, ...] = ("daily_summary", "free_capacity")
+
+# Row model per aggregated block, used to validate target metric paths.
+_BLOCK_ROW_MODELS: Dict[str, type[BaseModel]] = {
+    "daily_summary": DailySummary,
+    "free_capacity": FreeCapacityAnalysis,
+    "weekly_demand_capacity": WeeklyDemandCapacityRow,
+    "station_performance": StationPerformanceRow,
+    "bundle_metrics": BundleMetricsRow,
+    "per_product_summary": PerProductSummaryRow,
+}
+
+
+class RunningStat:
+    """
+    Welford's online mean/variance for one numeric field.
+
+    `to_dict` returns the same shape as `compute_stat`, so streamed and
+    batch-aggregated blocks are interchangeable for consumers.
+    """
+
+    __slots__ = ("n", "mean", "_m2")
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def push(self, value: float) -> None:
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def std(self) -> float:
+        if self.n < 2:
+            return 0.0
+        return math.sqrt(max(self._m2, 0.0) / (self.n - 1))
+
+    @property
+    def half_width(self) -> float:
+        if self.n < 2:
+            return 0.0
+        return _Z_95 * self.std / math.sqrt(self.n)
+
+    def relative_half_width(self) -> float:
+        """Half-width as a fraction of |mean|; 0 when both are 0, inf when only the mean is."""
+        half_width = self.half_width
+        if self.mean == 0:
+            return 0.0 if half_width == 0 else math.inf
+        return half_width / abs(self.mean)
+
+    def to_dict(self) -> Dict[str, float]:
+        if self.n == 0:
+            return {"mean": 0.0, "std": 0.0, "ci_lo_95": 0.0, "ci_hi_95": 0.0, "n": 0}
+        half_width = self.half_width
+        return {
+            "mean": self.mean,
+            "std": self.std,
+            "ci_lo_95": self.mean - half_width,
+            "ci_hi_95": self.mean + half_width,
+            "n": self.n,
+        }
+
+
+def _push_row(slots: Optional[Dict[str, Any]], row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fold one row into its per-field slots (RunningStat or carried value).
+
+    The first row seen fixes which fields are numeric, matching
+    `_aggregate_singleton` / `_aggregate_list_block`.
+    """
+    if slots is None:
+        slots = {field: RunningStat() if _is_numeric(value) else value for field, value in row.items()}
+    for field, slot in slots.items():
+        value = row.get(field)
+        if isinstance(slot, RunningStat) and _is_numeric(value):
+            slot.push(float(value))  # type: ignore[arg-type]
+    return slots
+
+
+def _render_row(slots: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: slot.to_dict() if isinstance(slot, RunningStat) else slot for field, slot in slots.items()}
+
+
+def validate_target_metrics(metrics: Sequence[str]) -> None:
+    """
+    Check adaptive-mode metric paths of the form ``"<block>.<field>"``.
+
+    Raises:
+        ValueError: if a path names an unknown block or field.
+    """
+    for path in metrics:
+        block, _, field = path.partition(".")
+        model = _BLOCK_ROW_MODELS.get(block)
+        if model is None or field not in model.model_fields:
+            raise ValueError(
+                f"Unknown Monte Carlo target metric '{path}'; expected '<block>.<field>' "
+                f"with block in {sorted(_BLOCK_ROW_MODELS)}"
+            )
+
+
+class StreamingAggregator:
+    """
+    Incremental counterpart to `aggregate_runs`.
+
+    Each replication is folded in as it completes, so memory stays
+    proportional to the number of distinct output rows rather than the
+    number of replications. `result()` has the same shape as
+    `aggregate_runs`.
+    """
+
+    def __init__(self) -> None:
+        self.n_runs = 0
+        self._singletons: Dict[str, Optional[Dict[str, Any]]] = {block: None for block in _SINGLETON_BLOCKS}
+        self._lists: Dict[str, Dict[Tuple[Any, ...], Dict[str, Any]]] = {block: {} for block in _BLOCK_ROW_KEYS}
+
+    def push(self, results: SimulationResults) -> None:
+        dump = results.model_dump(mode="python", include=set(_BLOCK_ROW_MODELS))
+        self.n_runs += 1
+        for block in _SINGLETON_BLOCKS:
+            self._singletons[block] = _push_row(self._singletons[block], dump.get(block) or {})
+        for block, key_fields in _BLOCK_ROW_KEYS.items():
+            grouped = self._lists[block]
+            for row in dump.get(block) or []:
+                key = tuple(row.get(k) for k in key_fields)
+                grouped[key] = _push_row(grouped.get(key), row)
+
+    def stats_for(self, path: str) -> List[RunningStat]:
+        """Every RunningStat behind a ``"<block>.<field>"`` path (one per row for list blocks)."""
+        block, _, field = path.partition(".")
+        if block in self._singletons:
+            rows = [self._singletons[block] or {}]
+        else:
+            rows = list(self._lists.get(block, {}).values())
+        return [row[field] for row in rows if isinstance(row.get(field), RunningStat)]
+
+    def relative_half_width(self, path: str) -> float:
+        """Worst (largest) relative CI half-width across the rows behind `path`."""
+        stats = self.stats_for(path)
+        if not stats:
+            return math.inf
+        return max(stat.relative_half_width() for stat in stats)
+
+    def result(self) -> Dict[str, Any]:
+        if self.n_runs == 0:
+            return {}
+        aggregated: Dict[str, Any] = {}
+        for block in _SINGLETON_BLOCKS:
+            aggregated[block] = _render_row(self._singletons[block] or {})
+        for block in _BLOCK_ROW_KEYS:
+            aggregated[block] = [_render_row(slots) for slots in self._lists[block].values()]
+        return aggregated
+
+
+# =============================================================================
+# Replication execution
+# =============================================================================
+
+
+def _run_replication(
+    config: SimulationConfig,
+    seed: Optional[int],
+    validation_report: ValidationReport,
+) -> Tuple[SimulationResults, float]:
+    """
+    Run one replication with its own RNG stream and compute its blocks.
+
+    Module-level (not a closure) so it can be pickled into pool workers.
+    A `None` seed gives the replication OS-entropy-seeded streams.
+    """
+    metrics, duration = run_simulation(config, seed=seed)
+    results = calculate_all_blocks(
+        config=config,
+        metrics=metrics,
+        validation_report=validation_report,
+        duration_seconds=duration,
+        defaults_applied=[],  # caller can attach to sample_run separately
+    )
+    return results, duration
+
+
+# Sentinel for the seed iterator in `_iter_replications`.
+_EXHAUSTED: Any = object()
+
+
+def _iter_replications(
+    config: SimulationConfig,
+    seeds: List[Optional[int]],
+    validation_report: ValidationReport,
+    workers: int,
+) -> Generator[Tuple[SimulationResults, float], None, None]:
+    """
+    Yield replication outcomes strictly in seed order.
+
+    With a pool, at most `2 * workers` replications are in flight ahead of
+    the consumer; if the consumer stops early, pending ones are cancelled.
+    """
+    if workers <= 1:
+        for seed in seeds:
+            yield _run_replication(config, seed, validation_report)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending: Deque[Future[Tuple[SimulationResults, float]]] = deque()
+        remaining = iter(seeds)
+        for seed in remaining:
+            pending.append(executor.submit(_run_replication, config, seed, validation_report))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            outcome = pending.popleft().result()
+            next_seed = next(remaining, _EXHAUSTED)
+            if next_seed is not _EXHAUSTED:
+                pending.append(executor.submit(_run_replication, config, next_seed, validation_report))
+            yield outcome
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _resolve_workers(max_workers: Optional[int], n_replications: int) -> int:
+    """Clamp the requested pool size to [1, min(cap, cpu_count, n_replications)]."""
+    if not max_workers or max_workers <= 1:
+        return 1
+    cpu_count = os.cpu_count() or 1
+    return max(1, min(max_workers, MAX_MONTE_CARLO_WORKERS, cpu_count, n_replications))
+
+
 # =============================================================================
 # Public runner
 # =============================================================================
 
+_DEFAULT_TARGET_METRICS: Tuple[str, ...] = ("daily_summary.daily_throughput_pcs",)
+
 
 def run_monte_carlo(
     config: SimulationConfig,
     n_replications: int,
     base_seed: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    target_relative_half_width: Optional[float] = None,
+    target_metrics: Optional[Sequence[str]] = None,
 ) -> Dict[str, Any]:
     """
     Run N replications of the simulation engine, aggregate results.
 
+    In adaptive mode (`target_relative_half_width` set) `n_replications`
+    is a budget: after each replication (in seed order, from
+    MIN_ADAPTIVE_REPLICATIONS on) the runner checks every target metric
+    and stops once all 95% CI half-widths are within the target fraction
+    of their mean. For list blocks the worst row governs.
+
     Args:
         config: Simulation configuration (validated by caller).
         n_replications: Number of replications to run (caller enforces bounds).
         base_seed: Optional anchor for the seed sequence; replication i uses
-            `base_seed + i` so the run is fully reproducible. If None,
-            replications use independent RNG state from the global Python
-            random module.
+            its own streams seeded with `base_seed + i` so the run is fully
+            reproducible. If None, each replication's streams are seeded
+            from OS entropy.
+        max_workers: Optional process-pool size. None or 1 runs replications
+            sequentially in-process; larger values fan out over a
+            `ProcessPoolExecutor` (clamped to MAX_MONTE_CARLO_WORKERS, the
+            CPU count and `n_replications`). Results are identical either way.
+        target_relative_half_width: Optional adaptive-mode precision target,
+            e.g. 0.02 for ±2% of the mean.
+        target_metrics: ``"<block>.<field>"`` paths the target applies to
+            (default: ``daily_summary.daily_throughput_pcs``).
 
     Returns:
         Dict with keys:
-          - n_replications: int
+          - n_replications: int — replications actually run
           - base_seed: Optional[int]
           - total_duration_seconds: float
           - per_run_duration_seconds: list[float]
+          - workers: int — pool size actually used (1 = sequential)
           - validation_report: ValidationReport (from the canonical config)
           - sample_run: SimulationResults — the replication that used
             seed=base_seed (or the first run if base_seed is None) for
             non-numeric blocks (rebalancing_suggestions, assumption_log)
             and as a concrete reference shape.
           - aggregated_stats: Dict[str, Any] — see `aggregate_runs`.
+          - converged: Optional[bool] — adaptive mode only: whether the
+            target was met within the budget.
+          - achieved_relative_half_width: Dict[str, float] — adaptive mode
+            only: final relative half-width per target metric.
+
+    Raises:
+        ValueError: if a target metric path is unknown.
     """
     start = datetime.now(tz=timezone.utc)
 
+    adaptive = target_relative_half_width is not None
+    metric_paths = list(target_metrics or _DEFAULT_TARGET_METRICS) if adaptive else []
+    validate_target_metrics(metric_paths)
+
     validation_report = validate_simulation_config(config)
     if validation_report.has_errors:
         # Mirror the route's contract: bail with the validation report;
@@ -225,36 +518,50 @@ def run_monte_carlo(
             "base_seed": base_seed,
             "total_duration_seconds": 0.0,
             "per_run_duration_seconds": [],
+            "workers": 0,
             "validation_report": validation_report,
             "sample_run": None,
             "aggregated_stats": {},
+            "converged": None,
+            "achieved_relative_half_width": {},
         }
 
-    runs: List[SimulationResults] = []
+    seeds = [(base_seed + i) if base_seed is not None else None for i in range(n_replications)]
+    workers = _resolve_workers(max_workers, n_replications)
+
+    aggregator = StreamingAggregator()
+    sample_run: Optional[SimulationResults] = None
     durations: List[float] = []
+    converged: Optional[bool] = False if adaptive else None
+
+    target = target_relative_half_width if target_relative_half_width is not None else 0.0
+
+    # closing() cancels in-flight pool work as soon as we stop early.
+    with closing(_iter_replications(config, seeds, validation_report, workers)) as outcomes:
+        for results, duration in outcomes:
+            if sample_run is None:
+                sample_run = results
+            aggregator.push(results)
+            durations.append(duration)
+            if (
+                adaptive
+                and aggregator.n_runs >= MIN_ADAPTIVE_REPLICATIONS
+                and all(aggregator.relative_half_width(path) <= target for path in metric_paths)
+            ):
+                converged = True
+                break
 
-    for i in range(n_replications):
-        seed = (base_seed + i) if base_seed is not None else None
-        metrics, duration = run_simulation(config, seed=seed)
-        results = calculate_all_blocks(
-            config=config,
-            metrics=metrics,
-            validation_report=validation_report,
-            duration_seconds=duration,
-            defaults_applied=[],  # caller can attach to sample_run separately
-        )
-        runs.append(results)
-        durations.append(duration)
-
-    aggregated_stats = aggregate_runs(runs)
     end = datetime.now(tz=timezone.utc)
 
     return {
-        "n_replications": n_replications,
+        "n_replications": aggregator.n_runs,
         "base_seed": base_seed,
         "total_duration_seconds": (end - start).total_seconds(),
         "per_run_duration_seconds": durations,
+        "workers": workers,
         "validation_report": validation_report,
-        "sample_run": runs[0] if runs else None,
-        "aggregated_stats": aggregated_stats,
+        "sample_run": sample_run,
+        "aggregated_stats": aggregator.result(),
+        "converged": converged,
+        "achieved_relative_half_width": {path: aggregator.relative_half_width(path) for path in metric_paths},
     }
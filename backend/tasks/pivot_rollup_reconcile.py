@@ -0,0 +1,77 @@
+"""
+Nightly PIVOT_DAILY_ROLLUP reconcile.
+
+The commit hooks in backend/pivot/rollup.py keep the rollup current for ORM
+writes; this rebuilds the trailing window for every client so whatever they
+could not see (Core bulk writes, dropped dimension rollups, a failed refresh)
+is back in the store by morning.
+
+Pattern matches `backend/tasks/dual_view_calculation.py` (APScheduler + cron trigger).
+"""
+
+from __future__ import annotations
+
+import logging
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.cron import CronTrigger
+from sqlalchemy.orm import Session
+
+from backend.config import settings
+from backend.database import SessionLocal
+from backend.pivot.rollup import reconcile_rollups
+
+logger = logging.getLogger(__name__)
+
+
+def run_nightly_pivot_rollup_reconcile() -> int:
+    """Rebuild the default reconcile window for every dataset and client.
+    Returns rollup rows written."""
+
+    db: Session = SessionLocal()
+    try:
+        written = reconcile_rollups(db)
+    except Exception:
+        db.rollback()
+        logger.exception("Nightly pivot rollup reconcile failed")
+        raise
+    finally:
+        db.close()
+
+    logger.info("Nightly pivot rollup reconcile complete: %d rows", written)
+    return written
+
+
+class PivotRollupReconcileScheduler:
+    """APScheduler wrapper. Mirrors backend/tasks/dual_view_calculation.DualViewCalculationScheduler."""
+
+    def __init__(self) -> None:
+        self.scheduler = BackgroundScheduler()
+        self.cron_hour = settings.PIVOT_ROLLUP_CRON_HOUR
+        self.enabled = settings.PIVOT_ROLLUP_ENABLED
+
+    def start(self) -> None:
+        if not self.enabled:
+            logger.info("Pivot rollup reconcile scheduler disabled by config")
+            return
+        self.scheduler.add_job(
+            func=run_nightly_pivot_rollup_reconcile,
+            trigger=CronTrigger(hour=self.cron_hour, minute=0),
+            id="nightly_pivot_rollup_reconcile",
+            name="Nightly Pivot Rollup Reconcile",
+            replace_existing=True,
+        )
+        self.scheduler.start()
+        logger.info("Pivot rollup reconcile scheduler started (cron: %02d:00 UTC)", self.cron_hour)
+
+    def stop(self) -> None:
+        try:
+            if self.scheduler.running:
+                self.scheduler.shutdown(wait=False)
+                logger.info("Pivot rollup reconcile scheduler stopped")
+        except Exception as exc:
+            logger.warning("Pivot rollup reconcile scheduler stop failed: %s", exc)
+
+
+# Module-level singleton, mirroring dual_view_calculation.scheduler.
+scheduler = PivotRollupReconcileScheduler()
@@ -139,6 +139,18 @@ def demo_mode_enabled():
     settings.DEMO_MODE = original
 
 
+@pytest.fixture(autouse=True)
+def reset_kpi_cache():
+    """Start every test with an empty KPICache. Entries are keyed by client and
+    window, not by database, so they would otherwise leak between tests'
+    databases."""
+    from backend.cache.kpi_cache import reset_cache
+
+    reset_cache()
+    yield
+    reset_cache()
+
+
 # Clear token revocations between tests to prevent cross-test contamination.
 # The blacklist is DB-backed (TOKEN_BLACKLIST, Run 7 T1.4) and the module-
 # scoped test engine persists across tests, so wipe the table around each.
@@ -162,6 +174,17 @@ def clear_token_blacklist():
     _wipe()
 
 
+@pytest.fixture(autouse=True)
+def clear_revocation_index():
+    """Clear the in-process revocation index that fronts TOKEN_BLACKLIST
+    (backend/auth/principal_cache.py) before/after each test."""
+    from backend.auth.principal_cache import revocation_index
+
+    revocation_index.clear()
+    yield
+    revocation_index.clear()
+
+
 # ---------------------------------------------------------------------------
 # C5: Alembic-built template DB. `alembic upgrade head` runs ONCE per session
 # into a file-based template; every fixture engine is a byte-identical clone
@@ -129,14 +129,15 @@ class TestModelMetadata:
         ATTENDANCE_HOUR_ALLOCATION, bringing the total to 58;
         0005_audit_trail.py adds AUDIT_ENTRY, bringing the total to 59;
         0006_hold_status_history.py adds HOLD_STATUS_TRANSITION, bringing
-        the total to 60).
+        the total to 60; 0007_pivot_daily_rollup.py adds PIVOT_DAILY_ROLLUP,
+        bringing the total to 61).
         """
         from backend.database import Base
 
         import backend.orm  # noqa: F401
         import backend.orm.capacity  # noqa: F401
 
-        assert len(Base.metadata.tables) == 60, f"Expected == 60 tables, got {len(Base.metadata.tables)}"
+        assert len(Base.metadata.tables) == 61, f"Expected == 61 tables, got {len(Base.metadata.tables)}"
 
 
 # ---------------------------------------------------------------------------
@@ -245,8 +246,8 @@ class TestAlembicCLI:
         result = _run_alembic("heads")
         assert result.returncode == 0, f"alembic heads failed: {result.stderr}"
         assert (
-            "0006_hold_status_history" in result.stdout
-        ), f"0006_hold_status_history not in heads output: {result.stdout}"
+            "0007_pivot_daily_rollup" in result.stdout
+        ), f"0007_pivot_daily_rollup not in heads output: {result.stdout}"
 
     def test_alembic_history(self):
         """``alembic history`` should contain the baseline entry."""
@@ -283,5 +284,5 @@ class TestAlembicCLI:
         result = _run_alembic("current", db_url=url)
         assert result.returncode == 0, f"alembic current failed: {result.stderr}"
         assert (
-            "0006_hold_status_history" in result.stdout
-        ), f"Expected 0006_hold_status_history in current output: {result.stdout}"
+            "0007_pivot_daily_rollup" in result.stdout
+        ), f"Expected 0007_pivot_daily_rollup in current output: {result.stdout}"
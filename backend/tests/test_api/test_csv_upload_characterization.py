@@ -1,7 +1,8 @@
 """Golden-master characterization of the CSV upload endpoints (pre/post C2 refactor).
 
-Hits the REAL endpoints via TestClient. CRUD create_* is monkeypatched to a stub so
-happy-path rows need no FK seeding — the real endpoint + mapper + processor still run.
+Hits the REAL endpoints via TestClient. CRUD create_* (or build_* for the bulk-path
+endpoints) is monkeypatched to a stub so happy-path rows need no FK seeding — the real
+endpoint + mapper + processor still run.
 """
 
 import io
@@ -23,6 +24,15 @@ class _Created:
         self.__dict__.update(kw)
 
 
+def _stub_bulk_session(monkeypatch):
+    """Bulk-path endpoints (downtime, attendance) add_all + commit built ORM objects;
+    make those no-ops so the _Created stubs never reach the real session."""
+    from sqlalchemy.orm import Session
+
+    monkeypatch.setattr(Session, "add_all", lambda self, objs: None)
+    monkeypatch.setattr(Session, "commit", lambda self: None)
+
+
 # ==================== HOLDS ====================
 
 
@@ -75,11 +85,12 @@ def test_holds_requires_elevated_role(test_client, auth_headers):
 def test_attendance_happy_path(test_client, admin_auth_headers, monkeypatch):
     captured = {}
 
-    def stub(db, entry, user):
+    def stub(entry, user):
         captured["entry"] = entry
         return _Created(attendance_entry_id="A-1")
 
-    monkeypatch.setattr("backend.endpoints.csv_upload.create_attendance_record", stub)
+    monkeypatch.setattr("backend.endpoints.csv_upload.build_attendance_entry", stub)
+    _stub_bulk_session(monkeypatch)
     # Required: client_id, employee_id, shift_date, scheduled_hours
     content = _csv_bytes(
         "client_id,employee_id,shift_date,scheduled_hours",
@@ -97,8 +108,8 @@ def test_attendance_happy_path(test_client, admin_auth_headers, monkeypatch):
 
 def test_attendance_invalid_row_recorded(test_client, admin_auth_headers, monkeypatch):
     monkeypatch.setattr(
-        "backend.endpoints.csv_upload.create_attendance_record",
-        lambda db, e, u: _Created(attendance_entry_id="X"),
+        "backend.endpoints.csv_upload.build_attendance_entry",
+        lambda e, u: _Created(attendance_entry_id="X"),
     )
     # Missing required client_id → ValueError("client_id is required") → Data parsing error
     content = _csv_bytes(
@@ -132,11 +143,12 @@ def test_attendance_csv_ot_split_and_override_persisted(test_client, admin_auth_
     fields through AND normalizes the omitted tier to 0, mirroring the crud layer."""
     captured = {}
 
-    def stub(db, entry, user):
+    def stub(entry, user):
         captured["entry"] = entry
         return _Created(attendance_entry_id="A-2")
 
-    monkeypatch.setattr("backend.endpoints.csv_upload.create_attendance_record", stub)
+    monkeypatch.setattr("backend.endpoints.csv_upload.build_attendance_entry", stub)
+    _stub_bulk_session(monkeypatch)
     content = _csv_bytes(
         "client_id,employee_id,shift_date,scheduled_hours,actual_hours,"
         "normal_hours,double_hours,labor_class_override",
@@ -159,8 +171,8 @@ def test_attendance_csv_ot_split_bad_sum_recorded(test_client, admin_auth_header
     """Split tiers that don't sum to actual_hours -> mapper's validate_ot_split raises
     ValueError -> reported as this row's error, not a request-aborting exception."""
     monkeypatch.setattr(
-        "backend.endpoints.csv_upload.create_attendance_record",
-        lambda db, e, u: _Created(attendance_entry_id="X"),
+        "backend.endpoints.csv_upload.build_attendance_entry",
+        lambda e, u: _Created(attendance_entry_id="X"),
     )
     content = _csv_bytes(
         "client_id,employee_id,shift_date,scheduled_hours,actual_hours," "normal_hours,double_hours,triple_hours",
@@ -182,8 +194,8 @@ def test_attendance_csv_normal_hours_3dp_rejected(test_client, admin_auth_header
     ValidationError, not the mapper's own ValueError) -> still surfaces as this row's
     error via the CSV per-row idiom, not a request-aborting exception."""
     monkeypatch.setattr(
-        "backend.endpoints.csv_upload.create_attendance_record",
-        lambda db, e, u: _Created(attendance_entry_id="X"),
+        "backend.endpoints.csv_upload.build_attendance_entry",
+        lambda e, u: _Created(attendance_entry_id="X"),
     )
     content = _csv_bytes(
         "client_id,employee_id,shift_date,scheduled_hours,actual_hours,normal_hours",
@@ -203,11 +215,12 @@ def test_attendance_csv_split_columns_absent_unsplit(test_client, admin_auth_hea
     """No split/override columns at all -> unsplit entry (back-compat)."""
     captured = {}
 
-    def stub(db, entry, user):
+    def stub(entry, user):
         captured["entry"] = entry
         return _Created(attendance_entry_id="A-3")
 
-    monkeypatch.setattr("backend.endpoints.csv_upload.create_attendance_record", stub)
+    monkeypatch.setattr("backend.endpoints.csv_upload.build_attendance_entry", stub)
+    _stub_bulk_session(monkeypatch)
     content = _csv_bytes(
         "client_id,employee_id,shift_date,scheduled_hours",
         "CLIENT-A,1,2024-01-15,8",
@@ -619,11 +632,12 @@ def test_floating_pool_requires_elevated_role(test_client, auth_headers):
 def test_downtime_happy_path(test_client, admin_auth_headers, monkeypatch):
     captured = {}
 
-    def stub(db, entry, user):
+    def stub(entry, user):
         captured["entry"] = entry
         return _Created(downtime_entry_id="DT-1")
 
-    monkeypatch.setattr("backend.endpoints.csv_upload.create_downtime_event", stub)
+    monkeypatch.setattr("backend.endpoints.csv_upload.build_downtime_event", stub)
+    _stub_bulk_session(monkeypatch)
     # Required: client_id, shift_date (YYYY-MM-DD), duration_hours (→ minutes via from_legacy_csv)
     content = _csv_bytes(
         "client_id,shift_date,duration_hours",
@@ -641,8 +655,8 @@ def test_downtime_happy_path(test_client, admin_auth_headers, monkeypatch):
 
 def test_downtime_invalid_row_recorded(test_client, admin_auth_headers, monkeypatch):
     monkeypatch.setattr(
-        "backend.endpoints.csv_upload.create_downtime_event",
-        lambda db, e, u: _Created(downtime_entry_id="X"),
+        "backend.endpoints.csv_upload.build_downtime_event",
+        lambda e, u: _Created(downtime_entry_id="X"),
     )
     # Missing required client_id → ValueError("client_id is required") → Data parsing error
     content = _csv_bytes(
@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session as SASession
 
@@ -141,6 +142,29 @@ def test_unsuppressed_bulk_write_is_still_captured(transactional_db):
     assert len(rows) == 3
 
 
+def test_flush_writes_its_audit_rows_in_one_statement(transactional_db):
+    """N audited rows in one flush cost one AUDIT_ENTRY executemany, not N INSERTs."""
+    register_audit_listener()
+    audit_inserts = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT") and "AUDIT_ENTRY" in statement:
+            audit_inserts.append(len(parameters) if executemany else 1)
+
+    bind = transactional_db.connection()
+    event.listen(bind, "before_cursor_execute", _count)
+    try:
+        for i in range(5):
+            transactional_db.add(KPIThreshold(threshold_id=f"AUD-X{i}", kpi_key="oee", target_value=float(i)))
+        transactional_db.flush()
+    finally:
+        event.remove(bind, "before_cursor_execute", _count)
+
+    assert audit_inserts == [5]
+    rows = [e for e in _entries(transactional_db) if e.record_pk.startswith("AUD-X")]
+    assert [r.record_pk for r in rows] == [f"AUD-X{i}" for i in range(5)]
+
+
 def test_bulk_create_replace_existing_deactivates_and_audits(transactional_db):
     """bulk_create_defect_types(replace_existing=True) deactivation was
     changed from a query-level `.update()` to an ORM loop specifically so
@@ -21,5 +21,6 @@ def test_run_best_effort_runs_fn():
 def test_start_schedulers_noop_when_none(monkeypatch):
     monkeypatch.setattr(lifecycle, "report_scheduler", None)
     monkeypatch.setattr(lifecycle, "dual_view_scheduler", None)
+    monkeypatch.setattr(lifecycle, "pivot_rollup_scheduler", None)
     lifecycle.start_schedulers()  # must not raise
     lifecycle.stop_schedulers()
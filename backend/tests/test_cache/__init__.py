@@ -0,0 +1 @@
+# Tests for the in-memory KPI cache (eviction, accounting, statistics)
@@ -0,0 +1,318 @@
+"""KPICache: LRU bounds, byte accounting, statistics, single-flight, tag invalidation."""
+
+import threading
+import time
+from datetime import date
+
+from backend.cache.kpi_cache import CacheTag, KPICache, estimate_size, key_prefix
+
+
+def test_lru_evicts_least_recently_used_at_capacity():
+    cache = KPICache(max_entries=2)
+    cache.set("a:1", 1)
+    cache.set("a:2", 2)
+    cache.get("a:1")  # a:1 is now the most recently used
+    cache.set("a:3", 3)
+
+    assert cache.get("a:2") is None
+    assert cache.get("a:1") == 1
+    assert cache.get("a:3") == 3
+    assert cache.get_stats()["entries"] == 2
+
+
+def test_size_never_exceeds_max_entries():
+    cache = KPICache(max_entries=10)
+    for i in range(1000):
+        cache.set(f"k:{i}", i)
+    stats = cache.get_stats()
+    assert stats["entries"] == 10
+    assert stats["evictions"] == 990
+    assert cache.get("k:999") == 999
+
+
+def test_overwrite_does_not_double_count():
+    cache = KPICache(max_entries=5, max_bytes=10_000)
+    cache.set("k:1", "x" * 100)
+    cache.set("k:1", "y" * 100)
+    stats = cache.get_stats()
+    assert stats["entries"] == 1
+    assert stats["bytes"] == estimate_size("y" * 100)
+    assert stats["prefixes"]["k"]["entries"] == 1
+
+
+def test_byte_budget_evicts_lru_entries():
+    value = "x" * 1000
+    budget = estimate_size(value) * 3
+    cache = KPICache(max_entries=100, max_bytes=budget)
+    for i in range(5):
+        cache.set(f"blob:{i}", value)
+
+    stats = cache.get_stats()
+    assert stats["entries"] == 3
+    assert stats["bytes"] <= budget
+    assert cache.get("blob:0") is None
+    assert cache.get("blob:4") == value
+
+
+def test_value_larger_than_budget_is_not_cached():
+    cache = KPICache(max_bytes=100)
+    cache.set("big:1", "x" * 1000)
+    assert cache.get("big:1") is None
+    assert cache.get_stats()["bytes"] == 0
+
+
+def test_delete_clear_and_invalidate_release_bytes():
+    cache = KPICache(max_bytes=1_000_000)
+    cache.set("a:1", [1, 2, 3])
+    cache.set("a:2", {"k": "v"})
+    cache.set("b:1", "text")
+    cache.delete("a:1")
+    cache.invalidate_pattern("a:")
+    assert cache.get_stats()["bytes"] == estimate_size("text")
+    cache.clear()
+    assert cache.get_stats()["bytes"] == 0
+
+
+def test_estimate_size_counts_nested_content():
+    assert estimate_size({"rows": ["x" * 500]}) > estimate_size({"rows": []}) + 500
+
+
+def test_per_prefix_statistics():
+    cache = KPICache()
+    cache.set("dashboard:c1", 1)
+    cache.set("client_config:c1", 2)
+    cache.get("dashboard:c1")
+    cache.get("dashboard:c2")
+    cache.invalidate_pattern("client_config:")
+
+    prefixes = cache.get_stats()["prefixes"]
+    assert prefixes["dashboard"] == {"entries": 1, "hits": 1, "misses": 1, "sets": 1, "evictions": 0}
+    assert prefixes["client_config"] == {"entries": 0, "hits": 0, "misses": 0, "sets": 1, "evictions": 1}
+
+
+def test_expired_entry_counts_as_expiration():
+    cache = KPICache(ttl_seconds=-1)
+    cache.set("a:1", 1, ttl_seconds=None)
+    assert cache.get("a:1") is None
+    stats = cache.get_stats()
+    assert stats["expirations"] == 1
+    assert stats["entries"] == 0
+
+
+def test_key_prefix():
+    assert key_prefix("daily_summary:CLIENT_A:2024-01-01") == "daily_summary"
+    assert key_prefix("plain") == "plain"
+
+
+# ---------------------------------------------------------------------------
+# get_or_set: single-flight, stale-while-revalidate, jitter, falsy values
+# ---------------------------------------------------------------------------
+
+
+def test_get_or_set_caches_none_and_falsy_results():
+    cache = KPICache()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return None
+
+    assert cache.get_or_set("empty:1", factory) is None
+    assert cache.get_or_set("empty:1", factory) is None
+    assert cache.get_or_set("zero:1", lambda: 0) == 0
+    assert cache.get_or_set("zero:1", lambda: 99) == 0
+    assert len(calls) == 1
+
+
+def test_concurrent_misses_compute_once():
+    cache = KPICache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_factory():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"total": 42}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_set("dash:c1", slow_factory))) for _ in range(8)
+    ]
+    threads[0].start()
+    started.wait(5)
+    for t in threads[1:]:
+        t.start()
+    # Let the followers reach the wait before the leader finishes.
+    deadline = time.monotonic() + 5
+    while cache.get_stats()["coalesced"] < 7 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert len(calls) == 1
+    assert results == [{"total": 42}] * 8
+    assert cache.get_stats()["coalesced"] == 7
+
+
+def test_factory_error_propagates_to_waiters_and_is_not_cached():
+    cache = KPICache()
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("db down")
+
+    errors = []
+
+    def call():
+        try:
+            cache.get_or_set("dash:c1", failing)
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=call)
+    follower.start()
+    deadline = time.monotonic() + 5
+    while cache.get_stats()["coalesced"] < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert errors == ["db down", "db down"]
+    assert cache.get_or_set("dash:c1", lambda: "recovered") == "recovered"
+
+
+def test_waiter_loads_directly_when_the_leader_hangs():
+    cache = KPICache(flight_wait_seconds=0.05)
+    started = threading.Event()
+    release = threading.Event()
+
+    def hung():
+        started.set()
+        release.wait(5)
+        return "late"
+
+    leader = threading.Thread(target=lambda: cache.get_or_set("dash:c1", hung))
+    leader.start()
+    started.wait(5)
+
+    assert cache.get_or_set("dash:c1", lambda: "direct") == "direct"
+    assert cache.get_stats()["flight_timeouts"] == 1
+    release.set()
+    leader.join(5)
+    assert cache.get("dash:c1") == "late"
+
+
+def test_factory_reentering_its_own_key_does_not_deadlock():
+    cache = KPICache()
+
+    def factory():
+        return cache.get_or_set("dash:c1", lambda: "inner") + "+outer"
+
+    assert cache.get_or_set("dash:c1", factory) == "inner+outer"
+    assert cache.get("dash:c1") == "inner+outer"
+    assert cache.get_stats()["coalesced"] == 0
+
+
+def test_stale_value_served_while_one_caller_refreshes():
+    cache = KPICache(ttl_seconds=-1, stale_seconds=60)  # every set is born expired but in its stale window
+    cache.set("dash:c1", "old")
+    started = threading.Event()
+    release = threading.Event()
+
+    def refresh():
+        started.set()
+        release.wait(5)
+        return "new"
+
+    refreshed = []
+    leader = threading.Thread(target=lambda: refreshed.append(cache.get_or_set("dash:c1", refresh)))
+    leader.start()
+    started.wait(5)
+
+    # While the leader is refreshing, other callers get the stale value immediately.
+    assert cache.get_or_set("dash:c1", lambda: "should not run") == "old"
+    assert cache.get("dash:c1") is None  # plain get() never returns stale data
+
+    release.set()
+    leader.join(5)
+    assert refreshed == ["new"]
+    assert cache.get_stats()["stale_hits"] >= 2
+
+
+def test_entry_past_stale_window_is_a_miss():
+    cache = KPICache(ttl_seconds=-1, stale_seconds=0)
+    cache.set("dash:c1", "old")
+    assert cache.get_or_set("dash:c1", lambda: "new", ttl_seconds=300) == "new"
+
+
+def test_ttl_jitter_spreads_expiry():
+    cache = KPICache(ttl_seconds=1000, ttl_jitter=0.2)
+    for i in range(50):
+        cache.set(f"k:{i}", i)
+    lifetimes = {(e.expiry - e.created_at).total_seconds() for e in cache._cache.values()}
+    assert len(lifetimes) > 1
+    assert all(800 <= life <= 1200 for life in lifetimes)
+
+
+# ---------------------------------------------------------------------------
+# Tag-based invalidation
+# ---------------------------------------------------------------------------
+
+
+def test_cache_tag_covers_client_and_date_range():
+    tag = CacheTag("production", "C1", date(2024, 1, 1), date(2024, 1, 31))
+    assert tag.covers("C1", date(2024, 1, 15))
+    assert not tag.covers("C2", date(2024, 1, 15))
+    assert not tag.covers("C1", date(2024, 2, 1))
+    assert tag.covers(None, date(2024, 1, 1))  # unknown client matches
+    assert tag.covers("C1", None)  # unknown day matches
+    assert CacheTag("production").covers("C9", date(1999, 1, 1))  # all clients, all dates
+
+
+def test_invalidate_tags_evicts_only_affected_entries():
+    cache = KPICache()
+    jan, feb = date(2024, 1, 10), date(2024, 2, 10)
+    cache.set("daily_summary:C1:jan", 1, tags=[CacheTag("production", "C1", jan, jan)])
+    cache.set("daily_summary:C1:feb", 2, tags=[CacheTag("production", "C1", feb, feb)])
+    cache.set("daily_summary:C2:jan", 3, tags=[CacheTag("production", "C2", jan, jan)])
+    cache.set("daily_summary:all:jan", 4, tags=[CacheTag("production", None, jan, jan)])
+    cache.set("client_config:C1", 5, tags=[CacheTag("client_config", "C1")])
+
+    assert cache.invalidate_tags("production", "C1", jan) == 2
+
+    assert cache.get("daily_summary:C1:jan") is None
+    assert cache.get("daily_summary:all:jan") is None
+    assert cache.get("daily_summary:C1:feb") == 2
+    assert cache.get("daily_summary:C2:jan") == 3
+    assert cache.get("client_config:C1") == 5
+
+
+def test_invalidation_during_get_or_set_is_not_cached():
+    cache = KPICache()
+    tag = CacheTag("production", "C1")
+
+    def factory():
+        # A commit lands while the value is being computed.
+        cache.invalidate_tags("production", "C1")
+        return "computed-from-old-data"
+
+    assert cache.get_or_set("dash:C1", factory, tags=[tag]) == "computed-from-old-data"
+    assert cache.get_or_set("dash:C1", lambda: "fresh", tags=[tag]) == "fresh"
+
+
+def test_evicted_entries_leave_the_tag_index():
+    cache = KPICache(max_entries=1)
+    cache.set("a:1", 1, tags=[CacheTag("production", "C1")])
+    cache.set("a:2", 2, tags=[CacheTag("production", "C1")])  # evicts a:1
+    assert cache._tag_index["production"] == {"a:2"}
+    assert cache.invalidate_tags("production", "C1") == 1
@@ -993,3 +993,135 @@ class TestCalculateTrueOTDEdgeCases:
         result = calculate_true_otd(db, client.client_id, (today - timedelta(days=30)).date(), today.date())
 
         assert result["inference"]["is_estimated"] is True or result["true_otd"]["total"] >= 0
+
+
+class TestSingleScanOTD:
+    """calculate_true_otd / _trend / _by_product read one column-only
+    WORK_ORDER scan; undelivered orders are pruned in SQL by
+    planned_date_floor() and judged by is_late."""
+
+    END = date(2026, 3, 31)
+
+    @staticmethod
+    def _order(db, client_id, work_order_id, **fields):
+        from backend.orm.work_order import WorkOrder
+
+        fields.setdefault("status", WorkOrderStatus.COMPLETED)
+        fields.setdefault("style_model", "SCAN-STYLE")
+        order = WorkOrder(work_order_id=work_order_id, client_id=client_id, planned_quantity=16, **fields)
+        db.add(order)
+        return order
+
+    @staticmethod
+    def _work_order_statements(db):
+        from sqlalchemy import event
+
+        statements = []
+        event.listen(
+            db.bind,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: (
+                statements.append(statement) if 'FROM "WORK_ORDER"' in statement else None
+            ),
+        )
+        return statements
+
+    @pytest.fixture
+    def seeded(self, otd_setup):
+        db = otd_setup["db"]
+        client_id = otd_setup["client"].client_id
+        day = datetime(2026, 3, 10)
+        # delivered: on time (early), late justified, in progress on time, no inferable date
+        self._order(db, client_id, "WO-SCAN-1", planned_ship_date=day, actual_delivery_date=day - timedelta(days=3))
+        self._order(
+            db,
+            client_id,
+            "WO-SCAN-2",
+            required_date=day,
+            actual_delivery_date=day + timedelta(days=1),
+            delay_classification="justified",
+            justified_delay_reason="customer_request",
+        )
+        self._order(
+            db,
+            client_id,
+            "WO-SCAN-3",
+            status=WorkOrderStatus.IN_PROGRESS,
+            planned_ship_date=day + timedelta(days=9),
+            actual_delivery_date=day + timedelta(days=9),
+        )
+        self._order(db, client_id, "WO-SCAN-4", style_model="NO-DATE", actual_delivery_date=day)
+        # undelivered: past due; calculated date (start + 16 * 1h / 8 = 2 days) lands after END
+        self._order(db, client_id, "WO-SCAN-5", status=WorkOrderStatus.IN_PROGRESS, planned_ship_date=day)
+        self._order(
+            db,
+            client_id,
+            "WO-SCAN-6",
+            status=WorkOrderStatus.IN_PROGRESS,
+            planned_start_date=datetime(2026, 3, 30),
+            ideal_cycle_time=Decimal("1"),
+        )
+        self._order(
+            db,
+            client_id,
+            "WO-SCAN-7",
+            status=WorkOrderStatus.IN_PROGRESS,
+            planned_start_date=datetime(2026, 3, 20),
+            ideal_cycle_time=Decimal("1"),
+        )
+        db.commit()
+        return db, client_id
+
+    def test_true_otd_is_one_statement_and_matches_is_late(self, seeded):
+        from backend.calculations.otd import calculate_true_otd, is_late
+        from backend.orm.work_order import WorkOrder
+
+        db, client_id = seeded
+        statements = self._work_order_statements(db)
+
+        result = calculate_true_otd(db, client_id, date(2026, 3, 1), self.END)
+
+        assert len(statements) == 1
+        assert {k: result["true_otd"][k] for k in ("on_time", "late", "early", "total", "skipped_no_date")} == {
+            "on_time": 1,
+            "late": 1,
+            "early": 1,
+            "total": 2,
+            "skipped_no_date": 1,
+        }
+        assert result["true_otd"]["net_percentage"] == Decimal("100.00")
+        assert (result["standard_otd"]["on_time"], result["standard_otd"]["total"]) == (2, 3)
+        every_order = db.query(WorkOrder).filter(WorkOrder.client_id == client_id).all()
+        expected_late = sorted(wo.work_order_id for wo in every_order if is_late(wo, self.END))
+        assert expected_late == ["WO-SCAN-2", "WO-SCAN-5", "WO-SCAN-7"]
+        assert result["late_counts"] == {"total": 3, "justified": 1, "unjustified": 0, "unclassified": 2}
+        assert result["justified_by_reason"] == {"customer_request": 1}
+
+    def test_trend_buckets_one_scan(self, seeded):
+        from backend.calculations.otd import calculate_otd_trend
+
+        db, client_id = seeded
+        statements = self._work_order_statements(db)
+
+        result = calculate_otd_trend(db, client_id, date(2026, 3, 2), date(2026, 3, 22), interval="weekly")
+
+        assert len(statements) == 1
+        assert [(p["period_start"], p["standard_otd_count"], p["true_otd_count"]) for p in result["trend"]] == [
+            ("2026-03-02", 1, 1),
+            ("2026-03-09", 1, 1),  # WO-SCAN-4 (no inferable date) delivered here too, but skipped
+            ("2026-03-16", 1, 0),
+        ]
+        assert [p["standard_otd_percentage"] for p in result["trend"]] == [Decimal("100.00"), Decimal("0.00")] + [
+            Decimal("100.00")
+        ]
+
+    def test_by_product_omits_styles_with_no_inferable_dates(self, seeded):
+        from backend.calculations.otd import calculate_otd_by_product
+
+        db, client_id = seeded
+
+        result = calculate_otd_by_product(db, client_id, date(2026, 3, 1), self.END)
+
+        assert [p["style_model"] for p in result["by_product"]] == ["SCAN-STYLE"]
+        assert result["by_product"][0]["standard_otd"]["total"] == 3
+        assert result["inference"]["skipped_no_date"] == 1
@@ -8,6 +8,7 @@ Coverage:
 - Linear trend extrapolation
 - Auto forecast selection
 - Forecast accuracy metrics
+- Smoothing parameter fitting and batched forecasts
 """
 
 import pytest
@@ -20,7 +21,12 @@ from backend.calculations.predictions import (
     linear_trend_extrapolation,
     auto_forecast,
     calculate_forecast_accuracy,
+    fit_holt_parameters,
+    fit_smoothing_alpha,
+    forecast,
+    forecast_many,
     ForecastResult,
+    SMOOTHING_GRID,
 )
 
 
@@ -463,6 +469,117 @@ class TestForecastIntegration:
         assert all(0 < float(p) < 100 for p in result.predictions)
 
 
+def _ses_sse(values, alpha):
+    level, sse = values[0], 0.0
+    for y in values[1:]:
+        sse += (y - level) ** 2
+        level = alpha * y + (1 - alpha) * level
+    return sse
+
+
+@pytest.mark.unit
+class TestParameterFitting:
+    """Test the one-step-ahead SSE grid search behind the default parameters"""
+
+    @pytest.mark.unit
+    def test_alpha_minimises_one_step_error(self):
+        """Fitted alpha has the lowest SSE on the grid"""
+        values = [85.0, 86.5, 84.2, 87.1, 88.0, 86.3, 85.9, 87.4]
+        alpha = fit_smoothing_alpha(values)
+
+        assert alpha in SMOOTHING_GRID
+        assert _ses_sse(values, alpha) == min(_ses_sse(values, a) for a in SMOOTHING_GRID)
+
+    @pytest.mark.unit
+    def test_alpha_tracks_level_shifts_and_damps_noise(self):
+        """A step change wants a fast alpha; alternating noise a slow one"""
+        assert fit_smoothing_alpha([10.0] * 5 + [20.0] * 5) == 1.0
+        assert fit_smoothing_alpha([80.0, 90.0] * 20) == 0.1
+
+    @pytest.mark.unit
+    def test_default_alpha_is_the_fitted_alpha(self):
+        """Omitting alpha equals passing the fitted one"""
+        values = [Decimal("85.0"), Decimal("86.5"), Decimal("84.2"), Decimal("87.1"), Decimal("88.0")]
+
+        fitted = simple_exponential_smoothing(values, Decimal(str(fit_smoothing_alpha(values))), 3)
+
+        assert simple_exponential_smoothing(values, forecast_periods=3) == fitted
+
+    @pytest.mark.unit
+    def test_float_and_decimal_inputs_agree(self):
+        """Routes pass floats, the ORM Decimals -- same forecast"""
+        floats = [85.0, 86.5, 84.2, 87.1, 88.0]
+
+        assert simple_exponential_smoothing(floats, 0.3, 5) == simple_exponential_smoothing(
+            [Decimal(str(v)) for v in floats], Decimal("0.3"), 5
+        )
+
+    @pytest.mark.unit
+    def test_holt_continues_an_exact_line(self):
+        """A perfect line is tracked exactly whatever the fitted pair"""
+        values = [10.0 + 2 * i for i in range(10)]
+
+        assert set(fit_holt_parameters(values)) <= set(SMOOTHING_GRID)
+        result = double_exponential_smoothing(values, forecast_periods=3)
+        assert result.predictions == [Decimal("30.0"), Decimal("32.0"), Decimal("34.0")]
+
+    @pytest.mark.unit
+    def test_explicit_beta_fits_only_alpha(self):
+        """A given beta is kept; alpha alone is searched"""
+        values = [100.0, 103.0, 101.0, 108.0, 107.0, 113.0, 112.0]
+        result = double_exponential_smoothing(values, beta=Decimal("0.5"), forecast_periods=2)
+
+        assert result.method == "double_exponential_smoothing"
+        with pytest.raises(ValueError):
+            double_exponential_smoothing(values, beta=Decimal("1.5"))
+
+    @pytest.mark.unit
+    def test_flat_series_forecasts_flat(self):
+        """A constant series (zero variance) no longer divides by zero"""
+        result = auto_forecast([50.0] * 10, 3)
+
+        assert result.predictions == [Decimal("50.0")] * 3
+        assert linear_trend_extrapolation([50.0] * 10, 2).accuracy_score == Decimal("100.0")
+
+
+@pytest.mark.unit
+class TestForecastMany:
+    """Test batched forecasting across KPIs/clients"""
+
+    @pytest.mark.unit
+    def test_matches_individual_forecasts(self):
+        """Each series gets exactly its single-series forecast"""
+        series = {
+            ("efficiency", "A"): [85.0 + i * 0.5 for i in range(30)],
+            ("quality", "A"): [95.0, 96.0, 94.5] * 10,
+            ("efficiency", "B"): [70.0, 72.0, 71.0, 74.0, 73.0],
+        }
+
+        results = forecast_many(series, 7)
+
+        assert set(results) == set(series)
+        for key, values in series.items():
+            assert results[key] == auto_forecast(values, 7)
+
+    @pytest.mark.unit
+    def test_short_series_are_left_out(self):
+        """Series below the minimum history are skipped, not raised"""
+        results = forecast_many({"ok": [1.0, 2.0, 3.0], "short": [1.0], "empty": []}, 2)
+
+        assert list(results) == ["ok"]
+
+    @pytest.mark.unit
+    def test_method_names(self):
+        """forecast() dispatches the API method names; unknown means auto"""
+        values = [85.0, 86.5, 84.2, 87.1, 88.0]
+
+        assert forecast(values, 2, "simple").method == "simple_exponential_smoothing"
+        assert forecast(values, 2, "double").method == "double_exponential_smoothing"
+        assert forecast(values, 2, "linear").method == "linear_trend_extrapolation"
+        assert forecast(values, 2, "bogus") == auto_forecast(values, 2)
+        assert forecast_many({"x": values}, 2, "linear")["x"].method == "linear_trend_extrapolation"
+
+
 @pytest.mark.unit
 class TestForecastResultDataclass:
     """Test the ForecastResult dataclass"""
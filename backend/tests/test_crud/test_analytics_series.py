@@ -0,0 +1,119 @@
+"""get_kpi_time_series_bundle: every KPI's daily series from one grouped query.
+
+Contracts: each series equals get_kpi_time_series_data for that KPI, the
+whole bundle costs one statement (then none while cached), and a production
+commit for the client evicts it.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from backend.crud.analytics import get_kpi_time_series_bundle, get_kpi_time_series_data
+from backend.tests.fixtures.factories import TestDataFactory
+
+START = date.today() - timedelta(days=10)
+END = date.today()
+KPIS = ["efficiency", "performance", "quality", "oee", "otd"]
+
+
+@pytest.fixture
+def seeded(transactional_db):
+    db = transactional_db
+    admin = TestDataFactory.create_user(db, role="admin")
+    TestDataFactory.create_client(db, client_id="SER-A")
+    product = TestDataFactory.create_product(db, client_id="SER-A")
+    shift = TestDataFactory.create_shift(db, client_id="SER-A")
+    work_order = TestDataFactory.create_work_order(db, client_id="SER-A")
+    for offset, efficiency, performance in ((1, "80.5", "90.0"), (1, "70.5", None), (3, None, None), (5, "88", "77")):
+        entry = TestDataFactory.create_production_entry(
+            db,
+            "SER-A",
+            product.product_id,
+            shift.shift_id,
+            admin.user_id,
+            production_date=END - timedelta(days=offset),
+            defect_count=offset * 10,
+            work_order_id=work_order.work_order_id,
+        )
+        entry.efficiency_percentage = Decimal(efficiency) if efficiency else None
+        entry.performance_percentage = Decimal(performance) if performance else None
+    db.commit()
+    return db, admin, product, shift, work_order
+
+
+def _series_queries(db):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if 'FROM "PRODUCTION_ENTRY"' in statement:
+            statements.append(statement)
+
+    event.listen(db.bind, "before_cursor_execute", record)
+    return statements
+
+
+def test_each_series_matches_the_single_kpi_query(seeded):
+    db, admin, *_ = seeded
+
+    bundle = get_kpi_time_series_bundle(db, "SER-A", KPIS, START, END, admin)
+
+    for kpi in ("efficiency", "performance", "quality"):
+        assert bundle[kpi] == get_kpi_time_series_data(db, "SER-A", kpi, START, END, admin)
+    assert len(bundle["efficiency"]) == 2
+    assert len(bundle["quality"]) == 3
+    # KPIs without a per-entry column come back empty instead of raising
+    assert bundle["oee"] == [] and bundle["otd"] == []
+
+
+def test_one_statement_then_served_from_cache(seeded):
+    db, admin, *_ = seeded
+    statements = _series_queries(db)
+
+    first = get_kpi_time_series_bundle(db, "SER-A", KPIS, START, END, admin)
+    assert len(statements) == 1
+
+    assert get_kpi_time_series_bundle(db, "SER-A", ["efficiency"], START, END, admin) == {
+        "efficiency": first["efficiency"]
+    }
+    assert len(statements) == 1
+
+
+def test_production_commit_evicts_the_bundle(seeded):
+    from backend.events.session_hooks import setup_session_hooks
+
+    db, admin, product, shift, work_order = seeded
+    setup_session_hooks(db)
+    before = get_kpi_time_series_bundle(db, "SER-A", ["quality"], START, END, admin)["quality"]
+
+    TestDataFactory.create_production_entry(
+        db,
+        "SER-A",
+        product.product_id,
+        shift.shift_id,
+        admin.user_id,
+        production_date=END - timedelta(days=7),
+        work_order_id=work_order.work_order_id,
+    )
+    db.commit()
+
+    after = get_kpi_time_series_bundle(db, "SER-A", ["quality"], START, END, admin)["quality"]
+    assert len(after) == len(before) + 1
+
+
+def test_predictions_dashboard_reads_every_kpi_in_one_query(seeded):
+    from backend.generators.sample_data_phase5 import KPITypePhase5
+    from backend.routes.predictions import get_historical_kpi_bundle, get_historical_kpi_data
+
+    db, admin, *_ = seeded
+    kpi_types = [kpi.value for kpi in KPITypePhase5]
+    statements = _series_queries(db)
+
+    histories = get_historical_kpi_bundle(db, "SER-A", kpi_types, START, END, admin)
+
+    assert len(statements) == 1
+    assert set(histories) == set(kpi_types)
+    assert histories["efficiency"] == get_historical_kpi_data(db, "SER-A", "efficiency", START, END, admin)
+    assert histories["efficiency"][0]["value"] == 88.0
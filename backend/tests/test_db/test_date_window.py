@@ -0,0 +1,110 @@
+"""date_window: the half-open day-range predicate shared by the pivot engine,
+pivot hooks, my-shift and trend routes.
+
+Two contracts: it selects exactly the rows `func.date(col)` between the days
+would, and -- unlike that form -- it lets SQLite (and MariaDB) range-seek the
+(client_id, shift_date) composite indexes instead of filtering every row of
+the client.
+"""
+
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import Column, Date, func, text
+from sqlalchemy.dialects import mysql, sqlite
+
+from backend.db.factories import TestDataFactory
+from backend.db.sql_functions import date_window
+from backend.orm.attendance_entry import AttendanceEntry
+from backend.orm.production_entry import ProductionEntry
+from backend.orm.quality_entry import QualityEntry
+
+
+def _plan(db, query):
+    compiled = query.statement.compile(db.bind, compile_kwargs={"literal_binds": True})
+    return " | ".join(str(row) for row in db.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).fetchall())
+
+
+@pytest.mark.parametrize("dialect", [sqlite.dialect(), mysql.dialect()])
+def test_compiles_to_a_half_open_range_on_the_raw_column(dialect):
+    sql = str(date_window(ProductionEntry.shift_date, date(2026, 3, 1), date(2026, 3, 31)).compile(dialect=dialect))
+    assert "shift_date >=" in sql
+    assert "shift_date <" in sql
+    assert "<=" not in sql
+    assert "date(" not in sql.lower()
+
+
+def test_bounds_are_midnights_and_end_defaults_to_start():
+    params = date_window(ProductionEntry.shift_date, date(2026, 3, 31)).compile().params
+    assert sorted(params.values()) == [datetime(2026, 3, 31), datetime(2026, 4, 1)]
+
+
+def test_selects_the_same_rows_as_func_date(db_session):
+    TestDataFactory.create_client(db_session, client_id="DW-A")
+    user = TestDataFactory.create_user(db_session, client_id="DW-A")
+    product = TestDataFactory.create_product(db_session, client_id="DW-A")
+    shift = TestDataFactory.create_shift(db_session, client_id="DW-A")
+    stamps = [
+        datetime(2026, 2, 28, 23, 59, 59, 999999),
+        datetime(2026, 3, 1),
+        datetime(2026, 3, 15, 14, 30),
+        datetime(2026, 3, 31, 23, 59, 59, 999999),
+        datetime(2026, 4, 1),
+    ]
+    for stamp in stamps:
+        entry = TestDataFactory.create_production_entry(
+            db_session, "DW-A", product.product_id, shift.shift_id, user.user_id
+        )
+        entry.shift_date = stamp
+    db_session.commit()
+
+    for start, end in ((date(2026, 3, 1), date(2026, 3, 31)), (date(2026, 3, 31), date(2026, 3, 31))):
+        windowed = db_session.query(ProductionEntry.shift_date).filter(
+            date_window(ProductionEntry.shift_date, start, end)
+        )
+        by_func = db_session.query(ProductionEntry.shift_date).filter(
+            func.date(ProductionEntry.shift_date) >= start, func.date(ProductionEntry.shift_date) <= end
+        )
+        assert sorted(r[0] for r in windowed) == sorted(r[0] for r in by_func)
+    assert (
+        db_session.query(ProductionEntry).filter(date_window(ProductionEntry.shift_date, date(2026, 3, 31))).count()
+        == 1
+    )
+
+
+@pytest.mark.parametrize(
+    "model, index",
+    [
+        (ProductionEntry, "ix_production_client_shift_date"),
+        (AttendanceEntry, "ix_attendance_client_shift_date"),
+        (QualityEntry, "ix_quality_client_shift_date"),
+    ],
+)
+def test_client_window_range_seeks_the_composite_index(db_session, model, index):
+    window = date_window(model.shift_date, date(2026, 3, 1), date(2026, 3, 31))
+    plan = _plan(db_session, db_session.query(model).filter(model.client_id == "DW-A", window))
+    assert index in plan
+    assert "shift_date>? AND shift_date<?" in plan
+
+    # the func.date() form it replaces can only seek the client_id prefix
+    legacy = _plan(
+        db_session,
+        db_session.query(model).filter(
+            model.client_id == "DW-A",
+            func.date(model.shift_date) >= date(2026, 3, 1),
+            func.date(model.shift_date) <= date(2026, 3, 31),
+        ),
+    )
+    assert "shift_date>?" not in legacy
+
+
+def test_unscoped_window_searches_instead_of_scanning(db_session):
+    window = date_window(ProductionEntry.shift_date, date(2026, 3, 1), date(2026, 3, 31))
+    plan = _plan(db_session, db_session.query(ProductionEntry.units_produced).filter(window))
+    assert "SEARCH" in plan
+    assert "SCAN" not in plan
+
+
+def test_date_columns_bind_dates():
+    params = date_window(Column("due", Date), date(2026, 3, 1), date(2026, 3, 2)).compile().params
+    assert sorted(params.values()) == [date(2026, 3, 1), date(2026, 3, 3)]
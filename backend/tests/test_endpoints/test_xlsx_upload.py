@@ -139,15 +139,7 @@ def _make_multi_sheet_xlsx_bytes(sheets):
 
 
 class TestDowntimeXlsxUpload:
-    """Tests for /api/downtime/upload/csv with XLSX files.
-
-    Note: The downtime CRUD function (create_downtime_event) has a
-    pre-existing bug (passes entered_by instead of reported_by to
-    DowntimeEntry). Therefore these tests verify that XLSX parsing works
-    correctly by checking total_rows (rows parsed from XLSX), while the
-    rows themselves fail at the CRUD layer — an issue unrelated to XLSX
-    support.
-    """
+    """Tests for /api/downtime/upload/csv with XLSX files (bulk-insert path)."""
 
     def test_xlsx_file_parsed_correctly(self, supervisor_client):
         """XLSX file is parsed and all rows are processed."""
@@ -177,8 +169,9 @@ class TestDowntimeXlsxUpload:
 
         assert response.status_code == 200, response.text
         body = response.json()
-        # Both rows were parsed from the XLSX file (total_rows proves parsing worked)
+        # Both rows were parsed from the XLSX file and inserted
         assert body["total_rows"] == 2
+        assert body["successful"] == 2, body["errors"]
 
     def test_xlsx_with_sheet_name(self, supervisor_client):
         """The sheet_name query parameter selects the correct sheet."""
@@ -0,0 +1,115 @@
+"""
+Event-driven KPICache invalidation: the bus handler and the commit hooks.
+"""
+
+import asyncio
+from datetime import date
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from backend.cache import CacheTag, get_cache
+from backend.cache.kpi_cache import reset_cache
+from backend.db.factories import TestDataFactory
+from backend.events.domain_events import ProductionEntryCreated, WorkOrderStatusChanged
+from backend.events.handlers.cache_handlers import CacheInvalidationHandler
+from backend.events.session_hooks import setup_session_hooks
+from backend.tests.conftest import clone_template_engine
+
+DAY = date(2024, 3, 5)
+OTHER_DAY = date(2024, 3, 6)
+
+
+@pytest.fixture
+def cache():
+    reset_cache()
+    yield get_cache()
+    reset_cache()
+
+
+def _seed(cache):
+    cache.set("daily_summary:C1:day", "c1-day", tags=[CacheTag("production", "C1", DAY, DAY)])
+    cache.set("daily_summary:C1:other", "c1-other", tags=[CacheTag("production", "C1", OTHER_DAY, OTHER_DAY)])
+    cache.set("daily_summary:C2:day", "c2-day", tags=[CacheTag("production", "C2", DAY, DAY)])
+    cache.set("dashboard:C1", "wo", tags=[CacheTag("work_order", "C1")])
+
+
+class TestCacheInvalidationHandler:
+    def test_production_event_evicts_matching_client_and_day(self, cache):
+        _seed(cache)
+        event = ProductionEntryCreated(
+            aggregate_id="PE-1", client_id="C1", product_id=1, shift_id=1, production_date=DAY, units_produced=10
+        )
+        asyncio.run(CacheInvalidationHandler().handle(event))
+
+        assert cache.get("daily_summary:C1:day") is None
+        assert cache.get("daily_summary:C1:other") == "c1-other"
+        assert cache.get("daily_summary:C2:day") == "c2-day"
+        assert cache.get("dashboard:C1") == "wo"
+
+    def test_event_without_date_evicts_every_date_for_the_entity(self, cache):
+        _seed(cache)
+        event = WorkOrderStatusChanged(aggregate_id="WO-1", client_id="C1", from_status="RECEIVED", to_status="ACTIVE")
+        asyncio.run(CacheInvalidationHandler().handle(event))
+
+        assert cache.get("dashboard:C1") is None
+        assert cache.get("daily_summary:C1:day") == "c1-day"
+
+
+class TestCommitHooks:
+    @pytest.fixture
+    def session_factory(self):
+        engine = clone_template_engine()
+        factory = sessionmaker(bind=engine)
+        setup_session_hooks(factory)
+        yield factory
+        engine.dispose()
+
+    def _production_entry(self, db, client_id):
+        TestDataFactory.create_client(db, client_id=client_id)
+        user = TestDataFactory.create_user(db, client_id=client_id)
+        product = TestDataFactory.create_product(db, client_id=client_id)
+        shift = TestDataFactory.create_shift(db, client_id=client_id)
+        return TestDataFactory.create_production_entry(
+            db, client_id, product.product_id, shift.shift_id, user.user_id, production_date=DAY
+        )
+
+    def test_commit_evicts_entries_for_written_rows(self, cache, session_factory):
+        db = session_factory()
+        try:
+            self._production_entry(db, "C1")
+            _seed(cache)
+            db.commit()
+        finally:
+            db.close()
+
+        assert cache.get("daily_summary:C1:day") is None
+        assert cache.get("daily_summary:C1:other") == "c1-other"
+        assert cache.get("daily_summary:C2:day") == "c2-day"
+
+    def test_moving_a_row_between_days_evicts_both(self, cache, session_factory):
+        db = session_factory()
+        try:
+            entry = self._production_entry(db, "C1")
+            db.commit()
+            _seed(cache)
+            entry.production_date = entry.production_date.replace(day=OTHER_DAY.day)
+            db.commit()
+        finally:
+            db.close()
+
+        assert cache.get("daily_summary:C1:day") is None
+        assert cache.get("daily_summary:C1:other") is None
+        assert cache.get("daily_summary:C2:day") == "c2-day"
+
+    def test_rollback_evicts_nothing(self, cache, session_factory):
+        db = session_factory()
+        try:
+            self._production_entry(db, "C1")
+            _seed(cache)
+            db.rollback()
+            db.commit()  # an empty later commit must not apply the rolled-back changes
+        finally:
+            db.close()
+
+        assert cache.get("daily_summary:C1:day") == "c1-day"
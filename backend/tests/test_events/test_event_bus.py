@@ -116,12 +116,12 @@ def reset_event_bus():
     """Reset EventBus singleton state so each test starts clean."""
     bus = EventBus()
     bus._handlers.clear()
-    bus._collected_events.clear()
+    bus.discard_collected()
     bus._persistence_handler = None
     yield bus
     # Cleanup after the test as well
     bus._handlers.clear()
-    bus._collected_events.clear()
+    bus.discard_collected()
     bus._persistence_handler = None
 
 
@@ -518,6 +518,69 @@ class TestEventBusCollectFlush:
         assert len(bus.get_collected_events()) == 1
 
 
+# ========================================================================
+# 5b. EventBus -- collection scoped to the session / request context
+# ========================================================================
+
+
+class TestEventBusCollectionScope:
+    """Events belong to the session (or context) that collected them: another
+    session's commit or rollback, or another thread, never touches them."""
+
+    def test_commit_flushes_only_the_committing_sessions_events(self, reset_event_bus):
+        from sqlalchemy.orm import Session
+
+        from backend.events.session_hooks import _discard_events, _flush_events
+
+        bus = reset_event_bus
+        handler = RecordingHandler()
+        bus.subscribe("test.event", handler)
+        first, second = Session(), Session()
+        mine, theirs = _make_event(aggregate_id="mine"), _make_event(aggregate_id="theirs")
+        bus.collect(mine, session=first)
+        bus.collect(theirs, session=second)
+
+        _flush_events(first)
+        assert handler.handled_events == [mine]
+        assert bus.get_collected_events(second) == [theirs]
+
+        _discard_events(first)  # a rollback elsewhere leaves `second` alone
+        _flush_events(second)
+        assert handler.handled_events == [mine, theirs]
+
+    def test_session_less_events_stay_in_their_thread(self, reset_event_bus):
+        import threading
+
+        bus = reset_event_bus
+        collected = threading.Event()
+        flushed_elsewhere = []
+
+        def other_thread():
+            collected.wait()
+            flushed_elsewhere.append(bus.flush_collected())
+
+        worker = threading.Thread(target=other_thread)
+        worker.start()
+        bus.collect(_make_event())
+        collected.set()
+        worker.join()
+
+        assert flushed_elsewhere == [0]
+        assert bus.flush_collected() == 1
+
+    def test_subscribe_does_not_mutate_a_list_being_dispatched(self, reset_event_bus):
+        bus = reset_event_bus
+        first = RecordingHandler()
+        bus.subscribe("test.event", first)
+        snapshot = bus._handlers["test.event"]
+
+        bus.subscribe("test.event", RecordingHandler(), priority=1)
+        bus.unsubscribe("test.event", first)
+
+        assert [reg.handler for reg in snapshot] == [first]
+        assert len(bus._handlers["test.event"]) == 1
+
+
 # ========================================================================
 # 6. EventBus -- error isolation
 # ========================================================================
@@ -0,0 +1,129 @@
+"""EventOutbox: committed events reach EVENT_STORE in multi-row batches from a
+background writer; a full queue writes inline instead of dropping, stop()
+drains what is left, and one bad row does not sink its batch.
+"""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.events.base import DomainEvent
+from backend.events.outbox import EventOutbox
+from backend.orm.event_store import EventStore
+from backend.tests.conftest import clone_template_engine
+
+
+@pytest.fixture
+def session_factory():
+    engine = clone_template_engine()
+    try:
+        yield sessionmaker(bind=engine)
+    finally:
+        engine.dispose()
+
+
+def _event(n: int = 0, **overrides) -> DomainEvent:
+    fields = {"aggregate_id": f"agg-{n}", "aggregate_type": "TestAggregate", "event_type": "test.event"}
+    fields.update(overrides)
+    return DomainEvent(**fields)
+
+
+def _stored(session_factory) -> int:
+    with session_factory() as session:
+        return int(session.scalar(select(func.count()).select_from(EventStore)))
+
+
+def test_flush_writes_in_batches(session_factory):
+    outbox = EventOutbox(session_factory, batch_size=2)
+    for n in range(5):
+        outbox.enqueue(_event(n))
+
+    assert outbox.get_stats()["queue_depth"] == 5
+    assert outbox.flush() == 5
+
+    assert _stored(session_factory) == 5
+    stats = outbox.get_stats()
+    assert (stats["batches"], stats["written"], stats["failed"], stats["queue_depth"]) == (3, 5, 0, 0)
+    assert stats["peak_depth"] == 5 and stats["max_flush_ms"] >= stats["avg_flush_ms"] > 0
+
+
+def test_background_writer_drains_on_the_interval(session_factory):
+    outbox = EventOutbox(session_factory, batch_size=100, flush_interval=0.05)
+    outbox.start()
+    try:
+        for n in range(3):
+            outbox.enqueue(_event(n))
+        deadline = time.monotonic() + 5
+        while _stored(session_factory) < 3 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert _stored(session_factory) == 3
+        assert outbox.get_stats()["running"] is True
+    finally:
+        outbox.stop()
+    assert outbox.get_stats()["running"] is False
+
+
+def test_full_queue_writes_inline(session_factory):
+    outbox = EventOutbox(session_factory, max_queue=1, enqueue_timeout=0.01)
+    outbox.enqueue(_event(1))
+    outbox.enqueue(_event(2))  # queue full, nobody draining -> written on this thread
+
+    assert _stored(session_factory) == 1
+    assert outbox.get_stats()["inline_writes"] == 1
+    assert outbox.stop() == 1
+    assert _stored(session_factory) == 2
+
+
+def test_events_after_stop_are_written_inline(session_factory):
+    outbox = EventOutbox(session_factory)
+    outbox.stop()
+
+    outbox.enqueue(_event())
+
+    assert _stored(session_factory) == 1
+
+
+def test_stop_waits_for_an_enqueue_already_under_way(session_factory):
+    outbox = EventOutbox(session_factory)
+    outbox.start()
+    in_put, release = threading.Event(), threading.Event()
+    real_put = outbox._queue.put
+
+    def slow_put(row, timeout=None):
+        in_put.set()
+        release.wait(5)
+        real_put(row, timeout=timeout)
+
+    outbox._queue.put = slow_put
+    producer = threading.Thread(target=outbox.enqueue, args=(_event(),))
+    producer.start()
+    assert in_put.wait(5)
+    stopper = threading.Thread(target=outbox.stop)
+    stopper.start()
+    time.sleep(0.05)
+    assert stopper.is_alive()  # held back until the put lands
+
+    release.set()
+    producer.join(5)
+    stopper.join(5)
+
+    assert _stored(session_factory) == 1
+    assert outbox.get_stats()["queue_depth"] == 0
+
+
+def test_bad_row_does_not_sink_its_batch(session_factory):
+    duplicate = _event(1)
+    outbox = EventOutbox(session_factory)
+    outbox.enqueue(duplicate)
+    outbox.flush()
+
+    for event in (_event(2), duplicate, _event(3)):
+        outbox.enqueue(event)
+    outbox.flush()
+
+    assert _stored(session_factory) == 3
+    stats = outbox.get_stats()
+    assert (stats["written"], stats["failed"]) == (3, 1)
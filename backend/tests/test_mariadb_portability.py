@@ -39,12 +39,13 @@ def test_register_all_models_populates_full_metadata():
     ATTENDANCE_HOUR_ALLOCATION, bringing the total to 58;
     0005_audit_trail.py adds AUDIT_ENTRY, bringing the total to 59;
     0006_hold_status_history.py adds HOLD_STATUS_TRANSITION, bringing the
-    total to 60).
+    total to 60; 0007_pivot_daily_rollup.py adds PIVOT_DAILY_ROLLUP, bringing
+    the total to 61).
     """
     from backend.orm import register_all_models
 
     register_all_models()
-    assert len(Base.metadata.tables) == 60
+    assert len(Base.metadata.tables) == 61
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,105 @@
+"""
+Response compression and the plain-ASGI middleware stack.
+
+CompressionMiddleware negotiates gzip (brotli when installed) for text-like
+bodies of at least minimum_size bytes, leaves pre-encoded and binary bodies
+alone and keeps streaming responses streamed. AuditLogMiddleware still sees
+the status and the user_id the auth dependency put on request.state.
+"""
+
+import gzip
+import logging
+import zlib
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.middleware.audit_log import AuditLogMiddleware
+from backend.middleware.compression import CompressionMiddleware, negotiate_encoding
+
+PAYLOAD = {"rows": [{"client_id": "ACME", "efficiency": 85.5, "n": n} for n in range(200)]}
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/big")
+    def big():
+        return PAYLOAD
+
+    @app.get("/small")
+    def small():
+        return {"status": "ok"}
+
+    @app.get("/png")
+    def png():
+        return Response(b"\x89PNG" + b"\x00" * 2000, media_type="image/png")
+
+    @app.get("/pre-encoded")
+    def pre_encoded():
+        body = gzip.compress(b"x" * 2000)
+        return Response(body, media_type="text/plain", headers={"Content-Encoding": "gzip"})
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse((f"row,{n}\n" for n in range(500)), media_type="text/csv")
+
+    return TestClient(app)
+
+
+def test_large_json_is_gzipped(client):
+    resp = client.get("/big", headers={"Accept-Encoding": "gzip"})
+
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in resp.headers["Vary"]
+    assert int(resp.headers["Content-Length"]) < len(resp.content) // 5
+    assert resp.json() == PAYLOAD  # decoded transparently by the client
+
+
+def test_small_and_unaccepted_bodies_are_not_compressed(client):
+    assert "Content-Encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+    assert "Content-Encoding" not in client.get("/big", headers={"Accept-Encoding": "identity"}).headers
+    assert "Content-Encoding" not in client.get("/big", headers={"Accept-Encoding": "gzip;q=0"}).headers
+
+
+def test_binary_and_pre_encoded_bodies_pass_through(client):
+    assert "Content-Encoding" not in client.get("/png", headers={"Accept-Encoding": "gzip"}).headers
+
+    resp = client.get("/pre-encoded", headers={"Accept-Encoding": "gzip"})
+    assert resp.content == b"x" * 2000  # encoded exactly once
+
+
+def test_streaming_response_is_compressed_incrementally(client):
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as resp:
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert "Content-Length" not in resp.headers
+        raw = b"".join(resp.iter_raw())
+
+    assert zlib.decompress(raw, 31).decode() == "".join(f"row,{n}\n" for n in range(500))
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("deflate") is None
+    assert negotiate_encoding("*") in ("br", "gzip")
+    assert negotiate_encoding("gzip;q=0, identity") is None
+    assert negotiate_encoding("") is None
+
+
+def test_audit_log_reads_status_and_user_from_request_state(caplog):
+    app = FastAPI()
+    app.add_middleware(AuditLogMiddleware)
+
+    @app.post("/api/things", status_code=201)
+    def create(request: Request):
+        request.state.user_id = 42
+        return {"ok": True}
+
+    with caplog.at_level(logging.INFO, logger="audit"):
+        TestClient(app).post("/api/things")
+
+    assert "[AUDIT] POST /api/things | user=42 | status=201" in caplog.text
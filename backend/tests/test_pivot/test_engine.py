@@ -8,14 +8,19 @@ from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
 
+from backend.config import settings
+from backend.events.session_hooks import setup_session_hooks
 from backend.orm.client import Client
 from backend.orm.downtime_entry import DowntimeEntry
 from backend.orm.product import Product
 from backend.orm.production_entry import ProductionEntry
 from backend.orm.shift import Shift
 from backend.orm.user import User
-from backend.pivot.engine import run_pivot
+from backend.pivot import engine
+from backend.pivot.engine import run_pivot, run_pivots
 
 
 # Fixture note (per task-3-brief.md): the db_session template DB is
@@ -525,3 +530,96 @@ def test_holds_age_to_date_clamps_to_window_end_date_not_today(db_session):
     # Clamped to window_end, not real-world today(): 2020-01-01 -> 2020-01-31
     # is exactly 30 days, regardless of how far "today" actually is.
     assert by_key["Material"]["hold_days"] == pytest.approx(30, abs=0.01)
+
+
+def _statements(db, fn):
+    seen = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        seen.append(statement)
+
+    event.listen(db.bind, "before_cursor_execute", count)
+    try:
+        result = fn()
+    finally:
+        event.remove(db.bind, "before_cursor_execute", count)
+    return result, len(seen)
+
+
+def test_rebucketing_a_window_is_served_from_the_day_row_cache(db_session):
+    _pe(db_session, "PVT-C1", "PIVOT-CLI", date(2026, 3, 2), 100, 10, 0.05)
+    _pe(db_session, "PVT-C2", "PIVOT-CLI", date(2026, 3, 9), 200, 10, 0.10)
+    db_session.commit()
+    window = (date(2026, 3, 1), date(2026, 3, 31), ["PIVOT-CLI"])
+
+    week, fetched = _statements(db_session, lambda: run_pivot(db_session, "production", "week", None, *window))
+    assert fetched > 0
+    month, refetched = _statements(db_session, lambda: run_pivot(db_session, "production", "month", None, *window))
+    assert refetched == 0
+    assert [r["bucket_start"] for r in week["rows"]] == ["2026-03-02", "2026-03-09"]
+    assert month["totals"] == week["totals"]
+
+
+def test_run_pivots_fetches_day_rows_once_per_dataset_and_group_by(db_session):
+    _pe(db_session, "PVT-C3", "PIVOT-CLI", date(2026, 3, 2), 100, 10, 0.05)
+    db_session.commit()
+    specs = [
+        ("production", "week", None),
+        ("production", "month", None),
+        ("production", "quarter", "client"),
+        ("downtime", "month", None),
+    ]
+    calls = []
+    real = engine.day_rows
+
+    def counting(db, ds, group_by, *args):
+        calls.append((ds.name, group_by))
+        return real(db, ds, group_by, *args)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(engine, "day_rows", counting)
+        mp.setattr(settings, "PIVOT_ROLLUP_ENABLED", False)
+        results = run_pivots(db_session, specs, date(2026, 3, 1), date(2026, 3, 31), ["PIVOT-CLI"])
+
+    assert len(calls) == 3
+    assert set(calls) == {("production", None), ("production", "client"), ("downtime", None)}
+    for spec, result in zip(specs, results):
+        assert result == run_pivot(
+            db_session, spec[0], spec[1], spec[2], date(2026, 3, 1), date(2026, 3, 31), ["PIVOT-CLI"]
+        )
+
+
+def test_run_pivots_validates_every_spec_first(db_session):
+    with pytest.raises(ValueError):
+        run_pivots(
+            db_session,
+            [("production", "month", None), ("production", "fortnight", None)],
+            date(2026, 3, 1),
+            date(2026, 3, 31),
+            None,
+        )
+
+
+def test_commit_evicts_cached_day_rows(db_engine):
+    factory = sessionmaker(bind=db_engine)
+    setup_session_hooks(factory)
+    db = factory()
+    try:
+        window = (date(2026, 3, 1), date(2026, 3, 31), ["PIVOT-CLI"])
+        _pe(db, "PVT-C4", "PIVOT-CLI", date(2026, 3, 2), 100, 10, 0.05)
+        db.commit()
+        assert run_pivot(db, "production", "month", None, *window)["totals"]["units"] == 100
+
+        _pe(db, "PVT-C5", "PIVOT-CLI", date(2026, 3, 20), 50, 5, 0.05)
+        db.commit()
+        assert run_pivot(db, "production", "week", None, *window)["totals"]["units"] == 150
+
+        # a product rename regroups every day
+        [row] = run_pivot(db, "production", "month", "product", *window)["rows"]
+        assert row["group_key"] == "Pivot Product"
+        db.get(Product, 1).product_name = "Renamed Product"
+        db.commit()
+        [row] = run_pivot(db, "production", "month", "product", *window)["rows"]
+        assert row["group_key"] == "Renamed Product"
+    finally:
+        db.close()
@@ -21,6 +21,7 @@ from datetime import date, datetime, time
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import event
 
 from backend.calculations.labor_hours import earned_hours, summarize_labor_hours
 from backend.calculations.otd import calculate_true_otd
@@ -34,6 +35,7 @@ from backend.orm.shift import Shift
 from backend.orm.user import User
 from backend.orm.work_order import WorkOrder, WorkOrderStatus
 from backend.pivot.engine import run_pivot
+from backend.pivot.registry import DATASETS
 
 WINDOW = (date(2025, 1, 1), date(2026, 12, 31))
 CID = "PVTH-CLI"
@@ -464,3 +466,67 @@ def test_labor_all_excluded_production_reports_efficiency_available_basis_as_zer
     out = run_pivot(db_session, "labor", "year", None, *WINDOW, [cid])
     assert out["totals"]["excluded_entries"] == 1.0
     assert out["totals"]["efficiency_available_basis"] == 0.0
+
+
+def _statements(db_session, fn):
+    """Number of SQL statements `fn` issues."""
+    seen = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        seen.append(statement)
+
+    event.listen(db_session.bind, "before_cursor_execute", count)
+    try:
+        fn()
+    finally:
+        event.remove(db_session.bind, "before_cursor_execute", count)
+    return len(seen)
+
+
+def test_hooks_issue_a_fixed_number_of_statements(db_session, seeded):
+    """No per-row lazy loads: doubling the rows in the window leaves every
+    hook's statement count unchanged."""
+
+    def counts():
+        db_session.expire_all()
+        return {
+            (name, group_by): _statements(db_session, lambda: list(ds.fetch(db_session, group_by, *WINDOW, [CID])))
+            for name, ds in DATASETS.items()
+            if ds.fetch is not None
+            for group_by in (None, *ds.group_bys)
+        }
+
+    before = counts()
+    assert before[("labor", None)] == 3
+    assert before[("labor", "labor_class")] == 2
+
+    for n in range(5, 9):
+        db_session.add(
+            AttendanceEntry(
+                attendance_entry_id=f"PVTH-ATT-{n}",
+                client_id=CID,
+                employee_id=n % 3 + 1,
+                shift_id=1,
+                shift_date=datetime(2026, 3, n, 6),
+                scheduled_hours=Decimal("8"),
+                actual_hours=Decimal("8"),
+                entered_by="USR-PVTH-001",
+            )
+        )
+        db_session.add(
+            AttendanceHourAllocation(attendance_entry_id=f"PVTH-ATT-{n}", category="training", hours=Decimal("1"))
+        )
+        db_session.add(
+            WorkOrder(
+                work_order_id=f"PVTH-WO-{n}",
+                client_id=CID,
+                style_model="PVTH-STYLE-A",
+                planned_quantity=10,
+                status=WorkOrderStatus.COMPLETED,
+                planned_ship_date=datetime(2026, 3, 5),
+                actual_delivery_date=datetime(2026, 3, n),
+            )
+        )
+    db_session.commit()
+
+    assert counts() == before
@@ -0,0 +1,261 @@
+"""PIVOT_DAILY_ROLLUP: reconcile, read-through in run_pivot, and the commit
+hooks that keep it current.
+
+The contract is equivalence: a pivot answered from the store must equal the
+live path's answer for every dataset, group_by and scope.
+"""
+
+from datetime import date, datetime, time
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from backend.cache.kpi_cache import reset_cache
+from backend.config import settings
+from backend.db.factories import TestDataFactory
+from backend.orm.product import Product
+from backend.orm.production_entry import ProductionEntry
+from backend.pivot.engine import run_pivot
+from backend.pivot.registry import DATASETS
+from backend.pivot import rollup
+from backend.pivot.rollup import RollupRefresher, read_rollup, reconcile_rollups, setup_rollup_hooks
+from backend.tests.conftest import clone_template_engine
+
+MARCH_START = date(2026, 3, 1)
+MARCH_END = date(2026, 3, 31)
+
+
+@pytest.fixture
+def engine():
+    eng = clone_template_engine()
+    yield eng
+    eng.dispose()
+
+
+@pytest.fixture
+def plain_factory(engine):
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def hooked_factory(engine):
+    factory = sessionmaker(bind=engine)
+    setup_rollup_hooks(factory)
+    return factory
+
+
+def _seed_client(db, client_id):
+    TestDataFactory.create_client(db, client_id=client_id)
+    user = TestDataFactory.create_user(db, client_id=client_id)
+    product = TestDataFactory.create_product(db, client_id=client_id)
+    shift = TestDataFactory.create_shift(db, client_id=client_id)
+    return user, product, shift
+
+
+def _seed_march(db, client_id, scale):
+    user, product, shift = _seed_client(db, client_id)
+    for day, units in ((date(2026, 3, 2), 100), (date(2026, 3, 9), 250)):
+        TestDataFactory.create_production_entry(
+            db,
+            client_id,
+            product.product_id,
+            shift.shift_id,
+            user.user_id,
+            production_date=day,
+            units_produced=units * scale,
+        )
+    TestDataFactory.create_downtime_entry(
+        db, client_id, user.user_id, shift_date=datetime(2026, 3, 3, 6), duration_minutes=45 * scale
+    )
+    employee = TestDataFactory.create_employee(db, client_id=client_id)
+    TestDataFactory.create_attendance_entry(db, employee.employee_id, client_id, shift.shift_id, date(2026, 3, 2))
+    wo = TestDataFactory.create_work_order(
+        db, client_id, planned_ship_date=datetime(2026, 3, 10, 12), style_model=f"STYLE-{client_id}"
+    )
+    wo.actual_delivery_date = datetime(2026, 3, 12, 9)
+    TestDataFactory.create_hold_entry(
+        db, wo.work_order_id, client_id, user.user_id, hold_status="ON_HOLD", hold_date=datetime(2026, 3, 4, 6)
+    )
+    TestDataFactory.create_hold_entry(
+        db,
+        wo.work_order_id,
+        client_id,
+        user.user_id,
+        hold_status="RESUMED",
+        hold_date=datetime(2026, 3, 5, 6),
+        resume_date=datetime(2026, 3, 7, 6),
+    )
+    db.commit()
+
+
+def _normalized(result):
+    def norm(value):
+        return round(value, 9) if isinstance(value, float) else value
+
+    return {
+        "rows": [{k: norm(v) for k, v in row.items()} for row in result["rows"]],
+        "totals": {k: norm(v) for k, v in result["totals"].items()},
+    }
+
+
+def _live(monkeypatch, db, *args):
+    monkeypatch.setattr(settings, "PIVOT_ROLLUP_ENABLED", False)
+    reset_cache()  # the stored answer is cached under the same key
+    try:
+        return run_pivot(db, *args)
+    finally:
+        monkeypatch.setattr(settings, "PIVOT_ROLLUP_ENABLED", True)
+
+
+def test_reconciled_rollup_answers_like_the_live_path(plain_factory, monkeypatch):
+    db = plain_factory()
+    try:
+        _seed_march(db, "RU-A", 1)
+        _seed_march(db, "RU-B", 2)
+        assert reconcile_rollups(db, MARCH_START, MARCH_END) > 0
+
+        for name, ds in DATASETS.items():
+            for group_by in (None, *ds.group_bys):
+                for client_ids in (None, ["RU-A"]):
+                    for end in (MARCH_END, date(2026, 3, 6)):
+                        assert read_rollup(db, ds, group_by, MARCH_START, end, client_ids) is not None
+                        args = (name, "week", group_by, MARCH_START, end, client_ids)
+                        stored = run_pivot(db, *args)
+                        live = _live(monkeypatch, db, *args)
+                        assert _normalized(stored) == _normalized(live), args
+    finally:
+        db.close()
+
+
+def test_open_hold_is_aged_to_the_reading_window(plain_factory):
+    db = plain_factory()
+    try:
+        _seed_march(db, "RU-A", 1)
+        reconcile_rollups(db, MARCH_START, MARCH_END, datasets=["holds"])
+
+        def hold_days(end):
+            return run_pivot(db, "holds", "month", None, MARCH_START, end, ["RU-A"])["totals"]["hold_days"]
+
+        # resumed hold: 2 days; open hold from 3/4 ages to the window's end
+        assert hold_days(date(2026, 3, 10)) == pytest.approx(2 + 6)
+        assert hold_days(MARCH_END) == pytest.approx(2 + 27)
+    finally:
+        db.close()
+
+
+def test_partially_materialized_window_falls_back_to_live(plain_factory):
+    db = plain_factory()
+    try:
+        _seed_march(db, "RU-A", 1)
+        reconcile_rollups(db, MARCH_START, date(2026, 3, 15))
+        ds = DATASETS["production"]
+        assert read_rollup(db, ds, None, MARCH_START, date(2026, 3, 15), ["RU-A"]) is not None
+        assert read_rollup(db, ds, None, MARCH_START, MARCH_END, ["RU-A"]) is None
+        assert run_pivot(db, "production", "month", None, MARCH_START, MARCH_END, ["RU-A"])["totals"]["units"] == 350
+    finally:
+        db.close()
+
+
+class TestCommitHooks:
+    def _seed_empty_march(self, factory):
+        """Client RU-A with no entries, March materialized. Returns the
+        (product_id, shift_id, user_id) an entry needs."""
+        db = factory()
+        try:
+            user, product, shift = _seed_client(db, "RU-A")
+            ids = (product.product_id, shift.shift_id, user.user_id)
+            db.commit()
+            reconcile_rollups(db, MARCH_START, MARCH_END)
+            return ids
+        finally:
+            db.close()
+
+    def _units(self, db, start=MARCH_START, end=MARCH_END):
+        rows = read_rollup(db, DATASETS["production"], None, start, end, ["RU-A"])
+        assert rows is not None
+        return {day: comps["units"] for day, _, comps in rows}
+
+    def test_commit_refreshes_the_touched_day(self, plain_factory, hooked_factory):
+        ids = self._seed_empty_march(plain_factory)
+
+        db = hooked_factory()
+        try:
+            entry = TestDataFactory.create_production_entry(db, "RU-A", *ids, production_date=date(2026, 3, 2))
+            db.commit()
+            assert self._units(db) == {date(2026, 3, 2): 1000.0}
+
+            # moving a row between days refreshes both
+            entry.shift_date = datetime.combine(date(2026, 3, 20), time(6))
+            db.commit()
+            assert self._units(db) == {date(2026, 3, 20): 1000.0}
+        finally:
+            db.close()
+
+    def test_rollback_leaves_the_rollup_alone(self, plain_factory, hooked_factory):
+        ids = self._seed_empty_march(plain_factory)
+
+        db = hooked_factory()
+        try:
+            TestDataFactory.create_production_entry(db, "RU-A", *ids, production_date=date(2026, 3, 2))
+            db.rollback()
+            assert self._units(db) == {}
+        finally:
+            db.close()
+
+    def test_dimension_edit_drops_the_clients_rollup(self, plain_factory, hooked_factory):
+        db = plain_factory()
+        _seed_march(db, "RU-A", 1)
+        reconcile_rollups(db, MARCH_START, MARCH_END)
+        db.close()
+
+        db = hooked_factory()
+        try:
+            product = db.query(Product).filter(Product.client_id == "RU-A").one()
+            product.ideal_cycle_time = Decimal("0.5")
+            db.commit()
+            assert read_rollup(db, DATASETS["production"], None, MARCH_START, MARCH_END, ["RU-A"]) is None
+            assert read_rollup(db, DATASETS["downtime"], None, MARCH_START, MARCH_END, ["RU-A"]) is not None
+            # the live fallback sees the new cycle time straight away
+            out = run_pivot(db, "production", "month", None, MARCH_START, MARCH_END, ["RU-A"])
+            assert out["totals"]["earned_hours"] == pytest.approx(350 * 0.5)
+            assert db.query(ProductionEntry).count() == 2
+        finally:
+            db.close()
+
+    def test_refresher_applies_the_commit_off_the_commit_path(self, plain_factory, hooked_factory, monkeypatch):
+        ids = self._seed_empty_march(plain_factory)
+        refresher = RollupRefresher()  # not started: the test drains it
+        monkeypatch.setattr(rollup, "_refresher", refresher)
+
+        db = hooked_factory()
+        try:
+            TestDataFactory.create_production_entry(db, "RU-A", *ids, production_date=date(2026, 3, 2))
+            db.commit()
+            # queued, not applied: the client reads live meanwhile
+            assert refresher.get_stats()["queue_depth"] == 1
+            assert read_rollup(db, DATASETS["production"], None, MARCH_START, MARCH_END, ["RU-A"]) is None
+            assert read_rollup(db, DATASETS["downtime"], None, MARCH_START, MARCH_END, ["RU-A"]) is not None
+            assert (
+                run_pivot(db, "production", "month", None, MARCH_START, MARCH_END, ["RU-A"])["totals"]["units"] == 1000
+            )
+
+            assert refresher.flush() == 1
+            assert self._units(db) == {date(2026, 3, 2): 1000.0}
+        finally:
+            db.close()
+
+    def test_stopped_refresher_hands_commits_back_inline(self, plain_factory, hooked_factory, monkeypatch):
+        ids = self._seed_empty_march(plain_factory)
+        refresher = RollupRefresher()
+        refresher.start()
+        refresher.stop()
+        monkeypatch.setattr(rollup, "_refresher", refresher)
+
+        db = hooked_factory()
+        try:
+            TestDataFactory.create_production_entry(db, "RU-A", *ids, production_date=date(2026, 3, 2))
+            db.commit()
+            assert self._units(db) == {date(2026, 3, 2): 1000.0}
+        finally:
+            db.close()
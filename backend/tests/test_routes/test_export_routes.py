@@ -259,6 +259,31 @@ class TestExportProductionEntries:
         assert records[0]["client_id"] == CLIENT_ID
         assert records[0]["units_produced"] == "500"
 
+    def test_export_gzip_when_accepted(self, seeded_db):
+        app = create_test_app(seeded_db)
+        client = TestClient(app)
+        response = client.get(
+            f"/api/export/production-entries?client_id={CLIENT_ID}",
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        # httpx transparently decodes the gzip body
+        records = _parse_csv_dict_response(response)
+        assert records[0]["production_entry_id"] == "PE-EXPORT-0001"
+
+    def test_export_plain_without_gzip(self, seeded_db):
+        app = create_test_app(seeded_db)
+        client = TestClient(app)
+        response = client.get(
+            f"/api/export/production-entries?client_id={CLIENT_ID}",
+            headers={"Accept-Encoding": "identity"},
+        )
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
     def test_export_date_range_filter(self, seeded_db):
         app = create_test_app(seeded_db)
         client = TestClient(app)
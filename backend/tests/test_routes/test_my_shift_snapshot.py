@@ -0,0 +1,132 @@
+"""/api/my-shift snapshot: /summary, /stats and /activity read one cached
+ShiftSnapshot per (client scope, shift date, shift), built from aggregate and
+LIMITed queries instead of loading every entry of the day.
+
+Drives the endpoint functions directly on transactional_db, like
+test_my_shift_activity.py.
+"""
+
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from backend.auth.jwt import ClientScope
+from backend.events.session_hooks import setup_session_hooks
+from backend.routes.my_shift import get_my_recent_activity, get_my_shift_stats, get_my_shift_summary
+from backend.tests.fixtures.factories import TestDataFactory
+
+CLIENT_ID = "MYSHIFT-SNAP"
+TODAY = date.today()
+
+
+@pytest.fixture
+def shift_day(transactional_db):
+    db = transactional_db
+    TestDataFactory.create_client(db, client_id=CLIENT_ID)
+    user = TestDataFactory.create_user(db, role="operator", client_id=CLIENT_ID)
+    shift = TestDataFactory.create_shift(db, client_id=CLIENT_ID)
+    product = TestDataFactory.create_product(db, client_id=CLIENT_ID, product_name="Widget")
+    work_order = TestDataFactory.create_work_order(db, client_id=CLIENT_ID, planned_quantity=400)
+
+    # Yesterday's output counts toward the order's progress, not today's stats
+    TestDataFactory.create_production_entry(
+        db,
+        CLIENT_ID,
+        product.product_id,
+        shift.shift_id,
+        user.user_id,
+        TODAY - timedelta(days=1),
+        100,
+        work_order_id=work_order.work_order_id,
+    )
+    for n, efficiency in enumerate(("80", "90", None)):
+        entry = TestDataFactory.create_production_entry(
+            db,
+            CLIENT_ID,
+            product.product_id,
+            shift.shift_id,
+            user.user_id,
+            TODAY,
+            10 * (n + 1),
+            work_order_id=work_order.work_order_id,
+        )
+        entry.efficiency_percentage = Decimal(efficiency) if efficiency else None
+        entry.created_at = datetime.combine(TODAY, time(8 + n))
+    for minutes in (15, 25):
+        TestDataFactory.create_downtime_entry(
+            db, CLIENT_ID, user.user_id, shift_date=datetime.combine(TODAY, time()), duration_minutes=minutes
+        )
+    TestDataFactory.create_quality_entry(
+        db, work_order.work_order_id, CLIENT_ID, user.user_id, TODAY, units_inspected=50, units_defective=3
+    )
+    db.commit()
+    return db, user, product, shift, work_order
+
+
+def _call(endpoint, db, user, **params):
+    return endpoint(db=db, current_user=user, scope=ClientScope(client_ids=(CLIENT_ID,)), shift_date=TODAY, **params)
+
+
+def _summary(db, user):
+    return _call(get_my_shift_summary, db, user, shift_id=None, operator_id=None)
+
+
+def test_summary_totals_come_from_aggregates(shift_day):
+    db, user, *_ = shift_day
+
+    summary = _summary(db, user)
+
+    assert summary.stats.units_produced == 60
+    assert summary.stats.efficiency == 85.0  # mean of the non-null cached efficiencies
+    assert (summary.stats.downtime_incidents, summary.stats.downtime_minutes) == (2, 40)
+    assert (summary.stats.quality_checks, summary.stats.defect_count) == (1, 3)
+    assert summary.data_completeness["production"]["entered"] == 3
+    [wo] = summary.assigned_work_orders
+    assert (wo.product_name, wo.produced, wo.target_qty, wo.progress_percent) == ("Widget", 160, 400, 40.0)
+    # newest production entry first
+    assert [a.params["units"] for a in summary.recent_activity if a.type == "production"][0] == 30
+
+
+def test_endpoints_share_one_snapshot(shift_day):
+    db, user, *_ = shift_day
+    statements = []
+    event.listen(db.bind, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    _summary(db, user)
+    built = len(statements)
+    stats = _call(get_my_shift_stats, db, user, shift_id=None, operator_id=None)
+    activity = _call(get_my_recent_activity, db, user, shift_id=None, limit=2)
+
+    assert len(statements) == built  # /stats and /activity served from the cache
+    assert all("LIMIT" in s for s in statements if "created_at DESC" in s)
+    assert stats["units_produced"] == 60 and stats["downtime_minutes"] == 40
+    assert len(activity["activity"]) == 2
+
+
+def test_shift_and_date_are_separate_entries(shift_day):
+    db, user, _, shift, _ = shift_day
+
+    assert _call(get_my_shift_stats, db, user, shift_id=shift.shift_id + 1, operator_id=None)["units_produced"] == 0
+    assert _call(get_my_shift_stats, db, user, shift_id=shift.shift_id, operator_id=None)["units_produced"] == 60
+
+
+def test_commit_evicts_the_snapshot(shift_day):
+    db, user, product, shift, work_order = shift_day
+    setup_session_hooks(db)
+    assert _summary(db, user).stats.units_produced == 60
+
+    TestDataFactory.create_production_entry(
+        db,
+        CLIENT_ID,
+        product.product_id,
+        shift.shift_id,
+        user.user_id,
+        TODAY,
+        5,
+        work_order_id=work_order.work_order_id,
+    )
+    db.commit()
+
+    assert _summary(db, user).stats.units_produced == 65
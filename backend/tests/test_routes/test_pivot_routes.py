@@ -271,3 +271,51 @@ def test_csv_group_key_with_formula_prefix_round_trips_escaped(admin_client, piv
     csv_rows = list(csv.DictReader(io.StringIO(r.text)))
     assert len(csv_rows) == 1
     assert csv_rows[0]["group_key"] == '\'=HYPERLINK("http://evil.example","click me")'
+
+
+def test_batch_matches_individual_pivots(admin_client, pivot_db):
+    client = TestDataFactory.create_client(pivot_db, client_id="PVT-RT-BATCH")
+    pivot_db.commit()
+    TestDataFactory.create_downtime_entry(
+        pivot_db,
+        client_id=client.client_id,
+        reported_by="pvt-admin-001",
+        shift_date=datetime(2026, 6, 15, 6),
+        duration_minutes=90,
+    )
+    pivot_db.commit()
+
+    window = {"start_date": "2026-01-01", "end_date": "2026-12-31"}
+    specs = [
+        {"dataset": "downtime", "bucket": "month"},
+        {"dataset": "downtime", "bucket": "year", "group_by": "client"},
+        {"dataset": "labor", "bucket": "quarter"},
+    ]
+    r = admin_client.post("/api/pivot/batch", json={**window, "pivots": specs})
+    assert r.status_code == 200
+    pivots = r.json()["pivots"]
+    assert len(pivots) == len(specs)
+    for spec, batched in zip(specs, pivots):
+        params = {**window, "bucket": spec["bucket"]}
+        if "group_by" in spec:
+            params["group_by"] = spec["group_by"]
+        assert batched == admin_client.get(f"/api/pivot/{spec['dataset']}", params=params).json()
+    assert pivots[1]["rows"][0]["downtime_hours"] == 1.5
+
+
+def test_batch_rejects_the_whole_batch_on_one_bad_spec(admin_client):
+    r = admin_client.post(
+        "/api/pivot/batch",
+        json={
+            "start_date": "2026-01-01",
+            "end_date": "2026-02-01",
+            "pivots": [{"dataset": "production", "bucket": "month"}, {"dataset": "nope", "bucket": "month"}],
+        },
+    )
+    assert r.status_code == 422
+    assert "dataset" in r.text
+
+
+def test_batch_requires_at_least_one_pivot(admin_client):
+    r = admin_client.post("/api/pivot/batch", json={"start_date": "2026-01-01", "end_date": "2026-02-01", "pivots": []})
+    assert r.status_code == 422
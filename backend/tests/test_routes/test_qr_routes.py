@@ -0,0 +1,161 @@
+"""Route tests for /api/qr image caching and bulk labels: payload-derived
+ETags with If-None-Match -> 304, renders served from the in-memory cache,
+and POST /api/qr/labels (PDF sheet / ZIP of PNGs, one lookup query, same
+404/403 rules as the single-image routes).
+
+Harness mirrors test_pivot_routes.py: fresh template DB per test, auth via
+app.dependency_overrides[get_current_user].
+"""
+
+import io
+import zipfile
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from backend.auth.jwt import get_current_user
+from backend.database import get_db
+from backend.routes.qr import router as qr_router
+from backend.schemas.qr import QRCodeData
+from backend.services.qr_service import LABEL_COLUMNS, LABEL_ROWS, QRService
+from backend.tests.conftest import clone_template_engine
+from backend.tests.fixtures.factories import TestDataFactory
+
+
+@pytest.fixture(scope="function")
+def qr_db():
+    """Fresh database for each test."""
+    engine = clone_template_engine()
+    session = sessionmaker(bind=engine)()
+    TestDataFactory.reset_counters()
+    try:
+        TestDataFactory.create_client(session, client_id="QR-A")
+        TestDataFactory.create_client(session, client_id="QR-B")
+        for n in range(1, 4):
+            TestDataFactory.create_work_order(session, client_id="QR-A", work_order_id=f"WO-QR-{n}")
+        TestDataFactory.create_work_order(session, client_id="QR-B", work_order_id="WO-QR-B")
+        TestDataFactory.create_product(session, client_id="QR-A", product_code="PRD-QR")
+        session.commit()
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+        engine.dispose()
+
+
+def _client(db, user):
+    app = FastAPI()
+    app.include_router(qr_router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: user
+    return TestClient(app)
+
+
+@pytest.fixture
+def admin_client(qr_db):
+    admin = TestDataFactory.create_user(qr_db, username="qr_admin", role="admin", client_id=None)
+    qr_db.commit()
+    return _client(qr_db, admin)
+
+
+def test_image_carries_a_payload_etag(admin_client):
+    r = admin_client.get("/api/qr/work-order/WO-QR-1/image", params={"size": 150})
+
+    assert r.status_code == 200
+    assert r.content[:4] == b"\x89PNG"
+    expected = QRService.image_etag(QRCodeData(type="work_order", id="WO-QR-1"), 150)
+    assert r.headers["etag"] == expected
+    assert r.headers["cache-control"].startswith("private")
+    # a different size is a different image
+    assert admin_client.get("/api/qr/work-order/WO-QR-1/image").headers["etag"] != expected
+
+
+def test_if_none_match_gets_304_without_rendering(admin_client):
+    etag = admin_client.get("/api/qr/work-order/WO-QR-2/image").headers["etag"]
+
+    with patch.object(QRService, "_render_qr_image") as render:
+        for header in (etag, f'"other", W/{etag}', "*"):
+            r = admin_client.get("/api/qr/work-order/WO-QR-2/image", headers={"If-None-Match": header})
+            assert r.status_code == 304
+            assert r.content == b""
+            assert r.headers["etag"] == etag
+    render.assert_not_called()
+
+    assert admin_client.get("/api/qr/work-order/WO-QR-2/image", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_repeat_renders_are_cached():
+    data = QRCodeData(type="job", id="JOB-CACHE-TEST")
+    first = QRService.generate_qr_image(data, 120)
+
+    with patch.object(QRService, "_render_qr_image") as render:
+        assert QRService.generate_qr_image(data, 120) == first
+    render.assert_not_called()
+
+
+def test_304_still_enforces_client_access(qr_db):
+    scoped = TestDataFactory.create_user(qr_db, username="qr_b", role="operator", client_id="QR-B")
+    qr_db.commit()
+    etag = QRService.image_etag(QRCodeData(type="work_order", id="WO-QR-1"), 200)
+
+    r = _client(qr_db, scoped).get("/api/qr/work-order/WO-QR-1/image", headers={"If-None-Match": etag})
+
+    assert r.status_code == 403
+
+
+def test_labels_pdf_pages_every_label(admin_client, qr_db):
+    statements = []
+    event.listen(qr_db.bind, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    ids = ["WO-QR-1", "WO-QR-2", "WO-QR-3"] * 5  # 15 labels -> 2 pages
+
+    r = admin_client.post("/api/qr/labels", json={"entity_type": "work_order", "entity_ids": ids})
+
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/pdf"
+    assert "qr_labels_work_order.pdf" in r.headers["content-disposition"]
+    assert r.content.startswith(b"%PDF")
+    assert r.content.count(b"/Type /Page\n") == -(-len(ids) // (LABEL_COLUMNS * LABEL_ROWS))
+    assert len([s for s in statements if 'FROM "WORK_ORDER"' in s]) == 1
+
+
+def test_labels_zip_has_one_png_per_distinct_label(admin_client):
+    r = admin_client.post(
+        "/api/qr/labels",
+        json={"entity_type": "product", "entity_ids": ["PRD-QR", "PRD-QR"], "format": "zip", "size": 100},
+    )
+
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/zip"
+    archive = zipfile.ZipFile(io.BytesIO(r.content))
+    assert archive.namelist() == ["qr_product_PRD-QR.png"]
+    png = archive.read("qr_product_PRD-QR.png")
+    assert png == QRService.generate_qr_image(QRCodeData(type="product", id="PRD-QR"), 100)
+
+
+def test_labels_404_names_missing_ids(admin_client):
+    r = admin_client.post("/api/qr/labels", json={"entity_type": "work_order", "entity_ids": ["WO-QR-1", "NOPE"]})
+
+    assert r.status_code == 404
+    assert "NOPE" in r.json()["detail"]
+
+
+def test_labels_403_when_any_entity_is_out_of_scope(qr_db):
+    scoped = TestDataFactory.create_user(qr_db, username="qr_a", role="operator", client_id="QR-A")
+    qr_db.commit()
+
+    r = _client(qr_db, scoped).post(
+        "/api/qr/labels", json={"entity_type": "work_order", "entity_ids": ["WO-QR-1", "WO-QR-B"]}
+    )
+
+    assert r.status_code == 403
+
+
+@pytest.mark.parametrize("ids", [[], ["X"] * 501])
+def test_labels_batch_size_is_bounded(admin_client, ids):
+    r = admin_client.post("/api/qr/labels", json={"entity_type": "work_order", "entity_ids": ids})
+
+    assert r.status_code == 422
@@ -0,0 +1,136 @@
+"""
+Cached authenticated principal (backend/auth/principal_cache.py).
+
+get_current_user resolves a token once -- blacklist probe, USER row and the
+USER_CLIENT_ASSIGNMENT client list -- and serves repeat requests with the
+same token from the cache. Logout revokes at once in this process, another
+worker's logout, deactivation or re-scope applies on the next
+revocation-index refresh, and USER / assignment commits evict the cached
+principal.
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from backend.auth.jwt import blacklist_token, create_access_token, get_current_user, token_revocation_key
+from backend.auth.principal_cache import revocation_index
+from backend.events.session_hooks import setup_session_hooks
+from backend.middleware.client_auth import get_user_client_filter
+from backend.orm.token_blacklist import TokenBlacklist
+from backend.orm.user_client_assignment import UserClientAssignment
+from backend.tests.fixtures.factories import TestDataFactory
+
+AUTH_TABLES = ('FROM "USER"', 'FROM "TOKEN_BLACKLIST"', 'FROM "USER_CLIENT_ASSIGNMENT"')
+
+
+@pytest.fixture
+def operator(transactional_db):
+    db = transactional_db
+    for client_id in ("PC-A", "PC-B"):
+        TestDataFactory.create_client(db, client_id=client_id)
+    user = TestDataFactory.create_user(db, username="pc_operator", role="operator", client_id="PC-A")
+    db.add(UserClientAssignment(user_id=user.user_id, client_id="PC-B"))
+    db.commit()
+    return db, user, create_access_token(data={"sub": user.username})
+
+
+def _auth_queries(db):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if any(table in statement for table in AUTH_TABLES):
+            statements.append(statement)
+
+    event.listen(db.bind, "before_cursor_execute", record)
+    return statements
+
+
+def _authenticate(db, token):
+    request = SimpleNamespace(state=SimpleNamespace())
+    user = get_current_user(request=request, token=token, db=db)
+    return user, get_user_client_filter(user, db)
+
+
+def test_repeat_requests_skip_the_auth_queries(operator):
+    db, user, token = operator
+    statements = _auth_queries(db)
+
+    first, first_clients = _authenticate(db, token)
+    resolved = len(statements)
+    second, second_clients = _authenticate(db, token)
+
+    assert resolved == 3  # blacklist probe, USER, USER_CLIENT_ASSIGNMENT
+    assert len(statements) == resolved + 3  # revocation index load: blacklist, USER, assignments
+    _authenticate(db, token)
+    assert len(statements) == resolved + 3
+    assert second.user_id == first.user_id == user.user_id
+    assert second_clients == first_clients == ["PC-B"]
+    assert second in db  # a persistent instance in the request's session
+
+
+def test_logout_revokes_a_cached_token(operator):
+    db, _, token = operator
+    _authenticate(db, token)
+
+    blacklist_token(db, token)
+
+    with pytest.raises(HTTPException) as exc:
+        _authenticate(db, token)
+    assert exc.value.status_code == 401
+
+
+def test_other_workers_logout_applies_on_refresh(operator):
+    db, _, token = operator
+    _authenticate(db, token)
+    _authenticate(db, token)  # index loaded
+    # Revoked by another process: a row, but no add() here
+    expires = datetime.now(tz=timezone.utc).replace(tzinfo=None) + timedelta(minutes=5)
+    db.add(TokenBlacklist(jti=token_revocation_key(token), expires_at=expires))
+    db.commit()
+
+    revocation_index.refresh(db)
+
+    with pytest.raises(HTTPException) as exc:
+        _authenticate(db, token)
+    assert exc.value.status_code == 401
+
+
+def test_user_and_assignment_commits_evict_the_principal(operator):
+    db, user, token = operator
+    setup_session_hooks(db)
+    _authenticate(db, token)
+
+    db.add(UserClientAssignment(user_id=user.user_id, client_id="PC-A"))
+    db.commit()
+    assert sorted(_authenticate(db, token)[1]) == ["PC-A", "PC-B"]
+
+    user.is_active = False
+    db.commit()
+    with pytest.raises(HTTPException) as exc:
+        _authenticate(db, token)
+    assert exc.value.status_code == 403
+
+
+def test_other_workers_deactivation_and_rescope_apply_on_refresh(operator):
+    db, user, token = operator
+    _authenticate(db, token)
+    _authenticate(db, token)  # index loaded
+    # Changed by another process: no session hooks here, so nothing is evicted
+    db.query(UserClientAssignment).filter(UserClientAssignment.user_id == user.user_id).update({"is_active": False})
+    db.add(UserClientAssignment(user_id=user.user_id, client_id="PC-A"))
+    db.commit()
+    assert _authenticate(db, token)[1] == ["PC-B"]  # cached until the refresh
+
+    revocation_index.refresh(db)
+    assert _authenticate(db, token)[1] == ["PC-A"]
+
+    user.is_active = False
+    db.commit()
+    revocation_index.refresh(db)
+    with pytest.raises(HTTPException) as exc:
+        _authenticate(db, token)
+    assert exc.value.status_code == 403
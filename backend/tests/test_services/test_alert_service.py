@@ -0,0 +1,166 @@
+"""
+Alert Service Tests
+
+Set-based OTD-risk and pending-hold alert generation: candidates outside the
+due window or already alerted are skipped, a second sweep adds nothing, and
+the commit-driven refresh only touches the work orders and clients a
+transaction wrote, off the committing thread.
+
+Uses real in-memory SQLite database -- NO mocks for DB layer.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from backend.crud.hold.core import create_wip_hold
+from backend.crud.work_order import create_work_order
+from backend.orm.alert import Alert
+from backend.orm.work_order import WorkOrderStatus
+from backend.schemas.hold import WIPHoldCreate
+from backend.services import alert_refresh
+from backend.services.alert_refresh import AlertRefresher, setup_alert_refresh_hooks
+from backend.services.alert_service import generate_hold_alerts, generate_otd_alerts
+from backend.tests.fixtures.factories import TestDataFactory
+
+CLIENT_A = "ALERT-SVC-A"
+CLIENT_B = "ALERT-SVC-B"
+
+
+@pytest.fixture
+def session_factory(db_engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    TestDataFactory.reset_counters()
+    TestDataFactory.create_client(session, client_id=CLIENT_A)
+    TestDataFactory.create_client(session, client_id=CLIENT_B)
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _work_order(db, client_id, due_in_days, status=WorkOrderStatus.ACTIVE):
+    """A work order 20 days old with nothing produced: far behind plan once due soon."""
+    now = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+    wo = TestDataFactory.create_work_order(
+        db, client_id=client_id, status=status, planned_ship_date=now + timedelta(days=due_in_days, hours=1)
+    )
+    wo.created_at = now - timedelta(days=20)
+    db.commit()
+    return wo.work_order_id
+
+
+def _active_alerts(db, category):
+    return db.query(Alert).filter(Alert.category == category, Alert.status == "active").all()
+
+
+def test_otd_alerts_are_generated_once_per_at_risk_order(db):
+    at_risk = _work_order(db, CLIENT_A, due_in_days=1)
+    _work_order(db, CLIENT_A, due_in_days=-2)  # already late
+    _work_order(db, CLIENT_A, due_in_days=45)  # beyond the horizon
+    _work_order(db, CLIENT_A, due_in_days=1, status=WorkOrderStatus.RECEIVED)
+
+    created = generate_otd_alerts(db, CLIENT_A)
+
+    assert [a.work_order_id for a in created] == [at_risk]
+    assert created[0].severity == "urgent"
+    assert created[0].created_at is not None
+    assert generate_otd_alerts(db, CLIENT_A) == []
+    assert len(_active_alerts(db, "otd")) == 1
+
+
+def test_otd_alerts_can_be_scoped_to_work_orders(db):
+    first = _work_order(db, CLIENT_A, due_in_days=1)
+    second = _work_order(db, CLIENT_B, due_in_days=1)
+
+    assert [a.work_order_id for a in generate_otd_alerts(db, work_order_ids=[second])] == [second]
+    assert generate_otd_alerts(db, work_order_ids=[]) == []
+    assert [a.work_order_id for a in generate_otd_alerts(db)] == [first]
+
+
+def test_hold_alert_is_refreshed_in_place_per_client(db):
+    user = TestDataFactory.create_user(db, role="admin", username="alert_svc_admin")
+    wo_a = _work_order(db, CLIENT_A, due_in_days=10)
+    wo_b = _work_order(db, CLIENT_B, due_in_days=10)
+    TestDataFactory.create_hold_entry(db, work_order_id=wo_a, client_id=CLIENT_A, created_by=user.user_id)
+    db.commit()
+
+    first = generate_hold_alerts(db, CLIENT_A)
+    assert first[0].alert_metadata["pending_count"] == 1
+
+    TestDataFactory.create_hold_entry(db, work_order_id=wo_a, client_id=CLIENT_A, created_by=user.user_id)
+    TestDataFactory.create_hold_entry(db, work_order_id=wo_b, client_id=CLIENT_B, created_by=user.user_id)
+    db.commit()
+
+    second = generate_hold_alerts(db, CLIENT_A)
+    other = generate_hold_alerts(db, CLIENT_B)
+
+    assert second[0].alert_id == first[0].alert_id
+    assert second[0].alert_metadata["pending_count"] == 2
+    assert other[0].alert_id != first[0].alert_id
+    assert len(_active_alerts(db, "hold")) == 2
+
+
+@pytest.fixture
+def refresher(session_factory, monkeypatch):
+    """Commit hooks plus a process refresher, as init_event_infrastructure wires them."""
+    setup_alert_refresh_hooks(session_factory)
+    refresher = AlertRefresher(session_factory)
+    monkeypatch.setattr(alert_refresh, "_refresher", refresher)
+    yield refresher
+    refresher.stop()
+
+
+def test_refresher_checks_only_what_it_was_given(db, session_factory):
+    user = TestDataFactory.create_user(db, role="admin", username="alert_svc_handler")
+    changed = _work_order(db, CLIENT_A, due_in_days=1)
+    _work_order(db, CLIENT_A, due_in_days=1)
+    TestDataFactory.create_hold_entry(db, work_order_id=changed, client_id=CLIENT_B, created_by=user.user_id)
+    db.commit()
+
+    refresher = AlertRefresher(session_factory)
+    refresher.submit([changed], [CLIENT_B])
+    refresher.stop()
+
+    assert [a.work_order_id for a in _active_alerts(db, "otd")] == [changed]
+    assert [a.client_id for a in _active_alerts(db, "hold")] == [CLIENT_B]
+
+
+def _at_risk_order(db, user):
+    now = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+    data = {
+        "work_order_id": "WO-ALERT-CRUD",
+        "client_id": CLIENT_A,
+        "style_model": "STYLE-1",
+        "planned_quantity": 100,
+        "status": WorkOrderStatus.ACTIVE,
+        "planned_ship_date": now + timedelta(days=1, hours=1),
+        "created_at": now - timedelta(days=20),
+    }
+    return create_work_order(db, data, user).work_order_id
+
+
+def test_committed_work_order_and_hold_refresh_alerts(db, refresher):
+    admin = TestDataFactory.create_user(db, role="admin", username="alert_svc_crud_admin")
+    operator = TestDataFactory.create_user(db, role="operator", username="alert_svc_crud_op", client_id=CLIENT_A)
+    db.commit()
+
+    wo_id = _at_risk_order(db, admin)
+    create_wip_hold(db, WIPHoldCreate(client_id=CLIENT_A, work_order_id=wo_id), operator)
+    db.rollback()
+    assert refresher.flush() == 0
+
+    wo_id = _at_risk_order(db, admin)
+    create_wip_hold(db, WIPHoldCreate(client_id=CLIENT_A, work_order_id=wo_id), operator)
+    db.commit()
+    refresher.stop()  # waits for the background refresh the commit queued
+
+    assert [a.work_order_id for a in _active_alerts(db, "otd")] == [wo_id]
+    assert [a.client_id for a in _active_alerts(db, "hold")] == [CLIENT_A]
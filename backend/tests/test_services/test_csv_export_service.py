@@ -8,6 +8,7 @@ Uses real in-memory SQLite database -- NO mocks for DB layer.
 """
 
 import csv
+import gzip
 import io
 from datetime import date, datetime, time
 from decimal import Decimal
@@ -20,6 +21,7 @@ from backend.orm.work_order import WorkOrderStatus
 from backend.orm.user import UserRole
 from backend.services.csv_export_service import (
     _format_value,
+    gzip_stream,
     sanitize_csv_value,
     stream_csv_export,
 )
@@ -377,3 +379,80 @@ class TestStreamCsvExport:
         assert len(records) == 4
         assert all("production_entry_id" in r for r in records)
         assert all("client_id" in r for r in records)
+
+
+# ---------------------------------------------------------------------------
+# Keyset paging, chunking and gzip
+# ---------------------------------------------------------------------------
+
+
+class TestKeysetPaging:
+    """Keyset-paged batches must cover every row exactly once, in PK order."""
+
+    COLUMNS = [
+        ("production_entry_id", "production_entry_id"),
+        ("units_produced", "units_produced"),
+    ]
+
+    def test_small_batches_cover_all_rows_in_order(self, seeded_db):
+        rows = _parse_csv(
+            stream_csv_export(
+                db=seeded_db,
+                model_class=ProductionEntry,
+                client_filter=ProductionEntry.client_id == CLIENT_ID,
+                columns=self.COLUMNS,
+                batch_size=1,
+            )
+        )
+        ids = [r[0] for r in rows[1:]]
+        assert ids == ["PE-CSV-0001", "PE-CSV-0002", "PE-CSV-0003", "PE-CSV-0004"]
+
+    def test_batch_size_matches_exact_multiple(self, seeded_db):
+        """A final full page followed by an empty page must not duplicate rows."""
+        rows = _parse_csv(
+            stream_csv_export(
+                db=seeded_db,
+                model_class=ProductionEntry,
+                client_filter=ProductionEntry.client_id == CLIENT_ID,
+                columns=self.COLUMNS,
+                batch_size=2,
+            )
+        )
+        assert len(rows) == 5
+        assert len({r[0] for r in rows[1:]}) == 4
+
+    def test_one_chunk_per_batch(self, seeded_db):
+        chunks = list(
+            stream_csv_export(
+                db=seeded_db,
+                model_class=ProductionEntry,
+                client_filter=ProductionEntry.client_id == CLIENT_ID,
+                columns=self.COLUMNS,
+                batch_size=2,
+            )
+        )
+        # Header + two 2-row chunks
+        assert len(chunks) == 3
+        assert chunks[1].count("\n") == 2
+
+    def test_unmapped_attribute_exports_empty(self, seeded_db):
+        rows = _parse_csv(
+            stream_csv_export(
+                db=seeded_db,
+                model_class=ProductionEntry,
+                client_filter=ProductionEntry.client_id == CLIENT_ID,
+                columns=[("production_entry_id", "id"), ("not_a_column", "missing")],
+            )
+        )
+        assert rows[0] == ["id", "missing"]
+        assert all(r[1] == "" for r in rows[1:])
+
+
+class TestGzipStream:
+    def test_round_trip(self):
+        chunks = ["a,b\r\n", "1,2\r\n" * 1000, "", "3,4\r\n"]
+        compressed = b"".join(gzip_stream(chunks))
+        assert gzip.decompress(compressed).decode("utf-8") == "".join(chunks)
+
+    def test_empty_stream_is_valid_gzip(self):
+        assert gzip.decompress(b"".join(gzip_stream([]))) == b""
@@ -1,3 +1,4 @@
+import pytest
 from pydantic import BaseModel
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -110,3 +111,87 @@ def test_row_numbering_starts_at_2():
 def test_sanitize_csv_value_prefixes():
     assert sanitize_csv_value("=cmd") == "'=cmd"
     assert sanitize_csv_value("safe") == "safe"
+
+
+class _FakeSession:
+    """Records chunk commits; a commit fails if any pending object is marked bad."""
+
+    def __init__(self):
+        self.pending = []
+        self.commits = []
+        self.rollbacks = 0
+
+    def add(self, obj):
+        self.pending.append(obj)
+
+    def add_all(self, objs):
+        self.pending.extend(objs)
+
+    def commit(self):
+        if any(getattr(o, "bad", False) for o in self.pending):
+            raise SQLAlchemyError("constraint")
+        self.commits.append([o.id for o in self.pending])
+        self.pending = []
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.pending = []
+
+
+def _bulk(rows, db, **kwargs):
+    kwargs.setdefault("row_mapper", lambda row, user: row)
+    kwargs.setdefault("build_fn", lambda e, u: _Created(e["v"]))
+    return process_csv_upload(
+        rows,
+        db=db,
+        current_user=None,
+        create_fn=lambda db, e, u: pytest.fail("create_fn must not run on the bulk path"),
+        id_getter=_id_getter,
+        **kwargs,
+    )
+
+
+def test_bulk_path_commits_once_per_chunk():
+    db = _FakeSession()
+    res = _bulk([{"v": str(i)} for i in range(5)], db, chunk_size=2)
+    assert res.successful == 5
+    assert res.created_entries == ["0", "1", "2", "3", "4"]
+    assert db.commits == [["0", "1"], ["2", "3"], ["4"]]
+
+
+def test_bulk_path_reports_mapping_errors_per_row():
+    def mapper(row, user):
+        if row["v"] == "bad":
+            raise ValueError("bad date")
+        return row
+
+    db = _FakeSession()
+    res = _bulk([{"v": "1"}, {"v": "bad"}, {"v": "3"}], db, row_mapper=mapper)
+    assert (res.total_rows, res.successful, res.failed) == (3, 2, 1)
+    assert res.errors == [{"row": 3, "error": "Data parsing error in CSV row", "data": {"v": "bad"}}]
+    assert db.commits == [["1", "3"]]
+
+
+def test_bulk_path_isolates_database_failure_to_its_row():
+    def build(e, u):
+        obj = _Created(e["v"])
+        obj.bad = e["v"] == "2"
+        return obj
+
+    db = _FakeSession()
+    res = _bulk([{"v": str(i)} for i in range(4)], db, build_fn=build, chunk_size=2)
+    assert res.created_entries == ["0", "1", "3"]
+    assert res.errors == [{"row": 4, "error": "Database error processing row", "data": {"v": "2"}}]
+    # Chunk [2, 3] failed as a whole, then replayed row by row.
+    assert db.commits == [["0", "1"], ["3"]]
+    assert db.rollbacks == 2
+
+
+def test_bulk_path_errors_sorted_and_capped():
+    def mapper(row, user):
+        raise ValueError("x")
+
+    res = _bulk([{"v": str(i)} for i in range(150)], _FakeSession(), row_mapper=mapper)
+    assert res.failed == 150
+    assert len(res.errors) == 100
+    assert [e["row"] for e in res.errors] == list(range(2, 102))
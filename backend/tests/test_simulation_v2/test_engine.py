@@ -5,10 +5,13 @@ Tests the discrete-event simulation engine, processing time calculations,
 and metric collection.
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from backend.simulation_v2.engine import (
     ProductionLineSimulator,
+    RandomStreams,
     SimulationMetrics,
     run_simulation,
 )
@@ -296,6 +299,91 @@ class TestBreakdownSimulation:
         assert total_breakdowns > 0
 
 
+class TestRandomStreams:
+    """Per-run RNG streams replace the module-global random state."""
+
+    def test_same_seed_same_streams(self):
+        a = RandomStreams.from_seed(7)
+        b = RandomStreams.from_seed(7)
+        assert a.variability.random() == b.variability.random()
+        assert a.breakdown.random() == b.breakdown.random()
+        assert a.rework.random() == b.rework.random()
+
+    def test_sources_are_independent_streams(self):
+        streams = RandomStreams.from_seed(7)
+        draws = {streams.variability.random(), streams.breakdown.random(), streams.rework.random()}
+        assert len(draws) == 3
+
+    def test_simulation_leaves_global_random_untouched(self, simple_config: SimulationConfig):
+        import random
+
+        random.seed(99)
+        expected = random.random()
+        random.seed(99)
+        run_simulation(simple_config, seed=42)
+        assert random.random() == expected
+
+    def test_concurrent_threads_stay_reproducible(self, config_with_breakdowns: SimulationConfig):
+        """Simulations interleaved across threads match a solo run per seed."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def signature(seed):
+            metrics, _ = run_simulation(config_with_breakdowns, seed=seed)
+            return (metrics.bundles_completed, metrics.breakdown_events, dict(metrics.station_busy_time))
+
+        seeds = [1, 2, 3, 4] * 2
+        expected = {seed: signature(seed) for seed in set(seeds)}
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(signature, seeds))
+        assert results == [expected[seed] for seed in seeds]
+
+
+class TestBatchPieceSampling:
+    """Batched bundle-operation sampling vs. the per-piece engine mode."""
+
+    @staticmethod
+    def _count_timeouts(config: SimulationConfig, seed: int):
+        simulator = ProductionLineSimulator(config, seed=seed)
+        calls = {"n": 0}
+        original = simulator.env.timeout
+
+        def counting_timeout(*args, **kwargs):
+            calls["n"] += 1
+            return original(*args, **kwargs)
+
+        with patch.object(simulator.env, "timeout", counting_timeout):
+            metrics = simulator.run()
+        return metrics, calls["n"]
+
+    def test_metrics_match_per_piece_mode_in_distribution(self, simple_config: SimulationConfig):
+        rework_config = simple_config.model_copy(
+            update={"operations": [op.model_copy(update={"rework_pct": 10.0}) for op in simple_config.operations]}
+        )
+        batched_config = rework_config.model_copy(update={"batch_piece_sampling": True})
+
+        per_piece_rework = batched_rework = 0
+        per_piece_busy = batched_busy = 0.0
+        for seed in range(8):
+            per_piece, _ = run_simulation(rework_config, seed=seed)
+            batched, _ = run_simulation(batched_config, seed=seed)
+            # Every bundle finishes inside the horizon in both modes.
+            assert batched.bundles_completed == per_piece.bundles_completed
+            assert dict(batched.station_pieces_processed) == dict(per_piece.station_pieces_processed)
+            per_piece_rework += per_piece.rework_count
+            batched_rework += batched.rework_count
+            per_piece_busy += sum(per_piece.station_busy_time.values())
+            batched_busy += sum(batched.station_busy_time.values())
+
+        assert batched_rework == pytest.approx(per_piece_rework, rel=0.2)
+        assert batched_busy == pytest.approx(per_piece_busy, rel=0.05)
+
+    def test_batched_mode_schedules_far_fewer_events(self, simple_config: SimulationConfig):
+        batched_config = simple_config.model_copy(update={"batch_piece_sampling": True})
+        _, per_piece_events = self._count_timeouts(simple_config, seed=3)
+        _, batched_events = self._count_timeouts(batched_config, seed=3)
+        assert batched_events < per_piece_events / 2
+
+
 class TestSimulationMetrics:
     """Test SimulationMetrics dataclass."""
 
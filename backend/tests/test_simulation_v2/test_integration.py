@@ -590,6 +590,30 @@ class TestRunMonteCarloEndpoint:
         assert "rebalancing_suggestions" in data["sample_run"]
         assert "assumption_log" in data["sample_run"]
 
+    def test_monte_carlo_adaptive_mode_reports_convergence(self, admin_client, valid_config_payload):
+        body = {
+            **valid_config_payload,
+            "n_replications": 20,
+            "base_seed": 7,
+            "target_relative_half_width": 0.5,
+        }
+        response = admin_client.post("/api/v2/simulation/run-monte-carlo", json=body)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["converged"] is True
+        assert data["n_replications"] < 20
+        assert "daily_summary.daily_throughput_pcs" in data["achieved_relative_half_width"]
+
+    def test_monte_carlo_rejects_unknown_target_metric(self, admin_client, valid_config_payload):
+        body = {
+            **valid_config_payload,
+            "n_replications": 3,
+            "target_relative_half_width": 0.05,
+            "target_metrics": ["daily_summary.bogus"],
+        }
+        response = admin_client.post("/api/v2/simulation/run-monte-carlo", json=body)
+        assert response.status_code == 422
+
     def test_monte_carlo_invalid_config_returns_validation_errors(self, admin_client, invalid_config_payload):
         body = {**invalid_config_payload, "n_replications": 3, "base_seed": 1}
         response = admin_client.post("/api/v2/simulation/run-monte-carlo", json=body)
@@ -13,7 +13,7 @@ integration test sits in `test_integration.py` alongside the existing
 `/run` route test.
 """
 
-from typing import List
+from typing import Any, Dict, List
 
 import pytest
 
@@ -25,7 +25,10 @@ from backend.simulation_v2.models import (
     SimulationConfig,
     SimulationResults,
 )
+from backend.simulation_v2.constants import MIN_ADAPTIVE_REPLICATIONS
 from backend.simulation_v2.monte_carlo import (
+    RunningStat,
+    StreamingAggregator,
     aggregate_runs,
     compute_stat,
     run_monte_carlo,
@@ -341,3 +344,127 @@ class TestRunMonteCarlo:
             "per_product_summary",
         ):
             assert block in agg, f"missing block {block} in aggregated_stats"
+
+
+class TestParallelMonteCarlo:
+    def test_parallel_matches_sequential(self, fast_config: SimulationConfig):
+        """Same base_seed → identical aggregates whatever the worker count."""
+        sequential = run_monte_carlo(fast_config, n_replications=4, base_seed=11)
+        parallel = run_monte_carlo(fast_config, n_replications=4, base_seed=11, max_workers=2)
+        assert parallel["aggregated_stats"] == sequential["aggregated_stats"]
+        assert parallel["sample_run"].daily_summary == sequential["sample_run"].daily_summary
+        assert len(parallel["per_run_duration_seconds"]) == 4
+
+    def test_sequential_reports_single_worker(self, fast_config: SimulationConfig):
+        result = run_monte_carlo(fast_config, n_replications=2, base_seed=5)
+        assert result["workers"] == 1
+
+    def test_workers_clamped_to_replication_count(self, fast_config: SimulationConfig):
+        result = run_monte_carlo(fast_config, n_replications=2, base_seed=5, max_workers=8)
+        assert 1 <= result["workers"] <= 2
+
+    def test_replications_do_not_touch_global_random(self, fast_config: SimulationConfig):
+        """Each replication owns its generator; the module RNG is left alone."""
+        import random
+
+        random.seed(1234)
+        expected = random.random()
+        random.seed(1234)
+        run_monte_carlo(fast_config, n_replications=2, base_seed=9)
+        assert random.random() == expected
+
+
+# =============================================================================
+# Streaming statistics + adaptive (early-stopping) mode
+# =============================================================================
+
+
+class TestRunningStat:
+    def test_matches_compute_stat(self):
+        values = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]
+        stat = RunningStat()
+        for v in values:
+            stat.push(v)
+        expected = compute_stat(values)
+        got = stat.to_dict()
+        assert got["n"] == expected["n"]
+        for key in ("mean", "std", "ci_lo_95", "ci_hi_95"):
+            assert got[key] == pytest.approx(expected[key], rel=1e-12)
+
+    def test_empty_and_single(self):
+        stat = RunningStat()
+        assert stat.to_dict() == compute_stat([])
+        stat.push(42.0)
+        assert stat.to_dict() == compute_stat([42.0])
+
+    def test_relative_half_width_zero_mean(self):
+        stat = RunningStat()
+        for v in (0.0, 0.0, 0.0):
+            stat.push(v)
+        assert stat.relative_half_width() == 0.0
+
+
+class TestStreamingAggregator:
+    def test_matches_aggregate_runs(self):
+        runs = [_build_min_results(throughput=t, util=u) for t, u in ((800, 70.0), (900, 80.0), (1000, 90.0))]
+        aggregator = StreamingAggregator()
+        for run in runs:
+            aggregator.push(run)
+        streamed = aggregator.result()
+        batch = aggregate_runs(runs)
+        assert streamed.keys() == batch.keys()
+        ds_streamed = streamed["daily_summary"]["daily_throughput_pcs"]
+        ds_batch = batch["daily_summary"]["daily_throughput_pcs"]
+        assert ds_streamed["mean"] == pytest.approx(ds_batch["mean"])
+        assert ds_streamed["std"] == pytest.approx(ds_batch["std"])
+        assert len(streamed["station_performance"]) == len(batch["station_performance"])
+
+    def test_no_runs_returns_empty(self):
+        assert StreamingAggregator().result() == {}
+
+
+class TestAdaptiveMonteCarlo:
+    def test_unknown_metric_rejected(self, fast_config: SimulationConfig):
+        with pytest.raises(ValueError):
+            run_monte_carlo(
+                fast_config,
+                n_replications=5,
+                base_seed=1,
+                target_relative_half_width=0.05,
+                target_metrics=["daily_summary.no_such_field"],
+            )
+
+    def test_loose_target_stops_early(self, fast_config: SimulationConfig):
+        result = run_monte_carlo(fast_config, n_replications=20, base_seed=1, target_relative_half_width=0.5)
+        assert result["converged"] is True
+        assert result["n_replications"] == MIN_ADAPTIVE_REPLICATIONS
+        assert len(result["per_run_duration_seconds"]) == MIN_ADAPTIVE_REPLICATIONS
+        assert result["achieved_relative_half_width"]["daily_summary.daily_throughput_pcs"] <= 0.5
+
+    def test_unreachable_target_uses_full_budget(self, fast_config: SimulationConfig):
+        result = run_monte_carlo(
+            fast_config,
+            n_replications=4,
+            base_seed=1,
+            target_relative_half_width=1e-9,
+            target_metrics=["station_performance.queue_wait_time_min"],
+        )
+        assert result["n_replications"] == 4
+        assert result["converged"] in (True, False)
+
+    def test_stopping_point_independent_of_workers(self, fast_config: SimulationConfig):
+        kwargs: Dict[str, Any] = dict(
+            n_replications=6,
+            base_seed=3,
+            target_relative_half_width=0.01,
+            target_metrics=["station_performance.util_pct"],
+        )
+        sequential = run_monte_carlo(fast_config, **kwargs)
+        parallel = run_monte_carlo(fast_config, max_workers=2, **kwargs)
+        assert parallel["n_replications"] == sequential["n_replications"]
+        assert parallel["aggregated_stats"] == sequential["aggregated_stats"]
+
+    def test_fixed_mode_reports_no_convergence(self, fast_config: SimulationConfig):
+        result = run_monte_carlo(fast_config, n_replications=2, base_seed=1)
+        assert result["converged"] is None
+        assert result["achieved_relative_half_width"] == {}
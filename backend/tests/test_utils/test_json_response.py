@@ -0,0 +1,90 @@
+"""
+FastJSONResponse: one-pass JSON encoding for large analytics payloads.
+
+Output must match what FastAPI's default path (jsonable_encoder + json)
+would have sent for the same content, and the stdlib fallback must produce
+the same bytes as orjson.
+"""
+
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, Field
+
+from backend.utils import json_response
+from backend.utils.json_response import FastJSONResponse
+
+
+class Level(str, Enum):
+    HIGH = "high"
+
+
+class Reading(BaseModel):
+    kpi_name: str = Field(alias="kpiName")
+    value: Decimal
+    at: datetime
+
+
+CONTENT = {
+    "rows": [{"bucket_start": date(2026, 10, 1), "efficiency": Decimal("85.50"), "units": Decimal("120")}],
+    "level": Level.HIGH,
+    "id": UUID("12345678-1234-5678-1234-567812345678"),
+    "generated_at": datetime(2026, 10, 1, 8, 30, tzinfo=timezone.utc),
+    "tags": ["a"],
+}
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    if request.param and not json_response.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(json_response, "ORJSON_AVAILABLE", request.param)
+
+
+def test_matches_fastapi_default_encoding(encoder):
+    body = FastJSONResponse(CONTENT).body
+
+    assert json.loads(body) == json.loads(json.dumps(jsonable_encoder(CONTENT)))
+    assert json.loads(body)["rows"][0] == {"bucket_start": "2026-10-01", "efficiency": 85.5, "units": 120}
+
+
+def test_pydantic_models_are_serialized_by_alias(encoder):
+    reading = Reading(kpiName="oee", value=Decimal("72.5"), at=datetime(2026, 10, 1, 8, 30))
+
+    top_level = json.loads(FastJSONResponse(reading).body)
+    nested = json.loads(FastJSONResponse({"readings": [reading]}).body)
+
+    assert top_level == json.loads(reading.model_dump_json(by_alias=True))
+    assert nested == {"readings": [top_level]}
+    assert top_level["kpiName"] == "oee"
+
+
+def test_nan_and_non_str_keys_encode_the_same_on_both_backends(monkeypatch):
+    if not json_response.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    content = {
+        "efficiency": float("nan"),
+        "series": [float("inf"), 1.5],
+        "by_day": {date(2026, 10, 1): 1, 3: 2, None: 3, Level.HIGH: 4, UUID(int=1): 5},
+    }
+
+    fast = FastJSONResponse(content).body
+    monkeypatch.setattr(json_response, "ORJSON_AVAILABLE", False)
+    fallback = FastJSONResponse(content).body
+
+    assert fallback == fast
+    assert json.loads(fast) == {
+        "efficiency": None,
+        "series": [None, 1.5],
+        "by_day": {"2026-10-01": 1, "3": 2, "null": 3, "high": 4, "00000000-0000-0000-0000-000000000001": 5},
+    }
+
+
+def test_unknown_types_still_fail_loudly(encoder):
+    with pytest.raises(TypeError):
+        FastJSONResponse({"x": object()})
@@ -0,0 +1,108 @@
+"""
+Fast JSON responses for large KPI and analytics payloads.
+
+FastAPI's default path for a route that returns a plain dict walks the whole
+result through ``jsonable_encoder`` (a recursive Python copy) and then
+``json.dumps``. For a 10k-row pivot that walk is most of the request time.
+``FastJSONResponse`` skips it: routes return ``FastJSONResponse(result)`` and
+the content is encoded in one pass.
+
+- orjson (a backend requirement). If it is missing, stdlib json with the
+  same ``default`` hook produces the same bytes: the fallback first rewrites
+  the two things the encoders disagree on, NaN/Infinity (``null``, as
+  orjson and Pydantic write them) and non-str dict keys (date, int, Enum,
+  UUID keys become strings, as with ``OPT_NON_STR_KEYS``). That pass is a
+  Python walk of the content, so the fallback is correct but not fast.
+- Decimal, date/datetime/time, UUID, Enum and set are handled natively;
+  Decimal follows ``jsonable_encoder`` (int when integral, else float).
+- A Pydantic model is serialized by its own Rust serializer straight to
+  bytes (``by_alias``, like FastAPI's response_model path); models nested in
+  dicts or lists go through ``model_dump(mode="json")``.
+
+Usage in a route:
+
+    @router.get("/{dataset}", response_class=FastJSONResponse)
+    def get_pivot(...) -> FastJSONResponse:
+        return FastJSONResponse(run_pivot(...))
+
+Not registered as the app's ``default_response_class``: FastAPI only
+serializes ``response_model`` routes straight to bytes while they keep the
+default class, so a global override would slow down every other route.
+"""
+
+import json
+import math
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+# orjson is in requirements.txt; the stdlib fallback keeps partial installs working
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj: Any) -> Any:
+    """Encode the types neither encoder handles on its own."""
+    if isinstance(obj, Decimal):
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)  # type: ignore[operator]
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _key(key: Any) -> str:
+    """A non-str dict key the way orjson's OPT_NON_STR_KEYS writes it."""
+    if key is None or isinstance(key, (bool, int, float)):
+        return json.dumps(key)
+    if isinstance(key, Enum):
+        return key.value if isinstance(key.value, str) else _key(key.value)
+    if isinstance(key, (datetime, date, time, UUID)):
+        return str(_default(key))
+    raise TypeError(f"Dict key of type {type(key).__name__} is not supported")
+
+
+def _portable(obj: Any) -> Any:
+    """Rewrite what the stdlib encoder would handle differently from orjson (see module docstring)."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k if isinstance(k, str) else _key(k): _portable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return [_portable(item) for item in obj]
+    return obj
+
+
+def dumps(content: Any) -> bytes:
+    """Compact UTF-8 JSON for `content`, the way FastJSONResponse renders it."""
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content, by_alias=True)
+    if ORJSON_AVAILABLE:
+        encoded: bytes = orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        return encoded
+    return json.dumps(
+        _portable(content), default=_default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that encodes in one pass (see module docstring)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)